@@ -0,0 +1,73 @@
+"""
+Offline bulk scoring (scripts/score.py) throughput by worker count and chunk size.
+
+A scaled-up copy of the fixture is written with --row-group-size rows per row group,
+then scored by serving/bulk_score.score_dataset for every (workers, chunk size) cell.
+Reports rows/s, speedup over one worker (ideal: the worker count, up to the CPUs
+available) and peak worker RSS, which should follow the chunk size, not the input size.
+
+    python benchmarks/bench_bulk_score.py --scale 100 --workers 1 2 4 --chunk-sizes 5000 50000
+"""
+from __future__ import annotations
+
+import argparse
+import itertools
+import tempfile
+import warnings
+from datetime import datetime, timezone
+from pathlib import Path
+
+from common import write_fixture_bundle, write_result, write_scaled_parquet
+
+from readmission_risk_monitor.runtime import available_cpus
+from readmission_risk_monitor.serving.bulk_score import score_dataset
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--scale", type=int, default=40, help="Fixture copies in the input")
+    p.add_argument("--row-group-size", type=int, default=20_000)
+    p.add_argument("--model", choices=["logreg", "lightgbm"], default="lightgbm")
+    p.add_argument("--workers", type=int, nargs="+", default=sorted({1, 2, available_cpus()}))
+    p.add_argument("--chunk-sizes", type=int, nargs="+", default=[5_000, 50_000])
+    return p.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    warnings.filterwarnings("ignore")
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        bundle_root = write_fixture_bundle(Path(tmp) / "bundle", model=args.model)
+        data = write_scaled_parquet(Path(tmp) / "input.parquet", args.scale, row_group_size=args.row_group_size)
+        base = {}
+        for chunk, w in itertools.product(args.chunk_sizes, sorted(args.workers)):
+            s = score_dataset(data, bundle_root, Path(tmp) / "out", chunk_size=chunk, n_workers=w)
+            base.setdefault(chunk, s["rows_per_s"])
+            r = {
+                "workers": s["n_workers"],
+                "chunk_size": chunk,
+                "n_rows": s["n_rows"],
+                "n_row_groups": s["n_row_groups"],
+                "seconds": s["seconds"],
+                "rows_per_s": s["rows_per_s"],
+                "speedup": s["rows_per_s"] / base[chunk],
+                "worker_peak_rss_mb": s["worker_peak_rss_mb"],
+            }
+            rows.append(r)
+            print(f"workers={r['workers']:<2} chunk={chunk:<6} {r['rows_per_s']:9.0f} rows/s "
+                  f"(x{r['speedup']:.2f})  peak worker RSS {r['worker_peak_rss_mb']:.0f} MB")
+
+    path = write_result("bulk_score", {
+        "created_utc": datetime.now(timezone.utc).isoformat(),
+        "cpu_count": available_cpus(),
+        "model": args.model,
+        "scale": args.scale,
+        "row_group_size": args.row_group_size,
+        "results": rows,
+    })
+    print(f"[OK] Wrote benchmark: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Latency of the array-compiled LightGBM scorer (modeling/compiled_trees.py) against the
+booster's own predict_proba, on the same pre-encoded rows, by batch size. Also reports
+the full raw-frame pipeline for context (the ColumnTransformer is not compiled) and the
+max probability difference between the two paths.
+
+    python benchmarks/bench_compiled_trees.py --rows 1 8 32 100 500
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import warnings
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+from common import load_fixture, write_result
+
+from readmission_risk_monitor.config import SETTINGS
+from readmission_risk_monitor.modeling.compiled_trees import CompiledPipeline, compile_lightgbm
+from readmission_risk_monitor.modeling.train import try_train_lightgbm
+
+
+def _per_call_ms(fn: Callable[[], Any], repeats: int) -> float:
+    fn()
+    t0 = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - t0) / repeats * 1000.0
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--rows", type=int, nargs="+", default=[1, 8, 32, 100, 500])
+    p.add_argument("--repeats", type=int, default=50)
+    return p.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    warnings.filterwarnings("ignore")
+    df = load_fixture()
+    result = try_train_lightgbm(
+        df,
+        target_col=SETTINGS.target_col,
+        patient_id_col=SETTINGS.patient_id_col,
+        record_id_col=SETTINGS.record_id_col,
+    )
+    if result is None:
+        raise SystemExit("lightgbm is not installed")
+
+    pre = result.pipeline.named_steps["preprocess"]
+    booster = result.pipeline.named_steps["model"]
+    t0 = time.perf_counter()
+    compiled = compile_lightgbm(booster)
+    compile_s = time.perf_counter() - t0
+    served = CompiledPipeline(pre, compiled, booster=booster)
+
+    X = df[result.feature_columns]
+    X_encoded = pre.transform(X)
+    max_abs_diff = float(np.abs(compiled.predict_proba(X_encoded) - booster.predict_proba(X_encoded)).max())
+
+    rows: List[Dict[str, Any]] = []
+    for n in args.rows:
+        xe, xr = X_encoded[:n], X.head(n)
+        repeats = max(args.repeats * 10 // max(n, 10), 3)
+        r = {
+            "rows": n,
+            "booster_ms": _per_call_ms(lambda xe=xe: booster.predict_proba(xe), repeats),
+            "compiled_ms": _per_call_ms(lambda xe=xe: compiled.predict_proba(xe), repeats),
+            "pipeline_ms": _per_call_ms(lambda xr=xr: result.pipeline.predict_proba(xr), repeats),
+            "served_pipeline_ms": _per_call_ms(lambda xr=xr: served.predict_proba(xr), repeats),
+        }
+        rows.append(r)
+        print(f"rows={n:<5} booster {r['booster_ms']:8.3f} ms  compiled {r['compiled_ms']:8.3f} ms  "
+              f"pipeline {r['pipeline_ms']:8.3f} ms  served {r['served_pipeline_ms']:8.3f} ms")
+
+    path = write_result("compiled_trees", {
+        "created_utc": datetime.now(timezone.utc).isoformat(),
+        "n_trees": compiled.n_trees,
+        "n_nodes": int(len(compiled.value)),
+        "n_encoded_features": compiled.n_features,
+        "n_used_features": int(len(compiled.used_features)),
+        "max_depth": compiled.max_depth,
+        "compile_seconds": compile_s,
+        "max_abs_proba_diff": max_abs_diff,
+        "latency": rows,
+    })
+    print(f"[OK] max |p_compiled - p_booster| = {max_abs_diff:.2e}")
+    print(f"[OK] Wrote benchmark: {path}")
+    print(json.dumps(rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Diagnosis-code encodings vs the default one-hot path: design-matrix width, fit time,
+single-row / batch inference latency and validation AUROC.
+
+    python benchmarks/bench_diag_encoding.py --factor 1
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+import warnings
+from datetime import datetime, timezone
+
+from common import load_fixture, scale_up, write_result
+
+from readmission_risk_monitor.config import SETTINGS
+from readmission_risk_monitor.features.build import DIAGNOSIS_COLUMNS
+from readmission_risk_monitor.features.split import SplitConfig, group_split
+from readmission_risk_monitor.modeling.evaluate import evaluate_binary_classifier
+from readmission_risk_monitor.modeling.train import train_baseline_logreg
+
+ENCODINGS = ["onehot", "icd9_chapter", "rare_bucket", "hash:64", "hash:256"]
+
+
+def _median_ms(fn, repeats: int) -> float:
+    times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - t0) * 1000.0)
+    return statistics.median(times)
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description=__doc__)
+    p.add_argument("--factor", type=int, default=1, help="Fixture scale-up factor")
+    p.add_argument("--repeats", type=int, default=200, help="Single-row latency repeats")
+    return p.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    warnings.filterwarnings("ignore")
+
+    df = scale_up(load_fixture(), args.factor)
+    train_df, valid_df, _ = group_split(
+        df,
+        group_col=SETTINGS.patient_id_col,
+        target_col=SETTINGS.target_col,
+        cfg=SplitConfig(),
+    )
+
+    rows = []
+    for enc in ENCODINGS:
+        encodings = None if enc == "onehot" else {c: enc for c in DIAGNOSIS_COLUMNS}
+
+        t0 = time.perf_counter()
+        result = train_baseline_logreg(
+            train_df,
+            target_col=SETTINGS.target_col,
+            patient_id_col=SETTINGS.patient_id_col,
+            record_id_col=SETTINGS.record_id_col,
+            column_encodings=encodings,
+        )
+        fit_s = time.perf_counter() - t0
+
+        pipe = result.pipeline
+        Xv = valid_df[result.feature_columns]
+        one = Xv.head(1)
+        batch = Xv.head(500)
+
+        res = {
+            "encoding": enc,
+            "matrix_width": int(pipe.named_steps["preprocess"].transform(one).shape[1]),
+            "n_coef": int(pipe.named_steps["model"].coef_.size),
+            "fit_seconds": fit_s,
+            "single_row_ms": _median_ms(lambda pipe=pipe, one=one: pipe.predict_proba(one), args.repeats),
+            "batch_500_ms": _median_ms(lambda pipe=pipe, batch=batch: pipe.predict_proba(batch), 20),
+            "valid_auroc": evaluate_binary_classifier(pipe, Xv, valid_df[SETTINGS.target_col])["auroc"],
+        }
+        rows.append(res)
+        print(
+            f"{enc:<13} width={res['matrix_width']:>5} fit={fit_s:6.2f}s "
+            f"row={res['single_row_ms']:.2f}ms batch500={res['batch_500_ms']:.1f}ms "
+            f"auroc={res['valid_auroc']:.4f}"
+        )
+
+    path = write_result("diag_encoding", {
+        "created_utc": datetime.now(timezone.utc).isoformat(),
+        "scale_factor": args.factor,
+        "columns": list(DIAGNOSIS_COLUMNS),
+        "results": rows,
+    })
+    print(f"[OK] Wrote benchmark: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Request parse + response serialize throughput of the scoring API, before and after the
+bundle-generated request schema:
+
+  before: json.loads -> PredictBatchRequest (features: Dict[str, Any]) -> python loop
+          aligning keys to the feature columns; response via jsonable_encoder + json.dumps
+  after:  BundlePredictBatchRequest.model_validate_json (typed, extra="forbid") ->
+          features.model_dump(); response via model_dump_json
+
+Model scoring is excluded, so the numbers are the per-row overhead the codec adds.
+
+    python benchmarks/bench_request_codec.py --rows 1 100 1000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List
+
+from common import load_fixture, sample_payloads, write_result
+from fastapi.encoders import jsonable_encoder
+
+from readmission_risk_monitor.config import SETTINGS
+from readmission_risk_monitor.data.contract import diabetes_readmission_contract
+from readmission_risk_monitor.features.build import FeatureSpec, infer_feature_columns
+from readmission_risk_monitor.modeling.bundle import compute_reference_stats
+from readmission_risk_monitor.serving.schemas import (
+    PredictBatchRequest,
+    PredictBatchResponse,
+    PredictResponse,
+    build_features_model,
+    bundle_request_models,
+)
+
+
+def _per_call_ms(fn: Callable[[], Any], repeats: int) -> float:
+    fn()
+    t0 = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - t0) / repeats * 1000.0
+
+
+def _response(n: int) -> PredictBatchResponse:
+    pred = PredictResponse(
+        request_id="r", readmission_risk=0.12, risk_tier="low", rank_score=0.12,
+        reason_codes=["PHASE4_BASELINE_EXPLAIN"], model_version="0.1.0", schema_version="1.0.0",
+        latency_ms=1.0,
+    )
+    return PredictBatchResponse(predictions=[pred] * n, latency_ms=1.0)
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--rows", type=int, nargs="+", default=[1, 100, 1000])
+    p.add_argument("--repeats", type=int, default=200)
+    return p.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    df = load_fixture()
+    columns = infer_feature_columns(df, FeatureSpec(
+        target_col=SETTINGS.target_col,
+        patient_id_col=SETTINGS.patient_id_col,
+        record_id_col=SETTINGS.record_id_col,
+    ))
+    features_model = build_features_model(
+        columns,
+        reference_stats=compute_reference_stats(df, feature_columns=columns),
+        contract=diabetes_readmission_contract(),
+    )
+    _, batch_model = bundle_request_models(features_model)
+
+    def before(body: bytes, resp: PredictBatchResponse) -> bytes:
+        req = PredictBatchRequest.model_validate(json.loads(body))
+        [{c: item.features.get(c) for c in columns} for item in req.items]
+        return json.dumps(jsonable_encoder(resp)).encode()
+
+    def after(body: bytes, resp: PredictBatchResponse) -> bytes:
+        req = batch_model.model_validate_json(body)
+        [item.features.model_dump() for item in req.items]
+        return resp.model_dump_json().encode()
+
+    payloads = sample_payloads(max(args.rows), columns)
+    results: List[Dict[str, Any]] = []
+    for n in args.rows:
+        body = json.dumps({"items": [{"request_id": f"r-{i}", "features": f} for i, f in enumerate(payloads[:n])]}).encode()
+        resp = _response(n)
+        repeats = max(args.repeats * 10 // max(n, 10), 3)
+        before_ms = _per_call_ms(lambda body=body, resp=resp: before(body, resp), repeats)
+        after_ms = _per_call_ms(lambda body=body, resp=resp: after(body, resp), repeats)
+        r = {
+            "rows": n,
+            "before_ms": before_ms,
+            "after_ms": after_ms,
+            "before_rows_per_s": n / before_ms * 1000.0,
+            "after_rows_per_s": n / after_ms * 1000.0,
+            "speedup": before_ms / after_ms,
+        }
+        results.append(r)
+        print(f"rows={n:<5} before {before_ms:8.3f} ms ({r['before_rows_per_s']:>9,.0f} rows/s)  "
+              f"after {after_ms:8.3f} ms ({r['after_rows_per_s']:>9,.0f} rows/s)  x{r['speedup']:.2f}")
+
+    path = write_result("request_codec", {
+        "created_utc": datetime.now(timezone.utc).isoformat(),
+        "n_features": len(columns),
+        "results": results,
+    })
+    print(f"[OK] Wrote benchmark: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Throughput of the pre-forked production server (scripts/serve.py --mode prod) by
+worker count. For each count a server is started on a fixture bundle, driven by
+client processes for --duration seconds, and the aggregated /metrics request count
+is checked against what the clients sent (multiprocess collection).
+
+    python benchmarks/bench_serve_workers.py --workers 1 2 4 --clients 8 --duration 15
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+import httpx
+from common import sample_payloads, write_fixture_bundle, write_result
+
+from readmission_risk_monitor.serving.model_loader import load_latest_bundle
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _client(url: str, payloads: List[Dict[str, Any]], duration: float, offset: int) -> List[float]:
+    latencies = []
+    deadline = time.perf_counter() + duration
+    i = offset
+    with httpx.Client(base_url=url, timeout=30.0) as client:
+        while time.perf_counter() < deadline:
+            body = {"request_id": f"bench-{offset}-{i}", "features": payloads[i % len(payloads)]}
+            t0 = time.perf_counter()
+            client.post("/predict", json=body).raise_for_status()
+            latencies.append(time.perf_counter() - t0)
+            i += 1
+    return latencies
+
+
+def _wait_ready(url: str, proc: subprocess.Popen, timeout: float = 60.0) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"Server exited with {proc.returncode}")
+        try:
+            if httpx.get(f"{url}/health", timeout=1.0).json().get("status") == "ok":
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise TimeoutError(f"Server at {url} not ready after {timeout}s")
+
+
+def _requests_total(url: str) -> float:
+    text = httpx.get(f"{url}/metrics", timeout=10.0).text
+    return sum(float(line.split()[-1]) for line in text.splitlines() if line.startswith("rrm_requests_total "))
+
+
+def run_one(workers: int, *, bundle_root: Path, payloads, clients: int, duration: float, port: int) -> Dict[str, Any]:
+    url = f"http://127.0.0.1:{port}"
+    env = {**os.environ, "RRM_AUDIT_DIR": "", "PYTHONUNBUFFERED": "1"}
+    proc = subprocess.Popen(
+        [sys.executable, str(ROOT / "scripts" / "serve.py"), "--mode", "prod", "--workers", str(workers),
+         "--host", "127.0.0.1", "--port", str(port), "--bundle-root", str(bundle_root), "--log-level", "warning"],
+        env=env,
+    )
+    try:
+        _wait_ready(url, proc)
+        with ProcessPoolExecutor(max_workers=clients) as pool:
+            futures = [pool.submit(_client, url, payloads, duration, k * 10_000) for k in range(clients)]
+            latencies = [x for f in futures for x in f.result()]
+        time.sleep(1.5)  # let every worker's time-based metric flush land
+        served = _requests_total(url)
+    finally:
+        proc.terminate()
+        proc.wait(timeout=30)
+
+    latencies.sort()
+    n = len(latencies)
+    return {
+        "workers": workers,
+        "clients": clients,
+        "requests": n,
+        "throughput_rps": n / duration,
+        "p50_ms": statistics.median(latencies) * 1000 if n else None,
+        "p99_ms": latencies[int(0.99 * (n - 1))] * 1000 if n else None,
+        "metrics_requests_total": served,
+        "metrics_consistent": served == n,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    p.add_argument("--clients", type=int, default=8, help="Concurrent client processes")
+    p.add_argument("--duration", type=float, default=15.0, help="Seconds of load per worker count")
+    p.add_argument("--port", type=int, default=8765)
+    return p.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        bundle_root = write_fixture_bundle(Path(tmp) / "bundle")
+        payloads = sample_payloads(200, load_latest_bundle(bundle_root).feature_columns)
+        for w in args.workers:
+            res = run_one(w, bundle_root=bundle_root, payloads=payloads, clients=args.clients,
+                          duration=args.duration, port=args.port)
+            rows.append(res)
+            print(f"workers={w:<3} {res['throughput_rps']:8.1f} req/s  p50={res['p50_ms']:.1f}ms "
+                  f"p99={res['p99_ms']:.1f}ms  metrics_consistent={res['metrics_consistent']}")
+
+    path = write_result("serve_workers", {
+        "created_utc": datetime.now(timezone.utc).isoformat(),
+        "cpu_count": os.cpu_count(),
+        "duration_s": args.duration,
+        "results": rows,
+    })
+    print(f"[OK] Wrote benchmark: {path}")
+
+
+if __name__ == "__main__":
+    main()
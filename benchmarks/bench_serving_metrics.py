@@ -0,0 +1,92 @@
+"""
+Hot-path cost of the serving metrics: ServingMetrics.observe per scored row, compared
+with the naive version (labels() lookup per request, one Counter.inc per missing feature).
+
+    python benchmarks/bench_serving_metrics.py --iterations 200000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List
+
+from common import load_fixture, write_result
+
+from readmission_risk_monitor.serving.metrics import (
+    FEATURE_MISSING,
+    PREDICTIONS,
+    RISK_SCORE,
+    ServingMetrics,
+)
+
+NAIVE_COLUMNS: List[str] = []
+
+
+def _naive_observe(rows, probas, tiers, model_version) -> None:
+    for r, p, t in zip(rows, probas, tiers, strict=True):
+        RISK_SCORE.observe(p)
+        PREDICTIONS.labels(risk_tier=t, model_version=model_version).inc()
+        for c in NAIVE_COLUMNS:
+            if r[c] is None:
+                FEATURE_MISSING.labels(feature=c).inc()
+
+
+def _per_call_us(fn: Callable[[], Any], iterations: int) -> float:
+    fn()
+    t0 = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - t0) / iterations * 1e6
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--iterations", type=int, default=200_000)
+    return p.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    df = load_fixture()
+    columns = [c for c in df.columns if c not in ("READMITTED_30D", "PATIENT_NBR", "ENCOUNTER_ID")]
+    NAIVE_COLUMNS.extend(columns)
+
+    # Rows as the API builds them: JSON-parsed python values, absent features as None
+    row = json.loads(df[columns].head(1).to_json(orient="records"))[0]
+    full = {c: (0 if v is None else v) for c, v in row.items()}
+    sparse = dict(full)
+    for c in columns[:3]:
+        sparse[c] = None
+    batch = [sparse] * 100
+
+    metrics = ServingMetrics(columns, "bench")
+    reference = PREDICTIONS.labels(risk_tier="low", model_version="reference")
+    cases: Dict[str, Callable[[], Any]] = {
+        # One bare prometheus Counter.inc(): the machine's yardstick for "cheap"
+        "reference_counter_inc": reference.inc,
+        "observe_single_no_missing": lambda: metrics.observe([full], [0.2], ["low"]),
+        "observe_single_3_missing": lambda: metrics.observe([sparse], [0.2], ["low"]),
+        "naive_single_3_missing": lambda: _naive_observe([sparse], [0.2], ["low"], "bench"),
+    }
+    results = {name: _per_call_us(fn, args.iterations) for name, fn in cases.items()}
+    batch_us = _per_call_us(lambda: metrics.observe(batch, [0.2] * 100, ["low"] * 100), args.iterations // 100)
+    results["observe_batch_100_per_row"] = batch_us / 100
+    results["flush"] = _per_call_us(metrics.flush, 10_000)
+
+    for name, us in results.items():
+        print(f"{name:<28} {us:8.2f} us")
+
+    path = write_result("serving_metrics", {
+        "created_utc": datetime.now(timezone.utc).isoformat(),
+        "n_features": len(columns),
+        "iterations": args.iterations,
+        "per_call_us": results,
+    })
+    print(f"[OK] Wrote benchmark: {path}")
+    print(json.dumps(results))
+
+
+if __name__ == "__main__":
+    main()
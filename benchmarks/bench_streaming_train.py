@@ -0,0 +1,128 @@
+"""
+Peak memory / wall time / AUROC: in-memory logreg baseline vs out-of-core SGD.
+
+Each mode runs in its own subprocess so peak RSS is not polluted by the other.
+
+    python benchmarks/bench_streaming_train.py --factors 1 10 20
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from common import peak_rss_mb, write_result, write_scaled_parquet
+
+from readmission_risk_monitor.config import SETTINGS
+from readmission_risk_monitor.features.build import FeatureSpec
+from readmission_risk_monitor.features.split import SplitConfig, patient_hash_split
+from readmission_risk_monitor.modeling.evaluate import binary_metrics
+
+
+def _run_worker(mode: str, data: Path, batch_size: int) -> dict:
+    cfg = SplitConfig()
+    spec = FeatureSpec(
+        target_col=SETTINGS.target_col,
+        patient_id_col=SETTINGS.patient_id_col,
+        record_id_col=SETTINGS.record_id_col,
+    )
+    t0 = time.perf_counter()
+
+    if mode == "in_memory":
+        import pandas as pd
+
+        from readmission_risk_monitor.modeling.train import train_baseline_logreg
+
+        df = pd.read_parquet(data)
+        split = patient_hash_split(df[SETTINGS.patient_id_col], cfg)
+        result = train_baseline_logreg(
+            df[split == "train"],
+            target_col=SETTINGS.target_col,
+            patient_id_col=SETTINGS.patient_id_col,
+            record_id_col=SETTINGS.record_id_col,
+        )
+        fit_s = time.perf_counter() - t0
+        valid = df[split == "valid"]
+        metrics = binary_metrics(
+            valid[SETTINGS.target_col],
+            result.pipeline.predict_proba(valid[result.feature_columns])[:, 1],
+        )
+    else:
+        from readmission_risk_monitor.modeling.streaming import stream_scores, train_streaming_sgd
+
+        result = train_streaming_sgd(
+            data,
+            target_col=SETTINGS.target_col,
+            patient_id_col=SETTINGS.patient_id_col,
+            record_id_col=SETTINGS.record_id_col,
+            split_cfg=cfg,
+            batch_size=batch_size,
+        )
+        fit_s = time.perf_counter() - t0
+        metrics = binary_metrics(*stream_scores(
+            result.pipeline,
+            data,
+            feature_columns=result.feature_columns,
+            spec=spec,
+            split_cfg=cfg,
+            split="valid",
+            batch_size=batch_size,
+        ))
+
+    return {
+        "mode": mode,
+        "fit_seconds": fit_s,
+        "peak_rss_mb": peak_rss_mb(),
+        "valid_auroc": metrics["auroc"],
+        "valid_n": metrics["n"],
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description=__doc__)
+    p.add_argument("--factors", type=int, nargs="+", default=[1, 10])
+    p.add_argument("--batch-size", type=int, default=20_000)
+    p.add_argument("--worker", choices=["in_memory", "streaming"], help=argparse.SUPPRESS)
+    p.add_argument("--data", type=Path, help=argparse.SUPPRESS)
+    return p.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if args.worker:
+        print(json.dumps(_run_worker(args.worker, args.data, args.batch_size)))
+        return
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for factor in args.factors:
+            data = write_scaled_parquet(Path(tmp) / f"x{factor}.parquet", factor)
+            for mode in ("in_memory", "streaming"):
+                out = subprocess.run(
+                    [sys.executable, __file__, "--worker", mode, "--data", str(data),
+                     "--batch-size", str(args.batch_size)],
+                    check=True, capture_output=True, text=True,
+                )
+                res = json.loads(out.stdout.strip().splitlines()[-1])
+                res["scale_factor"] = factor
+                rows.append(res)
+                print(
+                    f"x{factor:<4} {mode:<10} fit={res['fit_seconds']:.2f}s "
+                    f"peak_rss={res['peak_rss_mb']:.0f}MB auroc={res['valid_auroc']:.4f}"
+                )
+
+    path = write_result("streaming_train", {
+        "created_utc": datetime.now(timezone.utc).isoformat(),
+        "batch_size": args.batch_size,
+        "results": rows,
+    })
+    print(f"[OK] Wrote benchmark: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+Latency and throughput of the production server across thread settings
+(runtime.ResourceConfig): pre-forked workers x BLAS/OpenMP threads per worker x scoring
+threads per worker. Every cell starts scripts/serve.py --mode prod on a fixture bundle
+and drives it with interactive /predict clients plus /predict/batch clients, so both
+the small-request latency and the vectorized batch rate show up. Admission control is
+off (RRM_ADMISSION=0) so shedding does not hide queueing.
+
+A second table times LightGBM training for each --train-cpus budget (RRM_TRAIN_CPUS).
+
+    python benchmarks/bench_thread_settings.py --workers 1 2 --blas-threads 1 4 --scoring-threads 2 40
+    python benchmarks/bench_thread_settings.py --model logreg --train-cpus 1 2 4
+"""
+from __future__ import annotations
+
+import argparse
+import itertools
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+import numpy as np
+from common import load_fixture, sample_payloads, write_fixture_bundle, write_result
+
+from readmission_risk_monitor.config import SETTINGS
+from readmission_risk_monitor.runtime import available_cpus, limit_native_threads
+from readmission_risk_monitor.serving.model_loader import load_latest_bundle
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _client(url: str, payloads: List[Dict[str, Any]], batch_size: int, duration: float, offset: int) -> List[float]:
+    """Back-to-back requests for `duration` s: /predict when batch_size is 0, else /predict/batch."""
+    latencies = []
+    deadline = time.perf_counter() + duration
+    i = offset
+    with httpx.Client(base_url=url, timeout=60.0) as client:
+        while time.perf_counter() < deadline:
+            if batch_size:
+                items = [{"request_id": f"b-{offset}-{i}-{k}", "features": payloads[(i + k) % len(payloads)]}
+                         for k in range(batch_size)]
+                path, body = "/predict/batch", {"items": items}
+            else:
+                path, body = "/predict", {"request_id": f"i-{offset}-{i}", "features": payloads[i % len(payloads)]}
+            t0 = time.perf_counter()
+            client.post(path, json=body).raise_for_status()
+            latencies.append(time.perf_counter() - t0)
+            i += 1
+    return latencies
+
+
+def _wait_ready(url: str, proc: subprocess.Popen, timeout: float = 90.0) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"Server exited with {proc.returncode}")
+        try:
+            if httpx.get(f"{url}/health", timeout=1.0).json().get("status") == "ok":
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise TimeoutError(f"Server at {url} not ready after {timeout}s")
+
+
+def _ms(latencies: List[float], q: float) -> Optional[float]:
+    return float(np.percentile(latencies, q) * 1000.0) if latencies else None
+
+
+def run_cell(
+        workers: int,
+        blas_threads: int,
+        scoring_threads: int,
+        *,
+        bundle_root: Path,
+        payloads: List[Dict[str, Any]],
+        args: argparse.Namespace,
+) -> Dict[str, Any]:
+    url = f"http://127.0.0.1:{args.port}"
+    env = {**os.environ, "RRM_AUDIT_DIR": "", "RRM_ADMISSION": "0", "PYTHONUNBUFFERED": "1"}
+    proc = subprocess.Popen(
+        [sys.executable, str(ROOT / "scripts" / "serve.py"), "--mode", "prod", "--workers", str(workers),
+         "--blas-threads", str(blas_threads), "--scoring-threads", str(scoring_threads),
+         "--host", "127.0.0.1", "--port", str(args.port), "--bundle-root", str(bundle_root),
+         "--log-level", "warning"],
+        env=env,
+    )
+    try:
+        _wait_ready(url, proc)
+        n = args.clients + args.batch_clients
+        with ProcessPoolExecutor(max_workers=n) as pool:
+            interactive = [pool.submit(_client, url, payloads, 0, args.duration, k * 10_000)
+                           for k in range(args.clients)]
+            batch = [pool.submit(_client, url, payloads, args.batch_size, args.duration, (k + 100) * 10_000)
+                     for k in range(args.batch_clients)]
+            single_lat = [x for f in interactive for x in f.result()]
+            batch_lat = [x for f in batch for x in f.result()]
+    finally:
+        proc.terminate()
+        proc.wait(timeout=30)
+
+    return {
+        "workers": workers,
+        "blas_threads": blas_threads,
+        "scoring_threads": scoring_threads,
+        "threads_per_core": workers * blas_threads * scoring_threads / available_cpus(),
+        "predict_rps": len(single_lat) / args.duration,
+        "predict_p50_ms": _ms(single_lat, 50),
+        "predict_p99_ms": _ms(single_lat, 99),
+        "batch_rows_per_s": len(batch_lat) * args.batch_size / args.duration,
+        "batch_p99_ms": _ms(batch_lat, 99),
+    }
+
+
+def time_training(train_cpus: List[int]) -> List[Dict[str, Any]]:
+    from readmission_risk_monitor.modeling.train import try_train_lightgbm
+
+    df = load_fixture()
+    rows = []
+    for cpus in train_cpus:
+        limit_native_threads(cpus)
+        t0 = time.perf_counter()
+        result = try_train_lightgbm(
+            df,
+            target_col=SETTINGS.target_col,
+            patient_id_col=SETTINGS.patient_id_col,
+            record_id_col=SETTINGS.record_id_col,
+            n_jobs=cpus,
+        )
+        if result is None:
+            print("[WARN] lightgbm not installed; skipping the training table")
+            return []
+        rows.append({"train_cpus": cpus, "seconds": time.perf_counter() - t0})
+        print(f"train_cpus={cpus:<3} lightgbm fit {rows[-1]['seconds']:6.2f}s")
+    return rows
+
+
+def parse_args() -> argparse.Namespace:
+    cpus = available_cpus()
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--model", choices=["logreg", "lightgbm"], default="lightgbm", help="Fixture bundle to serve")
+    p.add_argument("--workers", type=int, nargs="+", default=sorted({1, cpus}))
+    p.add_argument("--blas-threads", type=int, nargs="+", default=sorted({1, cpus}))
+    p.add_argument("--scoring-threads", type=int, nargs="+", default=[2, 40],
+                   help="40 is anyio's default pool, i.e. the server before explicit sizing")
+    p.add_argument("--clients", type=int, default=8, help="Interactive /predict client processes")
+    p.add_argument("--batch-clients", type=int, default=2, help="/predict/batch client processes")
+    p.add_argument("--batch-size", type=int, default=200)
+    p.add_argument("--duration", type=float, default=10.0, help="Seconds of load per cell")
+    p.add_argument("--train-cpus", type=int, nargs="*", default=sorted({1, cpus}),
+                   help="Training budgets to time (none: skip training)")
+    p.add_argument("--port", type=int, default=8766)
+    return p.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    warnings.filterwarnings("ignore")
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        bundle_root = write_fixture_bundle(Path(tmp) / "bundle", model=args.model)
+        payloads = sample_payloads(500, load_latest_bundle(bundle_root).feature_columns)
+        for w, b, s in itertools.product(args.workers, args.blas_threads, args.scoring_threads):
+            res = run_cell(w, b, s, bundle_root=bundle_root, payloads=payloads, args=args)
+            rows.append(res)
+            print(f"workers={w:<2} blas={b:<2} scoring={s:<3} /predict {res['predict_rps']:7.1f} req/s "
+                  f"p50={res['predict_p50_ms']:6.1f}ms p99={res['predict_p99_ms']:7.1f}ms | "
+                  f"batch {res['batch_rows_per_s']:8.0f} rows/s p99={res['batch_p99_ms'] or 0:7.1f}ms")
+
+    training = time_training(args.train_cpus)
+    path = write_result("thread_settings", {
+        "created_utc": datetime.now(timezone.utc).isoformat(),
+        "cpu_count": available_cpus(),
+        "model": args.model,
+        "clients": args.clients,
+        "batch_clients": args.batch_clients,
+        "batch_size": args.batch_size,
+        "duration_s": args.duration,
+        "serving": rows,
+        "training": training,
+    })
+    print(f"[OK] Wrote benchmark: {path}")
+
+
+if __name__ == "__main__":
+    main()
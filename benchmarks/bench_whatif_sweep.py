@@ -0,0 +1,104 @@
+"""
+Latency of a what-if sweep (serving/sweep.py) against one single-patient prediction, for
+the logistic-regression and LightGBM bundle pipelines. Three ways to score the grid:
+
+  factorized: SweepScorer -- encode the base row + one row per swept value, assemble the grid
+  full grid:  build every grid row as a raw frame and run the whole pipeline on it
+  single:     one /predict-sized predict_proba call (the target)
+
+    python benchmarks/bench_whatif_sweep.py --values 50 --axes 2
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import warnings
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+from common import load_fixture, write_result
+
+from readmission_risk_monitor.config import SETTINGS
+from readmission_risk_monitor.modeling.train import train_baseline_logreg, try_train_lightgbm
+from readmission_risk_monitor.serving.sweep import SweepScorer, sweep_frame
+
+SWEEPABLE = ["NUM_MEDICATIONS", "TIME_IN_HOSPITAL", "NUM_LAB_PROCEDURES"]
+
+
+def _per_call_ms(fn: Callable[[], Any], repeats: int) -> float:
+    fn()
+    t0 = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - t0) / repeats * 1000.0
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--values", type=int, default=50, help="Values per swept feature")
+    p.add_argument("--axes", type=int, default=2, choices=[1, 2, 3])
+    p.add_argument("--repeats", type=int, default=20)
+    return p.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    warnings.filterwarnings("ignore")
+    df = load_fixture()
+    kwargs = dict(
+        target_col=SETTINGS.target_col,
+        patient_id_col=SETTINGS.patient_id_col,
+        record_id_col=SETTINGS.record_id_col,
+    )
+    trainers = {"logreg": train_baseline_logreg, "lightgbm": try_train_lightgbm}
+
+    results: List[Dict[str, Any]] = []
+    for name, train in trainers.items():
+        result = train(df, **kwargs)
+        columns = result.feature_columns
+        base = json.loads(df[columns].head(1).to_json(orient="records"))[0]
+        axes = [(f, np.linspace(1, 40, args.values).tolist()) for f in SWEEPABLE[:args.axes]]
+        scorer = SweepScorer(result.pipeline, columns)
+        one = pd.DataFrame.from_records([base], columns=columns)
+
+        pipeline = result.pipeline
+        single_ms = _per_call_ms(lambda pipeline=pipeline, one=one: pipeline.predict_proba(one), args.repeats)
+        factorized_ms = _per_call_ms(
+            lambda scorer=scorer, base=base, axes=axes: scorer.score(base, axes), args.repeats
+        )
+        full_ms = _per_call_ms(
+            lambda pipeline=pipeline, base=base, axes=axes, columns=columns: pipeline.predict_proba(
+                sweep_frame(base, axes, columns)
+            ),
+            max(args.repeats // 4, 3),
+        )
+        _, risk = scorer.score(base, axes)
+        full = result.pipeline.predict_proba(sweep_frame(base, axes, columns))[:, 1].reshape(risk.shape)
+        r = {
+            "model": name,
+            "n_points": int(risk.size),
+            "single_ms": single_ms,
+            "factorized_ms": factorized_ms,
+            "full_grid_ms": full_ms,
+            "factorized_vs_single": factorized_ms / single_ms,
+            "max_abs_diff": float(np.abs(risk - full).max()),
+        }
+        results.append(r)
+        print(f"{name:<9} {r['n_points']} points: single {single_ms:7.2f} ms  factorized {factorized_ms:7.2f} ms "
+              f"(x{r['factorized_vs_single']:.2f} of single)  full grid {full_ms:8.2f} ms  "
+              f"max |diff| {r['max_abs_diff']:.1e}")
+
+    path = write_result("whatif_sweep", {
+        "created_utc": datetime.now(timezone.utc).isoformat(),
+        "values_per_axis": args.values,
+        "n_axes": args.axes,
+        "results": results,
+    })
+    print(f"[OK] Wrote benchmark: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import json
+import resource
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+import pandas as pd
+
+from readmission_risk_monitor.config import SETTINGS
+
+
+def load_fixture() -> pd.DataFrame:
+    return pd.read_parquet(SETTINGS.data_fixtures_dir / SETTINGS.fixture_table)
+
+
+def scale_up(df: pd.DataFrame, factor: int) -> pd.DataFrame:
+    """
+    Replicate the fixture `factor` times with disjoint ENCOUNTER_ID / PATIENT_NBR ranges,
+    so contract checks and patient-level splits behave as on a genuinely larger extract.
+    Feature rows are exact copies, so held-out AUROC is optimistic beyond factor 1; use it
+    for timing and memory, and compare accuracy between modes at the same factor only.
+    """
+    if factor <= 1:
+        return df.copy()
+
+    rid, pid = SETTINGS.record_id_col, SETTINGS.patient_id_col
+    rid_step = int(df[rid].max()) + 1
+    pid_step = int(df[pid].max()) + 1
+
+    parts = []
+    for k in range(factor):
+        part = df.copy()
+        part[rid] = part[rid] + k * rid_step
+        part[pid] = part[pid] + k * pid_step
+        parts.append(part)
+    return pd.concat(parts, ignore_index=True)
+
+
+def write_scaled_parquet(path: Path, factor: int, *, row_group_size: int = 50_000) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    scale_up(load_fixture(), factor).to_parquet(path, index=False, row_group_size=row_group_size)
+    return path
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process (ru_maxrss is KiB on Linux, bytes on macOS)."""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def write_result(name: str, payload: Dict[str, Any]) -> Path:
+    out_dir = SETTINGS.artifacts_dir / "benchmarks"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    path = out_dir / f"{name}.json"
+    path.write_text(json.dumps(payload, indent=2))
+    return path
+
+
+def write_fixture_bundle(bundle_root: Path, *, model_version: str = "0.0.0", model: str = "logreg") -> Path:
+    """Bundle trained on the fixture's train split (for serving benchmarks); model: logreg | lightgbm."""
+    from readmission_risk_monitor.features.split import SplitConfig, group_split
+    from readmission_risk_monitor.modeling.bundle import write_bundle
+    from readmission_risk_monitor.modeling.train import train_baseline_logreg, try_train_lightgbm
+
+    train_df, _, _ = group_split(
+        load_fixture(),
+        group_col=SETTINGS.patient_id_col,
+        target_col=SETTINGS.target_col,
+        cfg=SplitConfig(),
+    )
+    train = {"logreg": train_baseline_logreg, "lightgbm": try_train_lightgbm}[model]
+    result = train(
+        train_df,
+        target_col=SETTINGS.target_col,
+        patient_id_col=SETTINGS.patient_id_col,
+        record_id_col=SETTINGS.record_id_col,
+    )
+    write_bundle(
+        bundle_root=bundle_root,
+        model_version=model_version,
+        schema_version="1.0.0",
+        pipeline=result.pipeline,
+        feature_columns=result.feature_columns,
+        feature_spec=result.feature_spec,
+        reference_df=train_df[result.feature_columns],
+        model_type="logistic_regression" if model == "logreg" else "lightgbm",
+    )
+    return bundle_root
+
+
+def sample_payloads(n: int, feature_columns: list) -> list:
+    """JSON-ready feature dicts from the fixture, as a client would send them."""
+    df = load_fixture()
+    return json.loads(df[feature_columns].head(n).to_json(orient="records"))
@@ -0,0 +1,316 @@
+"""
+Pipeline performance benchmarks with regression gates.
+
+Times every training/serving stage over the fixture and synthetic scale-ups of it,
+appends the run to artifacts/benchmarks/history.jsonl, and (with --compare) fails
+when a stage is slower than the recent baseline by more than --tolerance.
+
+    python benchmarks/run_benchmarks.py --scales 1 10 100
+    python benchmarks/run_benchmarks.py --scales 1 10 --compare --tolerance 0.25
+
+Cold-start stages (cold_*) run in a fresh interpreter; see scripts/profile_startup.py
+for the per-module breakdown.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from common import load_fixture, scale_up
+
+from readmission_risk_monitor.config import SETTINGS
+from readmission_risk_monitor.data.contract import diabetes_readmission_contract
+from readmission_risk_monitor.data.validate import validate_dataframe
+from readmission_risk_monitor.features.build import FeatureSpec, build_preprocessor, build_xy
+from readmission_risk_monitor.features.split import SplitConfig, group_split
+from readmission_risk_monitor.modeling.bundle import compute_reference_stats, write_bundle
+from readmission_risk_monitor.modeling.evaluate import evaluate_binary_classifier
+from readmission_risk_monitor.modeling.train import train_baseline_logreg, try_train_lightgbm
+
+HISTORY_PATH = SETTINGS.artifacts_dir / "benchmarks" / "history.jsonl"
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _load_ingest_module():
+    spec = importlib.util.spec_from_file_location("rrm_ingest", ROOT / "scripts" / "ingest.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _timeit(fn: Callable[[], Any], repeats: int) -> float:
+    """Best-of-N wall time in seconds (min is the least noise-sensitive estimator)."""
+    best = float("inf")
+    for _ in range(max(repeats, 1)):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        )
+        return out.stdout.strip()
+    except Exception:
+        return None
+
+
+def _serving_latency(
+    bundle_root: Path, sample: List[Dict[str, Any]], repeats: int, tmp: Path
+) -> Dict[str, float]:
+    from fastapi.testclient import TestClient
+
+    from readmission_risk_monitor.serving import app as app_module
+
+    os.environ["RRM_BUNDLE_DIR"] = str(bundle_root)
+    # Keep the audit log and score table of benchmark traffic out of the repo's artifacts dir
+    os.environ["RRM_AUDIT_DIR"] = str(tmp / "serving_audit")
+    os.environ["RRM_SCORE_TABLE"] = str(tmp / "scores" / "score_table.arrow")
+    batch = {"items": [{"request_id": f"b-{i}", "features": f} for i, f in enumerate(sample[:100])]}
+
+    with TestClient(app_module.app) as client:
+        client.post("/predict", json={"request_id": "warmup", "features": sample[0]})
+
+        single = []
+        for i in range(repeats):
+            payload = {"request_id": f"s-{i}", "features": sample[i % len(sample)]}
+            t0 = time.perf_counter()
+            client.post("/predict", json=payload).raise_for_status()
+            single.append(time.perf_counter() - t0)
+
+        batch_s = _timeit(lambda: client.post("/predict/batch", json=batch).raise_for_status(), 5)
+
+    return {"predict_single_p50": statistics.median(single), "predict_batch_100": batch_s}
+
+
+def _cold_start(bundle_root: Path, tmp: Path) -> Dict[str, float]:
+    """
+    Fresh-interpreter startup of the API (scripts/profile_startup.py child mode): time to
+    import the app, load the bundle and answer the first request, plus the slowest
+    training CLI's --help (heavy imports must stay out of argument parsing).
+    """
+    env = {**os.environ, "RRM_AUDIT_DIR": str(tmp / "cold_audit")}
+    out = subprocess.run(
+        [sys.executable, str(ROOT / "scripts" / "profile_startup.py"), "--child",
+         "--bundle-root", str(bundle_root), "--requests", "5"],
+        capture_output=True, text=True, check=True, env=env,
+    )
+    phases = json.loads(out.stdout.strip().splitlines()[-1])
+
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable, str(ROOT / "scripts" / "retrain.py"), "--help"],
+                   capture_output=True, check=True)
+    cli_help_s = time.perf_counter() - t0
+
+    return {
+        "cold_import_app": phases["import_app_ms"] / 1000.0,
+        "cold_bundle_load": phases["bundle_load_ms"] / 1000.0,
+        "cold_first_response": phases["time_to_first_response_ms"] / 1000.0,
+        "cold_cli_help": cli_help_s,
+    }
+
+
+def run_scale(factor: int, *, repeats: int, tmp: Path) -> List[Dict[str, Any]]:
+    warnings.filterwarnings("ignore")
+    df = scale_up(load_fixture(), factor)
+    n = len(df)
+    fast_repeats = repeats if factor <= 10 else 1
+    results: List[Dict[str, Any]] = []
+
+    def record(stage: str, seconds: float) -> None:
+        results.append({"stage": stage, "scale": factor, "rows": n, "seconds": seconds})
+        print(f"x{factor:<4} {stage:<24} {seconds * 1000:10.2f} ms")
+
+    ingest = _load_ingest_module()
+    raw = df.drop(columns=[SETTINGS.target_col]).rename(columns=str.lower)
+    contract = diabetes_readmission_contract()
+    record("ingest", _timeit(lambda: validate_dataframe(
+        ingest.coerce_types(ingest.build_traget_readmitted_30d(ingest.standardize_columns(raw))),
+        contract,
+    ), fast_repeats))
+
+    cfg = SplitConfig()
+    split_kw = {"group_col": SETTINGS.patient_id_col, "target_col": SETTINGS.target_col, "cfg": cfg}
+    record("group_split", _timeit(lambda: group_split(df, **split_kw), fast_repeats))
+    train_df, valid_df, _ = group_split(df, **split_kw)
+
+    spec = FeatureSpec(
+        target_col=SETTINGS.target_col,
+        patient_id_col=SETTINGS.patient_id_col,
+        record_id_col=SETTINGS.record_id_col,
+    )
+    X, _, numeric_cols, categorical_cols = build_xy(train_df, spec)
+    pre = build_preprocessor(numeric_cols, categorical_cols)
+    record("preprocess_fit", _timeit(lambda: pre.fit(X), fast_repeats))
+    record("preprocess_transform", _timeit(lambda: pre.transform(X), fast_repeats))
+
+    train_kw = {
+        "target_col": SETTINGS.target_col,
+        "patient_id_col": SETTINGS.patient_id_col,
+        "record_id_col": SETTINGS.record_id_col,
+    }
+    t0 = time.perf_counter()
+    baseline = train_baseline_logreg(train_df, **train_kw)
+    record("train_logreg", time.perf_counter() - t0)
+
+    t0 = time.perf_counter()
+    advanced = try_train_lightgbm(train_df, **train_kw)
+    if advanced is not None:
+        record("train_lightgbm", time.perf_counter() - t0)
+
+    from readmission_risk_monitor.modeling.streaming import train_streaming_sgd
+
+    data_path = tmp / f"x{factor}.parquet"
+    df.to_parquet(data_path, index=False, row_group_size=50_000)
+    t0 = time.perf_counter()
+    train_streaming_sgd(data_path, **train_kw, batch_size=50_000)
+    record("train_streaming_sgd", time.perf_counter() - t0)
+
+    Xv, yv = valid_df[baseline.feature_columns], valid_df[SETTINGS.target_col]
+    record("evaluate", _timeit(lambda: evaluate_binary_classifier(baseline.pipeline, Xv, yv), fast_repeats))
+
+    ref_df = train_df[baseline.feature_columns]
+    record("reference_stats", _timeit(
+        lambda: compute_reference_stats(ref_df, feature_columns=baseline.feature_columns), fast_repeats
+    ))
+
+    bundle_root = tmp / f"bundle_x{factor}"
+    write_bundle(
+        bundle_root=bundle_root,
+        model_version="0.0.0",
+        schema_version="1.0.0",
+        pipeline=baseline.pipeline,
+        feature_columns=baseline.feature_columns,
+        feature_spec=baseline.feature_spec,
+        reference_df=ref_df.head(5000),
+        model_type="logistic_regression",
+    )
+    sample = json.loads(valid_df[baseline.feature_columns].head(100).to_json(orient="records"))
+    for stage, seconds in _serving_latency(bundle_root, sample, repeats=50, tmp=tmp).items():
+        record(stage, seconds)
+    for stage, seconds in _cold_start(bundle_root, tmp).items():
+        record(stage, seconds)
+
+    return results
+
+
+def _key(r: Dict[str, Any]) -> str:
+    return f"{r['stage']}@x{r['scale']}"
+
+
+def load_history(path: Path = HISTORY_PATH) -> List[Dict[str, Any]]:
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
+
+
+def compare_to_history(
+        results: List[Dict[str, Any]],
+        history: List[Dict[str, Any]],
+        *,
+        tolerance: float,
+        min_delta_s: float,
+        window: int,
+) -> List[Dict[str, Any]]:
+    """
+    Baseline per stage@scale = median of the last `window` runs that measured it.
+    A stage regresses when it is slower than baseline * (1 + tolerance) AND by more than
+    min_delta_s in absolute terms (keeps sub-millisecond noise from failing the gate).
+    """
+    past: Dict[str, List[float]] = {}
+    for run in history:
+        for r in run["results"]:
+            past.setdefault(_key(r), []).append(float(r["seconds"]))
+
+    report = []
+    for r in results:
+        prior = past.get(_key(r), [])[-window:]
+        if not prior:
+            continue
+        base = statistics.median(prior)
+        cur = float(r["seconds"])
+        ratio = cur / base if base > 0 else float("inf")
+        report.append({
+            "key": _key(r),
+            "baseline_seconds": base,
+            "seconds": cur,
+            "ratio": ratio,
+            "regressed": ratio > 1.0 + tolerance and (cur - base) > min_delta_s,
+        })
+    return report
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--scales", type=int, nargs="+", default=[1, 10])
+    p.add_argument("--repeats", type=int, default=3, help="Best-of-N repeats for fast stages")
+    p.add_argument("--compare", action="store_true", help="Fail (exit 1) on regressions vs history")
+    p.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown ratio (0.25 = +25%%)")
+    p.add_argument("--min-delta-ms", type=float, default=5.0, help="Ignore regressions smaller than this")
+    p.add_argument("--window", type=int, default=5, help="Number of past runs forming the baseline")
+    p.add_argument("--no-save", action="store_true", help="Do not append this run to history")
+    return p.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+
+    results: List[Dict[str, Any]] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for factor in args.scales:
+            results.extend(run_scale(factor, repeats=args.repeats, tmp=Path(tmp)))
+
+    run = {
+        "created_utc": datetime.now(timezone.utc).isoformat(),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "results": results,
+    }
+
+    history = load_history()
+    report = compare_to_history(
+        results,
+        history,
+        tolerance=args.tolerance,
+        min_delta_s=args.min_delta_ms / 1000.0,
+        window=args.window,
+    )
+
+    if not args.no_save:
+        HISTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with HISTORY_PATH.open("a") as fh:
+            fh.write(json.dumps(run) + "\n")
+        print(f"[OK] Appended run to {HISTORY_PATH}")
+
+    if report:
+        print("=== Comparison vs history ===")
+        for r in report:
+            flag = "REGRESSED" if r["regressed"] else "ok"
+            print(f"{r['key']:<32} {r['baseline_seconds'] * 1000:10.2f} -> {r['seconds'] * 1000:10.2f} ms "
+                  f"(x{r['ratio']:.2f}) {flag}")
+
+    regressed = [r for r in report if r["regressed"]]
+    if args.compare and regressed:
+        print(f"[FAIL] {len(regressed)} stage(s) regressed beyond {args.tolerance:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from readmission_risk_monitor.config import SETTINGS
+
+SEVERITY_ORDER = {"stable": 0, "moderate": 1, "major": 2}
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        description="Compare a parquet extract against the active bundle's reference stats."
+    )
+    p.add_argument("--data", type=Path, required=True, help="Parquet file or directory (read lazily)")
+    p.add_argument("--bundle-root", type=Path, default=SETTINGS.bundle_dir)
+    p.add_argument("--workers", type=int, default=None, help="Column-parallel worker processes (default: CPUs)")
+    p.add_argument("--batch-size", type=int, default=100_000, help="Rows per streamed batch")
+    p.add_argument("--out-dir", type=Path, default=SETTINGS.artifacts_dir / "drift")
+    p.add_argument("--fail-on", choices=["moderate", "major"], default=None,
+                   help="Exit 1 when any feature reaches this severity (promotion / feed gate)")
+    return p.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if not args.data.exists():
+        raise FileNotFoundError(f"Missing extract: {args.data}")
+
+    from readmission_risk_monitor.monitoring.batch_drift import (
+        profile_against_reference,
+        render_html,
+    )
+    from readmission_risk_monitor.serving.model_loader import load_latest_bundle
+
+    bundle = load_latest_bundle(args.bundle_root)
+    if not bundle.reference_stats:
+        raise FileNotFoundError(f"Bundle has no reference_stats.json: {bundle.bundle_dir}")
+
+    t0 = time.perf_counter()
+    report = profile_against_reference(
+        args.data,
+        bundle.reference_stats,
+        feature_columns=bundle.feature_columns,
+        n_workers=args.workers,
+        batch_size=args.batch_size,
+    )
+    report["model_version"] = bundle.metadata.get("model_version")
+    report["seconds"] = time.perf_counter() - t0
+
+    args.out_dir.mkdir(parents=True, exist_ok=True)
+    json_path = args.out_dir / "drift_report.json"
+    html_path = args.out_dir / "drift_report.html"
+    json_path.write_text(json.dumps(report, indent=2))
+    html_path.write_text(render_html(report, title=f"Feature drift vs bundle {report['model_version']}"))
+    print(f"[OK] Profiled {report['n_rows']} rows in {report['seconds']:.1f}s")
+    print(f"[OK] Wrote drift report: {json_path}")
+    print(f"[OK] Wrote drift report: {html_path}")
+
+    for r in report["ranking"][:10]:
+        print(f"{r['feature']:<32} psi={r['psi']:.4f} {r['severity']}")
+
+    if args.fail_on:
+        worst = [r for r in report["ranking"] if SEVERITY_ORDER[r["severity"]] >= SEVERITY_ORDER[args.fail_on]]
+        if worst:
+            print(f"[FAIL] {len(worst)} feature(s) at or above '{args.fail_on}' drift")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Generate a contract-valid synthetic extract for scale testing, shaped by a bundle's
+reference stats (numeric histograms/moments, categorical top values).
+
+    python scripts/generate_synthetic.py --rows 50000000 --out data/synthetic/50m
+    python scripts/generate_synthetic.py --rows 1000000 --reference-stats bundle/0.1.0/reference_stats.json --validate
+
+The output directory is a parquet dataset (part-*.parquet) readable by train_streaming.py,
+drift_report.py and pd.read_parquet.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+from readmission_risk_monitor.config import SETTINGS
+
+
+def _latest_reference_stats(bundle_root: Path) -> Path:
+    ptr = bundle_root / "latest" / "PATH.txt"
+    if not ptr.exists():
+        raise FileNotFoundError(f"Missing latest pointer: {ptr}. Pass --reference-stats instead.")
+    path = Path(ptr.read_text().strip()) / "reference_stats.json"
+    if not path.exists():
+        raise FileNotFoundError(f"Bundle has no reference_stats.json: {path}")
+    return path
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--rows", type=int, required=True)
+    p.add_argument("--out", type=Path, default=SETTINGS.project_root / "data" / "synthetic")
+    p.add_argument("--reference-stats", type=Path, default=None,
+                   help="reference_stats.json to sample from (default: the active bundle's)")
+    p.add_argument("--bundle-root", type=Path, default=SETTINGS.bundle_dir)
+    p.add_argument("--positive-rate", type=float, default=0.11)
+    p.add_argument("--encounters-per-patient", type=float, default=1.4, help="Mean encounters per patient")
+    p.add_argument("--signal", type=float, default=1.0, help="Label dependence on features (0 = noise)")
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--id-offset", type=int, default=0, help="Shift encounter / patient ids (disjoint extracts)")
+    p.add_argument("--row-group-size", type=int, default=100_000)
+    p.add_argument("--rows-per-file", type=int, default=1_000_000)
+    p.add_argument("--workers", type=int, default=None, help="Writer processes (default: CPUs)")
+    p.add_argument("--validate", action="store_true", help="Run the data contract on the first part file")
+    return p.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+
+    import pandas as pd
+
+    from readmission_risk_monitor.data.contract import diabetes_readmission_contract
+    from readmission_risk_monitor.data.synthetic import SyntheticSpec, write_synthetic_dataset
+    from readmission_risk_monitor.data.validate import validate_dataframe
+
+    ref_path = args.reference_stats or _latest_reference_stats(args.bundle_root)
+    reference_stats = json.loads(ref_path.read_text())
+    spec = SyntheticSpec(
+        n_rows=args.rows,
+        positive_rate=args.positive_rate,
+        encounters_per_patient=args.encounters_per_patient,
+        signal=args.signal,
+        seed=args.seed,
+        id_offset=args.id_offset,
+        row_group_size=args.row_group_size,
+        rows_per_file=args.rows_per_file,
+    )
+    contract = diabetes_readmission_contract()
+    summary = write_synthetic_dataset(args.out, reference_stats, spec, contract=contract, n_workers=args.workers)
+    summary["reference_stats"] = str(ref_path)
+    (args.out / "_manifest.json").write_text(json.dumps({**summary, "spec": vars(spec)}, indent=2))
+
+    rate = summary["n_rows"] / max(summary["seconds"], 1e-9)
+    print(f"[OK] Wrote {summary['n_rows']} rows in {summary['n_files']} files "
+          f"({summary['seconds']:.1f}s, {rate:,.0f} rows/s, {summary['n_workers']} workers)")
+    print(f"[OK] Positive rate: {summary['positive_rate']:.4f}")
+
+    if args.validate:
+        first = pd.read_parquet(sorted(args.out.glob("part-*.parquet"))[0])
+        report = validate_dataframe(first, contract)
+        if not report["passed"]:
+            raise SystemExit(f"[FAIL] Contract validation: {report['errors']}")
+        print(f"[OK] Contract validation passed on {len(first)} rows")
+    print(f"[OK] Wrote synthetic dataset: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from readmission_risk_monitor.config import SETTINGS
+
+
+def _utcnow() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        description="Join the prediction audit log with delayed 30-day labels and track live performance."
+    )
+    p.add_argument("--audit-dir", type=Path, default=SETTINGS.artifacts_dir / "audit")
+    p.add_argument("--labels", type=Path, default=SETTINGS.data_processed_dir / SETTINGS.processed_table,
+                   help="Parquet file (or directory) of ingested encounters with the 30-day label")
+    p.add_argument("--partitions", type=int, default=32, help="Hash buckets for the spilled join")
+    p.add_argument("--batch-size", type=int, default=250_000)
+    p.add_argument("--rolling-weeks", type=int, default=4)
+    p.add_argument("--spill-dir", type=Path, default=None, help="Where join buckets are spilled (default: tmp)")
+    p.add_argument("--out", type=Path, default=SETTINGS.artifacts_dir / "live_performance.json")
+    return p.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if not args.audit_dir.exists():
+        raise FileNotFoundError(f"Missing audit log: {args.audit_dir}. Is the API writing RRM_AUDIT_DIR?")
+    if not args.labels.exists():
+        raise FileNotFoundError(f"Missing labels: {args.labels}. Run scripts/ingest.py first.")
+
+    from readmission_risk_monitor.monitoring.live_performance import (
+        JoinConfig,
+        join_predictions_with_labels,
+        live_performance_series,
+    )
+
+    cfg = JoinConfig(
+        n_partitions=args.partitions,
+        batch_size=args.batch_size,
+        rolling_weeks=args.rolling_weeks,
+    )
+
+    t0 = time.perf_counter()
+    groups, counts = join_predictions_with_labels(
+        args.audit_dir,
+        args.labels,
+        record_id_col=SETTINGS.record_id_col,
+        target_col=SETTINGS.target_col,
+        cfg=cfg,
+        spill_dir=args.spill_dir,
+    )
+    series = live_performance_series(groups, cfg=cfg)
+
+    payload = {
+        "created_utc": _utcnow(),
+        "audit_dir": str(args.audit_dir),
+        "labels": str(args.labels),
+        "join": {**counts, "partitions": cfg.n_partitions, "seconds": time.perf_counter() - t0},
+        "rolling_weeks": cfg.rolling_weeks,
+        "series": series,
+    }
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.out.write_text(json.dumps(payload, indent=2))
+    print(f"[OK] Joined {counts['joined_rows']} of {counts['audit_rows']} audited predictions")
+    print(f"[OK] Wrote live performance: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
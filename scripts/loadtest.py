@@ -0,0 +1,308 @@
+"""
+Load test for the scoring API: latency percentiles, throughput and error rate.
+
+Runs in-process against serving.app:app through httpx's ASGI transport (no server
+needed), or against a running server with --url. Payloads are sampled from the fixture
+using the active bundle's feature columns.
+
+Closed loop (default): --concurrency clients each send back-to-back requests.
+Open loop (--rate R): requests arrive as a Poisson process at R/s regardless of how
+fast the service answers; latency is measured from the scheduled arrival time so a
+stalled service is not hidden by clients waiting on it (coordinated omission).
+--concurrency then caps in-flight requests.
+
+Priority mix (--bulk-concurrency N): N extra closed-loop clients send /predict/batch
+jobs marked bulk alongside the measured traffic, as a batch job would while clinicians
+use the dashboard. Bulk latency and shed (503) counts are reported separately; compare
+the interactive p99 with admission control on and off (RRM_ADMISSION=0).
+
+    python scripts/loadtest.py --duration 20 --concurrency 16
+    python scripts/loadtest.py --endpoint batch --batch-size 100 --rate 20
+    python scripts/loadtest.py --url http://127.0.0.1:8000 --rate 200 --slo-p99-ms 50
+    python scripts/loadtest.py --rate 20 --bulk-concurrency 4 --bulk-batch-size 500 --slo-p99-ms 250
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+import numpy as np
+
+from readmission_risk_monitor.config import SETTINGS
+from readmission_risk_monitor.serving.model_loader import load_latest_bundle
+from readmission_risk_monitor.serving.schemas import PRIORITY_HEADER
+
+
+def _utcnow() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def load_payloads(data: Path, feature_columns: List[str], n: int, seed: int) -> List[Dict[str, Any]]:
+    """Feature dicts as a client sends them (JSON types, nulls for missing values)."""
+    import pandas as pd
+
+    df = pd.read_parquet(data, columns=feature_columns)
+    df = df.sample(min(n, len(df)), random_state=seed)
+    return json.loads(df.to_json(orient="records"))
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.latencies: List[float] = []
+        self.statuses: Counter = Counter()
+        self.errors: Counter = Counter()
+        self.rows = 0
+
+    def add(self, latency_s: float, status: Optional[int], rows: int, error: Optional[str] = None) -> None:
+        self.latencies.append(latency_s)
+        if error is not None:
+            self.errors[error] += 1
+            return
+        self.statuses[status] += 1
+        if status == 200:
+            self.rows += rows
+
+    def summary(self, elapsed_s: float) -> Dict[str, Any]:
+        lat = np.asarray(self.latencies) * 1000.0
+        n = len(lat)
+        ok = self.statuses.get(200, 0)
+        pct = (lambda q: float(np.percentile(lat, q))) if n else (lambda q: None)
+        return {
+            "requests": n,
+            "ok": ok,
+            "error_rate": (n - ok) / n if n else None,
+            "status_counts": {str(k): v for k, v in sorted(self.statuses.items())},
+            "transport_errors": dict(self.errors),
+            "elapsed_s": elapsed_s,
+            "throughput_rps": n / elapsed_s if elapsed_s else None,
+            "rows_per_s": self.rows / elapsed_s if elapsed_s else None,
+            "latency_ms": {
+                "p50": pct(50),
+                "p95": pct(95),
+                "p99": pct(99),
+                "max": float(lat.max()) if n else None,
+                "mean": float(lat.mean()) if n else None,
+            },
+        }
+
+
+def _make_request(args: argparse.Namespace, payloads: List[Dict[str, Any]], i: int):
+    if args.endpoint == "batch":
+        items = [
+            {"request_id": f"lt-{i}-{k}", "features": payloads[(i * args.batch_size + k) % len(payloads)]}
+            for k in range(args.batch_size)
+        ]
+        return "/predict/batch", {"items": items}, args.batch_size
+    return "/predict", {"request_id": f"lt-{i}", "features": payloads[i % len(payloads)]}, 1
+
+
+def _headers(priority: Optional[str]) -> Optional[Dict[str, str]]:
+    return {PRIORITY_HEADER: priority} if priority else None
+
+
+async def _send(client: httpx.AsyncClient, rec: Recorder, path: str, body: Dict[str, Any],
+                rows: int, start: float, priority: Optional[str] = None) -> Optional[httpx.Response]:
+    try:
+        resp = await client.post(path, json=body, headers=_headers(priority))
+        rec.add(time.perf_counter() - start, resp.status_code, rows)
+        return resp
+    except httpx.HTTPError as exc:
+        rec.add(time.perf_counter() - start, None, rows, error=type(exc).__name__)
+        return None
+
+
+async def closed_loop(client, args, payloads, rec: Recorder, deadline: float) -> None:
+    counter = iter(range(sys.maxsize))
+
+    async def worker() -> None:
+        while time.perf_counter() < deadline:
+            path, body, rows = _make_request(args, payloads, next(counter))
+            await _send(client, rec, path, body, rows, time.perf_counter(), args.priority)
+
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+
+
+async def bulk_loop(client, args, payloads, rec: Recorder, deadline: float) -> None:
+    """Background batch jobs: back-to-back bulk /predict/batch calls from --bulk-concurrency clients."""
+    counter = iter(range(sys.maxsize))
+
+    async def worker() -> None:
+        while time.perf_counter() < deadline:
+            i = next(counter)
+            items = [
+                {"request_id": f"bulk-{i}-{k}", "features": payloads[(i * args.bulk_batch_size + k) % len(payloads)]}
+                for k in range(args.bulk_batch_size)
+            ]
+            resp = await _send(client, rec, "/predict/batch", {"items": items}, args.bulk_batch_size,
+                               time.perf_counter(), "bulk")
+            if resp is not None and resp.status_code == 503:
+                # shed: wait out Retry-After as the SDK clients do
+                retry_after = float(resp.headers.get("Retry-After", "1"))
+                await asyncio.sleep(max(0.0, min(retry_after, deadline - time.perf_counter())))
+
+    await asyncio.gather(*(worker() for _ in range(args.bulk_concurrency)))
+
+
+async def open_loop(client, args, payloads, rec: Recorder, deadline: float) -> None:
+    rng = random.Random(args.seed)
+    sem = asyncio.Semaphore(args.concurrency)
+    tasks = []
+    next_at = time.perf_counter()
+    i = 0
+
+    async def fire(path, body, rows, scheduled: float) -> None:
+        async with sem:
+            await _send(client, rec, path, body, rows, scheduled, args.priority)
+
+    while next_at < deadline:
+        delay = next_at - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        path, body, rows = _make_request(args, payloads, i)
+        tasks.append(asyncio.create_task(fire(path, body, rows, next_at)))
+        i += 1
+        next_at += rng.expovariate(args.rate)
+    await asyncio.gather(*tasks)
+
+
+@asynccontextmanager
+async def _client(args: argparse.Namespace):
+    connections = args.concurrency + args.bulk_concurrency
+    limits = httpx.Limits(max_connections=connections, max_keepalive_connections=connections)
+    if args.url:
+        async with httpx.AsyncClient(base_url=args.url, timeout=args.timeout, limits=limits) as client:
+            yield client
+        return
+
+    # In-process: run the app's lifespan (bundle load, background threads) around the test
+    from readmission_risk_monitor.serving import app as app_module
+
+    app = app_module.app
+    # Synthetic traffic would flood the real audit log; keep it in a scratch dir unless
+    # the caller chose one (RRM_AUDIT_DIR="" still disables auditing)
+    with tempfile.TemporaryDirectory(prefix="loadtest-audit-") as audit_tmp:
+        os.environ.setdefault("RRM_AUDIT_DIR", audit_tmp)
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://loadtest",
+                                         timeout=args.timeout, limits=limits) as client:
+                yield client
+
+
+async def run(args: argparse.Namespace, payloads: List[Dict[str, Any]]) -> Dict[str, Any]:
+    async with _client(args) as client:
+        # Warm-up is not recorded (first-call import/JIT/cache costs)
+        warm = Recorder()
+        for i in range(args.warmup):
+            path, body, rows = _make_request(args, payloads, i)
+            await _send(client, warm, path, body, rows, time.perf_counter(), args.priority)
+
+        rec, bulk = Recorder(), Recorder()
+        t0 = time.perf_counter()
+        deadline = t0 + args.duration
+        main = open_loop if args.rate else closed_loop
+        await asyncio.gather(
+            main(client, args, payloads, rec, deadline),
+            bulk_loop(client, args, payloads, bulk, deadline),
+        )
+        elapsed = time.perf_counter() - t0
+        summary = rec.summary(elapsed)
+        if args.bulk_concurrency:
+            summary["bulk"] = bulk.summary(elapsed)
+        return summary
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--url", default=None, help="Target a running server instead of the in-process app")
+    p.add_argument("--endpoint", choices=["predict", "batch"], default="predict")
+    p.add_argument("--batch-size", type=int, default=50, help="Items per /predict/batch request")
+    p.add_argument("--concurrency", type=int, default=8, help="Closed-loop clients / open-loop in-flight cap")
+    p.add_argument("--rate", type=float, default=None, help="Open-loop arrival rate (requests/s)")
+    p.add_argument("--priority", choices=["interactive", "bulk"], default=None,
+                   help="Priority header on the measured traffic (default: none, the server decides)")
+    p.add_argument("--bulk-concurrency", type=int, default=0, help="Background bulk /predict/batch clients")
+    p.add_argument("--bulk-batch-size", type=int, default=200, help="Items per background bulk request")
+    p.add_argument("--duration", type=float, default=10.0, help="Seconds of measured load")
+    p.add_argument("--warmup", type=int, default=20, help="Unrecorded requests sent first")
+    p.add_argument("--timeout", type=float, default=30.0)
+    p.add_argument("--data", type=Path, default=SETTINGS.data_fixtures_dir / SETTINGS.fixture_table)
+    p.add_argument("--sample", type=int, default=1000, help="Distinct payloads sampled from --data")
+    p.add_argument("--bundle-root", type=Path, default=None, help="Overrides RRM_BUNDLE_DIR")
+    p.add_argument("--seed", type=int, default=42)
+    p.add_argument("--slo-p99-ms", type=float, default=None, help="Exit 1 if p99 latency exceeds this")
+    p.add_argument("--max-error-rate", type=float, default=0.0, help="Exit 1 if the error rate exceeds this")
+    p.add_argument("--out", type=Path, default=SETTINGS.artifacts_dir / "loadtest.json")
+    return p.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if args.bundle_root is not None:
+        os.environ["RRM_BUNDLE_DIR"] = str(args.bundle_root)
+    bundle_root = Path(os.getenv("RRM_BUNDLE_DIR", str(SETTINGS.bundle_dir)))
+
+    feature_columns = load_latest_bundle(bundle_root).feature_columns
+    payloads = load_payloads(args.data, feature_columns, args.sample, args.seed)
+
+    summary = asyncio.run(run(args, payloads))
+    payload = {
+        "created_utc": _utcnow(),
+        "target": args.url or "in-process:readmission_risk_monitor.serving.app:app",
+        "endpoint": args.endpoint,
+        "batch_size": args.batch_size if args.endpoint == "batch" else 1,
+        "mode": "open_loop" if args.rate else "closed_loop",
+        "rate_rps": args.rate,
+        "concurrency": args.concurrency,
+        "priority": args.priority,
+        "bulk_concurrency": args.bulk_concurrency,
+        "bulk_batch_size": args.bulk_batch_size if args.bulk_concurrency else None,
+        "admission": os.getenv("RRM_ADMISSION", "1") != "0",
+        "duration_s": args.duration,
+        "cpu_count": os.cpu_count(),
+        **summary,
+    }
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.out.write_text(json.dumps(payload, indent=2))
+
+    if summary["requests"] == 0:
+        # No latencies or error rate to report: the run itself failed
+        print(f"[FAIL] No requests completed in {args.duration}s (wrote {args.out})")
+        sys.exit(1)
+
+    lat = summary["latency_ms"]
+    print(f"[OK] {summary['requests']} requests, {summary['throughput_rps']:.1f} req/s, "
+          f"error rate {summary['error_rate']:.2%}")
+    print(f"[OK] latency ms p50={lat['p50']:.1f} p95={lat['p95']:.1f} p99={lat['p99']:.1f}")
+    if "bulk" in summary and summary["bulk"]["requests"] == 0:
+        print("[WARN] bulk: no batches completed")
+    elif "bulk" in summary:
+        b = summary["bulk"]
+        print(f"[OK] bulk: {b['ok']} batches ok ({b['rows_per_s']:.0f} rows/s), "
+              f"{b['status_counts'].get('503', 0)} shed, p99={b['latency_ms']['p99']:.1f} ms")
+    print(f"[OK] Wrote load test: {args.out}")
+
+    failed = []
+    if args.slo_p99_ms is not None and lat["p99"] > args.slo_p99_ms:
+        failed.append(f"p99 {lat['p99']:.1f}ms > {args.slo_p99_ms}ms")
+    if summary["error_rate"] > args.max_error_rate:
+        failed.append(f"error rate {summary['error_rate']:.2%} > {args.max_error_rate:.2%}")
+    if failed:
+        print(f"[FAIL] SLO violated: {'; '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
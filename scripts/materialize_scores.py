@@ -0,0 +1,54 @@
+"""
+Nightly job: score every open encounter with the active bundle and write the score table
+served by GET/POST /score/{encounter_id}.
+
+    python scripts/materialize_scores.py --data data/open_encounters.parquet
+
+The table is an uncompressed Arrow IPC file sorted by ENCOUNTER_ID (risk, tier, reason
+codes, model version). It replaces the previous table atomically; running API workers
+pick it up within seconds. Point the API at it with RRM_SCORE_TABLE (default: --out).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+from readmission_risk_monitor.config import SETTINGS
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--data", type=Path, required=True, help="Parquet file or directory of open encounters")
+    p.add_argument("--bundle-root", type=Path, default=SETTINGS.bundle_dir)
+    p.add_argument("--out", type=Path, default=SETTINGS.artifacts_dir / "scores" / "score_table.arrow")
+    p.add_argument("--batch-size", type=int, default=50_000, help="Rows scored per vectorized call")
+    p.add_argument("--no-explain", action="store_true", help="Skip per-patient reason codes")
+    return p.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if not args.data.exists():
+        raise FileNotFoundError(f"Missing extract: {args.data}")
+
+    from readmission_risk_monitor.serving.model_loader import load_latest_bundle
+    from readmission_risk_monitor.serving.score_table import materialize_scores
+
+    bundle = load_latest_bundle(args.bundle_root)
+    summary = materialize_scores(
+        args.data, bundle, args.out, batch_size=args.batch_size, explain=not args.no_explain
+    )
+    args.out.with_suffix(".json").write_text(json.dumps(summary, indent=2))
+
+    print(f"[OK] Scored {summary['n_rows']} encounters with model {summary['model_version']} "
+          f"in {summary['seconds']:.1f}s")
+    if summary["n_duplicates"]:
+        print(f"[WARN] {summary['n_duplicates']} duplicate ENCOUNTER_ID rows (last one kept)")
+    if summary["missing_features"]:
+        print(f"[WARN] Features absent from the extract (scored as missing): {summary['missing_features']}")
+    print(f"[OK] Wrote score table: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""
+Cold-start profile of the serving app and the CLI entry points.
+
+Every measurement runs in a fresh interpreter, so nothing is already imported:
+
+  - import cost per module from `python -X importtime` (top modules by cumulative
+    time, and self time summed per top-level package)
+  - serving phases: import serving.app, bundle load, app startup (monitors and
+    background threads), first /predict and steady-state /predict latency
+  - wall time of `scripts/<name>.py --help` for the argparse entry points
+
+    python scripts/profile_startup.py --bundle-root bundle
+    python scripts/profile_startup.py --module readmission_risk_monitor.monitoring.live_performance --no-serving
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+from readmission_risk_monitor.config import SETTINGS
+
+ROOT = Path(__file__).resolve().parents[1]
+APP_MODULE = "readmission_risk_monitor.serving.app"
+
+# Entry points that parse arguments before doing any work
+HELP_SCRIPTS = [
+    "drift_report.py",
+    "generate_synthetic.py",
+    "live_performance.py",
+    "loadtest.py",
+    "materialize_scores.py",
+    "profile_startup.py",
+    "retrain.py",
+    "score.py",
+    "serve.py",
+    "train_streaming.py",
+    "tune_thresholds.py",
+]
+
+
+def _utcnow() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """
+    Rows of `-X importtime` output ("import time: self [us] | cumulative | imported package"),
+    in completion order. depth is the nesting level (0 = imported by the profiled statement).
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cum_us, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip())) // 2 - 1
+        rows.append({
+            "module": name.strip(),
+            "depth": max(depth, 0),
+            "self_ms": int(self_us) / 1000.0,
+            "cumulative_ms": int(cum_us) / 1000.0,
+        })
+    return rows
+
+
+def import_profile(module: str, *, top: int) -> Dict[str, Any]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    )
+    rows = parse_importtime(proc.stderr)
+    target = next((r for r in reversed(rows) if r["module"] == module), None)
+
+    by_package: Dict[str, float] = {}
+    for r in rows:
+        pkg = r["module"].split(".")[0]
+        by_package[pkg] = by_package.get(pkg, 0.0) + r["self_ms"]
+
+    return {
+        "module": module,
+        "total_ms": target["cumulative_ms"] if target else sum(r["self_ms"] for r in rows),
+        "n_modules": len(rows),
+        "top_cumulative": sorted(rows, key=lambda r: r["cumulative_ms"], reverse=True)[:top],
+        "by_package_ms": dict(sorted(by_package.items(), key=lambda kv: kv[1], reverse=True)[:top]),
+    }
+
+
+def _serving_phases(bundle_root: Path, n_requests: int) -> Dict[str, Any]:
+    """Runs in the child interpreter (--child); prints one JSON object."""
+    t0 = time.perf_counter()
+    from readmission_risk_monitor.serving import app as app_module
+    import_s = time.perf_counter() - t0
+    imported = {m: m in sys.modules for m in ("pandas", "sklearn", "pyarrow", "lightgbm")}
+
+    t0 = time.perf_counter()
+    app_module.preload_bundle(bundle_root)
+    bundle_load_s = time.perf_counter() - t0
+
+    from fastapi.testclient import TestClient
+
+    features = {c: None for c in app_module.FEATURE_COLUMNS}
+    t0 = time.perf_counter()
+    with TestClient(app_module.app) as client:
+        startup_s = time.perf_counter() - t0
+
+        latencies = []
+        for i in range(n_requests + 1):
+            t0 = time.perf_counter()
+            client.post("/predict", json={"request_id": f"cold-{i}", "features": features}).raise_for_status()
+            latencies.append(time.perf_counter() - t0)
+
+    return {
+        "import_app_ms": import_s * 1000.0,
+        "imported_by_app": imported,
+        "bundle_load_ms": bundle_load_s * 1000.0,
+        "startup_ms": startup_s * 1000.0,
+        "first_request_ms": latencies[0] * 1000.0,
+        "steady_request_p50_ms": statistics.median(latencies[1:]) * 1000.0,
+        "time_to_first_response_ms": (import_s + bundle_load_s + startup_s + latencies[0]) * 1000.0,
+    }
+
+
+def serving_profile(bundle_root: Path, *, n_requests: int) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {**os.environ, "RRM_AUDIT_DIR": str(Path(tmp) / "audit")}
+        proc = subprocess.run(
+            [sys.executable, __file__, "--child", "--bundle-root", str(bundle_root),
+             "--requests", str(n_requests)],
+            capture_output=True, text=True, check=True, env=env,
+        )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def script_help_profile(scripts: List[str]) -> Dict[str, float]:
+    out = {}
+    for name in scripts:
+        t0 = time.perf_counter()
+        subprocess.run([sys.executable, str(ROOT / "scripts" / name), "--help"],
+                       capture_output=True, check=True)
+        out[name] = (time.perf_counter() - t0) * 1000.0
+    return out
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--module", action="append", default=None,
+                   help=f"Module to import-profile (repeatable; default {APP_MODULE})")
+    p.add_argument("--top", type=int, default=15, help="Rows kept per import table")
+    p.add_argument("--bundle-root", type=Path, default=None, help="Overrides RRM_BUNDLE_DIR")
+    p.add_argument("--requests", type=int, default=20, help="Steady-state /predict calls after the first")
+    p.add_argument("--no-serving", action="store_true", help="Skip the serving phase timings")
+    p.add_argument("--no-scripts", action="store_true", help="Skip the script --help timings")
+    p.add_argument("--out", type=Path, default=SETTINGS.artifacts_dir / "startup_profile.json")
+    p.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    return p.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    bundle_root = args.bundle_root or Path(os.getenv("RRM_BUNDLE_DIR", str(SETTINGS.bundle_dir)))
+
+    if args.child:
+        print(json.dumps(_serving_phases(bundle_root, args.requests)))
+        return
+
+    payload: Dict[str, Any] = {
+        "created_utc": _utcnow(),
+        "python": sys.version.split()[0],
+        "cpu_count": os.cpu_count(),
+        "imports": [import_profile(m, top=args.top) for m in args.module or [APP_MODULE]],
+    }
+    for imp in payload["imports"]:
+        heaviest = ", ".join(f"{k} {v:.0f}ms" for k, v in list(imp["by_package_ms"].items())[:4])
+        print(f"[OK] import {imp['module']}: {imp['total_ms']:.0f} ms ({heaviest})")
+
+    if not args.no_serving:
+        serving = payload["serving"] = serving_profile(bundle_root, n_requests=args.requests)
+        print(f"[OK] serving: import {serving['import_app_ms']:.0f} ms, bundle load {serving['bundle_load_ms']:.0f} ms, "
+              f"startup {serving['startup_ms']:.0f} ms, first request {serving['first_request_ms']:.1f} ms, "
+              f"steady p50 {serving['steady_request_p50_ms']:.1f} ms")
+
+    if not args.no_scripts:
+        payload["script_help_ms"] = script_help_profile(HELP_SCRIPTS)
+        slowest = max(payload["script_help_ms"].items(), key=lambda kv: kv[1])
+        print(f"[OK] script --help: slowest {slowest[0]} {slowest[1]:.0f} ms")
+
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.out.write_text(json.dumps(payload, indent=2))
+    print(f"[OK] Wrote startup profile: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
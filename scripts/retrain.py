@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from readmission_risk_monitor.config import SETTINGS
+
+
+def _utcnow() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        description="Warm-start the promoted bundle on newly ingested encounters and write a new version."
+    )
+    p.add_argument("--new-data", type=Path, required=True,
+                   help="Parquet file (or directory) of newly ingested, labelled encounters")
+    p.add_argument("--holdout-frac", type=float, default=0.2,
+                   help="Patient-level share of the new data held out to compare old vs new bundle")
+    p.add_argument("--max-iter", type=int, default=50, help="LogisticRegression warm-start iterations")
+    p.add_argument("--extra-rounds", type=int, default=50, help="Extra LightGBM boosting rounds")
+    p.add_argument("--epochs", type=int, default=2, help="Extra SGD epochs (streaming bundles)")
+    p.add_argument("--bump", choices=["major", "minor", "patch"], default="patch")
+    p.add_argument("--bundle-root", type=Path, default=SETTINGS.bundle_dir)
+    p.add_argument("--no-promote", action="store_true",
+                   help="Write the new bundle without moving the latest pointer")
+    p.add_argument("--force", action="store_true",
+                   help="Promote even if holdout AUROC dropped versus the previous bundle")
+    args = p.parse_args()
+    if not 0.0 < args.holdout_frac < 1.0:
+        p.error(f"--holdout-frac must be between 0 and 1 (exclusive), got {args.holdout_frac}")
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+    if not args.new_data.exists():
+        raise FileNotFoundError(f"Missing new data: {args.new_data}")
+
+    # pandas/sklearn are imported only once there is work to do (keeps --help instant)
+    import pandas as pd
+
+    from readmission_risk_monitor.features.split import SplitConfig, patient_hash_split
+    from readmission_risk_monitor.modeling.bundle import (
+        merge_reference_stats,
+        next_model_version,
+        write_bundle,
+    )
+    from readmission_risk_monitor.modeling.evaluate import evaluate_binary_classifier
+    from readmission_risk_monitor.modeling.importance import grouped_permutation_importance
+    from readmission_risk_monitor.modeling.retrain import metric_delta, warm_start_retrain
+    from readmission_risk_monitor.modeling.thresholds import choose_tier_thresholds
+    from readmission_risk_monitor.serving.model_loader import load_latest_bundle
+
+    previous = load_latest_bundle(args.bundle_root)
+    prev_meta = previous.metadata
+    feature_spec = prev_meta["feature_spec"]
+    target_col = feature_spec["target_col"]
+
+    df = pd.read_parquet(args.new_data)
+
+    # Patient-level holdout of the new data: the comparison set neither model was fit on
+    cfg = SplitConfig(train_size=1.0 - args.holdout_frac, valid_size=args.holdout_frac, test_size=0.0)
+    split = patient_hash_split(df[feature_spec["patient_id_col"]], cfg)
+    fit_df, holdout_df = df[split == "train"], df[split == "valid"]
+    n_classes = holdout_df[target_col].nunique()
+    if n_classes < 2:
+        # AUROC (and so the old-vs-new comparison) is undefined on a single-class holdout
+        raise ValueError(
+            f"Holdout has {len(holdout_df)} rows and {n_classes} class(es); need both classes. "
+            "Use more new data or a larger --holdout-frac."
+        )
+
+    t0 = time.perf_counter()
+    result = warm_start_retrain(
+        previous.model,
+        fit_df,
+        feature_columns=previous.feature_columns,
+        feature_spec=feature_spec,
+        max_iter=args.max_iter,
+        extra_rounds=args.extra_rounds,
+        n_epochs=args.epochs,
+    )
+    fit_seconds = time.perf_counter() - t0
+
+    Xh, yh = holdout_df[previous.feature_columns], holdout_df[target_col]
+    prev_metrics = evaluate_binary_classifier(previous.model, Xh, yh)
+    new_metrics = evaluate_binary_classifier(result.pipeline, Xh, yh)
+    delta = metric_delta(prev_metrics, new_metrics)
+    # A warm start that does worse on the holdout is written but not promoted unless forced
+    regressed = delta.get("auroc", 0.0) < 0.0
+    promote = not args.no_promote and (not regressed or args.force)
+
+    policy = (prev_meta.get("tier_thresholds") or {}).get("policy", {})
+    tier_thresholds = choose_tier_thresholds(
+        yh,
+        result.pipeline.predict_proba(Xh)[:, 1],
+        high_capacity=policy.get("high_capacity", 0.10),
+        medium_capacity=policy.get("medium_capacity", 0.30),
+        source="retrain_holdout",
+    )
+
+    # Carry the parent's optional artifacts forward, rebuilt for the new model: compiled
+    # trees (fast serving path) and global importance (/explain/global, on the holdout)
+    global_importance = None
+    if previous.global_importance is not None:
+        global_importance = grouped_permutation_importance(
+            result.pipeline,
+            Xh,
+            yh,
+            feature_columns=result.feature_columns,
+            n_repeats=int(previous.global_importance.get("n_repeats", 5)),
+            random_state=int(previous.global_importance.get("random_state", 0)),
+        )
+
+    # The new model has seen the parent's reference data and the new rows, so the drift
+    # reference is the parent's stats with the new rows folded in (same histogram edges)
+    if previous.reference_stats is not None:
+        reference_stats = merge_reference_stats(
+            previous.reference_stats, fit_df, feature_columns=result.feature_columns
+        )
+    else:
+        reference_stats = None
+
+    prev_version = str(prev_meta.get("model_version", "unknown"))
+    model_version = next_model_version(args.bundle_root, bump=args.bump)
+    bundle_paths = write_bundle(
+        bundle_root=args.bundle_root,
+        model_version=model_version,
+        schema_version=str(prev_meta.get("schema_version", "1.0.0")),
+        pipeline=result.pipeline,
+        feature_columns=result.feature_columns,
+        feature_spec=result.feature_spec,
+        reference_df=fit_df[result.feature_columns],
+        reference_stats=reference_stats,
+        model_type=str(prev_meta.get("model_type", "unknown")),
+        tier_thresholds=tier_thresholds,
+        lineage={
+            "parent_version": prev_version,
+            "training_mode": "warm_start",
+            "new_rows": int(len(fit_df)),
+            "fit_seconds": fit_seconds,
+            "reference": "parent+new" if reference_stats is not None else "new",
+        },
+        promote=promote,
+        compile_trees=previous.compiled is not None,
+        global_importance=global_importance,
+    )
+
+    report = {
+        "created_utc": _utcnow(),
+        "previous_version": prev_version,
+        "model_version": model_version,
+        "promoted": promote,
+        "fit_seconds": fit_seconds,
+        "rows": {"fit": int(len(fit_df)), "holdout": int(len(holdout_df))},
+        "holdout": {"previous": prev_metrics, "current": new_metrics, "delta": delta},
+    }
+    SETTINGS.artifacts_dir.mkdir(parents=True, exist_ok=True)
+    report_path = SETTINGS.artifacts_dir / "retrain_report.json"
+    report_path.write_text(json.dumps(report, indent=2))
+
+    print(f"[OK] Warm-start fit in {fit_seconds:.2f}s on {len(fit_df)} new rows")
+    print("=== Holdout delta (current - previous) ===")
+    for k, v in delta.items():
+        print(f"{k:>14}: {prev_metrics[k]:.4f} -> {new_metrics[k]:.4f} ({v:+.4f})")
+    print(f"[OK] Bundle written: {bundle_paths.model_dir} (parent {prev_version})")
+    if regressed and not args.no_promote and not args.force:
+        print(f"[WARN] Holdout AUROC dropped ({delta['auroc']:+.4f}): not promoted; "
+              f"latest still points to {prev_version} (rerun with --force to promote)")
+    print(f"[OK] Wrote retrain report: {report_path}")
+
+
+if __name__ == "__main__":
+    main()
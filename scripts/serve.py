@@ -1,11 +1,76 @@
 from __future__ import annotations
 
-import uvicorn
+import argparse
+import os
+import tempfile
+from pathlib import Path
+
+APP_PATH = "readmission_risk_monitor.serving.app:app"
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Run the scoring API.")
+    p.add_argument("--mode", choices=["dev", "prod"], default="dev",
+                   help="dev: single process with auto-reload; prod: pre-forked workers")
+    p.add_argument("--workers", type=int, default=None,
+                   help="prod mode worker processes (default: available CPUs)")
+    p.add_argument("--blas-threads", type=int, default=None,
+                   help="BLAS/OpenMP threads per worker (overrides RRM_BLAS_THREADS, default 1)")
+    p.add_argument("--scoring-threads", type=int, default=None,
+                   help="Scoring threads per worker (overrides RRM_SCORING_THREADS)")
+    p.add_argument("--host", default="0.0.0.0")
+    p.add_argument("--port", type=int, default=8000)
+    p.add_argument("--bundle-root", type=Path, default=None, help="Overrides RRM_BUNDLE_DIR")
+    p.add_argument("--metrics-dir", type=Path, default=None,
+                   help="PROMETHEUS_MULTIPROC_DIR for prod mode (default: a fresh temp dir)")
+    p.add_argument("--log-level", default="info")
+    return p.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if args.bundle_root is not None:
+        os.environ["RRM_BUNDLE_DIR"] = str(args.bundle_root)
+    if args.blas_threads is not None:
+        os.environ["RRM_BLAS_THREADS"] = str(args.blas_threads)
+    if args.scoring_threads is not None:
+        os.environ["RRM_SCORING_THREADS"] = str(args.scoring_threads)
+
+    # Thread limits go into the environment before NumPy/LightGBM load, so their pools
+    # start at the right size; each worker's ResourceConfig splits the CPUs by RRM_WORKERS
+    from readmission_risk_monitor.runtime import (
+        ResourceConfig,
+        available_cpus,
+        limit_native_threads,
+    )
+
+    workers = 1 if args.mode == "dev" else (args.workers or available_cpus())
+    os.environ["RRM_WORKERS"] = str(workers)
+    limit_native_threads(ResourceConfig.from_env().blas_threads)
+
+    if args.mode == "dev":
+        import uvicorn
+
+        uvicorn.run(APP_PATH, host=args.host, port=args.port, reload=True, log_level=args.log_level)
+        return
+
+    # The multiprocess metrics dir has to exist before anything imports prometheus_client
+    from readmission_risk_monitor.serving.prefork import prepare_multiprocess_dir, serve_prefork
+
+    metrics_dir = args.metrics_dir or Path(tempfile.gettempdir()) / f"rrm-metrics-{args.port}"
+    prepare_multiprocess_dir(metrics_dir)
+
+    from readmission_risk_monitor.serving import app as app_module
+
+    serve_prefork(
+        app_path=APP_PATH,
+        host=args.host,
+        port=args.port,
+        workers=workers,
+        preload=app_module.preload_bundle,
+        log_level=args.log_level,
+    )
+
 
 if __name__ == "__main__":
-    uvicorn.run(
-        "readmission_risk_monitor.serving.app:app",
-        host = "0.0.0.0",
-        port=8000,
-        reload=True,
-    )
\ No newline at end of file
+    main()
@@ -7,9 +7,12 @@ import pandas as pd
 
 from readmission_risk_monitor.config import SETTINGS
 from readmission_risk_monitor.features.split import SplitConfig, group_split
-from readmission_risk_monitor.modeling.bundle import write_bundle
+from readmission_risk_monitor.modeling.bundle import next_model_version, write_bundle
 from readmission_risk_monitor.modeling.evaluate import evaluate_binary_classifier
+from readmission_risk_monitor.modeling.importance import grouped_permutation_importance
+from readmission_risk_monitor.modeling.thresholds import choose_tier_thresholds
 from readmission_risk_monitor.modeling.train import train_baseline_logreg, try_train_lightgbm
+from readmission_risk_monitor.runtime import ResourceConfig, limit_native_threads
 from readmission_risk_monitor.features.build import FeatureSpec, build_xy
 
 
@@ -18,6 +21,11 @@ def _utcnow() -> str:
 
 
 def main() -> None:
+    # CPU budget for this job (RRM_TRAIN_CPUS); BLAS/OpenMP and LightGBM stay within it
+    resources = ResourceConfig.from_env()
+    limit_native_threads(resources.train_cpus)
+    print(f"[OK] Training CPU budget: {resources.train_cpus} of {resources.cpus}")
+
     table_path = SETTINGS.data_processed_dir / SETTINGS.processed_table
     if not table_path.exists():
         raise FileNotFoundError(
@@ -62,6 +70,7 @@ def main() -> None:
         patient_id_col=SETTINGS.patient_id_col,
         record_id_col=SETTINGS.record_id_col,
         random_state=cfg.random_state,
+        n_jobs=resources.train_cpus,
     )
 
     advanced_valid = None
@@ -76,7 +85,7 @@ def main() -> None:
     SETTINGS.artifacts_dir.mkdir(parents=True, exist_ok=True)
     eval_path = SETTINGS.artifacts_dir / "latest_eval.json"
 
-    model_version = "0.1.0"
+    model_version = next_model_version(SETTINGS.bundle_dir)
     schema_version = "1.0.0"
 
     payload = {
@@ -111,6 +120,32 @@ def main() -> None:
     eval_path.write_text(json.dumps(payload, indent=2))
     print(f"[OK] Wrote evaluation artifact: {eval_path}")
 
+    # Tier cut-points sized to care-team capacity on the validation split
+    tier_thresholds = choose_tier_thresholds(
+        yv,
+        baseline.pipeline.predict_proba(Xv)[:, 1],
+        high_capacity=0.10,
+        medium_capacity=0.30,
+        source="valid",
+    )
+    print(
+        f"[OK] Tier thresholds: high>={tier_thresholds['high']:.4f} "
+        f"medium>={tier_thresholds['medium']:.4f}"
+    )
+
+    # Global explanation: grouped permutation importance of the bundled model on the validation split
+    global_importance = grouped_permutation_importance(
+        baseline.pipeline,
+        Xv,
+        yv,
+        feature_columns=baseline.feature_columns,
+        n_repeats=5,
+        random_state=cfg.random_state,
+        n_workers=resources.train_cpus,
+    )
+    top = ", ".join(f"{f['feature']} ({f['importance_mean']:.4f})" for f in global_importance["features"][:5])
+    print(f"[OK] Permutation importance in {global_importance['seconds']:.1f}s; top drivers: {top}")
+
     # Bundle (baseline as latest)
     SETTINGS.bundle_dir.mkdir(parents=True, exist_ok=True)
 
@@ -123,6 +158,8 @@ def main() -> None:
         feature_spec=baseline.feature_spec,
         reference_df=train_df[baseline.feature_columns],
         model_type="logistic_regression",
+        tier_thresholds=tier_thresholds,
+        global_importance=global_importance,
     )
     print(f"[OK] Bundle written: {bundle_paths.model_dir}")
     print(f"[OK] Latest pointer: {bundle_paths.latest_ptr}")
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import argparse
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+from readmission_risk_monitor.config import SETTINGS
+
+
+def _utcnow() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        description="Out-of-core baseline training: streams parquet batches into SGD partial_fit."
+    )
+    p.add_argument("--data", type=Path, default=SETTINGS.data_processed_dir / SETTINGS.processed_table,
+                   help="Parquet file or directory of parquet files")
+    p.add_argument("--batch-size", type=int, default=50_000)
+    p.add_argument("--epochs", type=int, default=3)
+    p.add_argument("--max-categories", type=int, default=None,
+                   help="Cap the frozen one-hot vocabulary per categorical column")
+    p.add_argument("--model-version", default=None,
+                   help="Bundle version (default: next patch version under --bundle-root)")
+    p.add_argument("--bundle-root", type=Path, default=SETTINGS.bundle_dir)
+    return p.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if not args.data.exists():
+        raise FileNotFoundError(f"Missing training data: {args.data}. Run scripts/ingest.py first.")
+
+    from readmission_risk_monitor.features.build import FeatureSpec
+    from readmission_risk_monitor.features.split import SplitConfig
+    from readmission_risk_monitor.modeling.bundle import next_model_version, write_bundle
+    from readmission_risk_monitor.modeling.evaluate import binary_metrics
+    from readmission_risk_monitor.modeling.streaming import (
+        reservoir_sample,
+        stream_scores,
+        train_streaming_sgd,
+    )
+    from readmission_risk_monitor.modeling.thresholds import choose_tier_thresholds
+
+    cfg = SplitConfig(train_size=0.7, valid_size=0.15, test_size=0.15, random_state=42)
+    spec = FeatureSpec(
+        target_col=SETTINGS.target_col,
+        patient_id_col=SETTINGS.patient_id_col,
+        record_id_col=SETTINGS.record_id_col,
+    )
+
+    result = train_streaming_sgd(
+        args.data,
+        target_col=SETTINGS.target_col,
+        patient_id_col=SETTINGS.patient_id_col,
+        record_id_col=SETTINGS.record_id_col,
+        split_cfg=cfg,
+        batch_size=args.batch_size,
+        n_epochs=args.epochs,
+        max_categories=args.max_categories,
+        random_state=cfg.random_state,
+    )
+
+    scores = {}
+    for split in ("valid", "test"):
+        scores[split] = stream_scores(
+            result.pipeline,
+            args.data,
+            feature_columns=result.feature_columns,
+            spec=spec,
+            split_cfg=cfg,
+            split=split,
+            batch_size=args.batch_size,
+        )
+
+    model_version = args.model_version or next_model_version(args.bundle_root)
+    schema_version = "1.0.0"
+    payload = {
+        "created_utc": _utcnow(),
+        "model_version": model_version,
+        "schema_version": schema_version,
+        "split": {"strategy": "patient_hash", "random_state": cfg.random_state},
+        "baseline": {
+            "model_type": "sgd_logistic_streaming",
+            "valid": binary_metrics(*scores["valid"]),
+            "test": binary_metrics(*scores["test"]),
+        },
+    }
+    SETTINGS.artifacts_dir.mkdir(parents=True, exist_ok=True)
+    eval_path = SETTINGS.artifacts_dir / "latest_eval_streaming.json"
+    eval_path.write_text(json.dumps(payload, indent=2))
+    print(f"[OK] Wrote evaluation artifact: {eval_path}")
+
+    tier_thresholds = choose_tier_thresholds(*scores["valid"], source="valid")
+
+    # Reference stats come from a bounded reservoir sample, not the full train split
+    reference_df = reservoir_sample(
+        args.data,
+        columns=result.feature_columns,
+        spec=spec,
+        split_cfg=cfg,
+        batch_size=args.batch_size,
+    )
+
+    args.bundle_root.mkdir(parents=True, exist_ok=True)
+    bundle_paths = write_bundle(
+        bundle_root=args.bundle_root,
+        model_version=model_version,
+        schema_version=schema_version,
+        pipeline=result.pipeline,
+        feature_columns=result.feature_columns,
+        feature_spec=result.feature_spec,
+        reference_df=reference_df,
+        model_type="sgd_logistic_streaming",
+        tier_thresholds=tier_thresholds,
+    )
+    print(f"[OK] Bundle written: {bundle_paths.model_dir}")
+    print(f"[OK] Latest pointer: {bundle_paths.latest_ptr}")
+
+
+if __name__ == "__main__":
+    main()
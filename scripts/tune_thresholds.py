@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import argparse
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+from readmission_risk_monitor.config import SETTINGS
+
+
+def _utcnow() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        description="Re-tune risk tier cut-points of the active bundle from care-team capacity."
+    )
+    p.add_argument("--high-capacity", type=float, default=0.10,
+                   help="Share of patients the team can follow up as HIGH risk (default 0.10)")
+    p.add_argument("--medium-capacity", type=float, default=0.30,
+                   help="Cumulative share flagged MEDIUM or above (default 0.30)")
+    p.add_argument("--data", type=Path, default=SETTINGS.data_processed_dir / SETTINGS.processed_table,
+                   help="Processed table used to rebuild the validation split")
+    p.add_argument("--bundle-root", type=Path, default=SETTINGS.bundle_dir)
+    p.add_argument("--dry-run", action="store_true", help="Print thresholds without touching the bundle")
+    return p.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if not args.data.exists():
+        raise FileNotFoundError(f"Missing processed table: {args.data}. Run scripts/ingest.py first.")
+
+    import pandas as pd
+
+    from readmission_risk_monitor.features.build import FeatureSpec, build_xy
+    from readmission_risk_monitor.features.split import SplitConfig, group_split
+    from readmission_risk_monitor.modeling.bundle import update_bundle_metadata
+    from readmission_risk_monitor.modeling.thresholds import (
+        choose_tier_thresholds,
+        curve_to_records,
+        threshold_curve,
+    )
+    from readmission_risk_monitor.serving.model_loader import load_latest_bundle
+
+    bundle = load_latest_bundle(args.bundle_root)
+    df = pd.read_parquet(args.data)
+
+    cfg = SplitConfig(train_size=0.7, valid_size=0.15, test_size=0.15, random_state=42)
+    _, valid_df, _ = group_split(
+        df,
+        group_col=SETTINGS.patient_id_col,
+        target_col=SETTINGS.target_col,
+        cfg=cfg,
+    )
+
+    spec = FeatureSpec(
+        target_col=SETTINGS.target_col,
+        patient_id_col=SETTINGS.patient_id_col,
+        record_id_col=SETTINGS.record_id_col,
+    )
+    Xv, yv, _, _ = build_xy(valid_df, spec)
+    scores = bundle.model.predict_proba(Xv[bundle.feature_columns])[:, 1]
+
+    tiers = choose_tier_thresholds(
+        yv,
+        scores,
+        high_capacity=args.high_capacity,
+        medium_capacity=args.medium_capacity,
+        source="valid",
+    )
+    print(f"high   >= {tiers['high']:.4f}  {tiers['operating_points']['high']}")
+    print(f"medium >= {tiers['medium']:.4f}  {tiers['operating_points']['medium']}")
+
+    SETTINGS.artifacts_dir.mkdir(parents=True, exist_ok=True)
+    curve_path = SETTINGS.artifacts_dir / "threshold_curve.json"
+    curve_path.write_text(json.dumps({
+        "created_utc": _utcnow(),
+        "model_version": bundle.metadata.get("model_version"),
+        "tier_thresholds": tiers,
+        "curve": curve_to_records(threshold_curve(yv, scores)),
+    }, indent=2))
+    print(f"[OK] Wrote threshold curve: {curve_path}")
+
+    if args.dry_run:
+        return
+
+    update_bundle_metadata(bundle.bundle_dir, {"tier_thresholds": tiers})
+    print(f"[OK] Updated tier thresholds in {bundle.bundle_dir / 'metadata.json'}")
+
+
+if __name__ == "__main__":
+    main()
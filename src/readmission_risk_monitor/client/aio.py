@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import httpx
+
+from readmission_risk_monitor.client.base import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_TIMEOUT_S,
+    AxisInput,
+    PatientInput,
+    RetryPolicy,
+    RiskClientError,
+    batch_body,
+    batch_predictions,
+    check_batch_size,
+    chunked,
+    pool_limits,
+    raise_for_response,
+    sweep_body,
+    to_request,
+)
+from readmission_risk_monitor.serving.schemas import (
+    PRIORITY_HEADER,
+    FeatureSchemaResponse,
+    GlobalImportanceResponse,
+    HealthResponse,
+    PredictRequest,
+    PredictResponse,
+    SweepResponse,
+)
+
+
+class AsyncRiskClient:
+    """
+    asyncio client for the scoring API.
+
+    - one pooled keep-alive httpx.AsyncClient; at most `max_concurrency` requests in flight
+    - predict_many() splits patients into concurrent /predict/batch calls
+    - with batch_window_ms > 0, concurrent predict() calls are coalesced: requests arriving
+      within the window (or until `batch_size` are waiting) go out as one /predict/batch
+      and each caller gets its own typed response back
+    - transient failures are retried with jittered backoff (RetryPolicy)
+    - priority="bulk" marks batch jobs so the server queues them behind interactive traffic
+
+        async with AsyncRiskClient(url, batch_window_ms=5) as client:
+            results = await asyncio.gather(*(client.predict(f) for f in patients))
+    """
+
+    def __init__(
+            self,
+            base_url: str,
+            *,
+            timeout: float = DEFAULT_TIMEOUT_S,
+            batch_size: int = DEFAULT_BATCH_SIZE,
+            max_concurrency: int = 8,
+            batch_window_ms: float = 0.0,
+            retry: Optional[RetryPolicy] = None,
+            priority: Optional[str] = None,
+            transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.batch_size = check_batch_size(batch_size)
+        self.batch_window_s = batch_window_ms / 1000.0
+        self.retry = retry or RetryPolicy()
+        self._headers = {PRIORITY_HEADER: priority} if priority else None
+        self._http = httpx.AsyncClient(
+            base_url=base_url.rstrip("/"),
+            timeout=timeout,
+            limits=pool_limits(max_concurrency),
+            transport=transport,
+        )
+        self._sem = asyncio.Semaphore(max_concurrency)
+        self._pending: List[Tuple[PredictRequest, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._inflight: set = set()
+
+    async def __aenter__(self) -> AsyncRiskClient:
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        self._flush()
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+        await self._http.aclose()
+
+    async def _request(self, method: str, path: str, json: Optional[Dict[str, Any]] = None) -> Any:
+        attempt = 0
+        while True:
+            try:
+                async with self._sem:
+                    resp = await self._http.request(method, path, json=json, headers=self._headers)
+            except httpx.TransportError as exc:
+                if not self.retry.should_retry(attempt, None):
+                    raise RiskClientError(f"{method} {path} failed: {exc}") from exc
+                await asyncio.sleep(self.retry.delay(attempt))
+            else:
+                if resp.is_success or not self.retry.should_retry(attempt, resp.status_code):
+                    raise_for_response(resp)
+                    return resp.json()
+                await asyncio.sleep(self.retry.delay(attempt, resp))
+            attempt += 1
+
+    async def health(self) -> HealthResponse:
+        return HealthResponse.model_validate(await self._request("GET", "/health"))
+
+    async def feature_schema(self) -> FeatureSchemaResponse:
+        """Feature names, types and allowed codes the served bundle accepts."""
+        return FeatureSchemaResponse.model_validate(await self._request("GET", "/schema"))
+
+    async def global_importance(self) -> GlobalImportanceResponse:
+        """Per-feature permutation importance stored with the served bundle."""
+        return GlobalImportanceResponse.model_validate(await self._request("GET", "/explain/global"))
+
+    async def sweep(self, features: Mapping[str, Any], axes: Sequence[AxisInput]) -> SweepResponse:
+        """What-if risk curve: the patient re-scored over the grid of `axes` (/predict/sweep)."""
+        return SweepResponse.model_validate(await self._request("POST", "/predict/sweep", json=sweep_body(features, axes)))
+
+    async def _send_batch(self, requests: Sequence[PredictRequest]) -> List[PredictResponse]:
+        data = await self._request("POST", "/predict/batch", json=batch_body(requests))
+        return batch_predictions(requests, data)
+
+    async def predict_many(self, patients: Sequence[PatientInput]) -> List[PredictResponse]:
+        """Score many patients through concurrent /predict/batch calls; input order is kept."""
+        requests = [to_request(p) for p in patients]
+        results = await asyncio.gather(*(self._send_batch(c) for c in chunked(requests, self.batch_size)))
+        return [p for chunk in results for p in chunk]
+
+    async def predict(self, features: PatientInput, *, encounter_id: Optional[str] = None) -> PredictResponse:
+        req = to_request(features, encounter_id=encounter_id)
+        if self.batch_window_s <= 0:
+            data = await self._request("POST", "/predict", json=req.model_dump(exclude_none=True))
+            return PredictResponse.model_validate(data)
+
+        loop = asyncio.get_running_loop()
+        fut: asyncio.Future = loop.create_future()
+        self._pending.append((req, fut))
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window_s, self._flush)
+        return await fut
+
+    # --- coalescing ---------------------------------------------------------------
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        task = asyncio.ensure_future(self._dispatch(pending))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, pending: List[Tuple[PredictRequest, asyncio.Future]]) -> None:
+        try:
+            predictions = await self._send_batch([req for req, _ in pending])
+            for (_, fut), pred in zip(pending, predictions, strict=True):
+                if not fut.done():
+                    fut.set_result(pred)
+        except Exception as exc:
+            # Every caller still waiting gets the error; none is left hanging
+            for _, fut in pending:
+                if not fut.done():
+                    fut.set_exception(exc)
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import random
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Union
+
+import httpx
+
+from readmission_risk_monitor.serving.schemas import (
+    MAX_BATCH_ITEMS,
+    PredictBatchResponse,
+    PredictRequest,
+    PredictResponse,
+    SweepAxis,
+    SweepRequest,
+)
+
+# A patient to score: a bare feature dict, or a full PredictRequest (own ids)
+PatientInput = Union[Mapping[str, Any], PredictRequest]
+# A what-if axis: SweepAxis or its dict form, e.g. {"feature": "NUM_MEDICATIONS", "start": 1, "stop": 40}
+AxisInput = Union[Mapping[str, Any], SweepAxis]
+
+DEFAULT_TIMEOUT_S = 30.0
+DEFAULT_BATCH_SIZE = 500
+
+
+class RiskClientError(Exception):
+    """Non-retryable (or retries exhausted) API error; carries the HTTP status and body."""
+
+    def __init__(self, message: str, *, status_code: Optional[int] = None, body: Any = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.body = body
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter: attempt k sleeps uniform(0, min(cap, base * 2**k)),
+    or the server's Retry-After when it sends one. Only idempotent-safe failures are
+    retried: connection/timeout errors and the statuses below.
+    """
+    max_attempts: int = 3
+    backoff_base_s: float = 0.1
+    backoff_max_s: float = 2.0
+    retry_statuses: tuple = (429, 502, 503, 504)
+
+    def should_retry(self, attempt: int, status_code: Optional[int]) -> bool:
+        if attempt + 1 >= self.max_attempts:
+            return False
+        return status_code is None or status_code in self.retry_statuses
+
+    def delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    return min(float(retry_after), self.backoff_max_s)
+                except ValueError:
+                    pass
+        return random.uniform(0.0, min(self.backoff_max_s, self.backoff_base_s * 2 ** attempt))
+
+
+def new_request_id() -> str:
+    return uuid.uuid4().hex
+
+
+def to_request(patient: PatientInput, *, encounter_id: Optional[str] = None) -> PredictRequest:
+    if isinstance(patient, PredictRequest):
+        return patient
+    return PredictRequest(request_id=new_request_id(), features=dict(patient), encounter_id=encounter_id)
+
+
+def sweep_body(features: Mapping[str, Any], axes: Sequence[AxisInput]) -> Dict[str, Any]:
+    req = SweepRequest(
+        request_id=new_request_id(),
+        features=dict(features),
+        axes=[a if isinstance(a, SweepAxis) else SweepAxis(**a) for a in axes],
+    )
+    return req.model_dump(exclude_none=True)
+
+
+def chunked(items: Sequence[Any], size: int) -> Iterator[Sequence[Any]]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def batch_body(requests: Sequence[PredictRequest]) -> Dict[str, List[Dict[str, Any]]]:
+    return {"items": [r.model_dump(exclude_none=True) for r in requests]}
+
+
+def batch_predictions(requests: Sequence[PredictRequest], data: Any) -> List[PredictResponse]:
+    """Predictions of a /predict/batch response, one per request (a short reply is an error)."""
+    predictions = PredictBatchResponse.model_validate(data).predictions
+    if len(predictions) != len(requests):
+        raise RiskClientError(
+            f"/predict/batch returned {len(predictions)} predictions for {len(requests)} requests",
+            body=data,
+        )
+    return predictions
+
+
+def check_batch_size(batch_size: int) -> int:
+    if not 1 <= batch_size <= MAX_BATCH_ITEMS:
+        raise ValueError(f"batch_size must be in [1, {MAX_BATCH_ITEMS}], got {batch_size}")
+    return batch_size
+
+
+def raise_for_response(resp: httpx.Response) -> None:
+    if resp.is_success:
+        return
+    try:
+        body = resp.json()
+    except ValueError:
+        body = resp.text
+    raise RiskClientError(
+        f"{resp.request.method} {resp.request.url.path} failed with {resp.status_code}",
+        status_code=resp.status_code,
+        body=body,
+    )
+
+
+def pool_limits(max_connections: int) -> httpx.Limits:
+    return httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+import httpx
+
+from readmission_risk_monitor.client.base import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_TIMEOUT_S,
+    AxisInput,
+    PatientInput,
+    RetryPolicy,
+    RiskClientError,
+    batch_body,
+    batch_predictions,
+    check_batch_size,
+    chunked,
+    pool_limits,
+    raise_for_response,
+    sweep_body,
+    to_request,
+)
+from readmission_risk_monitor.serving.schemas import (
+    PRIORITY_HEADER,
+    FeatureSchemaResponse,
+    GlobalImportanceResponse,
+    HealthResponse,
+    PredictResponse,
+    SweepResponse,
+)
+
+
+class RiskClient:
+    """
+    Blocking client for the scoring API.
+
+    One pooled keep-alive httpx.Client per instance (thread-safe; reuse it rather than
+    creating one per call). predict_many() splits patients into /predict/batch calls of
+    `batch_size` and runs up to `max_concurrency` of them at once, preserving order.
+    Transient failures are retried per `retry` (a shed 503 waits out its Retry-After).
+    priority="bulk" marks batch jobs so the server queues them behind interactive traffic.
+
+        with RiskClient("http://127.0.0.1:8000") as client:
+            client.health().model_version
+            client.predict_many(ward_features)
+    """
+
+    def __init__(
+            self,
+            base_url: str,
+            *,
+            timeout: float = DEFAULT_TIMEOUT_S,
+            batch_size: int = DEFAULT_BATCH_SIZE,
+            max_concurrency: int = 4,
+            retry: Optional[RetryPolicy] = None,
+            priority: Optional[str] = None,
+            http_client: Optional[httpx.Client] = None,
+    ):
+        self.batch_size = check_batch_size(batch_size)
+        self.max_concurrency = max_concurrency
+        self.retry = retry or RetryPolicy()
+        self._headers = {PRIORITY_HEADER: priority} if priority else None
+        self._owns_client = http_client is None
+        self._http = http_client or httpx.Client(
+            base_url=base_url.rstrip("/"),
+            timeout=timeout,
+            limits=pool_limits(max_concurrency),
+        )
+
+    def __enter__(self) -> RiskClient:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._owns_client:
+            self._http.close()
+
+    def _request(self, method: str, path: str, json: Optional[Dict[str, Any]] = None) -> Any:
+        attempt = 0
+        while True:
+            try:
+                resp = self._http.request(method, path, json=json, headers=self._headers)
+            except httpx.TransportError as exc:
+                if not self.retry.should_retry(attempt, None):
+                    raise RiskClientError(f"{method} {path} failed: {exc}") from exc
+                time.sleep(self.retry.delay(attempt))
+            else:
+                if resp.is_success or not self.retry.should_retry(attempt, resp.status_code):
+                    raise_for_response(resp)
+                    return resp.json()
+                time.sleep(self.retry.delay(attempt, resp))
+            attempt += 1
+
+    def health(self) -> HealthResponse:
+        return HealthResponse.model_validate(self._request("GET", "/health"))
+
+    def feature_schema(self) -> FeatureSchemaResponse:
+        """Feature names, types and allowed codes the served bundle accepts."""
+        return FeatureSchemaResponse.model_validate(self._request("GET", "/schema"))
+
+    def global_importance(self) -> GlobalImportanceResponse:
+        """Per-feature permutation importance stored with the served bundle."""
+        return GlobalImportanceResponse.model_validate(self._request("GET", "/explain/global"))
+
+    def sweep(self, features: Mapping[str, Any], axes: Sequence[AxisInput]) -> SweepResponse:
+        """What-if risk curve: the patient re-scored over the grid of `axes` (/predict/sweep)."""
+        return SweepResponse.model_validate(self._request("POST", "/predict/sweep", json=sweep_body(features, axes)))
+
+    def predict(self, features: PatientInput, *, encounter_id: Optional[str] = None) -> PredictResponse:
+        req = to_request(features, encounter_id=encounter_id)
+        body = req.model_dump(exclude_none=True)
+        return PredictResponse.model_validate(self._request("POST", "/predict", json=body))
+
+    def predict_many(self, patients: Sequence[PatientInput]) -> List[PredictResponse]:
+        """Score many patients through /predict/batch; results follow the input order."""
+        requests = [to_request(p) for p in patients]
+        chunks = list(chunked(requests, self.batch_size))
+
+        def send(chunk) -> List[PredictResponse]:
+            data = self._request("POST", "/predict/batch", json=batch_body(chunk))
+            return batch_predictions(chunk, data)
+
+        if len(chunks) <= 1 or self.max_concurrency <= 1:
+            results = [send(c) for c in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(chunks))) as pool:
+                results = list(pool.map(send, chunks))
+        return [p for chunk in results for p in chunk]
@@ -0,0 +1,344 @@
+from __future__ import annotations
+
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from readmission_risk_monitor.data.contract import DataContract, diabetes_readmission_contract
+
+MISSING_TOKEN = "__MISSING__"
+
+# Share of non-positive encounters readmitted after 30 days (">30") in the UCI extract
+LATE_READMIT_SHARE = 0.40
+
+
+@dataclass(frozen=True)
+class SyntheticSpec:
+    """
+    Size and shape of a synthetic extract.
+
+    encounters_per_patient is the mean number of encounters per PATIENT_NBR (geometric,
+    so most patients have one and a few have many; the UCI extract is ~1.4). signal
+    scales how strongly the numeric features drive the label (0 = pure noise).
+    Patients never span row groups, so patient-level splits stay leak-free.
+    """
+    n_rows: int
+    positive_rate: float = 0.11
+    encounters_per_patient: float = 1.4
+    signal: float = 1.0
+    seed: int = 0
+    id_offset: int = 0
+    row_group_size: int = 100_000
+    rows_per_file: int = 1_000_000
+    tail_cardinality: int = 200
+
+
+@dataclass(frozen=True)
+class SyntheticPlan:
+    """Per-column samplers derived once from reference stats + contract; shipped to workers."""
+    primary_key: str
+    patient_key: str
+    target: str
+    outcome_col: Optional[str]
+    columns: Dict[str, Dict[str, Any]]
+    label_weights: Dict[str, float]
+
+
+def _numeric_plan(ref: Dict[str, Any]) -> Dict[str, Any]:
+    lo, hi = ref.get("min"), ref.get("max")
+    mean, std = ref.get("mean"), ref.get("std")
+    integer = lo is not None and hi is not None and float(lo).is_integer() and float(hi).is_integer()
+    plan: Dict[str, Any] = {
+        "type": "numeric",
+        "integer": integer,
+        "missing_rate": float(ref.get("missing_rate") or 0.0),
+        "mean": mean,
+        "std": std,
+        "min": lo,
+        "max": hi,
+        "bins": None,
+    }
+    hist = ref.get("histogram")
+    if not hist or lo is None or hi is None:
+        return plan
+
+    # Bin i holds edges[i-1] <= x < edges[i]; the outer bins are closed by min / max
+    edges = np.asarray(hist["edges"], dtype=float)
+    counts = np.asarray(hist["counts"], dtype=float)
+    lows = np.r_[lo, edges]
+    highs = np.r_[edges, hi + 1.0 if integer else hi]
+    if integer:
+        lows, highs = np.ceil(lows), np.maximum(np.ceil(highs), np.ceil(lows))
+    probs = counts / max(counts.sum(), 1.0)
+
+    # The open-ended top bin (long-tailed counts) decays geometrically instead of
+    # uniformly, with the decay chosen so the column keeps its reference mean
+    tail_mean = None
+    if mean is not None and probs[-1] > 0:
+        mids = (lows + highs - (1.0 if integer else 0.0)) / 2.0
+        rest = float((probs[:-1] * mids[:-1]).sum())
+        tail_mean = float(np.clip((mean - rest) / probs[-1], lows[-1], mids[-1]))
+    plan["bins"] = {"low": lows, "high": highs, "p": probs, "tail_mean": tail_mean}
+    return plan
+
+
+def _categorical_plan(
+        ref: Dict[str, Any],
+        *,
+        allowed: Optional[set],
+        ref_rows: Optional[int],
+        tail_cardinality: int,
+        name: str,
+) -> Dict[str, Any]:
+    top = {str(k): float(v) for k, v in ref.get("top_values", {}).items()}
+    values: List[Optional[str]] = []
+    weights: List[float] = []
+    for v, n in top.items():
+        if allowed is not None and v != MISSING_TOKEN and v not in allowed:
+            continue
+        values.append(None if v == MISSING_TOKEN else v)
+        weights.append(n)
+
+    # Reference mass outside the stored top values becomes a Zipf tail of rare codes,
+    # except where the contract pins the allowed codes
+    tail = max(float(ref_rows or 0) - sum(top.values()), 0.0)
+    if tail > 0 and allowed is None and tail_cardinality > 0:
+        zipf = 1.0 / np.arange(1, tail_cardinality + 1)
+        values += [f"{name}_RARE_{k}" for k in range(tail_cardinality)]
+        weights += (tail * zipf / zipf.sum()).tolist()
+
+    if not values:
+        values, weights = [None], [1.0]
+    p = np.asarray(weights, dtype=float)
+    return {"type": "categorical", "values": values, "p": p / p.sum()}
+
+
+def plan_from_reference(
+        reference_stats: Dict[str, Any],
+        *,
+        contract: Optional[DataContract] = None,
+        spec: Optional[SyntheticSpec] = None,
+) -> SyntheticPlan:
+    """
+    Column samplers from a bundle's reference_stats.json: numeric columns follow the
+    stored histogram (or a clipped normal from mean/std for older bundles), categorical
+    columns the stored top-value frequencies, both at the reference missing rate.
+    Contract allowed_values are enforced so every generated row passes validation.
+    """
+    contract = contract or diabetes_readmission_contract()
+    spec = spec or SyntheticSpec(n_rows=0)
+    rules = {r.name: r for r in contract.columns}
+    reserved = {contract.primary_key, contract.patient_key, contract.target}
+    outcome_col = "READMITTED" if "READMITTED" in rules else None
+
+    columns: Dict[str, Dict[str, Any]] = {}
+    for col, ref in reference_stats.get("columns", {}).items():
+        if col in reserved or col == outcome_col:
+            continue
+        if ref.get("type") == "numeric":
+            columns[col] = _numeric_plan(ref)
+        else:
+            rule = rules.get(col)
+            columns[col] = _categorical_plan(
+                ref,
+                allowed=set(rule.allowed_values) if rule is not None and rule.allowed_values else None,
+                ref_rows=reference_stats.get("n_rows"),
+                tail_cardinality=spec.tail_cardinality,
+                name=col,
+            )
+
+    # Fixed random direction over the standardized numeric features drives the label
+    numeric = [c for c, p in columns.items() if p["type"] == "numeric" and p["std"]]
+    w = np.random.default_rng(spec.seed).normal(size=len(numeric)) / math.sqrt(max(len(numeric), 1))
+    return SyntheticPlan(
+        primary_key=contract.primary_key,
+        patient_key=contract.patient_key,
+        target=contract.target,
+        outcome_col=outcome_col,
+        columns=columns,
+        label_weights=dict(zip(numeric, w.tolist(), strict=True)),
+    )
+
+
+def _sample_numeric(plan: Dict[str, Any], rng: np.random.Generator, n: int) -> np.ndarray:
+    bins = plan["bins"]
+    if bins is not None:
+        b = rng.choice(len(bins["p"]), size=n, p=bins["p"])
+        lo, hi = bins["low"][b], bins["high"][b]
+        x = lo + rng.random(n) * (hi - lo)
+        if plan["integer"]:
+            x = np.floor(x)
+        top = b == len(bins["p"]) - 1
+        tail_mean = bins["tail_mean"]
+        if tail_mean is not None and top.any():
+            base = bins["low"][-1]
+            if plan["integer"]:
+                x[top] = base + rng.geometric(1.0 / (tail_mean - base + 1.0), size=int(top.sum())) - 1
+            elif tail_mean > base:
+                x[top] = base + rng.exponential(tail_mean - base, size=int(top.sum()))
+    elif plan["mean"] is not None:
+        x = rng.normal(plan["mean"], plan["std"] or 0.0, size=n)
+        if plan["integer"]:
+            x = np.rint(x)
+    else:
+        x = np.full(n, np.nan)
+    if plan["min"] is not None:
+        x = np.clip(x, plan["min"], plan["max"])
+    return x
+
+
+def _calibrate_intercept(z: np.ndarray, rate: float) -> float:
+    """Intercept a with mean(sigmoid(a + z)) == rate (bisection; the mean is monotone in a)."""
+    lo, hi = -30.0, 30.0
+    for _ in range(60):
+        mid = (lo + hi) / 2.0
+        if np.mean(1.0 / (1.0 + np.exp(-(mid + z)))) < rate:
+            lo = mid
+        else:
+            hi = mid
+    return (lo + hi) / 2.0
+
+
+def generate_row_group(plan: SyntheticPlan, spec: SyntheticSpec, group: int, n: int) -> pa.Table:
+    """
+    Rows [group * row_group_size, + n) of the dataset. Seeded by (seed, group), so the
+    output does not depend on how row groups are spread over files or workers.
+    """
+    rng = np.random.default_rng([spec.seed, group])
+    start = group * spec.row_group_size
+
+    # Patient multiplicity: geometric encounter counts, encounters shuffled within the group
+    counts = rng.geometric(1.0 / max(spec.encounters_per_patient, 1.0), size=n)
+    n_patients = int(np.searchsorted(np.cumsum(counts), n)) + 1
+    local_patient = rng.permutation(np.repeat(np.arange(n_patients), counts[:n_patients])[:n])
+
+    arrays: Dict[str, pa.Array] = {
+        plan.primary_key: pa.array(spec.id_offset + start + np.arange(n, dtype=np.int64) + 1),
+        plan.patient_key: pa.array(spec.id_offset + start + local_patient.astype(np.int64) + 1),
+    }
+    z = np.zeros(n)
+    for col, cp in plan.columns.items():
+        if cp["type"] == "numeric":
+            x = _sample_numeric(cp, rng, n)
+            if col in plan.label_weights:
+                z += plan.label_weights[col] * (x - cp["mean"]) / cp["std"]
+            missing = np.isnan(x)
+            if cp["missing_rate"]:
+                missing |= rng.random(n) < cp["missing_rate"]
+            arrays[col] = pa.array(
+                np.nan_to_num(x).astype(np.int64) if cp["integer"] else x,
+                mask=missing,
+            )
+        else:
+            idx = rng.choice(len(cp["p"]), size=n, p=cp["p"])
+            arrays[col] = pa.array(cp["values"], type=pa.string()).take(pa.array(idx))
+
+    # Patients share a random effect, so repeat encounters carry correlated risk
+    z = spec.signal * (z + rng.normal(0.0, 0.5, size=n_patients)[local_patient])
+    p = 1.0 / (1.0 + np.exp(-(_calibrate_intercept(z, spec.positive_rate) + z)))
+    y = (rng.random(n) < p).astype(np.int64)
+
+    if plan.outcome_col is not None:
+        late = rng.random(n) < LATE_READMIT_SHARE
+        arrays[plan.outcome_col] = pa.array(np.where(y == 1, "<30", np.where(late, ">30", "NO")))
+    arrays[plan.target] = pa.array(y)
+    return pa.table(arrays)
+
+
+def generate_synthetic_frame(
+        reference_stats: Dict[str, Any],
+        spec: SyntheticSpec,
+        *,
+        contract: Optional[DataContract] = None,
+) -> pd.DataFrame:
+    """In-memory synthetic extract (tests, small benchmarks)."""
+    plan = plan_from_reference(reference_stats, contract=contract, spec=spec)
+    tables = [generate_row_group(plan, spec, g, n) for g, n in _row_groups(spec)]
+    return pa.concat_tables(tables).to_pandas() if tables else pd.DataFrame()
+
+
+def _row_groups(spec: SyntheticSpec) -> List[Tuple[int, int]]:
+    return [
+        (g, min(spec.row_group_size, spec.n_rows - g * spec.row_group_size))
+        for g in range(math.ceil(spec.n_rows / spec.row_group_size))
+    ]
+
+
+def _write_part(path: str, plan: SyntheticPlan, spec: SyntheticSpec, groups: List[Tuple[int, int]]) -> Dict[str, int]:
+    """Worker: stream the given row groups into one parquet file."""
+    n_rows = n_positive = 0
+    writer: Optional[pq.ParquetWriter] = None
+    try:
+        for g, n in groups:
+            table = generate_row_group(plan, spec, g, n)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table, row_group_size=n)
+            n_rows += n
+            n_positive += int(np.asarray(table.column(plan.target)).sum())
+    finally:
+        if writer is not None:
+            writer.close()
+    return {"n_rows": n_rows, "n_positive": n_positive}
+
+
+def write_synthetic_dataset(
+        out_dir: Path,
+        reference_stats: Dict[str, Any],
+        spec: SyntheticSpec,
+        *,
+        contract: Optional[DataContract] = None,
+        n_workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Write a synthetic extract as a directory of parquet files (part-00000.parquet, ...),
+    each `rows_per_file` rows in row groups of `row_group_size`. Files are generated in
+    parallel by `n_workers` processes, each streaming one row group at a time, so memory
+    is O(row_group_size x workers) regardless of n_rows. The directory reads as one
+    dataset (pyarrow.dataset / pd.read_parquet / training and drift scripts).
+    """
+    if spec.rows_per_file % spec.row_group_size:
+        raise ValueError("rows_per_file must be a multiple of row_group_size")
+    if not 0.0 < spec.positive_rate < 1.0:
+        raise ValueError(f"positive_rate must be in (0, 1), got {spec.positive_rate}")
+    out_dir = Path(out_dir)
+    if out_dir.exists() and any(out_dir.glob("*.parquet")):
+        raise FileExistsError(f"Output directory already holds parquet files: {out_dir}")
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    plan = plan_from_reference(reference_stats, contract=contract, spec=spec)
+    groups = _row_groups(spec)
+    per_file = spec.rows_per_file // spec.row_group_size
+    parts = [
+        (str(out_dir / f"part-{i:05d}.parquet"), groups[j:j + per_file])
+        for i, j in enumerate(range(0, len(groups), per_file))
+    ]
+
+    t0 = time.perf_counter()
+    n_workers = max(1, min(n_workers or os.cpu_count() or 1, len(parts)))
+    if n_workers == 1:
+        results = [_write_part(path, plan, spec, g) for path, g in parts]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            futures = [pool.submit(_write_part, path, plan, spec, g) for path, g in parts]
+            results = [f.result() for f in futures]
+
+    n_rows = sum(r["n_rows"] for r in results)
+    return {
+        "out_dir": str(out_dir),
+        "n_rows": n_rows,
+        "n_files": len(parts),
+        "n_row_groups": len(groups),
+        "positive_rate": sum(r["n_positive"] for r in results) / max(n_rows, 1),
+        "n_workers": n_workers,
+        "seconds": time.perf_counter() - t0,
+    }
@@ -1,15 +1,25 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Tuple, List
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, List
 
+import numpy as np
 import pandas as pd
+from scipy import sparse
+from sklearn.base import BaseEstimator, TransformerMixin
 from sklearn.compose import ColumnTransformer
 from sklearn.impute import SimpleImputer
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import OneHotEncoder
+from sklearn.preprocessing import FunctionTransformer, OneHotEncoder
 
+DIAGNOSIS_COLUMNS: Tuple[str, ...] = ("DIAG_1", "DIAG_2", "DIAG_3")
 
+# Encodings selectable per categorical column via FeatureSpec.column_encodings.
+# "rare_bucket" and "hash" take an optional parameter: "rare_bucket:50", "hash:128".
+ENCODINGS: Tuple[str, ...] = ("onehot", "icd9_chapter", "rare_bucket", "hash")
+RARE_MIN_FREQUENCY = 20
+HASH_N_FEATURES = 64
 
 
 @dataclass(frozen=True)
@@ -21,9 +31,106 @@ class FeatureSpec:
     #Columns that must never be used as festures
     forbidden_cols: Tuple[str, ...] = ("READMITTED", )
 
+    #Per-column categorical encoding (default: onehot), e.g. {"DIAG_1": "icd9_chapter"}
+    column_encodings: Dict[str, str] = field(default_factory=dict)
+
     def all_drop_cols(self) -> Tuple[str, ...]:
         return(self.target_col, self.patient_id_col, self.record_id_col) + self.forbidden_cols
-    
+
+
+# ICD-9-CM chapter lower bounds (numeric codes); 250.xx split out of endocrine as diabetes
+_ICD9_BOUNDS = np.array(
+    [1, 140, 240, 250, 251, 280, 290, 320, 390, 460, 520, 580, 630, 680, 710, 740, 760, 780, 800, 1000],
+    dtype=float,
+)
+_ICD9_CHAPTERS = np.array(
+    [
+        "infectious", "neoplasms", "endocrine", "diabetes", "endocrine", "blood", "mental",
+        "nervous", "circulatory", "respiratory", "digestive", "genitourinary", "pregnancy",
+        "skin", "musculoskeletal", "congenital", "perinatal", "symptoms", "injury",
+    ],
+    dtype=object,
+)
+
+
+@lru_cache(maxsize=4096)
+def _icd9_chapter_of(code) -> str:
+    if code is None or code != code:  # None / NaN
+        return "missing"
+    text = str(code).strip().upper()
+    if text in ("", "?"):
+        return "missing"
+    if text[0] == "V":
+        return "supplementary"
+    if text[0] == "E":
+        return "external"
+    try:
+        value = float(text)
+    except ValueError:
+        return "other"
+    idx = int(np.searchsorted(_ICD9_BOUNDS, value, side="right")) - 1
+    return str(_ICD9_CHAPTERS[idx]) if 0 <= idx < len(_ICD9_CHAPTERS) else "other"
+
+
+def icd9_chapter(X) -> np.ndarray:
+    """
+    Map raw ICD-9 codes to chapter labels, column-wise.
+    V-codes -> "supplementary", E-codes -> "external", missing / "?" -> "missing".
+    Per-code results are cached (a few hundred distinct codes), so this stays cheap
+    for single-row requests as well as batches.
+    """
+    values = np.asarray(X, dtype=object)
+    if values.ndim == 1:
+        values = values.reshape(-1, 1)
+    flat = [_icd9_chapter_of(v) for v in values.ravel()]
+    return np.asarray(flat, dtype=object).reshape(values.shape)
+
+
+class HashingColumnEncoder(TransformerMixin, BaseEstimator):
+    """
+    Feature hashing per column into a fixed-width block of n_features indicators.
+    Width (and coef_ size) is independent of how many codes appear in the data;
+    colliding codes share a weight. Hashing is deterministic across processes.
+    """
+
+    def __init__(self, n_features: int = HASH_N_FEATURES):
+        self.n_features = n_features
+
+    def fit(self, X, y=None):
+        df = pd.DataFrame(X)
+        self.feature_names_in_ = np.asarray(
+            getattr(X, "columns", [f"x{i}" for i in range(df.shape[1])]), dtype=object
+        )
+        self.n_features_in_ = df.shape[1]
+        return self
+
+    def transform(self, X) -> sparse.csr_matrix:
+        df = pd.DataFrame(X)
+        n, k = df.shape
+        cols = np.empty((n, k), dtype=np.int64)
+        for j in range(k):
+            values = df.iloc[:, j].astype("string").fillna("__MISSING__").to_numpy(dtype=object)
+            cols[:, j] = j * self.n_features + (
+                pd.util.hash_array(values) % np.uint64(self.n_features)
+            ).astype(np.int64)
+        return sparse.csr_matrix(
+            (np.ones(n * k), (np.repeat(np.arange(n), k), cols.ravel())),
+            shape=(n, k * self.n_features),
+        )
+
+    def get_feature_names_out(self, input_features=None) -> np.ndarray:
+        names = self.feature_names_in_ if input_features is None else input_features
+        return np.asarray(
+            [f"{c}__hash_{i}" for c in names for i in range(self.n_features)], dtype=object
+        )
+
+
+def _parse_encoding(value: str) -> Tuple[str, Optional[int]]:
+    name, _, arg = value.partition(":")
+    if name not in ENCODINGS:
+        raise ValueError(f"Unknown encoding {value!r}; expected one of {ENCODINGS}")
+    return name, (int(arg) if arg else None)
+
 
 def infer_feature_columns(df: pd.DataFrame, spec: FeatureSpec) -> List[str]:
     drop = set(spec.all_drop_cols())
@@ -58,15 +165,52 @@ def build_xy(
     return X, y, numeric_cols, categorical_cols 
 
 
+def _encoding_pipeline(name: str, arg: Optional[int]) -> Pipeline:
+    if name == "icd9_chapter":
+        # "missing" is its own chapter, so no imputation step
+        return Pipeline(
+            steps=[
+                ("chapter", FunctionTransformer(icd9_chapter, feature_names_out="one-to-one")),
+                ("onehot", OneHotEncoder(handle_unknown="ignore")),
+            ]
+        )
+    if name == "rare_bucket":
+        # codes seen fewer than min_frequency times (and unseen codes) share one column
+        return Pipeline(
+            steps=[
+                ("imputer", SimpleImputer(strategy="most_frequent")),
+                ("onehot", OneHotEncoder(
+                    handle_unknown="infrequent_if_exist",
+                    min_frequency=arg or RARE_MIN_FREQUENCY,
+                )),
+            ]
+        )
+    if name == "hash":
+        return Pipeline(
+            steps=[
+                ("hash", HashingColumnEncoder(n_features=arg or HASH_N_FEATURES)),
+            ]
+        )
+    raise ValueError(f"No pipeline for encoding {name!r}")
+
+
 def build_preprocessor(
         numeric_cols: List[str],
         categorical_cols: List[str],
+        encodings: Optional[Dict[str, str]] = None,
 ) -> ColumnTransformer:
     """
     Build a preprocessing  ColumnTransformer using inferred numeric/categorical columns
     Numeric: median impute
     Categorical: most_frequent impute + onehot encode 
+    High-cardinality columns can opt into another encoding via `encodings`
+    (icd9_chapter / rare_bucket / hash); they get their own transformer block.
     """
+    encodings = dict(encodings or {})
+    unknown = sorted(set(encodings) - set(categorical_cols))
+    if unknown:
+        raise ValueError(f"Encodings given for non-categorical or missing columns: {unknown}")
+
     num_pipe = Pipeline(
         steps=[
             ("imputer", SimpleImputer(strategy="median")),
@@ -80,14 +224,70 @@ def build_preprocessor(
         ]
     )
 
+    groups: Dict[str, List[str]] = {}
+    onehot_cols: List[str] = []
+    for c in categorical_cols:
+        enc = encodings.get(c, "onehot")
+        _parse_encoding(enc)
+        if enc == "onehot":
+            onehot_cols.append(c)
+        else:
+            groups.setdefault(enc, []).append(c)
+
+    transformers = [
+        ("num", num_pipe, numeric_cols),
+        ("cat", cat_pipe, onehot_cols),
+    ]
+    for enc, cols in groups.items():
+        transformers.append((enc.replace(":", "_"), _encoding_pipeline(*_parse_encoding(enc)), cols))
+
     pre = ColumnTransformer(
-        transformers=[
-            ("num", num_pipe, numeric_cols),
-            ("cat", cat_pipe, categorical_cols),
-        ],
+        transformers=transformers,
         remainder="drop",
         verbose_feature_names_out=False,
     )
 
     return pre
 
+
+def _onehot_widths(encoder: OneHotEncoder) -> List[int]:
+    """Output columns per input column of a fitted OneHotEncoder (infrequent bucket, drop aware)."""
+    widths = [len(c) for c in encoder.categories_]
+    try:
+        infrequent = encoder.infrequent_categories_
+    except AttributeError:  # infrequent grouping not enabled
+        infrequent = [None] * len(widths)
+    drop_idx = encoder.drop_idx_ if encoder.drop_idx_ is not None else [None] * len(widths)
+    return [
+        w - (len(inf) - 1 if inf is not None else 0) - (d is not None)
+        for w, inf, d in zip(widths, infrequent, drop_idx, strict=True)
+    ]
+
+
+def encoded_feature_groups(preprocessor: ColumnTransformer) -> List[str]:
+    """
+    Raw feature column behind each output column of a fitted build_preprocessor():
+    every one-hot / chapter / rare-bucket / hash indicator maps back to the column it
+    encodes, so per-encoded-column attributions can be summed per raw feature.
+    """
+    groups: List[str] = []
+    for name, transformer, cols in preprocessor.transformers_:
+        out = preprocessor.output_indices_.get(name, slice(0, 0))
+        if transformer == "drop" or out.stop == out.start:
+            continue
+        cols = list(cols)
+        last = transformer.steps[-1][1] if isinstance(transformer, Pipeline) else transformer
+        if isinstance(last, OneHotEncoder):
+            names = [c for c, w in zip(cols, _onehot_widths(last), strict=True) for _ in range(w)]
+        elif isinstance(last, HashingColumnEncoder):
+            names = [c for c in cols for _ in range(last.n_features)]
+        else:
+            # one-to-one blocks (numeric imputation); dropped all-missing columns are absent here too
+            names = [str(c) for c in transformer.get_feature_names_out(cols)]
+        if len(names) != out.stop - out.start:
+            raise ValueError(
+                f"Cannot map transformer {name!r} outputs back to raw columns "
+                f"({len(names)} names for {out.stop - out.start} outputs)"
+            )
+        groups.extend(names)
+    return groups
@@ -6,8 +6,8 @@ from pathlib import Path
 from dataclasses import dataclass
 from typing import Tuple
 
+import numpy as np
 import pandas as pd
-from sklearn.model_selection import GroupShuffleSplit
 
 
 @dataclass(frozen=True)
@@ -38,6 +38,8 @@ def group_split(
     - Split train vs temp (valid+test)
     - Split temp into valid vs test
     """
+    from sklearn.model_selection import GroupShuffleSplit
+
     if group_col not in df.columns:
         raise ValueError(f"Missing group_col: {group_col}")
     if target_col not in df.columns:
@@ -77,3 +79,24 @@ def group_split(
     test_df = temp_df.iloc[test_idx].copy()
 
     return train_df, valid_df, test_df
+
+
+def patient_hash_split(patient_ids: pd.Series, cfg: SplitConfig) -> np.ndarray:
+    """
+    Streaming-friendly patient-level split.
+
+    Each patient id is hashed (seeded by cfg.random_state) to a uniform bucket in [0, 1),
+    so every batch can be assigned independently and a patient always lands in the same
+    split. Returns an array of "train" / "valid" / "test" labels aligned with patient_ids.
+    """
+    ids = np.asarray(patient_ids, dtype=np.int64).view(np.uint64)
+    # hash_key is ignored for numeric input, so the seed is mixed into the hashed value.
+    seed_mix = pd.util.hash_array(np.array([cfg.random_state], dtype=np.int64))[0]
+    h = pd.util.hash_array(ids ^ seed_mix)
+    bucket = h / np.float64(2**64)
+
+    return np.where(
+        bucket < cfg.train_size,
+        "train",
+        np.where(bucket < cfg.train_size + cfg.valid_size, "valid", "test"),
+    )
@@ -5,9 +5,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime, timezone
 from importlib.metadata import version as pkg_version
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
-import joblib
+import numpy as np
 import pandas as pd
 
 def _utcnow() -> str:
@@ -20,6 +20,49 @@ class BundlePaths:
     latest_ptr: Path
 
 
+def _parse_version(name: str) -> Optional[Tuple[int, int, int]]:
+    parts = name.split(".")
+    if len(parts) != 3 or not all(p.isdigit() for p in parts):
+        return None
+    return int(parts[0]), int(parts[1]), int(parts[2])
+
+
+def next_model_version(bundle_root: Path, *, bump: str = "patch") -> str:
+    """
+    Next free semantic version under bundle_root (bundle dirs are named MAJOR.MINOR.PATCH).
+    An empty bundle root starts at 0.1.0.
+    """
+    if bump not in ("major", "minor", "patch"):
+        raise ValueError(f"bump must be one of major/minor/patch (got {bump!r})")
+
+    existing = []
+    if bundle_root.exists():
+        existing = [v for v in (_parse_version(p.name) for p in bundle_root.iterdir() if p.is_dir()) if v]
+    if not existing:
+        return "0.1.0"
+
+    major, minor, patch = max(existing)
+    if bump == "major":
+        return f"{major + 1}.0.0"
+    if bump == "minor":
+        return f"{major}.{minor + 1}.0"
+    return f"{major}.{minor}.{patch + 1}"
+
+
+def numeric_histogram(s: pd.Series, n_bins: int = 10) -> Optional[Dict[str, Any]]:
+    """
+    Quantile-edged histogram of the non-null values. Edges are the unique interior
+    quantiles, so discrete features (e.g. mostly-zero counts) get fewer, wider bins.
+    Bin i holds values with edges[i-1] <= x < edges[i] (searchsorted side="right").
+    """
+    v = s.dropna().to_numpy(dtype=float)
+    if len(v) == 0:
+        return None
+    edges = np.unique(np.quantile(v, np.linspace(0.0, 1.0, n_bins + 1)[1:-1]))
+    counts = np.bincount(np.searchsorted(edges, v, side="right"), minlength=len(edges) + 1)
+    return {"edges": edges.tolist(), "counts": counts.astype(int).tolist()}
+
+
 def compute_reference_stats(
         df: pd.DataFrame,
         *,
@@ -28,10 +71,10 @@ def compute_reference_stats(
 ) -> Dict[str, Any]:
     """
     Lightweight stats for monitoring:
-    -numeric: mean/std/min/max
+    -numeric: mean/std/min/max + decile histogram (drift PSI/KS bins)
     -categorical: missing_rate + top values
     """
-    stats: Dict[str, Any] = {"generated_utc": _utcnow(), "columns": {}}
+    stats: Dict[str, Any] = {"generated_utc": _utcnow(), "n_rows": int(len(df)), "columns": {}}
 
     for col in feature_columns:
         s = df[col]
@@ -43,6 +86,7 @@ def compute_reference_stats(
                 "min": float(s.min(skipna=True)) if s.notna().any() else None,
                 "max": float(s.max(skipna=True)) if s.notna().any() else None,
                 "missing_rate": float(s.isna().mean()),
+                "histogram": numeric_histogram(s),
             }
         else:
             vc = s.astype("string").fillna("__MISSING__").value_counts(dropna=False)
@@ -54,6 +98,75 @@ def compute_reference_stats(
             }
     return stats
 
+def _merge_numeric(ref_col: Dict[str, Any], n_ref: int, s: pd.Series) -> Dict[str, Any]:
+    from readmission_risk_monitor.monitoring.stats import NumericAccumulator, reference_bins
+
+    edges, expected, _ = reference_bins(ref_col)
+    acc = NumericAccumulator(edges)
+    acc.n_missing = int(round(n_ref * float(ref_col.get("missing_rate", 0.0))))
+    acc.n = n_ref - acc.n_missing
+    if acc.n > 0 and ref_col.get("mean") is not None:
+        std = ref_col.get("std") or 0.0
+        acc.mean = float(ref_col["mean"])
+        acc.m2 = std * std * (acc.n - 1)
+        acc.min, acc.max = float(ref_col["min"]), float(ref_col["max"])
+        hist = ref_col.get("histogram")
+        counts = hist["counts"] if hist else np.round(expected * acc.n)
+        acc.bin_counts = np.asarray(counts, dtype=np.int64)
+    else:
+        acc.n = 0
+    acc.update(s.to_numpy(dtype=object))
+    return acc.to_stats()
+
+
+def _merge_categorical(ref_col: Dict[str, Any], n_ref: int, s: pd.Series, max_categories: int) -> Dict[str, Any]:
+    from collections import Counter
+
+    counts = Counter({str(k): int(v) for k, v in ref_col.get("top_values", {}).items()})
+    counts.update(s.astype("string").fillna("__MISSING__").value_counts(dropna=False).to_dict())
+    n_missing = round(n_ref * float(ref_col.get("missing_rate", 0.0))) + int(s.isna().sum())
+    total = n_ref + len(s)
+    return {
+        "type": "categorical",
+        "missing_rate": n_missing / total if total else 0.0,
+        "top_values": {str(k): int(v) for k, v in counts.most_common(max_categories)},
+    }
+
+
+def merge_reference_stats(
+        reference_stats: Dict[str, Any],
+        df: pd.DataFrame,
+        *,
+        feature_columns: list[str],
+        max_categories: int = 20,
+) -> Dict[str, Any]:
+    """
+    Reference stats of a parent bundle with the rows of `df` folded in (warm-start
+    retraining, where the new model has seen both):
+    -numeric: count/mean/std/min/max merged; the parent's histogram edges are kept, so
+     drift bins stay comparable across versions, and the new rows are counted into them
+    -categorical: parent top values + new value counts (the parent's values outside its
+     stored top values are not known, so their mass stays in n_rows only)
+    Columns the parent has no stats for are profiled from `df` alone.
+    """
+    n_ref = int(reference_stats.get("n_rows", 0))
+    ref_cols = reference_stats.get("columns", {})
+    fresh = [c for c in feature_columns if c not in ref_cols]
+    stats: Dict[str, Any] = {"generated_utc": _utcnow(), "n_rows": n_ref + int(len(df)), "columns": {}}
+    if fresh:
+        stats["columns"].update(compute_reference_stats(df, feature_columns=fresh)["columns"])
+
+    for col in feature_columns:
+        ref_col = ref_cols.get(col)
+        if ref_col is None:
+            continue
+        if ref_col.get("type") == "numeric":
+            stats["columns"][col] = _merge_numeric(ref_col, n_ref, df[col])
+        else:
+            stats["columns"][col] = _merge_categorical(ref_col, n_ref, df[col], max_categories)
+    stats["columns"] = {c: stats["columns"][c] for c in feature_columns}
+    return stats
+
 def write_bundle(
         *,
         bundle_root: Path,
@@ -62,9 +175,26 @@ def write_bundle(
         pipeline,
         feature_columns: list[str],
         feature_spec: Dict[str, Any],
-        reference_df: pd.DataFrame,
+        reference_df: Optional[pd.DataFrame],
         model_type: str, 
+        tier_thresholds: Optional[Dict[str, Any]] = None,
+        lineage: Optional[Dict[str, Any]] = None,
+        promote: bool = True,
+        compile_trees: bool = False,
+        global_importance: Optional[Dict[str, Any]] = None,
+        reference_stats: Optional[Dict[str, Any]] = None,
 ) -> BundlePaths:
+    """
+    Persist a new, immutable bundle version. With promote=True (default) the latest
+    pointer is moved to it; otherwise the bundle is written but left inactive.
+    compile_trees=True also stores the LightGBM model as flat node arrays
+    (model_compiled.npz, see modeling/compiled_trees.py) for low-latency serving.
+    global_importance (modeling/importance.py) is stored as global_importance.json.
+    reference_stats, when given, is written as reference_stats.json instead of profiling
+    reference_df (e.g. merge_reference_stats for a warm-started bundle).
+    """
+    if reference_stats is None and reference_df is None:
+        raise ValueError("write_bundle needs reference_df or reference_stats")
     model_dir = bundle_root / model_version
     model_dir.mkdir(parents=True, exist_ok=False)
 
@@ -73,6 +203,8 @@ def write_bundle(
     latest_ptr = latest_dir /"PATH.txt"
 
     # Persist model pipeline
+    import joblib
+
     joblib.dump(pipeline, model_dir / "model.joblib")
 
 
@@ -89,15 +221,62 @@ def write_bundle(
         },
         "feature_spec": feature_spec,
     }
+    if tier_thresholds is not None:
+        meta["tier_thresholds"] = tier_thresholds
+    if lineage is not None:
+        meta["lineage"] = lineage
+    if compile_trees:
+        from readmission_risk_monitor.modeling.compiled_trees import (
+            COMPILED_FILENAME,
+            COMPILED_FORMAT,
+            compile_lightgbm,
+        )
+
+        compiled = compile_lightgbm(pipeline.named_steps["model"])
+        compiled.save(model_dir / COMPILED_FILENAME)
+        meta["compiled_model"] = {
+            "path": COMPILED_FILENAME,
+            "format": COMPILED_FORMAT,
+            "n_trees": compiled.n_trees,
+            "n_nodes": int(len(compiled.value)),
+            "n_used_features": int(len(compiled.used_features)),
+        }
+    if global_importance is not None:
+        from readmission_risk_monitor.modeling.importance import IMPORTANCE_FILENAME
+
+        (model_dir / IMPORTANCE_FILENAME).write_text(json.dumps(global_importance, indent=2))
+        meta["global_importance"] = {
+            "path": IMPORTANCE_FILENAME,
+            "method": global_importance.get("method"),
+            "metric": global_importance.get("metric"),
+        }
     (model_dir / "metadata.json").write_text(json.dumps(meta, indent=2))
 
     (model_dir / "feature_columns.json").write_text(
         json.dumps({"feature_columns": feature_columns}, indent=2)
     )
 
-    ref = compute_reference_stats(reference_df, feature_columns=feature_columns)
+    ref = reference_stats
+    if ref is None:
+        ref = compute_reference_stats(reference_df, feature_columns=feature_columns)
     (model_dir / "reference_stats.json").write_text(json.dumps(ref, indent=2))
 
-    latest_ptr.write_text(str(model_dir.as_posix()))
+    if promote:
+        latest_ptr.write_text(str(model_dir.as_posix()))
+
+    return BundlePaths(model_dir=model_dir, latest_ptr=latest_ptr)
+
+
+def update_bundle_metadata(model_dir: Path, updates: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Merge top-level keys into an existing bundle's metadata.json (e.g. re-tuned tier thresholds).
+    """
+    meta_path = model_dir / "metadata.json"
+    if not meta_path.exists():
+        raise FileNotFoundError(f"Missing metadata: {meta_path}")
 
-    return BundlePaths(model_dir=model_dir, latest_ptr=latest_ptr)
\ No newline at end of file
+    meta = json.loads(meta_path.read_text())
+    meta.update(updates)
+    meta["updated_utc"] = _utcnow()
+    meta_path.write_text(json.dumps(meta, indent=2))
+    return meta
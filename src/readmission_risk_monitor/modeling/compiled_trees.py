@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+COMPILED_FORMAT = "lightgbm_arrays_v1"
+COMPILED_FILENAME = "model_compiled.npz"
+
+# Above this many rows the native booster is faster than the array traversal
+# (crossover ~8 rows for the fixture model; benchmarks/bench_compiled_trees.py)
+COMPILED_MAX_ROWS = 8
+
+# LightGBM treats |x| <= kZeroThreshold as zero for missing_type "Zero"
+_ZERO_THRESHOLD = 1e-35
+
+
+@dataclass(frozen=True)
+class CompiledTrees:
+    """
+    A fitted binary LightGBM ensemble flattened into contiguous node arrays.
+
+    All trees share one node table. Leaves are nodes that point to themselves
+    (left == right == own index) and carry the leaf value. Scoring walks every
+    (row, tree) pair one level per vectorized step. `feature` indexes the
+    compact input produced by project(): only the encoded columns some split
+    actually uses. node_value holds each node's expected output (internal_value
+    for splits), used for path attributions.
+    """
+    feature: np.ndarray        # int32 [n_nodes], position in used_features
+    threshold: np.ndarray      # float64 [n_nodes]
+    left: np.ndarray           # int32 [n_nodes]
+    right: np.ndarray          # int32 [n_nodes]
+    default_left: np.ndarray   # bool [n_nodes]
+    missing_nan: np.ndarray    # bool [n_nodes], missing_type == "NaN"
+    missing_zero: np.ndarray   # bool [n_nodes], missing_type == "Zero"
+    value: np.ndarray          # float64 [n_nodes], leaf value (0 for splits)
+    roots: np.ndarray          # int32 [n_trees]
+    used_features: np.ndarray  # int64 [n_used], columns of the encoded matrix
+    n_features: int
+    max_depth: int
+    sigmoid: float
+    node_value: Optional[np.ndarray] = None  # float64 [n_nodes]
+
+    @property
+    def n_trees(self) -> int:
+        return int(len(self.roots))
+
+    def project(self, X_encoded) -> np.ndarray:
+        """Dense float64 (n_rows, n_used) from an encoded matrix (dense or scipy sparse)."""
+        if X_encoded.shape[1] != self.n_features:
+            raise ValueError(f"Expected {self.n_features} encoded columns, got {X_encoded.shape[1]}")
+        if hasattr(X_encoded, "tocsc"):
+            return X_encoded.tocsc()[:, self.used_features].toarray().astype(np.float64, copy=False)
+        return np.asarray(X_encoded, dtype=np.float64)[:, self.used_features]
+
+    @cached_property
+    def is_leaf(self) -> np.ndarray:
+        return self.left == np.arange(len(self.left), dtype=self.left.dtype)
+
+    def _walk(
+            self,
+            X_encoded,
+            visit: Optional[Callable[[np.ndarray, np.ndarray, np.ndarray], None]] = None,
+    ) -> np.ndarray:
+        """
+        Final node of every (row, tree) pair, pair id = row * n_trees + tree. Pairs that
+        reached a leaf drop out of `active`, so the work per step follows the typical path
+        length, not the deepest tree. visit(active, cur, nxt) sees every step taken.
+        """
+        X = np.ascontiguousarray(self.project(X_encoded))
+        n, k = X.shape
+        flat = X.ravel()
+        node = np.tile(self.roots, n)
+        offset = np.repeat(np.arange(n, dtype=np.int64) * k, self.n_trees)
+        active = np.flatnonzero(~self.is_leaf[node])
+        check_missing = bool(self.missing_zero.any()) or bool(np.isnan(flat).any())
+
+        while len(active):
+            cur = node[active]
+            x = flat[offset[active] + self.feature[cur]]
+            if check_missing:
+                nan = np.isnan(x)
+                x = np.where(nan & ~self.missing_nan[cur], 0.0, x)
+                is_missing = (self.missing_nan[cur] & nan) | (
+                    self.missing_zero[cur] & (np.abs(x) <= _ZERO_THRESHOLD)
+                )
+                go_left = np.where(is_missing, self.default_left[cur], x <= self.threshold[cur])
+            else:
+                go_left = x <= self.threshold[cur]
+            nxt = np.where(go_left, self.left[cur], self.right[cur])
+            node[active] = nxt
+            if visit is not None:
+                visit(active, cur, nxt)
+            active = active[~self.is_leaf[nxt]]
+        return node
+
+    def raw_score(self, X_encoded) -> np.ndarray:
+        """Sum of leaf values per row (the booster's raw margin)."""
+        n = X_encoded.shape[0]
+        if n == 0:
+            return np.zeros(0)
+        return self.value[self._walk(X_encoded)].reshape(n, self.n_trees).sum(axis=1)
+
+    def path_contributions(self, X_encoded) -> Tuple[np.ndarray, float]:
+        """
+        Per-row raw-margin attributions over used_features, plus the shared bias.
+        Each split on a row's path credits its feature with the change in expected
+        output (child node_value - node_value): the path method ("Saabas"), an
+        approximation of TreeSHAP at the cost of one scoring pass. Each row sums to
+        raw_score - bias.
+        """
+        if self.node_value is None:
+            raise ValueError("Compiled model has no node values; recompile it to get path contributions")
+        n, k = X_encoded.shape[0], len(self.used_features)
+        contrib = np.zeros(n * k)
+
+        def visit(active: np.ndarray, cur: np.ndarray, nxt: np.ndarray) -> None:
+            contrib[:] += np.bincount(
+                (active // self.n_trees) * k + self.feature[cur],
+                weights=self.node_value[nxt] - self.node_value[cur],
+                minlength=n * k,
+            )
+
+        if n:
+            self._walk(X_encoded, visit)
+        return contrib.reshape(n, k), float(self.node_value[self.roots].sum())
+
+    def predict_proba(self, X_encoded) -> np.ndarray:
+        """(n_rows, 2) class probabilities, like LGBMClassifier.predict_proba."""
+        p = 1.0 / (1.0 + np.exp(-self.sigmoid * self.raw_score(X_encoded)))
+        return np.column_stack([1.0 - p, p])
+
+    def save(self, path: Path) -> Path:
+        np.savez(
+            path,
+            feature=self.feature,
+            threshold=self.threshold,
+            left=self.left,
+            right=self.right,
+            default_left=self.default_left,
+            missing_nan=self.missing_nan,
+            missing_zero=self.missing_zero,
+            value=self.value,
+            roots=self.roots,
+            used_features=self.used_features,
+            **({} if self.node_value is None else {"node_value": self.node_value}),
+            header=np.array(json.dumps({
+                "format": COMPILED_FORMAT,
+                "n_features": self.n_features,
+                "max_depth": self.max_depth,
+                "sigmoid": self.sigmoid,
+            })),
+        )
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> CompiledTrees:
+        with np.load(path, allow_pickle=False) as z:
+            header = json.loads(str(z["header"]))
+            if header.get("format") != COMPILED_FORMAT:
+                raise ValueError(f"Unsupported compiled model format in {path}: {header.get('format')!r}")
+            arrays = {k: z[k] for k in z.files if k != "header"}
+        return cls(
+            **arrays,
+            n_features=int(header["n_features"]),
+            max_depth=int(header["max_depth"]),
+            sigmoid=float(header["sigmoid"]),
+        )
+
+
+class CompiledPipeline:
+    """
+    Drop-in scorer for a (preprocess -> LightGBM) bundle pipeline: the fitted
+    ColumnTransformer encodes raw feature frames, CompiledTrees scores them.
+    Batches larger than `max_rows` go to `booster` when one is given; both paths
+    return the same probabilities.
+    """
+
+    def __init__(self, preprocessor: Any, trees: CompiledTrees, *, booster: Any = None,
+                 max_rows: int = COMPILED_MAX_ROWS):
+        self.preprocessor = preprocessor
+        self.trees = trees
+        self.booster = booster
+        self.max_rows = max_rows
+
+    def predict_proba(self, X) -> np.ndarray:
+        return self.predict_proba_encoded(self.preprocessor.transform(X))
+
+    def predict_proba_encoded(self, X_encoded) -> np.ndarray:
+        """Score rows the preprocessor already encoded (serving reuses them for reason codes)."""
+        if self.booster is not None and X_encoded.shape[0] > self.max_rows:
+            return self.booster.predict_proba(X_encoded)
+        return self.trees.predict_proba(X_encoded)
+
+
+def _sigmoid_from_objective(objective: str) -> float:
+    name, *params = objective.split()
+    if name not in ("binary", "cross_entropy"):
+        raise ValueError(f"Only binary LightGBM models can be compiled (objective {objective!r})")
+    for p in params:
+        key, _, val = p.partition(":")
+        if key == "sigmoid":
+            return float(val)
+    return 1.0
+
+
+def compile_lightgbm(model: Any) -> CompiledTrees:
+    """
+    Flatten a fitted LGBMClassifier (or lightgbm.Booster) into CompiledTrees.
+    Numerical splits only: the bundle's preprocessor already one-hot/hash encodes
+    categoricals, so LightGBM never sees categorical features.
+    """
+    booster = getattr(model, "booster_", model)
+    dump: Dict[str, Any] = booster.dump_model()
+    if dump.get("num_tree_per_iteration", 1) != 1 or dump.get("average_output"):
+        raise ValueError("Only single-output boosted (non random-forest) LightGBM models can be compiled")
+    sigmoid = _sigmoid_from_objective(str(dump.get("objective", "")))
+
+    feature: List[int] = []
+    threshold: List[float] = []
+    left: List[int] = []
+    right: List[int] = []
+    default_left: List[bool] = []
+    missing_type: List[str] = []
+    value: List[float] = []
+    node_value: List[float] = []
+    roots: List[int] = []
+    max_depth = 0
+
+    def add(node: Dict[str, Any], depth: int) -> int:
+        nonlocal max_depth
+        idx = len(feature)
+        feature.append(0)
+        threshold.append(np.inf)
+        left.append(idx)
+        right.append(idx)
+        default_left.append(True)
+        missing_type.append("None")
+        value.append(0.0)
+        node_value.append(float(node.get("internal_value", node.get("leaf_value", 0.0))))
+
+        if "split_feature" not in node:
+            value[idx] = float(node["leaf_value"])
+            max_depth = max(max_depth, depth)
+            return idx
+        if node.get("decision_type", "<=") != "<=":
+            raise ValueError(f"Unsupported split {node.get('decision_type')!r}: categorical splits cannot be compiled")
+
+        feature[idx] = int(node["split_feature"])
+        threshold[idx] = float(node["threshold"])
+        default_left[idx] = bool(node.get("default_left", True))
+        missing_type[idx] = str(node.get("missing_type", "None"))
+        left[idx] = add(node["left_child"], depth + 1)
+        right[idx] = add(node["right_child"], depth + 1)
+        return idx
+
+    for tree in dump["tree_info"]:
+        roots.append(add(tree["tree_structure"], 0))
+
+    is_split = np.asarray([child != i for i, child in enumerate(left)], dtype=bool)
+    raw_feature = np.asarray(feature, dtype=np.int64)
+    used = np.unique(raw_feature[is_split])
+    compact = np.searchsorted(used, raw_feature).clip(0, max(len(used) - 1, 0))
+    missing = np.asarray(missing_type, dtype=object)
+
+    return CompiledTrees(
+        feature=np.where(is_split, compact, 0).astype(np.int32),
+        threshold=np.asarray(threshold, dtype=np.float64),
+        left=np.asarray(left, dtype=np.int32),
+        right=np.asarray(right, dtype=np.int32),
+        default_left=np.asarray(default_left, dtype=bool),
+        missing_nan=missing == "NaN",
+        missing_zero=missing == "Zero",
+        value=np.asarray(value, dtype=np.float64),
+        roots=np.asarray(roots, dtype=np.int32),
+        used_features=used.astype(np.int64),
+        n_features=int(dump["max_feature_idx"]) + 1,
+        max_depth=max_depth,
+        sigmoid=sigmoid,
+        node_value=np.asarray(node_value, dtype=np.float64),
+    )
@@ -4,7 +4,6 @@ from typing import Any, Dict
 
 import pandas as pd
 import numpy as np
-from sklearn.metrics import average_precision_score, roc_auc_score, brier_score_loss
 
 def _proba_pos(pipeline, X: pd.DataFrame) -> np.ndarray:
     """Helper to get positive class probabilities from a fitted pipeline"""
@@ -12,13 +11,12 @@ def _proba_pos(pipeline, X: pd.DataFrame) -> np.ndarray:
     return proba[:, 1]
 
 
-def evaluate_binary_classifier(
-        pipeline,
-        X: pd.DataFrame,
-        y: pd.Series,
-) -> Dict[str, Any]:
-    y_int = y.astype(int)
-    p = _proba_pos(pipeline, X)
+def binary_metrics(y, p) -> Dict[str, Any]:
+    """Metrics from labels and positive-class scores (shared by offline and streaming eval)."""
+    from sklearn.metrics import average_precision_score, brier_score_loss, roc_auc_score
+
+    y_int = np.asarray(y).astype(int)
+    p = np.asarray(p, dtype=float)
 
     return {
         "n": int(len(y_int)),
@@ -26,4 +24,12 @@ def evaluate_binary_classifier(
         "auroc": float(roc_auc_score(y_int, p)),
         "avg_precision": float(average_precision_score(y_int, p)),
         "brier": float(brier_score_loss(y_int, p)),
-    }
\ No newline at end of file
+    }
+
+
+def evaluate_binary_classifier(
+        pipeline,
+        X: pd.DataFrame,
+        y: pd.Series,
+) -> Dict[str, Any]:
+    return binary_metrics(y, _proba_pos(pipeline, X))
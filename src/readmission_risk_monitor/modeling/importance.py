@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import copy
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from readmission_risk_monitor.runtime import ResourceConfig, limit_native_threads, set_model_threads
+
+IMPORTANCE_FILENAME = "global_importance.json"
+
+
+def _utcnow() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _permuted_scores(model: Any, X_encoded: Any, y: np.ndarray, blocks: List[np.ndarray], seed: int) -> np.ndarray:
+    """
+    One repeat: validation AUROC with each raw feature's encoded column block shuffled
+    across rows in turn (rows of the block move together, so a one-hot row stays one-hot).
+    """
+    from scipy import sparse
+    from sklearn.metrics import roc_auc_score
+
+    dense = not sparse.issparse(X_encoded)
+    X = sparse.csr_matrix(X_encoded)
+    rng = np.random.default_rng(seed)
+    scores = np.full(len(blocks), np.nan)
+    for i, cols in enumerate(blocks):
+        if not len(cols):
+            continue
+        mask = np.zeros(X.shape[1])
+        mask[cols] = 1.0
+        block = (X @ sparse.diags(mask, format="csr"))[rng.permutation(X.shape[0])]
+        X_perm = X @ sparse.diags(1.0 - mask, format="csr") + block
+        p = model.predict_proba(X_perm.toarray() if dense else X_perm)[:, 1]
+        scores[i] = roc_auc_score(y, p)
+    return scores
+
+
+def grouped_permutation_importance(
+        pipeline: Any,
+        X: pd.DataFrame,
+        y: pd.Series,
+        *,
+        feature_columns: List[str],
+        n_repeats: int = 5,
+        random_state: int = 0,
+        n_workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Global importance of each raw feature for a (preprocess -> model) bundle pipeline:
+    the drop in AUROC on (X, y) when that feature is shuffled, averaged over `n_repeats`.
+
+    X is encoded once; a feature is shuffled by permuting the rows of its block of encoded
+    columns (one-hot / hash / imputed, see features.build.encoded_feature_groups), so
+    the preprocessor never runs again. Repeats run in parallel across `n_workers`
+    processes (default: the training CPU budget), each with its BLAS/OpenMP share of it.
+    Features whose columns the preprocessor dropped get importance 0.
+    """
+    from sklearn.metrics import roc_auc_score
+
+    from readmission_risk_monitor.features.build import encoded_feature_groups
+
+    if n_repeats < 1:
+        raise ValueError(f"n_repeats must be >= 1, got {n_repeats}")
+    t0 = time.perf_counter()
+    preprocessor = pipeline.named_steps["preprocess"]
+    model = pipeline.named_steps["model"]
+    y_arr = np.asarray(y).astype(int)
+
+    X_encoded = preprocessor.transform(X[feature_columns])
+    groups = np.asarray(encoded_feature_groups(preprocessor), dtype=object)
+    blocks = [np.flatnonzero(groups == c) for c in feature_columns]
+    baseline = float(roc_auc_score(y_arr, model.predict_proba(X_encoded)[:, 1]))
+
+    seeds = [int(s) for s in np.random.SeedSequence(random_state).generate_state(n_repeats)]
+    cpus = ResourceConfig.from_env().train_cpus
+    n_workers = max(1, min(n_workers or cpus, n_repeats))
+    if n_workers == 1:
+        results = [_permuted_scores(model, X_encoded, y_arr, blocks, s) for s in seeds]
+    else:
+        # LightGBM passes its own n_jobs to OpenMP on every predict, so the workers get a
+        # copy pinned to their share; the process-wide limit alone would be overridden
+        threads = max(1, cpus // n_workers)
+        worker_model = copy.deepcopy(model)
+        set_model_threads(worker_model, threads)
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=limit_native_threads,
+                                 initargs=(threads,)) as pool:
+            futures = [pool.submit(_permuted_scores, worker_model, X_encoded, y_arr, blocks, s) for s in seeds]
+            results = [f.result() for f in futures]
+
+    drops = np.nan_to_num(baseline - np.vstack(results), nan=0.0)
+    mean, std = drops.mean(axis=0), drops.std(axis=0)
+    order = np.argsort(-mean, kind="stable")
+    return {
+        "generated_utc": _utcnow(),
+        "method": "grouped_permutation",
+        "metric": "auroc",
+        "baseline_score": baseline,
+        "n_rows": int(len(y_arr)),
+        "n_repeats": n_repeats,
+        "random_state": random_state,
+        "n_workers": n_workers,
+        "seconds": time.perf_counter() - t0,
+        "features": [
+            {
+                "feature": feature_columns[i],
+                "importance_mean": float(mean[i]),
+                "importance_std": float(std[i]),
+                "n_encoded_columns": int(len(blocks[i])),
+            }
+            for i in order
+        ],
+    }
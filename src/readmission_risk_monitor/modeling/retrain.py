@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import copy
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+from sklearn.pipeline import Pipeline
+
+from readmission_risk_monitor.modeling.train import TrainResult
+
+
+def _preprocessor_columns(pre) -> Tuple[List[str], List[str]]:
+    """Numeric / categorical input columns of a fitted preprocessor (either flavour)."""
+    if hasattr(pre, "vocabulary"):
+        return list(pre.vocabulary.numeric_columns), list(pre.vocabulary.categorical_columns)
+
+    cols: Dict[str, List[str]] = {name: list(c) for name, _, c in pre.transformers_ if name != "remainder"}
+    numeric = cols.get("num", [])
+    categorical = [c for name, cs in cols.items() if name != "num" for c in cs]
+    return numeric, categorical
+
+
+def _continue_fit(model, Xt, y: np.ndarray, *, max_iter: int, extra_rounds: int, n_epochs: int):
+    """
+    Continue training a fitted estimator from its current parameters on (Xt, y).
+    -LogisticRegression: warm_start from coef_/intercept_, bounded iterations
+    -SGDClassifier: more partial_fit epochs (balanced sample weights, as in training)
+    -LightGBM: boost `extra_rounds` more trees on top of the existing booster
+    """
+    name = type(model).__name__
+
+    if name == "LogisticRegression":
+        new = copy.deepcopy(model)
+        new.set_params(warm_start=True, max_iter=max_iter)
+        new.fit(Xt, y)
+        return new
+
+    if name == "SGDClassifier":
+        new = copy.deepcopy(model)
+        pos = max(int(y.sum()), 1)
+        neg = max(int(len(y) - y.sum()), 1)
+        w = np.where(y == 1, len(y) / (2.0 * pos), len(y) / (2.0 * neg))
+        for _ in range(n_epochs):
+            new.partial_fit(Xt, y, sample_weight=w)
+        return new
+
+    if name == "LGBMClassifier":
+        params = model.get_params()
+        params["n_estimators"] = extra_rounds
+        new = type(model)(**params)
+        new.fit(Xt, y, init_model=model.booster_)
+        return new
+
+    raise ValueError(f"Warm-start retraining is not supported for model type {name}")
+
+
+def warm_start_retrain(
+        pipeline: Pipeline,
+        new_df: pd.DataFrame,
+        *,
+        feature_columns: list[str],
+        feature_spec: Dict[str, Any],
+        max_iter: int = 50,
+        extra_rounds: int = 50,
+        n_epochs: int = 2,
+) -> TrainResult:
+    """
+    Incremental retrain of a promoted bundle's pipeline on newly ingested encounters.
+
+    The fitted preprocessor is reused as-is (frozen vocabulary), so the encoded feature
+    space and coefficient shapes match the previous model; codes first seen in the new
+    data are ignored until the next full refit. Only the final estimator is updated.
+    """
+    target_col = feature_spec["target_col"]
+    missing = [c for c in feature_columns + [target_col] if c not in new_df.columns]
+    if missing:
+        raise ValueError(f"New data is missing bundle columns: {missing[:10]}")
+
+    pre = pipeline.named_steps["preprocess"]
+    model = pipeline.named_steps["model"]
+
+    Xt = pre.transform(new_df[feature_columns])
+    y = new_df[target_col].astype(int).to_numpy()
+    if len(np.unique(y)) < 2:
+        raise ValueError("New data must contain both classes to continue training")
+
+    new_model = _continue_fit(
+        model,
+        Xt,
+        y,
+        max_iter=max_iter,
+        extra_rounds=extra_rounds,
+        n_epochs=n_epochs,
+    )
+    numeric_cols, categorical_cols = _preprocessor_columns(pre)
+
+    return TrainResult(
+        pipeline=Pipeline(steps=[("preprocess", pre), ("model", new_model)]),
+        feature_columns=list(feature_columns),
+        numeric_columns=numeric_cols,
+        categorical_columns=categorical_cols,
+        feature_spec=dict(feature_spec),
+    )
+
+
+def metric_delta(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, float]:
+    """current - previous for the score metrics produced by evaluate.binary_metrics."""
+    return {
+        k: float(current[k]) - float(previous[k])
+        for k in ("auroc", "avg_precision", "brier")
+        if k in previous and k in current
+    }
@@ -0,0 +1,363 @@
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+from scipy import sparse
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.linear_model import SGDClassifier
+from sklearn.pipeline import Pipeline
+
+from readmission_risk_monitor.features.build import FeatureSpec
+from readmission_risk_monitor.features.split import SplitConfig, patient_hash_split
+from readmission_risk_monitor.modeling.train import TrainResult
+
+
+@dataclass(frozen=True)
+class StreamingVocabulary:
+    """
+    Everything the preprocessor needs, gathered in one streaming pass over the train rows.
+    Numeric imputation uses the streaming mean (the in-memory baseline uses the median).
+    """
+    feature_columns: List[str]
+    numeric_columns: List[str]
+    categorical_columns: List[str]
+    numeric_mean: Dict[str, float]
+    numeric_std: Dict[str, float]
+    categories: Dict[str, List[str]]
+    modes: Dict[str, str]
+    n_rows: int
+    label_counts: Dict[int, int] = field(default_factory=dict)
+
+
+def open_parquet_source(source: Path) -> ds.Dataset:
+    """A single parquet file or a directory of parquet files (partitioned dataset)."""
+    return ds.dataset(str(source), format="parquet")
+
+
+def infer_streaming_columns(
+        schema: pa.Schema,
+        spec: FeatureSpec,
+) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Arrow-schema equivalent of build_xy + infer_numeric_categorical (no data loaded).
+    """
+    drop = set(spec.all_drop_cols())
+    feature_cols = [f.name for f in schema if f.name not in drop]
+
+    numeric_cols: List[str] = []
+    categorical_cols: List[str] = []
+    for name in feature_cols:
+        t = schema.field(name).type
+        if pa.types.is_integer(t) or pa.types.is_floating(t) or pa.types.is_boolean(t):
+            numeric_cols.append(name)
+        else:
+            categorical_cols.append(name)
+    return feature_cols, numeric_cols, categorical_cols
+
+
+def iter_split_batches(
+        dataset: ds.Dataset,
+        *,
+        columns: List[str],
+        spec: FeatureSpec,
+        split_cfg: SplitConfig,
+        split: str,
+        batch_size: int,
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream record batches (column projection + bounded batch size) and keep only the rows
+    whose patient hashes into `split`.
+    """
+    cols = list(dict.fromkeys(columns + [spec.patient_id_col]))
+    for rb in dataset.to_batches(columns=cols, batch_size=batch_size):
+        if rb.num_rows == 0:
+            continue
+        df = rb.to_pandas()
+        mask = patient_hash_split(df[spec.patient_id_col], split_cfg) == split
+        if mask.any():
+            yield df.loc[mask].reset_index(drop=True)
+
+
+def build_streaming_vocabulary(
+        dataset: ds.Dataset,
+        spec: FeatureSpec,
+        *,
+        split_cfg: SplitConfig,
+        batch_size: int = 50_000,
+        max_categories: Optional[int] = None,
+) -> StreamingVocabulary:
+    """
+    First streaming pass: numeric moments (Chan's parallel merge of per-batch mean/M2),
+    categorical frequency counts, and label counts. Memory is O(columns + categories).
+    """
+    feature_cols, numeric_cols, categorical_cols = infer_streaming_columns(dataset.schema, spec)
+
+    n_num = np.zeros(len(numeric_cols))
+    mean = np.zeros(len(numeric_cols))
+    m2 = np.zeros(len(numeric_cols))
+    counts: Dict[str, Counter] = {c: Counter() for c in categorical_cols}
+    labels: Counter = Counter()
+    n_rows = 0
+
+    for df in iter_split_batches(
+        dataset,
+        columns=feature_cols + [spec.target_col],
+        spec=spec,
+        split_cfg=split_cfg,
+        split="train",
+        batch_size=batch_size,
+    ):
+        n_rows += len(df)
+        labels.update(df[spec.target_col].astype(int).tolist())
+
+        if numeric_cols:
+            x = df[numeric_cols].to_numpy(dtype=float, na_value=np.nan)
+            nb = np.sum(~np.isnan(x), axis=0).astype(float)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                mb = np.where(nb > 0, np.nansum(x, axis=0) / np.maximum(nb, 1), 0.0)
+                m2b = np.nansum((x - mb) ** 2, axis=0)
+            tot = n_num + nb
+            delta = mb - mean
+            safe_tot = np.maximum(tot, 1)
+            mean = mean + delta * nb / safe_tot
+            m2 = m2 + m2b + delta**2 * n_num * nb / safe_tot
+            n_num = tot
+
+        for c in categorical_cols:
+            counts[c].update(df[c].dropna().astype(str).value_counts().to_dict())
+
+    if n_rows == 0:
+        raise ValueError("No training rows found in streaming source")
+
+    std = np.sqrt(m2 / np.maximum(n_num - 1, 1))
+
+    categories: Dict[str, List[str]] = {}
+    modes: Dict[str, str] = {}
+    for c in categorical_cols:
+        ranked = counts[c].most_common(max_categories)
+        categories[c] = sorted(k for k, _ in ranked)
+        modes[c] = ranked[0][0] if ranked else "__MISSING__"
+
+    return StreamingVocabulary(
+        feature_columns=feature_cols,
+        numeric_columns=numeric_cols,
+        categorical_columns=categorical_cols,
+        numeric_mean={c: float(m) for c, m in zip(numeric_cols, mean, strict=True)},
+        numeric_std={c: float(s) for c, s in zip(numeric_cols, std, strict=True)},
+        categories=categories,
+        modes=modes,
+        n_rows=n_rows,
+        label_counts={int(k): int(v) for k, v in labels.items()},
+    )
+
+
+class FrozenVocabularyPreprocessor(TransformerMixin, BaseEstimator):
+    """
+    Stateless-at-fit preprocessor driven by a StreamingVocabulary:
+    -numeric: mean impute + standardize (SGD needs comparable scales)
+    -categorical: mode impute + one-hot over the frozen vocabulary (unknown -> all zeros)
+    Output is CSR, so a batch costs O(rows x columns) regardless of vocabulary size.
+    """
+
+    def __init__(self, vocabulary: StreamingVocabulary):
+        self.vocabulary = vocabulary
+
+    def fit(self, X=None, y=None):
+        v = self.vocabulary
+        self.feature_names_in_ = np.asarray(v.feature_columns, dtype=object)
+        self.n_features_in_ = len(v.feature_columns)
+        self.mean_ = np.asarray([v.numeric_mean[c] for c in v.numeric_columns], dtype=float)
+        scale = np.asarray([v.numeric_std[c] for c in v.numeric_columns], dtype=float)
+        self.scale_ = np.where(scale > 0, scale, 1.0)
+        self.categories_ = [pd.Index(v.categories[c]) for c in v.categorical_columns]
+
+        sizes = [len(cats) for cats in self.categories_]
+        self.offsets_ = len(v.numeric_columns) + np.concatenate([[0], np.cumsum(sizes)]).astype(np.int64)
+        self.n_features_out_ = int(self.offsets_[-1])
+        return self
+
+    def transform(self, X: pd.DataFrame) -> sparse.csr_matrix:
+        v = self.vocabulary
+        n = len(X)
+
+        num = X[v.numeric_columns].to_numpy(dtype=float, na_value=np.nan)
+        num = np.where(np.isnan(num), self.mean_, num)
+        num = (num - self.mean_) / self.scale_
+
+        rows = [np.repeat(np.arange(n), num.shape[1])]
+        cols = [np.tile(np.arange(num.shape[1]), n)]
+        vals = [num.ravel()]
+
+        for j, c in enumerate(v.categorical_columns):
+            s = X[c]
+            s = s.where(s.notna(), v.modes[c]).astype(str)
+            codes = self.categories_[j].get_indexer(s)
+            hit = codes >= 0
+            rows.append(np.flatnonzero(hit))
+            cols.append(self.offsets_[j] + codes[hit])
+            vals.append(np.ones(int(hit.sum())))
+
+        return sparse.csr_matrix(
+            (np.concatenate(vals), (np.concatenate(rows), np.concatenate(cols))),
+            shape=(n, self.n_features_out_),
+        )
+
+    def get_feature_names_out(self, input_features=None) -> np.ndarray:
+        v = self.vocabulary
+        names = list(v.numeric_columns)
+        for c, cats in zip(v.categorical_columns, self.categories_, strict=True):
+            names.extend(f"{c}_{k}" for k in cats)
+        return np.asarray(names, dtype=object)
+
+
+def train_streaming_sgd(
+        source: Path,
+        *,
+        target_col: str,
+        patient_id_col: str,
+        record_id_col: str,
+        split_cfg: Optional[SplitConfig] = None,
+        batch_size: int = 50_000,
+        n_epochs: int = 3,
+        alpha: float = 1e-3,
+        max_categories: Optional[int] = None,
+        random_state: int = 42,
+) -> TrainResult:
+    """
+    Out-of-core baseline:
+    -pass 1 builds a frozen vocabulary over train rows (patient-hash split)
+    -passes 2..n stream row batches through the frozen preprocessor into SGD partial_fit
+    -log-loss SGD with balanced sample weights mirrors the logreg baseline; averaged SGD
+     keeps the one-pass-per-epoch updates stable without tuning a learning-rate schedule
+    Peak memory is bounded by batch_size, not by dataset size.
+    """
+    split_cfg = split_cfg or SplitConfig()
+    spec = FeatureSpec(
+        target_col=target_col,
+        patient_id_col=patient_id_col,
+        record_id_col=record_id_col,
+    )
+    dataset = open_parquet_source(Path(source))
+    vocab = build_streaming_vocabulary(
+        dataset,
+        spec,
+        split_cfg=split_cfg,
+        batch_size=batch_size,
+        max_categories=max_categories,
+    )
+    pre = FrozenVocabularyPreprocessor(vocab).fit()
+
+    # class_weight="balanced" is not supported by partial_fit; use equivalent sample weights
+    n_total = sum(vocab.label_counts.values())
+    class_w = {k: n_total / (2.0 * max(v, 1)) for k, v in vocab.label_counts.items()}
+
+    clf = SGDClassifier(
+        loss="log_loss",
+        alpha=alpha,
+        average=True,
+        random_state=random_state,
+    )
+    classes = np.array([0, 1])
+    for _ in range(n_epochs):
+        for df in iter_split_batches(
+            dataset,
+            columns=vocab.feature_columns + [target_col],
+            spec=spec,
+            split_cfg=split_cfg,
+            split="train",
+            batch_size=batch_size,
+        ):
+            y = df[target_col].astype(int).to_numpy()
+            w = np.vectorize(class_w.get, otypes=[float])(y)
+            clf.partial_fit(pre.transform(df), y, classes=classes, sample_weight=w)
+
+    pipe = Pipeline(steps=[("preprocess", pre), ("model", clf)])
+
+    return TrainResult(
+        pipeline=pipe,
+        feature_columns=vocab.feature_columns,
+        numeric_columns=vocab.numeric_columns,
+        categorical_columns=vocab.categorical_columns,
+        feature_spec={
+            "target_col": target_col,
+            "patient_id_col": patient_id_col,
+            "record_id_col": record_id_col,
+            "forbidden_cols": list(spec.forbidden_cols),
+            "training_mode": "streaming_sgd",
+            "split": "patient_hash",
+        },
+    )
+
+
+def stream_scores(
+        pipeline,
+        source: Path,
+        *,
+        feature_columns: List[str],
+        spec: FeatureSpec,
+        split_cfg: SplitConfig,
+        split: str,
+        batch_size: int = 50_000,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Score one patient-hash split batch by batch; only (label, score) pairs are kept in memory.
+    """
+    ys: List[np.ndarray] = []
+    ps: List[np.ndarray] = []
+    for df in iter_split_batches(
+        open_parquet_source(Path(source)),
+        columns=feature_columns + [spec.target_col],
+        spec=spec,
+        split_cfg=split_cfg,
+        split=split,
+        batch_size=batch_size,
+    ):
+        ys.append(df[spec.target_col].astype(int).to_numpy())
+        ps.append(pipeline.predict_proba(df[feature_columns])[:, 1])
+
+    if not ys:
+        return np.zeros(0, dtype=int), np.zeros(0)
+    return np.concatenate(ys), np.concatenate(ps)
+
+
+def reservoir_sample(
+        source: Path,
+        *,
+        columns: List[str],
+        spec: FeatureSpec,
+        split_cfg: SplitConfig,
+        n: int = 50_000,
+        batch_size: int = 50_000,
+        random_state: int = 42,
+) -> pd.DataFrame:
+    """
+    Bounded-size uniform sample of train rows (e.g. for write_bundle's reference_df).
+    """
+    rng = np.random.default_rng(random_state)
+    sample: Optional[pd.DataFrame] = None
+    for df in iter_split_batches(
+        open_parquet_source(Path(source)),
+        columns=columns,
+        spec=spec,
+        split_cfg=split_cfg,
+        split="train",
+        batch_size=batch_size,
+    ):
+        df = df[columns]
+        # Random keys keep a uniform sample: retain the n rows with the smallest keys
+        keys = rng.random(len(df))
+        df = df.assign(_key=keys)
+        sample = df if sample is None else pd.concat([sample, df], ignore_index=True)
+        if len(sample) > n:
+            sample = sample.nsmallest(n, "_key")
+
+    if sample is None:
+        raise ValueError("No training rows found in streaming source")
+    return sample.drop(columns="_key").reset_index(drop=True)
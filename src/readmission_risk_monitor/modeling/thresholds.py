@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class ThresholdCurve:
+    """
+    Operating characteristics for every distinct score, highest first.
+    A patient is flagged at threshold t when score >= t.
+    """
+    thresholds: np.ndarray
+    flagged: np.ndarray
+    true_positives: np.ndarray
+    n: int
+    n_positive: int
+
+    @property
+    def flagged_rate(self) -> np.ndarray:
+        return self.flagged / max(self.n, 1)
+
+    @property
+    def precision(self) -> np.ndarray:
+        return self.true_positives / np.maximum(self.flagged, 1)
+
+    @property
+    def recall(self) -> np.ndarray:
+        return self.true_positives / max(self.n_positive, 1)
+
+
+def threshold_curve(y_true, scores) -> ThresholdCurve:
+    """
+    Precision / recall / flagged volume at every distinct score.
+    One descending sort plus cumulative sums: O(n log n) for the whole curve.
+    """
+    y = np.asarray(y_true, dtype=np.int64)
+    s = np.asarray(scores, dtype=np.float64)
+    if y.shape != s.shape:
+        raise ValueError(f"y_true and scores must have the same shape (got {y.shape} vs {s.shape})")
+    if len(s) == 0:
+        raise ValueError("Cannot build a threshold curve from zero scores")
+
+    order = np.argsort(-s, kind="mergesort")
+    s_sorted = s[order]
+    tp_cum = np.cumsum(y[order])
+
+    # Last position of each run of tied scores: everything tied is flagged together
+    run_end = np.r_[np.flatnonzero(np.diff(s_sorted) != 0), len(s_sorted) - 1]
+
+    return ThresholdCurve(
+        thresholds=s_sorted[run_end],
+        flagged=run_end + 1,
+        true_positives=tp_cum[run_end],
+        n=int(len(s)),
+        n_positive=int(y.sum()),
+    )
+
+
+def capacity_threshold(curve: ThresholdCurve, capacity_rate: float) -> float:
+    """
+    Lowest threshold whose flagged volume stays within capacity_rate of the population.
+    If even the top score's ties exceed capacity, the top score is returned.
+    """
+    if not 0.0 < capacity_rate <= 1.0:
+        raise ValueError(f"capacity_rate must be in (0, 1] (got {capacity_rate})")
+
+    budget = capacity_rate * curve.n
+    idx = int(np.searchsorted(curve.flagged, budget, side="right")) - 1
+    return float(curve.thresholds[max(idx, 0)])
+
+
+def _operating_point(curve: ThresholdCurve, threshold: float) -> Dict[str, float]:
+    # thresholds are descending; find the last one still >= threshold
+    idx = int(np.searchsorted(-curve.thresholds, -threshold, side="right")) - 1
+    idx = max(idx, 0)
+    return {
+        "threshold": float(curve.thresholds[idx]),
+        "flagged": int(curve.flagged[idx]),
+        "flagged_rate": float(curve.flagged_rate[idx]),
+        "precision": float(curve.precision[idx]),
+        "recall": float(curve.recall[idx]),
+    }
+
+
+def choose_tier_thresholds(
+        y_true,
+        scores,
+        *,
+        high_capacity: float = 0.10,
+        medium_capacity: float = 0.30,
+        source: str = "valid",
+) -> Dict[str, Any]:
+    """
+    Derive tier cut-points from care-team capacity instead of fixed probabilities.
+    -high: top `high_capacity` share of patients
+    -medium: top `medium_capacity` share (cumulative, includes high)
+    Returned dict is stored as metadata["tier_thresholds"] in the bundle.
+    """
+    if medium_capacity < high_capacity:
+        raise ValueError("medium_capacity must be >= high_capacity (capacities are cumulative)")
+
+    curve = threshold_curve(y_true, scores)
+    high = capacity_threshold(curve, high_capacity)
+    medium = min(capacity_threshold(curve, medium_capacity), high)
+
+    return {
+        "high": high,
+        "medium": medium,
+        "policy": {
+            "high_capacity": float(high_capacity),
+            "medium_capacity": float(medium_capacity),
+            "source": source,
+            "n": curve.n,
+            "n_positive": curve.n_positive,
+        },
+        "operating_points": {
+            "high": _operating_point(curve, high),
+            "medium": _operating_point(curve, medium),
+        },
+    }
+
+
+def curve_to_records(curve: ThresholdCurve, *, max_points: int = 200) -> List[Dict[str, float]]:
+    """
+    Downsample the curve (evenly by flagged volume) into JSON-friendly records.
+    """
+    n_points = len(curve.thresholds)
+    if n_points <= max_points:
+        idx = np.arange(n_points)
+    else:
+        idx = np.unique(np.linspace(0, n_points - 1, max_points).round().astype(int))
+
+    precision = curve.precision
+    recall = curve.recall
+    flagged_rate = curve.flagged_rate
+    return [
+        {
+            "threshold": float(curve.thresholds[i]),
+            "flagged": int(curve.flagged[i]),
+            "flagged_rate": float(flagged_rate[i]),
+            "precision": float(precision[i]),
+            "recall": float(recall[i]),
+        }
+        for i in idx
+    ]
@@ -8,6 +8,7 @@ from sklearn.linear_model import LogisticRegression
 from sklearn.pipeline import Pipeline
 
 from readmission_risk_monitor.features.build import FeatureSpec, build_xy, build_preprocessor
+from readmission_risk_monitor.runtime import ResourceConfig
 
 @dataclass(frozen=True)
 class TrainResult:
@@ -24,11 +25,12 @@ def train_baseline_logreg(
         patient_id_col: str,
         record_id_col: str,
         random_state: int = 42,
+        column_encodings: Optional[Dict[str, str]] = None,
 )-> TrainResult: 
     """ 
     Baseline model:
     -leakage-safe column selection via FeatureSpec (forbidden cols)
-    -preprocess via build_preprocessor()
+    -preprocess via build_preprocessor() (per-column encodings via column_encodings)
     -logistical regression for interpretability-first baseline
     """
 
@@ -36,9 +38,10 @@ def train_baseline_logreg(
         target_col=target_col,
         patient_id_col=patient_id_col,
         record_id_col=record_id_col,
+        column_encodings=dict(column_encodings or {}),
     )
     X, y, numeric_cols, categorical_cols = build_xy(train_df, spec)
-    pre  = build_preprocessor(numeric_cols, categorical_cols)
+    pre  = build_preprocessor(numeric_cols, categorical_cols, spec.column_encodings)
 
     clf = LogisticRegression(
         max_iter=1000,
@@ -58,6 +61,7 @@ def train_baseline_logreg(
             "patient_id_col": patient_id_col,
             "record_id_col": record_id_col,
             "forbidden_cols": list(spec.forbidden_cols),
+            "column_encodings": dict(spec.column_encodings),
         },
     )
 
@@ -68,9 +72,12 @@ def try_train_lightgbm(
         patient_id_col: str,
         record_id_col: str,
         random_state: int = 42,
+        column_encodings: Optional[Dict[str, str]] = None,
+        n_jobs: Optional[int] = None,
 ) -> Optional[TrainResult]:
     """
     Placeholder for future more complex model training, e.g., LightGBM
+    n_jobs: LightGBM threads (default: the training CPU budget, RRM_TRAIN_CPUS)
     """
     try:
         from lightgbm import LGBMClassifier
@@ -80,16 +87,17 @@ def try_train_lightgbm(
         target_col=target_col,
         patient_id_col=patient_id_col,
         record_id_col=record_id_col,
+        column_encodings=dict(column_encodings or {}),
     )
     X, y, numeric_cols, categorical_cols = build_xy(train_df, spec)
-    pre  = build_preprocessor(numeric_cols, categorical_cols)
+    pre  = build_preprocessor(numeric_cols, categorical_cols, spec.column_encodings)
 
     model = LGBMClassifier(
         n_estimators=300,
         learning_rate=0.05,
         num_leaves=31,
         random_state=random_state,
-        n_jobs=-1,
+        n_jobs=n_jobs or ResourceConfig.from_env().train_cpus,
     )
 
     pipe = Pipeline(steps=[("preprocess", pre), ("model", model)])
@@ -108,6 +116,7 @@ def try_train_lightgbm(
             "patient_id_col": patient_id_col,
             "record_id_col": record_id_col,
             "forbidden_cols": list(spec.forbidden_cols),
+            "column_encodings": dict(spec.column_encodings),
         },
     )
     
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import html
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+from readmission_risk_monitor.monitoring.stats import (
+    CategoricalAccumulator,
+    NumericAccumulator,
+    rank_by_drift,
+    reference_bins,
+    score_against_reference,
+)
+
+
+def _utcnow() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _update_from_arrow(acc, arr: pa.ChunkedArray) -> None:
+    if isinstance(acc, NumericAccumulator):
+        if pa.types.is_integer(arr.type) or pa.types.is_floating(arr.type):
+            arr = pc.cast(arr, pa.float64())
+        acc.update(arr.to_numpy(zero_copy_only=False))
+        return
+
+    # Categorical: aggregate in Arrow, merge only the (small) distinct-value table
+    n_missing = arr.null_count
+    vc = pc.value_counts(arr if pa.types.is_string(arr.type) else pc.cast(arr, pa.string()))
+    counts = {
+        v: int(n)
+        for v, n in zip(vc.field("values").to_pylist(), vc.field("counts").to_pylist(), strict=True)
+        if v is not None
+    }
+    acc.update_counts(counts, n_missing)
+
+
+def _profile_columns(
+        source: str,
+        columns: List[str],
+        ref_columns: Dict[str, Dict[str, Any]],
+        batch_size: int,
+) -> Tuple[Dict[str, Any], int]:
+    """
+    Worker: stream only `columns` through the dataset's row groups.
+    Categorical counts are untracked here so the current top values are exact.
+    """
+    accs: Dict[str, Any] = {}
+    for c in columns:
+        ref = ref_columns[c]
+        accs[c] = (
+            NumericAccumulator(reference_bins(ref)[0]) if ref.get("type") == "numeric"
+            else CategoricalAccumulator()
+        )
+
+    n_rows = 0
+    dataset = ds.dataset(source, format="parquet")
+    for batch in dataset.to_batches(columns=columns, batch_size=batch_size):
+        n_rows += batch.num_rows
+        for c, acc in accs.items():
+            _update_from_arrow(acc, pa.chunked_array([batch.column(c)]))
+    return accs, n_rows
+
+
+def _column_groups(columns: List[str], n_groups: int) -> List[List[str]]:
+    groups = [columns[i::n_groups] for i in range(n_groups)]
+    return [g for g in groups if g]
+
+
+def profile_against_reference(
+        source: Path,
+        reference_stats: Dict[str, Any],
+        *,
+        feature_columns: Optional[List[str]] = None,
+        n_workers: Optional[int] = None,
+        batch_size: int = 100_000,
+        max_categories: int = 20,
+) -> Dict[str, Any]:
+    """
+    Profile a parquet extract (file or directory) out of core and score it against a
+    bundle's reference stats.
+
+    Columns are split across `n_workers` processes; each worker projects only its own
+    columns and streams them batch by batch, so memory is O(batch_size x columns per
+    worker) regardless of the extract size. Numeric columns are binned on the reference
+    edges; the per-column "current" entry has the same shape as compute_reference_stats.
+    """
+    ref_columns = reference_stats.get("columns", {})
+    schema = ds.dataset(str(source), format="parquet").schema
+    wanted = feature_columns or list(ref_columns)
+    columns = [c for c in wanted if c in ref_columns and c in schema.names]
+    missing = [c for c in wanted if c in ref_columns and c not in schema.names]
+
+    n_workers = max(1, min(n_workers or os.cpu_count() or 1, len(columns)))
+    groups = _column_groups(columns, n_workers)
+
+    accs: Dict[str, Any] = {}
+    n_rows = 0
+    if n_workers == 1:
+        results = [_profile_columns(str(source), g, ref_columns, batch_size) for g in groups]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            futures = [
+                pool.submit(_profile_columns, str(source), g, ref_columns, batch_size) for g in groups
+            ]
+            results = [f.result() for f in futures]
+    for group_accs, rows in results:
+        accs.update(group_accs)
+        n_rows = rows
+
+    scores = score_against_reference(accs, reference_stats)
+    features = {}
+    for c in columns:
+        current = (
+            accs[c].to_stats(max_categories) if isinstance(accs[c], CategoricalAccumulator)
+            else accs[c].to_stats()
+        )
+        features[c] = {**scores[c], "current": current}
+
+    ranked = rank_by_drift(scores)
+    return {
+        "generated_utc": _utcnow(),
+        "source": str(source),
+        "n_rows": n_rows,
+        "reference_generated_utc": reference_stats.get("generated_utc"),
+        "reference_n_rows": reference_stats.get("n_rows"),
+        "missing_columns": missing,
+        "ranking": [{"feature": c, "psi": v, "severity": features[c]["severity"]} for c, v in ranked],
+        "features": features,
+    }
+
+
+_SEVERITY_COLOR = {"major": "#f8d7da", "moderate": "#fff3cd", "stable": "#ffffff"}
+
+
+def _fmt(v: Any) -> str:
+    if v is None or (isinstance(v, float) and np.isnan(v)):
+        return "-"
+    if isinstance(v, float):
+        return f"{v:.4f}"
+    return html.escape(str(v))
+
+
+def render_html(report: Dict[str, Any], *, title: str = "Feature drift report") -> str:
+    """Self-contained HTML table of the report, most drifted features first."""
+    ranked = [r["feature"] for r in report["ranking"]]
+    unranked = [c for c in report["features"] if c not in ranked]
+    rows = []
+    for c in ranked + unranked:
+        f = report["features"][c]
+        color = _SEVERITY_COLOR.get(f.get("severity", "stable"), "#ffffff")
+        rows.append(
+            f'<tr style="background:{color}"><td>{html.escape(c)}</td><td>{_fmt(f["type"])}</td>'
+            f'<td>{_fmt(f.get("psi"))}</td><td>{_fmt(f.get("ks"))}</td>'
+            f'<td>{_fmt(f.get("mean_shift_z"))}</td><td>{_fmt(f.get("missing_rate_delta"))}</td>'
+            f'<td>{_fmt(f.get("unseen_rate"))}</td><td>{_fmt(f.get("severity"))}</td></tr>'
+        )
+    missing = "".join(f"<li>{html.escape(c)}</li>" for c in report.get("missing_columns", []))
+    return (
+        f"<!doctype html><html><head><meta charset='utf-8'><title>{html.escape(title)}</title>"
+        "<style>body{font-family:sans-serif}table{border-collapse:collapse}"
+        "td,th{border:1px solid #ccc;padding:4px 8px;text-align:right}"
+        "td:first-child,th:first-child{text-align:left}</style></head><body>"
+        f"<h1>{html.escape(title)}</h1>"
+        f"<p>Source: <code>{html.escape(report['source'])}</code> ({report['n_rows']} rows), "
+        f"reference generated {_fmt(report.get('reference_generated_utc'))}, "
+        f"report generated {_fmt(report['generated_utc'])}.</p>"
+        + (f"<p>Columns missing from the extract:</p><ul>{missing}</ul>" if missing else "")
+        + "<table><tr><th>feature</th><th>type</th><th>PSI</th><th>KS</th><th>mean shift (z)</th>"
+          "<th>missing rate delta</th><th>unseen rate</th><th>severity</th></tr>"
+        + "".join(rows)
+        + "</table></body></html>"
+    )
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+import pandas as pd
+from prometheus_client import Counter, Gauge
+
+from readmission_risk_monitor.monitoring.stats import (
+    accumulator_for,
+    rank_by_drift,
+    score_against_reference,
+)
+
+# multiprocess_mode only matters under PROMETHEUS_MULTIPROC_DIR (pre-forked workers each
+# run their own window); the worst live worker is reported
+DRIFT_PSI = Gauge("rrm_feature_drift_psi", "PSI of the last drift window vs reference", ["feature"],
+                  multiprocess_mode="livemax")
+DRIFT_KS = Gauge("rrm_feature_drift_ks", "KS distance of the last drift window vs reference", ["feature"],
+                 multiprocess_mode="livemax")
+DRIFT_WINDOW_ROWS = Gauge("rrm_drift_window_rows", "Rows in the last completed drift window",
+                          multiprocess_mode="livesum")
+DRIFT_DROPPED = Counter("rrm_drift_rows_dropped_total", "Scored rows dropped because the drift queue was full")
+
+
+def _utcnow() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class DriftMonitor:
+    """
+    Online feature-drift monitor fed from the scoring path.
+
+    observe() only appends row dicts to a bounded deque (O(1), no locking in the caller).
+    A daemon thread drains the deque every `drain_interval_s`, updates per-feature
+    streaming accumulators in vectorized batches, and every `window_seconds` (once at
+    least `min_rows` rows arrived) scores the window against reference_stats.json,
+    publishes PSI/KS gauges and starts a fresh window. When the deque is full the
+    oldest rows are discarded and counted in rrm_drift_rows_dropped_total.
+    """
+
+    def __init__(
+            self,
+            reference_stats: Dict[str, Any],
+            feature_columns: List[str],
+            *,
+            queue_size: int = 50_000,
+            window_seconds: float = 60.0,
+            min_rows: int = 200,
+            drain_interval_s: float = 1.0,
+    ):
+        self.reference_stats = reference_stats
+        ref_cols = reference_stats.get("columns", {})
+        self.feature_columns = [c for c in feature_columns if c in ref_cols]
+        self.window_seconds = window_seconds
+        self.min_rows = min_rows
+        self.drain_interval_s = drain_interval_s
+
+        self._queue: deque = deque(maxlen=queue_size)
+        self._observed = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self._window = self._new_window()
+        self._window_rows = 0
+        self._window_started = time.monotonic()
+        self._window_started_utc = _utcnow()
+        self._last: Dict[str, Any] = {"status": "warming_up", "window_rows": 0, "features": {}}
+
+    def _new_window(self) -> Dict[str, Any]:
+        ref_cols = self.reference_stats["columns"]
+        return {c: accumulator_for(ref_cols[c]) for c in self.feature_columns}
+
+    # --- request path -------------------------------------------------------------
+
+    def observe(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """Enqueue scored feature rows; constant work per row, never blocks on scoring."""
+        q = self._queue
+        for row in rows:
+            if len(q) == q.maxlen:
+                DRIFT_DROPPED.inc()
+            q.append(row)
+            self._observed += 1
+
+    # --- background ---------------------------------------------------------------
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="rrm-drift", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.drain_interval_s):
+            self.drain()
+            if time.monotonic() - self._window_started >= self.window_seconds:
+                self.close_window()
+
+    def drain(self) -> int:
+        """Move queued rows into the current window's accumulators."""
+        rows = []
+        q = self._queue
+        while q:
+            try:
+                rows.append(q.popleft())
+            except IndexError:
+                break
+        if not rows:
+            return 0
+
+        df = pd.DataFrame.from_records(rows, columns=self.feature_columns)
+        with self._lock:
+            for c, acc in self._window.items():
+                acc.update(df[c].to_numpy(dtype=object))
+            self._window_rows += len(rows)
+        return len(rows)
+
+    def close_window(self, *, force: bool = False) -> Optional[Dict[str, Any]]:
+        """Score the current window and start a new one (skipped below min_rows unless forced)."""
+        with self._lock:
+            if self._window_rows < self.min_rows and not force:
+                return None
+            scores = score_against_reference(self._window, self.reference_stats)
+            report = {
+                "status": "ok",
+                "window_start_utc": self._window_started_utc,
+                "window_end_utc": _utcnow(),
+                "window_rows": self._window_rows,
+                "features": scores,
+                "top_drifting": [{"feature": c, "psi": v} for c, v in rank_by_drift(scores)[:10]],
+            }
+            self._window = self._new_window()
+            self._window_rows = 0
+            self._window_started = time.monotonic()
+            self._window_started_utc = _utcnow()
+            self._last = report
+
+        DRIFT_WINDOW_ROWS.set(report["window_rows"])
+        for c, s in scores.items():
+            if s.get("psi") is not None:
+                DRIFT_PSI.labels(feature=c).set(s["psi"])
+            if s.get("ks") is not None:
+                DRIFT_KS.labels(feature=c).set(s["ks"])
+        return report
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Last completed window plus live counters (what /drift returns)."""
+        with self._lock:
+            current_rows = self._window_rows
+            last = dict(self._last)
+        last["current_window_rows"] = current_rows + len(self._queue)
+        last["observed_total"] = self._observed
+        last["reference_generated_utc"] = self.reference_stats.get("generated_utc")
+        return last
@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import shutil
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from readmission_risk_monitor.modeling.evaluate import binary_metrics
+
+AUDIT_COLUMNS = ["scored_utc", "encounter_id", "model_version", "readmission_risk"]
+_KEY = "encounter_id"
+
+
+@dataclass(frozen=True)
+class JoinConfig:
+    """
+    Grace hash join settings: both inputs are spilled into `n_partitions` buckets by
+    hash(encounter_id), then each bucket pair is joined in memory on its own.
+    Peak memory is roughly (audit + label rows) / n_partitions.
+    """
+    n_partitions: int = 32
+    batch_size: int = 250_000
+    calibration_bins: int = 10
+    rolling_weeks: int = 4
+
+
+def _bucket_of(keys: pd.Series, n_partitions: int) -> np.ndarray:
+    return (pd.util.hash_pandas_object(keys, index=False).to_numpy() % n_partitions).astype(np.int64)
+
+
+class _Spill:
+    """One ParquetWriter per bucket; a bucket file only exists if it received rows."""
+
+    def __init__(self, root: Path, name: str, n_partitions: int):
+        self.root = root
+        self.name = name
+        self.n_partitions = n_partitions
+        self._writers: Dict[int, pq.ParquetWriter] = {}
+
+    def path(self, bucket: int) -> Path:
+        return self.root / f"{self.name}-{bucket:04d}.parquet"
+
+    def write(self, df: pd.DataFrame) -> None:
+        if df.empty:
+            return
+        buckets = _bucket_of(df[_KEY], self.n_partitions)
+        order = np.argsort(buckets, kind="stable")
+        buckets = buckets[order]
+        df = df.iloc[order]
+        bounds = np.flatnonzero(np.diff(buckets)) + 1
+        for lo, hi in zip(np.r_[0, bounds], np.r_[bounds, len(buckets)], strict=True):
+            b = int(buckets[lo])
+            table = pa.Table.from_pandas(df.iloc[lo:hi], preserve_index=False)
+            writer = self._writers.get(b)
+            if writer is None:
+                writer = pq.ParquetWriter(self.path(b), table.schema)
+                self._writers[b] = writer
+            writer.write_table(table)
+
+    def close(self) -> None:
+        for w in self._writers.values():
+            w.close()
+        self._writers.clear()
+
+    def read(self, bucket: int, columns: List[str]) -> pd.DataFrame:
+        p = self.path(bucket)
+        if not p.exists():
+            return pd.DataFrame(columns=columns)
+        return pd.read_parquet(p, columns=columns)
+
+
+def iter_audit_batches(audit_dir: Path, *, batch_size: int) -> Iterator[pd.DataFrame]:
+    """Completed audit files only (in-progress files carry a different suffix)."""
+    files = sorted(str(p) for p in Path(audit_dir).glob("date=*/*.parquet"))
+    if not files:
+        return
+    dataset = ds.dataset(files, format="parquet")
+    for batch in dataset.to_batches(columns=AUDIT_COLUMNS, batch_size=batch_size):
+        df = batch.to_pandas()
+        df = df[df[_KEY].notna()]
+        if len(df):
+            yield df
+
+
+def iter_label_batches(
+        labels: Path,
+        *,
+        record_id_col: str,
+        target_col: str,
+        batch_size: int,
+) -> Iterator[pd.DataFrame]:
+    dataset = ds.dataset(str(labels), format="parquet")
+    for batch in dataset.to_batches(columns=[record_id_col, target_col], batch_size=batch_size):
+        df = batch.to_pandas().dropna()
+        if len(df):
+            # Audit ids are strings (they come from JSON requests); normalize the label side
+            yield pd.DataFrame({
+                _KEY: df[record_id_col].astype("int64").astype(str),
+                "y": df[target_col].astype(int),
+            })
+
+
+def calibration_summary(y: np.ndarray, p: np.ndarray, *, n_bins: int = 10) -> Dict[str, Any]:
+    """
+    Expected calibration error over equal-width bins, calibration-in-the-large
+    (mean predicted - observed rate) and the per-bin reliability table.
+    """
+    edges = np.linspace(0.0, 1.0, n_bins + 1)
+    idx = np.clip(np.searchsorted(edges, p, side="right") - 1, 0, n_bins - 1)
+    count = np.bincount(idx, minlength=n_bins)
+    sum_p = np.bincount(idx, weights=p, minlength=n_bins)
+    sum_y = np.bincount(idx, weights=y, minlength=n_bins)
+
+    nz = count > 0
+    mean_p = np.divide(sum_p, count, out=np.zeros(n_bins), where=nz)
+    obs = np.divide(sum_y, count, out=np.zeros(n_bins), where=nz)
+    ece = float(np.sum(count[nz] * np.abs(mean_p[nz] - obs[nz])) / max(len(p), 1))
+    return {
+        "ece": ece,
+        "mean_predicted": float(p.mean()) if len(p) else None,
+        "calibration_in_the_large": float(p.mean() - y.mean()) if len(p) else None,
+        "bins": [
+            {"lower": float(edges[i]), "upper": float(edges[i + 1]), "n": int(count[i]),
+             "mean_predicted": float(mean_p[i]), "observed_rate": float(obs[i])}
+            for i in range(n_bins) if count[i]
+        ],
+    }
+
+
+def group_metrics(y: np.ndarray, p: np.ndarray, *, n_bins: int = 10) -> Dict[str, Any]:
+    """binary_metrics (the offline evaluation) plus calibration; ranking metrics need both classes."""
+    if len(np.unique(y)) == 2:
+        out = binary_metrics(y, p)
+    else:
+        out = {
+            "n": int(len(y)),
+            "positive_rate": float(y.mean()) if len(y) else None,
+            "auroc": None,
+            "avg_precision": None,
+            "brier": float(np.mean((p - y) ** 2)) if len(y) else None,
+        }
+    out["calibration"] = calibration_summary(y, p, n_bins=n_bins)
+    return out
+
+
+def _week_start(ts: pd.Series) -> pd.Series:
+    """Monday 00:00 UTC of each timestamp's ISO week (kept as datetime; formatted per group)."""
+    day = ts.dt.tz_convert("UTC").dt.tz_localize(None).dt.normalize()
+    return day - pd.to_timedelta(day.dt.weekday, unit="D")
+
+
+def join_predictions_with_labels(
+        audit_dir: Path,
+        labels: Path,
+        *,
+        record_id_col: str,
+        target_col: str,
+        cfg: Optional[JoinConfig] = None,
+        spill_dir: Optional[Path] = None,
+) -> Tuple[Dict[Tuple[str, str], Tuple[np.ndarray, np.ndarray]], Dict[str, int]]:
+    """
+    Grace hash join of the prediction audit log with delayed labels on encounter id.
+
+    Pass 1 streams both inputs once and spills them into hash buckets.
+    Pass 2 joins bucket pairs independently (an encounter's rows always share a bucket);
+    when an encounter was scored more than once by the same model version the latest
+    score is kept. Returns {(week_start, model_version): (y, p)} and join counts.
+    """
+    cfg = cfg or JoinConfig()
+    tmp = Path(tempfile.mkdtemp(prefix="rrm-join-", dir=spill_dir))
+    counts = {"audit_rows": 0, "label_rows": 0, "joined_rows": 0}
+    try:
+        audit_spill = _Spill(tmp, "audit", cfg.n_partitions)
+        for df in iter_audit_batches(audit_dir, batch_size=cfg.batch_size):
+            counts["audit_rows"] += len(df)
+            audit_spill.write(df)
+        audit_spill.close()
+
+        label_spill = _Spill(tmp, "labels", cfg.n_partitions)
+        for df in iter_label_batches(labels, record_id_col=record_id_col, target_col=target_col,
+                                     batch_size=cfg.batch_size):
+            counts["label_rows"] += len(df)
+            label_spill.write(df)
+        label_spill.close()
+
+        parts: Dict[Tuple[str, str], List[Tuple[np.ndarray, np.ndarray]]] = {}
+        for b in range(cfg.n_partitions):
+            left = audit_spill.read(b, AUDIT_COLUMNS)
+            if left.empty:
+                continue
+            right = label_spill.read(b, [_KEY, "y"]).drop_duplicates(_KEY, keep="last")
+            if right.empty:
+                continue
+
+            left = left.sort_values("scored_utc").drop_duplicates([_KEY, "model_version"], keep="last")
+            joined = left.merge(right, on=_KEY, how="inner")
+            if joined.empty:
+                continue
+            counts["joined_rows"] += len(joined)
+            joined["week"] = _week_start(joined["scored_utc"])
+            for (week, version), g in joined.groupby(["week", "model_version"], sort=False):
+                parts.setdefault((f"{week:%Y-%m-%d}", version), []).append(
+                    (g["y"].to_numpy(dtype=np.int8), g["readmission_risk"].to_numpy(dtype=float))
+                )
+
+        groups = {
+            k: (np.concatenate([y for y, _ in v]), np.concatenate([p for _, p in v]))
+            for k, v in parts.items()
+        }
+        return groups, counts
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def live_performance_series(
+        groups: Dict[Tuple[str, str], Tuple[np.ndarray, np.ndarray]],
+        *,
+        cfg: Optional[JoinConfig] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Per model version and scoring week: that week's metrics and metrics over the
+    trailing `rolling_weeks` weeks (inclusive), ordered by version then week.
+    """
+    cfg = cfg or JoinConfig()
+    series: List[Dict[str, Any]] = []
+    for version in sorted({v for _, v in groups}):
+        weeks = sorted(w for w, v in groups if v == version)
+        for i, week in enumerate(weeks):
+            y, p = groups[(week, version)]
+            week_ts = pd.Timestamp(week)
+            trailing = [w for w in weeks[: i + 1]
+                        if (week_ts - pd.Timestamp(w)).days < 7 * cfg.rolling_weeks]
+            ry = np.concatenate([groups[(w, version)][0] for w in trailing])
+            rp = np.concatenate([groups[(w, version)][1] for w in trailing])
+            series.append({
+                "model_version": version,
+                "week_start": week,
+                "weekly": group_metrics(y, p, n_bins=cfg.calibration_bins),
+                "rolling": {
+                    "weeks": len(trailing),
+                    **group_metrics(ry, rp, n_bins=cfg.calibration_bins),
+                },
+            })
+    return series
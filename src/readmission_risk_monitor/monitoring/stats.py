@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import math
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+MISSING_TOKEN = "__MISSING__"
+OTHER_TOKEN = "__OTHER__"
+
+# Standard normal deciles: fallback bins for reference stats written before histograms existed
+_NORMAL_DECILES = np.array([-1.2816, -0.8416, -0.5244, -0.2533, 0.0, 0.2533, 0.5244, 0.8416, 1.2816])
+_PSI_EPS = 1e-4
+
+
+def reference_bins(ref_col: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray, bool]:
+    """
+    (interior edges, expected bin proportions, approximate?) for a numeric reference column.
+    Uses the stored histogram when present, else a normal approximation from mean/std.
+    """
+    hist = ref_col.get("histogram")
+    if hist:
+        counts = np.asarray(hist["counts"], dtype=float)
+        return np.asarray(hist["edges"], dtype=float), counts / max(counts.sum(), 1.0), False
+
+    mean, std = ref_col.get("mean"), ref_col.get("std")
+    if mean is None or not std:
+        return np.zeros(0), np.ones(1), True
+    edges = mean + std * _NORMAL_DECILES
+    return edges, np.full(len(edges) + 1, 1.0 / (len(edges) + 1)), True
+
+
+class NumericAccumulator:
+    """
+    Streaming numeric profile: count/mean/M2 (Chan's parallel merge of Welford states),
+    min/max, missing count and bin counts over fixed reference edges.
+    update() is vectorized over a batch; memory is O(bins).
+    """
+
+    def __init__(self, edges: np.ndarray):
+        self.edges = np.asarray(edges, dtype=float)
+        self.n = 0
+        self.n_missing = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.bin_counts = np.zeros(len(self.edges) + 1, dtype=np.int64)
+
+    def update(self, values) -> None:
+        x = pd.to_numeric(pd.Series(values), errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+        missing = np.isnan(x)
+        self.n_missing += int(missing.sum())
+        x = x[~missing]
+        nb = len(x)
+        if nb == 0:
+            return
+
+        mb = float(x.mean())
+        m2b = float(((x - mb) ** 2).sum())
+        tot = self.n + nb
+        delta = mb - self.mean
+        self.mean += delta * nb / tot
+        self.m2 += m2b + delta * delta * self.n * nb / tot
+        self.n = tot
+        self.min = min(self.min, float(x.min()))
+        self.max = max(self.max, float(x.max()))
+        self.bin_counts += np.bincount(
+            np.searchsorted(self.edges, x, side="right"), minlength=len(self.bin_counts)
+        )
+
+    @property
+    def total(self) -> int:
+        return self.n + self.n_missing
+
+    def to_stats(self) -> Dict[str, Any]:
+        """Same shape as compute_reference_stats' numeric entry."""
+        has = self.n > 0
+        return {
+            "type": "numeric",
+            "mean": self.mean if has else None,
+            "std": math.sqrt(self.m2 / (self.n - 1)) if self.n > 1 else None,
+            "min": self.min if has else None,
+            "max": self.max if has else None,
+            "missing_rate": self.n_missing / self.total if self.total else 0.0,
+            "histogram": {"edges": self.edges.tolist(), "counts": self.bin_counts.tolist()} if has else None,
+        }
+
+
+class CategoricalAccumulator:
+    """
+    Streaming categorical profile: value counts (missing counted as __MISSING__, like
+    compute_reference_stats). With max_tracked set, values outside `tracked` are folded
+    into __OTHER__ so memory stays bounded on high-cardinality columns.
+    """
+
+    def __init__(self, tracked: Optional[List[str]] = None):
+        self.tracked = set(tracked) if tracked is not None else None
+        self.counts: Counter = Counter()
+        self.n_missing = 0
+
+    def update(self, values) -> None:
+        s = pd.Series(values, dtype="object")
+        missing = s.isna()
+        self.update_counts(s[~missing].astype(str).value_counts().to_dict(), int(missing.sum()))
+
+    def update_counts(self, counts: Dict[str, int], n_missing: int = 0) -> None:
+        """Merge pre-aggregated value counts (e.g. pyarrow value_counts of a row group)."""
+        if self.tracked is not None:
+            other = sum(v for k, v in counts.items() if k not in self.tracked)
+            counts = {k: v for k, v in counts.items() if k in self.tracked}
+            if other:
+                self.counts[OTHER_TOKEN] += other
+        self.counts.update(counts)
+        if n_missing:
+            self.n_missing += n_missing
+            self.counts[MISSING_TOKEN] += n_missing
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def to_stats(self, max_categories: int = 20) -> Dict[str, Any]:
+        """Same shape as compute_reference_stats' categorical entry."""
+        total = self.total
+        return {
+            "type": "categorical",
+            "missing_rate": self.n_missing / total if total else 0.0,
+            "top_values": {str(k): int(v) for k, v in self.counts.most_common(max_categories)},
+        }
+
+
+def accumulator_for(ref_col: Dict[str, Any]):
+    if ref_col.get("type") == "numeric":
+        return NumericAccumulator(reference_bins(ref_col)[0])
+    return CategoricalAccumulator(tracked=list(ref_col.get("top_values", {}).keys()))
+
+
+def psi(expected: np.ndarray, actual: np.ndarray) -> float:
+    """Population stability index between two proportion vectors (eps-smoothed)."""
+    e = np.clip(np.asarray(expected, dtype=float), _PSI_EPS, None)
+    a = np.clip(np.asarray(actual, dtype=float), _PSI_EPS, None)
+    e, a = e / e.sum(), a / a.sum()
+    return float(np.sum((a - e) * np.log(a / e)))
+
+
+def _severity(value: float) -> str:
+    # Conventional PSI bands: <0.1 stable, 0.1-0.25 moderate, >0.25 major shift
+    if value >= 0.25:
+        return "major"
+    if value >= 0.10:
+        return "moderate"
+    return "stable"
+
+
+def score_numeric(acc: NumericAccumulator, ref_col: Dict[str, Any]) -> Dict[str, Any]:
+    _, expected, approximate = reference_bins(ref_col)
+    if acc.n == 0 or len(expected) != len(acc.bin_counts):
+        return {"type": "numeric", "n": acc.total, "psi": None, "ks": None}
+
+    actual = acc.bin_counts / acc.n
+    value = psi(expected, actual)
+    ks = float(np.max(np.abs(np.cumsum(actual) - np.cumsum(expected))))
+    std = ref_col.get("std") or 0.0
+    return {
+        "type": "numeric",
+        "n": acc.total,
+        "psi": value,
+        "ks": ks,
+        "mean_shift_z": (acc.mean - ref_col["mean"]) / std if std else None,
+        "missing_rate_delta": acc.to_stats()["missing_rate"] - float(ref_col.get("missing_rate", 0.0)),
+        "approximate_bins": approximate,
+        "severity": _severity(value),
+    }
+
+
+def score_categorical(
+        acc: CategoricalAccumulator,
+        ref_col: Dict[str, Any],
+        *,
+        ref_rows: Optional[int] = None,
+) -> Dict[str, Any]:
+    top = {str(k): float(v) for k, v in ref_col.get("top_values", {}).items()}
+    total = acc.total
+    if total == 0 or not top:
+        return {"type": "categorical", "n": total, "psi": None, "ks": None}
+
+    # Reference mass outside the stored top values (needs n_rows; 0 for older bundles)
+    ref_total = float(ref_rows) if ref_rows else sum(top.values())
+    expected = np.array([top[k] for k in top] + [max(ref_total - sum(top.values()), 0.0)]) / ref_total
+    seen = [acc.counts.get(k, 0) for k in top]
+    # Everything outside the reference top values (folded or untracked) is one bucket
+    actual = np.array(seen + [total - sum(seen)], dtype=float) / total
+
+    value = psi(expected, actual)
+    return {
+        "type": "categorical",
+        "n": total,
+        "psi": value,
+        "ks": None,
+        "unseen_rate": float(actual[-1]),
+        "missing_rate_delta": acc.to_stats()["missing_rate"] - float(ref_col.get("missing_rate", 0.0)),
+        "severity": _severity(value),
+    }
+
+
+def score_against_reference(
+        accumulators: Dict[str, Any],
+        reference_stats: Dict[str, Any],
+) -> Dict[str, Dict[str, Any]]:
+    """Per-feature drift scores for a set of accumulators built with accumulator_for()."""
+    ref_cols = reference_stats.get("columns", {})
+    ref_rows = reference_stats.get("n_rows")
+    out: Dict[str, Dict[str, Any]] = {}
+    for col, acc in accumulators.items():
+        ref_col = ref_cols.get(col)
+        if ref_col is None:
+            continue
+        if isinstance(acc, NumericAccumulator):
+            out[col] = score_numeric(acc, ref_col)
+        else:
+            out[col] = score_categorical(acc, ref_col, ref_rows=ref_rows)
+    return out
+
+
+def rank_by_drift(scores: Dict[str, Dict[str, Any]]) -> List[Tuple[str, float]]:
+    ranked = [(c, s["psi"]) for c, s in scores.items() if s.get("psi") is not None]
+    return sorted(ranked, key=lambda t: t[1], reverse=True)
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+# Read by OpenMP (LightGBM), OpenBLAS / MKL / Accelerate (NumPy, SciPy) and numexpr when
+# they are loaded; threadpoolctl resizes the pools of libraries that are already loaded
+THREAD_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+
+
+def available_cpus() -> int:
+    """CPUs this process may run on (respects taskset / cgroup cpusets, unlike os.cpu_count)."""
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return os.cpu_count() or 1
+
+
+@dataclass(frozen=True)
+class ResourceConfig:
+    """
+    CPU budget of one process. Serving runs `workers` processes side by side, so each one
+    gets cpus // workers; native pools default to one thread because a /predict call is
+    too small to split and W workers x N BLAS threads x M scoring threads oversubscribes
+    the cores. Training runs alone and gets every CPU unless RRM_TRAIN_CPUS caps it.
+    """
+
+    cpus: int = 1
+    workers: int = 1
+    blas_threads: int = 1
+    scoring_threads: int = 2
+    train_cpus: int = 1
+
+    @property
+    def cpus_per_worker(self) -> int:
+        return max(1, self.cpus // self.workers)
+
+    @classmethod
+    def from_env(cls, *, workers: Optional[int] = None) -> ResourceConfig:
+        """
+        RRM_CPUS (default: available CPUs), RRM_WORKERS (serving processes, set by
+        scripts/serve.py), RRM_BLAS_THREADS (default 1), RRM_SCORING_THREADS (default:
+        CPUs per worker, at least 2), RRM_TRAIN_CPUS (default: all CPUs).
+        """
+        cpus = int(os.getenv("RRM_CPUS", str(available_cpus())))
+        workers = workers or int(os.getenv("RRM_WORKERS", "1"))
+        per_worker = max(1, cpus // workers)
+        config = cls(
+            cpus=cpus,
+            workers=workers,
+            blas_threads=int(os.getenv("RRM_BLAS_THREADS", "1")),
+            scoring_threads=int(os.getenv("RRM_SCORING_THREADS", str(max(2, per_worker)))),
+            train_cpus=int(os.getenv("RRM_TRAIN_CPUS", str(cpus))),
+        )
+        for name in ("cpus", "workers", "blas_threads", "scoring_threads", "train_cpus"):
+            if getattr(config, name) < 1:
+                raise ValueError(f"{name} must be >= 1, got {getattr(config, name)}")
+        return config
+
+
+def limit_native_threads(n_threads: int) -> List[Dict[str, Any]]:
+    """
+    Cap BLAS and OpenMP pools of this process (and of processes it starts) at `n_threads`.
+    Returns what threadpoolctl found (empty when it is not installed; it ships with
+    scikit-learn, so the env vars alone only cover libraries loaded afterwards).
+    """
+    for var in THREAD_ENV_VARS:
+        os.environ[var] = str(n_threads)
+    try:
+        from threadpoolctl import threadpool_info, threadpool_limits
+    except ImportError:
+        return []
+    threadpool_limits(limits=n_threads)
+    return [
+        {"user_api": p.get("user_api"), "internal_api": p.get("internal_api"), "num_threads": p.get("num_threads")}
+        for p in threadpool_info()
+    ]
+
+
+def set_model_threads(pipeline: Any, n_threads: int) -> None:
+    """
+    Pin the final estimator's own thread count: LightGBM hands n_jobs to OpenMP on every
+    predict call, overriding the process-wide limit.
+    """
+    model = pipeline.steps[-1][1] if hasattr(pipeline, "steps") else pipeline
+    if "n_jobs" in getattr(model, "get_params", dict)():
+        model.set_params(n_jobs=n_threads)
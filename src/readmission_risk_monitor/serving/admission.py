@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import os
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from prometheus_client import Counter, Gauge, Histogram
+from starlette.responses import JSONResponse
+
+from readmission_risk_monitor.serving.schemas import PRIORITY_HEADER
+
+# Without the priority header /predict/batch is bulk and everything else interactive
+_PRIORITY_HEADER_KEY = PRIORITY_HEADER.lower().encode("latin-1")
+INTERACTIVE = "interactive"
+BULK = "bulk"
+PRIORITIES = (INTERACTIVE, BULK)
+
+QUEUE_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+ADMITTED = Counter("rrm_admission_admitted_total", "Scoring requests given a slot", ["priority"])
+SHED = Counter("rrm_admission_shed_total", "Scoring requests rejected with 503", ["priority", "reason"])
+QUEUE_WAIT = Histogram("rrm_admission_queue_seconds", "Time scoring requests waited for a slot", ["priority"],
+                       buckets=QUEUE_BUCKETS)
+QUEUE_DEPTH = Gauge("rrm_admission_queue_depth", "Scoring requests waiting for a slot", ["priority"],
+                    multiprocess_mode="livesum")
+IN_FLIGHT = Gauge("rrm_admission_in_flight", "Scoring requests holding a slot", ["priority"],
+                  multiprocess_mode="livesum")
+
+
+@dataclass(frozen=True)
+class AdmissionConfig:
+    slots: int = 2
+    bulk_slots: int = 1
+    max_queue: int = 64
+    interactive_deadline_ms: float = 250.0
+    bulk_deadline_ms: float = 5000.0
+
+    @classmethod
+    def from_env(cls, *, slots: Optional[int] = None) -> AdmissionConfig:
+        """
+        RRM_ADMISSION_SLOTS (default: `slots`, else CPUs, at least 2), RRM_ADMISSION_BULK_SLOTS
+        (default: slots - 1), RRM_ADMISSION_MAX_QUEUE, RRM_INTERACTIVE_DEADLINE_MS,
+        RRM_BULK_DEADLINE_MS. The app passes its scoring thread count as `slots`, so every
+        admitted request has a thread to run on.
+        """
+        slots = int(os.getenv("RRM_ADMISSION_SLOTS", str(slots or max(2, os.cpu_count() or 1))))
+        return cls(
+            slots=slots,
+            bulk_slots=int(os.getenv("RRM_ADMISSION_BULK_SLOTS", str(max(1, slots - 1)))),
+            max_queue=int(os.getenv("RRM_ADMISSION_MAX_QUEUE", "64")),
+            interactive_deadline_ms=float(os.getenv("RRM_INTERACTIVE_DEADLINE_MS", "250")),
+            bulk_deadline_ms=float(os.getenv("RRM_BULK_DEADLINE_MS", "5000")),
+        )
+
+    def deadline_s(self, priority: str) -> float:
+        ms = self.interactive_deadline_ms if priority == INTERACTIVE else self.bulk_deadline_ms
+        return ms / 1000.0
+
+
+class Rejected(Exception):
+    """A scoring request shed by admission control (answered 503 + Retry-After)."""
+
+    def __init__(self, priority: str, reason: str, retry_after_s: float):
+        super().__init__(f"{priority} request shed ({reason})")
+        self.priority = priority
+        self.reason = reason
+        self.retry_after_s = retry_after_s
+
+
+class AdmissionController:
+    """
+    Bounded scoring slots with two priority classes, one per worker process (runs on the
+    event loop, so no locks).
+
+    - at most `slots` requests score at once; bulk holds at most `bulk_slots` of them,
+      so interactive requests always have a slot bulk jobs cannot take
+    - requests without a free slot queue per priority; a freed slot goes to the oldest
+      interactive waiter first, then to bulk
+    - each priority has a queue-time deadline. A request is shed up front when the
+      estimated wait (requests ahead x mean slot hold time / slots) already exceeds it or
+      its queue is full, and shed when the deadline passes while it is still queued
+    """
+
+    def __init__(self, config: AdmissionConfig):
+        if not 1 <= config.bulk_slots <= config.slots:
+            raise ValueError(f"bulk_slots must be in [1, slots], got {config.bulk_slots} (slots={config.slots})")
+        self.config = config
+        self._in_flight: Dict[str, int] = dict.fromkeys(PRIORITIES, 0)
+        self._queues: Dict[str, Deque[asyncio.Future]] = {p: deque() for p in PRIORITIES}
+        self._hold_s: Dict[str, Optional[float]] = dict.fromkeys(PRIORITIES)
+
+    def _can_start(self, priority: str) -> bool:
+        if sum(self._in_flight.values()) >= self.config.slots:
+            return False
+        return priority == INTERACTIVE or self._in_flight[BULK] < self.config.bulk_slots
+
+    def estimated_wait_s(self, priority: str) -> float:
+        """Expected queue time for a new request of this priority (0 until a hold time is known)."""
+        if priority == INTERACTIVE:
+            ahead, capacity = len(self._queues[INTERACTIVE]), self.config.slots
+        else:
+            ahead, capacity = len(self._queues[INTERACTIVE]) + len(self._queues[BULK]), self.config.bulk_slots
+        return (ahead + 1) * (self._hold_s[priority] or 0.0) / capacity
+
+    def _publish(self) -> None:
+        for p in PRIORITIES:
+            QUEUE_DEPTH.labels(priority=p).set(len(self._queues[p]))
+            IN_FLIGHT.labels(priority=p).set(self._in_flight[p])
+
+    def _reject(self, priority: str, reason: str, wait_s: float) -> Rejected:
+        SHED.labels(priority=priority, reason=reason).inc()
+        return Rejected(priority, reason, retry_after_s=wait_s)
+
+    async def acquire(self, priority: str) -> float:
+        """Wait for a slot; returns the admission time for release(). Raises Rejected."""
+        t0 = time.perf_counter()
+        queue = self._queues[priority]
+        if not queue and self._can_start(priority):
+            self._in_flight[priority] += 1
+        else:
+            wait_s = self.estimated_wait_s(priority)
+            if len(queue) >= self.config.max_queue:
+                raise self._reject(priority, "queue_full", wait_s)
+            if wait_s > self.config.deadline_s(priority):
+                raise self._reject(priority, "slo", wait_s)
+
+            fut = asyncio.get_running_loop().create_future()
+            queue.append(fut)
+            self._publish()
+            try:
+                done, _ = await asyncio.wait({fut}, timeout=self.config.deadline_s(priority))
+            except BaseException:
+                # client went away while queued; give back a slot that was already handed over
+                if fut.done() and not fut.cancelled():
+                    self._free_slot(priority)
+                else:
+                    fut.cancel()
+                    queue.remove(fut)
+                    self._publish()
+                raise
+            if not done:
+                fut.cancel()
+                queue.remove(fut)
+                self._publish()
+                raise self._reject(priority, "deadline", self.estimated_wait_s(priority))
+
+        ADMITTED.labels(priority=priority).inc()
+        admitted = time.perf_counter()
+        QUEUE_WAIT.labels(priority=priority).observe(admitted - t0)
+        self._publish()
+        return admitted
+
+    def release(self, priority: str, admitted: float) -> None:
+        held = time.perf_counter() - admitted
+        prev = self._hold_s[priority]
+        self._hold_s[priority] = held if prev is None else 0.8 * prev + 0.2 * held
+        self._free_slot(priority)
+
+    def _free_slot(self, priority: str) -> None:
+        """Return a slot and hand free slots to the oldest waiters, interactive first."""
+        self._in_flight[priority] -= 1
+        for p in PRIORITIES:
+            queue = self._queues[p]
+            while queue and self._can_start(p):
+                fut = queue.popleft()
+                if not fut.done():
+                    self._in_flight[p] += 1
+                    fut.set_result(None)
+        self._publish()
+
+
+def request_priority(scope: Dict[str, Any]) -> str:
+    for name, value in scope.get("headers", ()):
+        if name == _PRIORITY_HEADER_KEY:
+            v = value.decode("latin-1").strip().lower()
+            if v in PRIORITIES:
+                return v
+    return BULK if scope["path"] == "/predict/batch" else INTERACTIVE
+
+
+class AdmissionMiddleware:
+    """
+    ASGI middleware that runs scoring requests (POST under `prefixes`) through the
+    worker's AdmissionController; everything else (health, metrics, schema) bypasses it.
+    `controller` is looked up per request, so the app can create it at startup and
+    None disables admission control.
+    """
+
+    def __init__(
+            self,
+            app: Any,
+            *,
+            controller: Callable[[], Optional[AdmissionController]],
+            prefixes: Tuple[str, ...] = ("/predict", "/score"),
+    ):
+        self.app = app
+        self.controller = controller
+        self.prefixes = prefixes
+
+    async def __call__(self, scope, receive, send) -> None:
+        controller = self.controller() if scope["type"] == "http" else None
+        if controller is None or scope["method"] != "POST" or not scope["path"].startswith(self.prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        priority = request_priority(scope)
+        try:
+            admitted = await controller.acquire(priority)
+        except Rejected as exc:
+            response = JSONResponse(
+                {"detail": "Scoring capacity exhausted; retry later", "priority": exc.priority, "reason": exc.reason},
+                status_code=503,
+                headers={"Retry-After": str(max(1, math.ceil(exc.retry_after_s)))},
+            )
+            await response(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            controller.release(priority, admitted)
@@ -1,22 +1,60 @@
 from __future__ import annotations
 
+import asyncio
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
-from fastapi import FastAPI
-from prometheus_client import Counter, Histogram, generate_latest
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.exception_handlers import request_validation_exception_handler
+from fastapi.exceptions import RequestValidationError
+from prometheus_client import Counter, Histogram
+from pydantic import BaseModel, ValidationError
+from starlette.concurrency import run_in_threadpool
 from starlette.responses import Response
 
 from readmission_risk_monitor.config import SETTINGS
-from readmission_risk_monitor.serving.explain import derive_risk_tier
-from readmission_risk_monitor.serving.model_loader import load_latest_bundle
+from readmission_risk_monitor.data.contract import diabetes_readmission_contract
+from readmission_risk_monitor.monitoring.drift import DriftMonitor
+from readmission_risk_monitor.runtime import ResourceConfig, limit_native_threads, set_model_threads
+from readmission_risk_monitor.serving.admission import (
+    AdmissionConfig,
+    AdmissionController,
+    AdmissionMiddleware,
+)
+from readmission_risk_monitor.serving.audit import AuditLogger
+from readmission_risk_monitor.serving.explain import (
+    BASELINE_REASON_CODE,
+    DEFAULT_TIER_THRESHOLDS,
+    TreeExplainer,
+    derive_risk_tier,
+    tier_thresholds_from_metadata,
+)
+from readmission_risk_monitor.serving.metrics import ServingMetrics, metrics_payload, record_error
+from readmission_risk_monitor.serving.model_loader import LoadedBundle, load_latest_bundle
 from readmission_risk_monitor.serving.schemas import (
+    MAX_SWEEP_POINTS,
+    FeatureSchemaResponse,
+    GlobalImportanceResponse,
     HealthResponse,
+    PredictBatchRequest,
+    PredictBatchResponse,
     PredictRequest,
     PredictResponse,
+    ScoreResponse,
+    SweepAxisValues,
+    SweepRequest,
+    SweepResponse,
+    build_features_model,
+    bundle_request_models,
+    bundle_sweep_model,
 )
+from readmission_risk_monitor.serving.score_table import SCORE_TABLE_FILENAME, ScoreTableReader
+from readmission_risk_monitor.serving.sweep import SweepScorer, grid_shape, sweep_frame
 
 app = FastAPI(title="readmission-risk-monitor", version="0.1.0")
 
@@ -28,22 +66,164 @@ REQ_LAT = Histogram("rrm_request_latency_seconds", "Prediction latency")
 MODEL = None
 META: Dict[str, Any] = {}
 FEATURE_COLUMNS: list[str] = []
+TIER_THRESHOLDS: Dict[str, float] = dict(DEFAULT_TIER_THRESHOLDS)
+BUNDLE_DIR: str = ""
+DRIFT: Optional[DriftMonitor] = None
+AUDIT: Optional[AuditLogger] = None
+METRICS: Optional[ServingMetrics] = None
+SCORES: Optional[ScoreTableReader] = None
+BUNDLE: Optional[LoadedBundle] = None
+EXPLAINER: Optional[TreeExplainer] = None
+# Scores preprocessor-encoded rows; set with EXPLAINER so a request is encoded only once
+SCORE_ENCODED: Optional[Callable[[Any], np.ndarray]] = None
+SWEEP: Optional[SweepScorer] = None
+ADMISSION: Optional[AdmissionController] = None
+RESOURCES: Optional[ResourceConfig] = None
+SCORING_POOL: Optional[ThreadPoolExecutor] = None
+
+# Request models generated from the bundle's feature columns (schemas.build_features_model)
+FEATURES_MODEL: Optional[type] = None
+REQUEST_MODEL: Optional[type] = None
+BATCH_REQUEST_MODEL: Optional[type] = None
+SWEEP_REQUEST_MODEL: Optional[type] = None
+
+# Set by preload_bundle() in a pre-fork parent; workers then skip loading at startup
+_PRELOADED = False
+
+# Scoring slots / priorities / load shedding (serving/admission.py); the controller is created per worker
+app.add_middleware(AdmissionMiddleware, controller=lambda: ADMISSION)
+
+
+def _bundle_root() -> Path:
+    """RRM_BUNDLE_DIR overrides the bundle root (defaults to <project_root>/bundle)."""
+    return Path(os.getenv("RRM_BUNDLE_DIR", str(SETTINGS.bundle_dir)))
+
+
+def _load_bundle(bundle_path: Path) -> None:
+    global MODEL, META, FEATURE_COLUMNS, TIER_THRESHOLDS, BUNDLE_DIR, BUNDLE, EXPLAINER, SWEEP, SCORE_ENCODED
+    global FEATURES_MODEL, REQUEST_MODEL, BATCH_REQUEST_MODEL, SWEEP_REQUEST_MODEL, RESOURCES
+
+    BUNDLE = load_latest_bundle(bundle_path)
+
+    # Cap BLAS/OpenMP threads once the model's native libraries are loaded; forked workers inherit it
+    RESOURCES = ResourceConfig.from_env()
+    limit_native_threads(RESOURCES.blas_threads)
+    set_model_threads(BUNDLE.model, RESOURCES.blas_threads)
+    MODEL = BUNDLE.scorer
+    META = BUNDLE.metadata
+    FEATURE_COLUMNS = BUNDLE.feature_columns
+    TIER_THRESHOLDS = tier_thresholds_from_metadata(BUNDLE.metadata)
+    BUNDLE_DIR = str(BUNDLE.bundle_dir.as_posix())
+
+    FEATURES_MODEL = build_features_model(
+        FEATURE_COLUMNS,
+        reference_stats=BUNDLE.reference_stats,
+        contract=diabetes_readmission_contract(),
+    )
+    REQUEST_MODEL, BATCH_REQUEST_MODEL = bundle_request_models(FEATURES_MODEL)
+    SWEEP_REQUEST_MODEL = bundle_sweep_model(FEATURES_MODEL)
+
+    # Tree bundles get per-patient TreeSHAP reason codes; RRM_EXPLAIN_BUDGET_MS="" = always exact
+    EXPLAINER = None
+    if TreeExplainer.supports(BUNDLE.model):
+        budget = os.getenv("RRM_EXPLAIN_BUDGET_MS", "25")
+        EXPLAINER = TreeExplainer(
+            BUNDLE.model,
+            FEATURE_COLUMNS,
+            compiled=BUNDLE.compiled,
+            budget_ms=float(budget) if budget else None,
+        )
+    # The explainer needs the encoded rows too, so scoring takes them instead of the raw frame
+    SCORE_ENCODED = None
+    if EXPLAINER is not None:
+        SCORE_ENCODED = getattr(MODEL, "predict_proba_encoded", None) or BUNDLE.model.named_steps["model"].predict_proba
+
+    # What-if grids skip re-encoding every grid row when the pipeline is preprocess -> model
+    SWEEP = SweepScorer(BUNDLE.model, FEATURE_COLUMNS) if SweepScorer.supports(BUNDLE.model) else None
+    _warm_up()
+
+
+def _warm_up() -> None:
+    """
+    Score one all-missing row right after loading, so the first real request does not
+    pay the model's first-call costs (lazy submodule imports, validation setup).
+    Runs before forking in prod mode, so every worker starts warm.
+    """
+    try:
+        MODEL.predict_proba(_feature_frame([FEATURES_MODEL().model_dump()]))
+    except Exception as exc:
+        # A model that cannot score an all-missing row still serves real traffic,
+        # but a broken bundle should be visible before the first request hits it
+        record_error("warmup", exc)
+        print(f"[WARN] Warm-up scoring failed: {type(exc).__name__}: {exc}", flush=True)
+
+
+def preload_bundle(bundle_path: Optional[Path] = None) -> None:
+    """
+    Load the bundle before workers are forked (scripts/serve.py --mode prod).
+    Forked workers share the parent's model pages copy-on-write instead of each
+    running joblib.load again.
+    """
+    global _PRELOADED
+    _load_bundle(bundle_path or _bundle_root())
+    _PRELOADED = True
 
 
 @app.on_event("startup")
 def _startup() -> None:
     """
-    Load the latest model bundle once at startup.
-    This avoids re-loading the model on every request.
+    Load the latest model bundle once at startup (unless a pre-fork parent already did)
+    and start this process's background threads. Threads never survive a fork, so
+    drift/audit/metrics state is always created per worker.
     """
-    global MODEL, META, FEATURE_COLUMNS
+    global DRIFT, AUDIT, METRICS, SCORES, ADMISSION, SCORING_POOL
+
+    if not _PRELOADED:
+        _load_bundle(_bundle_root())
+    METRICS = ServingMetrics(FEATURE_COLUMNS, str(META.get("model_version", "unknown")))
+    METRICS.start()
+
+    # Drift monitoring needs the bundle's reference stats; RRM_DRIFT_WINDOW_S=0 disables it
+    window_s = float(os.getenv("RRM_DRIFT_WINDOW_S", "60"))
+    if BUNDLE.reference_stats and window_s > 0:
+        DRIFT = DriftMonitor(BUNDLE.reference_stats, FEATURE_COLUMNS, window_seconds=window_s)
+        DRIFT.start()
+
+    # Prediction audit log (parquet); RRM_AUDIT_DIR="" disables it
+    audit_dir = os.getenv("RRM_AUDIT_DIR", str(SETTINGS.artifacts_dir / "audit"))
+    if audit_dir:
+        AUDIT = AuditLogger(Path(audit_dir))
+        AUDIT.start()
+
+    # Nightly score table (scripts/materialize_scores.py); RRM_SCORE_TABLE="" disables lookups
+    score_table = os.getenv("RRM_SCORE_TABLE", str(SETTINGS.artifacts_dir / "scores" / SCORE_TABLE_FILENAME))
+    SCORES = ScoreTableReader(Path(score_table)) if score_table else None
+
+    # Admission control for scoring endpoints; RRM_ADMISSION=0 disables it
+    enabled = os.getenv("RRM_ADMISSION", "1") != "0"
+    ADMISSION = AdmissionController(AdmissionConfig.from_env(slots=RESOURCES.scoring_threads)) if enabled else None
+
+    # Scoring runs on its own pool, sized to the admission slots instead of anyio's 40 threads
+    SCORING_POOL = ThreadPoolExecutor(max_workers=RESOURCES.scoring_threads, thread_name_prefix="rrm-score")
 
-    bundle_path = Path(SETTINGS.project_root) / "bundle"
-    bundle = load_latest_bundle(bundle_path)
 
-    MODEL = bundle.model
-    META = bundle.metadata
-    FEATURE_COLUMNS = bundle.feature_columns
+@app.on_event("shutdown")
+def _shutdown() -> None:
+    global METRICS, DRIFT, AUDIT, SCORING_POOL
+    if METRICS is not None:
+        # Stops the flush timer and pushes the last pending tallies
+        METRICS.stop()
+        METRICS = None
+    if DRIFT is not None:
+        DRIFT.stop()
+        DRIFT = None
+    if AUDIT is not None:
+        # Flush buffered predictions before the process exits
+        AUDIT.close()
+        AUDIT = None
+    if SCORING_POOL is not None:
+        SCORING_POOL.shutdown(wait=True)
+        SCORING_POOL = None
 
 
 @app.get("/")
@@ -55,6 +235,7 @@ def root() -> Dict[str, Any]:
         "docs": "/docs",
         "health": "/health",
         "metrics": "/metrics",
+        "drift": "/drift",
         "openapi": "/openapi.json",
     }
 
@@ -66,46 +247,378 @@ def health() -> HealthResponse:
         status="ok" if ok else "not_ready",
         model_version=str(META.get("model_version", "unknown")),
         schema_version=str(META.get("schema_version", "unknown")),
+        bundle_path=BUNDLE_DIR,
     )
 
 
+@app.exception_handler(RequestValidationError)
+async def _count_validation_errors(request: Request, exc: RequestValidationError) -> Response:
+    record_error(request.url.path, exc)
+    return await request_validation_exception_handler(request, exc)
+
+
 @app.get("/metrics")
 def metrics() -> Response:
-    return Response(generate_latest(), media_type="text/plain; version=0.0.4")
+    if METRICS is not None:
+        METRICS.flush()
+    return Response(metrics_payload(), media_type="text/plain; version=0.0.4")
+
+
+@app.get("/drift")
+def drift() -> Dict[str, Any]:
+    """Per-feature PSI/KS of the last completed traffic window vs the bundle's reference stats."""
+    if DRIFT is None:
+        return {"status": "disabled", "features": {}}
+    return DRIFT.snapshot()
+
+
+@app.get("/schema", response_model=FeatureSchemaResponse)
+def schema() -> FeatureSchemaResponse:
+    """The `features` object /predict accepts for the loaded bundle: names, types, allowed codes."""
+    _require_model()
+    return FeatureSchemaResponse(
+        model_version=str(META.get("model_version", "unknown")),
+        feature_columns=FEATURE_COLUMNS,
+        json_schema=FEATURES_MODEL.model_json_schema(),
+    )
 
 
-@app.post("/predict", response_model=PredictResponse)
-def predict(req: PredictRequest) -> PredictResponse:
+@app.get("/explain/global", response_model=GlobalImportanceResponse)
+def explain_global() -> GlobalImportanceResponse:
+    """Per-feature permutation importance computed on the validation split at training time."""
+    _require_model()
+    if BUNDLE.global_importance is None:
+        raise HTTPException(404, "This bundle has no global importance; retrain it with scripts/train.py")
+    return GlobalImportanceResponse.model_validate(
+        {**BUNDLE.global_importance, "model_version": str(META.get("model_version", "unknown"))}
+    )
+
+
+def _require_model() -> None:
     if MODEL is None or not FEATURE_COLUMNS:
         # This would mean startup didn't load correctly
         raise RuntimeError("Model bundle not loaded. Check startup logs and bundle path.")
 
-    t0 = time.perf_counter()
 
-    # Build a single-row dataframe with EXACT feature column order
-    row: Dict[str, Any] = {c: None for c in FEATURE_COLUMNS}
-    for k, v in req.features.items():
-        if k in row:
-            row[k] = v
+def _feature_frame(rows: List[Dict[str, Any]]) -> pd.DataFrame:
+    return pd.DataFrame.from_records(rows, columns=FEATURE_COLUMNS)
 
-    X = pd.DataFrame([row], columns=FEATURE_COLUMNS)
 
-    with REQ_LAT.time():
-        # Correct indexing: [:, 1] gives proba for positive class; take first row
-        proba = float(MODEL.predict_proba(X)[:, 1][0])
+def _audit(
+        requests: List[PredictRequest],
+        rows: List[Dict[str, Any]],
+        responses: List[PredictResponse],
+        latency_ms: float,
+) -> None:
+    if AUDIT is None:
+        return
+    AUDIT.record(
+        request_ids=[r.request_id for r in requests],
+        encounter_ids=[r.encounter_id for r in requests],
+        features=rows,
+        probas=[r.readmission_risk for r in responses],
+        tiers=[r.risk_tier for r in responses],
+        model_version=str(META.get("model_version", "unknown")),
+        schema_version=str(META.get("schema_version", "unknown")),
+        latency_ms=latency_ms,
+    )
 
-    tier = derive_risk_tier(proba, high=0.7, medium=0.4)
 
-    latency_ms = (time.perf_counter() - t0) * 1000.0
-    REQ_COUNT.inc()
+def _score(X: pd.DataFrame) -> Tuple[np.ndarray, Any]:
+    """Positive-class probabilities, plus the encoded rows when the explainer can reuse them."""
+    if SCORE_ENCODED is None:
+        return MODEL.predict_proba(X)[:, 1], None
+    X_encoded = EXPLAINER.preprocessor.transform(X)
+    return SCORE_ENCODED(X_encoded)[:, 1], X_encoded
+
 
+def _reason_codes(
+        endpoint: str,
+        rows: List[Dict[str, Any]],
+        X: pd.DataFrame,
+        X_encoded: Any = None,
+) -> Tuple[List[List[str]], List[bool]]:
+    """Per-row reason codes and approximate flags; an explainer failure never fails scoring."""
+    if EXPLAINER is not None:
+        try:
+            return EXPLAINER.explain(rows, X, X_encoded)
+        except Exception as exc:
+            record_error(endpoint, exc)
+    return [[BASELINE_REASON_CODE]] * len(rows), [False] * len(rows)
+
+
+def _to_response(
+        request_id: str,
+        proba: float,
+        latency_ms: float,
+        reason_codes: List[str],
+        approximate: bool = False,
+) -> PredictResponse:
     return PredictResponse(
-        request_id=req.request_id,
+        request_id=request_id,
         readmission_risk=proba,
-        risk_tier=tier,
+        risk_tier=derive_risk_tier(proba, **TIER_THRESHOLDS),
         rank_score=proba,
-        reason_codes=["PHASE4_BASELINE_EXPLAIN"],
+        reason_codes=reason_codes,
+        reason_codes_approximate=approximate,
         model_version=str(META.get("model_version", "unknown")),
         schema_version=str(META.get("schema_version", "unknown")),
         latency_ms=float(latency_ms),
     )
+
+
+async def _parse_body(request: Request, model: type) -> Any:
+    """
+    Validate the raw JSON body against a bundle request model in one pydantic-core pass
+    (no intermediate dict). Errors are raised as FastAPI 422s whose loc names the field,
+    e.g. ["body", "items", 3, "features", "RACE"].
+    """
+    body = await request.body()
+    try:
+        return model.model_validate_json(body)
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [{**e, "loc": ("body", *e["loc"])} for e in exc.errors(include_url=False)]
+        ) from None
+
+
+async def _run_scoring(fn: Callable[..., Any], *args: Any) -> Any:
+    """Run a blocking scoring call on the worker's scoring pool (anyio's pool before startup)."""
+    if SCORING_POOL is None:
+        return await run_in_threadpool(fn, *args)
+    return await asyncio.get_running_loop().run_in_executor(SCORING_POOL, fn, *args)
+
+
+def _json_response(resp: BaseModel) -> Response:
+    """Serialize with pydantic-core directly instead of jsonable_encoder + json.dumps."""
+    return Response(resp.model_dump_json(), media_type="application/json")
+
+
+def _request_body_schema(model: type) -> Dict[str, Any]:
+    """OpenAPI requestBody for endpoints that read the body themselves (generic feature schema)."""
+    schema = model.model_json_schema()
+    defs = schema.pop("$defs", {})
+
+    def inline(node: Any) -> Any:
+        if isinstance(node, dict):
+            ref = node.get("$ref", "")
+            if ref.startswith("#/$defs/"):
+                return inline(defs[ref.rsplit("/", 1)[-1]])
+            return {k: inline(v) for k, v in node.items()}
+        if isinstance(node, list):
+            return [inline(v) for v in node]
+        return node
+
+    return {"requestBody": {"required": True, "content": {"application/json": {"schema": inline(schema)}}}}
+
+
+@app.post("/predict", response_model=PredictResponse, openapi_extra=_request_body_schema(PredictRequest))
+async def predict(request: Request) -> Response:
+    _require_model()
+    req = await _parse_body(request, REQUEST_MODEL)
+    return _json_response(await _run_scoring(_predict, req))
+
+
+def _predict(req: PredictRequest) -> PredictResponse:
+    t0 = time.perf_counter()
+
+    rows = [req.features.model_dump()]
+    X = _feature_frame(rows)
+
+    with REQ_LAT.time():
+        try:
+            # _score returns the positive-class column; take the first (only) row
+            p, X_encoded = _score(X)
+            proba = float(p[0])
+        except Exception as exc:
+            record_error("/predict", exc)
+            raise
+
+    (codes,), (approximate,) = _reason_codes("/predict", rows, X, X_encoded)
+
+    latency_ms = (time.perf_counter() - t0) * 1000.0
+    REQ_COUNT.inc()
+    if DRIFT is not None:
+        DRIFT.observe(rows)
+
+    resp = _to_response(req.request_id, proba, latency_ms, codes, approximate)
+    METRICS.observe(rows, [proba], [resp.risk_tier])
+    _audit([req], rows, [resp], latency_ms)
+    return resp
+
+
+@app.post(
+    "/predict/batch",
+    response_model=PredictBatchResponse,
+    openapi_extra=_request_body_schema(PredictBatchRequest),
+)
+async def predict_batch(request: Request) -> Response:
+    """
+    Score many patients in one vectorized predict_proba call.
+    Each item's latency_ms is the shared batch latency.
+    """
+    _require_model()
+    req = await _parse_body(request, BATCH_REQUEST_MODEL)
+    return _json_response(await _run_scoring(_predict_batch, req))
+
+
+def _predict_batch(req: PredictBatchRequest) -> PredictBatchResponse:
+    t0 = time.perf_counter()
+
+    rows = [item.features.model_dump() for item in req.items]
+    X = _feature_frame(rows)
+    X_encoded = None
+    try:
+        if len(X):
+            p, X_encoded = _score(X)
+            probas = p.tolist()
+        else:
+            probas = []
+    except Exception as exc:
+        record_error("/predict/batch", exc)
+        raise
+    codes, approximate = _reason_codes("/predict/batch", rows, X, X_encoded) if len(X) else ([], [])
+
+    latency_ms = (time.perf_counter() - t0) * 1000.0
+    REQ_COUNT.inc(len(req.items))
+    if DRIFT is not None:
+        DRIFT.observe(rows)
+
+    predictions = [
+        _to_response(item.request_id, p, latency_ms, c, a)
+        for item, p, c, a in zip(req.items, probas, codes, approximate, strict=True)
+    ]
+    METRICS.observe(rows, probas, [p.risk_tier for p in predictions])
+    _audit(req.items, rows, predictions, latency_ms)
+    return PredictBatchResponse(predictions=predictions, latency_ms=float(latency_ms))
+
+
+@app.post("/predict/sweep", response_model=SweepResponse, openapi_extra=_request_body_schema(SweepRequest))
+async def predict_sweep(request: Request) -> Response:
+    """
+    What-if response curve for one patient: vary up to three features (a numeric range
+    or a set of values each) and score the whole grid in one vectorized call. Grid points
+    are hypothetical patients, so they are not audited or fed to drift / serving metrics.
+    """
+    _require_model()
+    req = await _parse_body(request, SWEEP_REQUEST_MODEL)
+    axes = _sweep_axes(req)
+    return _json_response(await _run_scoring(_sweep, req, axes))
+
+
+def _sweep_axes(req: SweepRequest) -> List[Tuple[str, List[Any]]]:
+    """Each axis's values, validated against the bundle's feature schema (422s located under body.axes)."""
+    errors: List[Dict[str, Any]] = []
+    axes: List[Tuple[str, List[Any]]] = []
+    for i, axis in enumerate(req.axes):
+        loc = ("body", "axes", i)
+        if axis.feature not in FEATURE_COLUMNS or axis.feature in [f for f, _ in axes]:
+            errors.append({
+                "loc": (*loc, "feature"),
+                "msg": f"Not a bundle feature, or swept twice: {axis.feature!r}",
+                "type": "value_error",
+                "input": axis.feature,
+            })
+            continue
+        values = []
+        for k, v in enumerate(axis.grid_values()):
+            try:
+                values.append(getattr(FEATURES_MODEL.model_validate({axis.feature: v}), axis.feature))
+            except ValidationError as exc:
+                at = (*loc, "values", k) if axis.values is not None else (*loc, "start")
+                errors.extend({**e, "loc": at} for e in exc.errors(include_url=False))
+                if axis.values is None:
+                    break
+        axes.append((axis.feature, values))
+    if not errors and int(np.prod(grid_shape(axes))) > MAX_SWEEP_POINTS:
+        errors.append({
+            "loc": ("body", "axes"),
+            "msg": f"Grid has {int(np.prod(grid_shape(axes)))} points (max {MAX_SWEEP_POINTS})",
+            "type": "value_error",
+            "input": None,
+        })
+    if errors:
+        raise RequestValidationError(errors)
+    return axes
+
+
+def _sweep(req: SweepRequest, axes: List[Tuple[str, List[Any]]]) -> SweepResponse:
+    t0 = time.perf_counter()
+
+    base = req.features.model_dump()
+    try:
+        if SWEEP is not None:
+            base_risk, risk = SWEEP.score(base, axes)
+        else:
+            X = pd.concat([_feature_frame([base]), sweep_frame(base, axes, FEATURE_COLUMNS)], ignore_index=True)
+            probas = MODEL.predict_proba(X)[:, 1]
+            base_risk, risk = float(probas[0]), probas[1:].reshape(grid_shape(axes))
+    except Exception as exc:
+        record_error("/predict/sweep", exc)
+        raise
+
+    return SweepResponse(
+        request_id=req.request_id,
+        base_risk=base_risk,
+        base_risk_tier=derive_risk_tier(base_risk, **TIER_THRESHOLDS),
+        axes=[SweepAxisValues(feature=f, values=v) for f, v in axes],
+        risk=risk.tolist(),
+        n_points=int(risk.size),
+        model_version=str(META.get("model_version", "unknown")),
+        schema_version=str(META.get("schema_version", "unknown")),
+        latency_ms=(time.perf_counter() - t0) * 1000.0,
+    )
+
+
+def _table_score(encounter_id: int, request_id: str) -> Optional[ScoreResponse]:
+    """The nightly score for this encounter, if the table has it for the serving model version."""
+    if SCORES is None:
+        return None
+    t0 = time.perf_counter()
+    row = SCORES.lookup(encounter_id, str(META.get("model_version", "unknown")))
+    if row is None:
+        return None
+    return ScoreResponse(
+        request_id=request_id,
+        readmission_risk=row["readmission_risk"],
+        risk_tier=row["risk_tier"],
+        rank_score=row["readmission_risk"],
+        reason_codes=row["reason_codes"],
+        reason_codes_approximate=row["reason_codes_approximate"],
+        model_version=row["model_version"],
+        schema_version=str(META.get("schema_version", "unknown")),
+        latency_ms=(time.perf_counter() - t0) * 1000.0,
+        source="table",
+        scored_utc=row["scored_utc"],
+    )
+
+
+@app.get("/score/{encounter_id}", response_model=ScoreResponse)
+def score(encounter_id: int, request_id: Optional[str] = None) -> Response:
+    """
+    Precomputed score from the nightly table (binary search over the memory-mapped file).
+    404 when the encounter is not in the table or was scored by another model version;
+    POST with the patient's features to fall back to live scoring.
+    """
+    _require_model()
+    hit = _table_score(encounter_id, request_id or f"score-{encounter_id}")
+    if hit is None:
+        raise HTTPException(404, "Encounter not in the current score table; POST its features to score live")
+    return _json_response(hit)
+
+
+@app.post("/score/{encounter_id}", response_model=ScoreResponse, openapi_extra=_request_body_schema(PredictRequest))
+async def score_or_predict(encounter_id: int, request: Request) -> Response:
+    """
+    Nightly table score when present and current; otherwise the body's features are
+    scored live (same path as /predict, audited under this encounter id).
+    """
+    _require_model()
+    req = await _parse_body(request, REQUEST_MODEL)
+    hit = _table_score(encounter_id, req.request_id)
+    if hit is not None:
+        return _json_response(hit)
+    if req.encounter_id is None:
+        req = req.model_copy(update={"encounter_id": str(encounter_id)})
+    live = await _run_scoring(_predict, req)
+    return _json_response(ScoreResponse(**live.model_dump(), source="live"))
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+import pyarrow as pa
+from prometheus_client import Counter, Gauge
+
+if TYPE_CHECKING:
+    import pyarrow.parquet as pq
+
+AUDIT_WRITTEN = Counter("rrm_audit_rows_written_total", "Prediction audit rows written to parquet")
+AUDIT_DROPPED = Counter("rrm_audit_rows_dropped_total", "Prediction audit rows dropped because the buffer was full")
+AUDIT_WRITE_ERRORS = Counter("rrm_audit_write_errors_total", "Audit row-group writes that failed")
+AUDIT_QUEUE_DEPTH = Gauge("rrm_audit_queue_depth", "Prediction audit rows buffered in memory",
+                          multiprocess_mode="livesum")
+
+AUDIT_SCHEMA = pa.schema([
+    ("scored_utc", pa.timestamp("us", tz="UTC")),
+    ("request_id", pa.string()),
+    ("encounter_id", pa.string()),
+    ("model_version", pa.string()),
+    ("schema_version", pa.string()),
+    ("readmission_risk", pa.float64()),
+    ("risk_tier", pa.string()),
+    ("latency_ms", pa.float64()),
+    ("features", pa.string()),
+])
+
+_IN_PROGRESS_SUFFIX = ".inprogress"
+
+
+def _json_default(v: Any) -> Any:
+    # numpy scalars / timestamps that slipped through request parsing
+    return v.item() if hasattr(v, "item") else str(v)
+
+
+class AuditLogger:
+    """
+    Non-blocking prediction audit log.
+
+    record() only appends tuples to a bounded ring buffer (O(1) per row, no I/O in the
+    request path). A daemon thread drains the buffer every `flush_interval_s` (or as soon
+    as `row_group_size` rows are waiting), serializes features to JSON and appends one
+    parquet row group per drain to the current file.
+
+    Files are partitioned by scoring date and rotated by row count / age:
+        <out_dir>/date=YYYY-MM-DD/audit-<HHMMSS>-<pid>-<seq>.parquet
+    They carry an .inprogress suffix until closed, so readers only ever see complete files.
+    When the buffer is full the oldest rows are overwritten and counted in
+    rrm_audit_rows_dropped_total. close() drains everything and finalizes the open file.
+    """
+
+    def __init__(
+            self,
+            out_dir: Path,
+            *,
+            capacity: int = 100_000,
+            row_group_size: int = 5_000,
+            flush_interval_s: float = 2.0,
+            rotate_rows: int = 1_000_000,
+            rotate_seconds: float = 3600.0,
+    ):
+        self.out_dir = Path(out_dir)
+        self.row_group_size = row_group_size
+        self.flush_interval_s = flush_interval_s
+        self.rotate_rows = rotate_rows
+        self.rotate_seconds = rotate_seconds
+
+        self._buffer: deque = deque(maxlen=capacity)
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._write_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+        self._writer: Optional[pq.ParquetWriter] = None
+        self._path: Optional[Path] = None
+        self._file_date: Optional[str] = None
+        self._file_rows = 0
+        self._file_opened = 0.0
+        self._seq = 0
+        self.files_written: List[Path] = []
+
+    # --- request path -------------------------------------------------------------
+
+    def record(
+            self,
+            *,
+            request_ids: List[str],
+            encounter_ids: List[Optional[str]],
+            features: List[Dict[str, Any]],
+            probas: List[float],
+            tiers: List[str],
+            model_version: str,
+            schema_version: str,
+            latency_ms: float,
+    ) -> None:
+        """Buffer one row per scored patient; never blocks on disk."""
+        buf = self._buffer
+        now = time.time()
+        for rid, eid, feats, p, tier in zip(request_ids, encounter_ids, features, probas, tiers, strict=True):
+            if len(buf) == buf.maxlen:
+                AUDIT_DROPPED.inc()
+            buf.append((now, rid, eid, model_version, schema_version, p, tier, latency_ms, feats))
+        if len(buf) >= self.row_group_size:
+            self._wake.set()
+
+    # --- background ---------------------------------------------------------------
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="rrm-audit", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval_s)
+            self._wake.clear()
+            self.flush()
+
+    def close(self) -> None:
+        """Stop the drain thread, write everything still buffered and finalize the open file."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=10.0)
+            self._thread = None
+        self.flush()
+        with self._write_lock:
+            self._close_file()
+
+    def flush(self) -> int:
+        """Drain the buffer into row groups of at most row_group_size rows."""
+        written = 0
+        with self._write_lock:
+            while True:
+                rows = self._take(self.row_group_size)
+                if not rows:
+                    break
+                try:
+                    self._write(rows)
+                    written += len(rows)
+                except Exception:
+                    AUDIT_WRITE_ERRORS.inc()
+                    AUDIT_DROPPED.inc(len(rows))
+            if self._writer is not None and time.monotonic() - self._file_opened >= self.rotate_seconds:
+                self._close_file()
+        AUDIT_QUEUE_DEPTH.set(len(self._buffer))
+        return written
+
+    def _take(self, n: int) -> List[tuple]:
+        rows = []
+        buf = self._buffer
+        while buf and len(rows) < n:
+            try:
+                rows.append(buf.popleft())
+            except IndexError:
+                break
+        return rows
+
+    def _write(self, rows: List[tuple]) -> None:
+        cols = list(zip(*rows, strict=True))
+        table = pa.Table.from_arrays(
+            [
+                pa.array([int(t * 1_000_000) for t in cols[0]], type=pa.int64()).cast(AUDIT_SCHEMA.field(0).type),
+                pa.array(cols[1], type=pa.string()),
+                pa.array([None if e is None else str(e) for e in cols[2]], type=pa.string()),
+                pa.array(cols[3], type=pa.string()),
+                pa.array(cols[4], type=pa.string()),
+                pa.array(cols[5], type=pa.float64()),
+                pa.array(cols[6], type=pa.string()),
+                pa.array(cols[7], type=pa.float64()),
+                pa.array(
+                    [json.dumps(f, separators=(",", ":"), default=_json_default) for f in cols[8]],
+                    type=pa.string(),
+                ),
+            ],
+            schema=AUDIT_SCHEMA,
+        )
+
+        # Date partition follows the first row; a group straddling midnight stays in one file
+        date = datetime.fromtimestamp(cols[0][0], tz=timezone.utc).strftime("%Y-%m-%d")
+        if self._writer is not None and (date != self._file_date or self._file_rows >= self.rotate_rows):
+            self._close_file()
+        if self._writer is None:
+            self._open_file(date)
+
+        self._writer.write_table(table)
+        self._file_rows += len(rows)
+        AUDIT_WRITTEN.inc(len(rows))
+
+    def _open_file(self, date: str) -> None:
+        # Imported on the writer thread, off the app's import and request paths
+        import pyarrow.parquet as pq
+
+        part = self.out_dir / f"date={date}"
+        part.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now(timezone.utc).strftime("%H%M%S")
+        self._seq += 1
+        final = part / f"audit-{stamp}-{os.getpid()}-{self._seq:04d}.parquet"
+        self._path = final.with_name(final.name + _IN_PROGRESS_SUFFIX)
+        self._writer = pq.ParquetWriter(self._path, AUDIT_SCHEMA, compression="zstd")
+        self._file_date = date
+        self._file_rows = 0
+        self._file_opened = time.monotonic()
+
+    def _close_file(self) -> None:
+        if self._writer is None:
+            return
+        self._writer.close()
+        final = self._path.with_name(self._path.name[: -len(_IN_PROGRESS_SUFFIX)])
+        self._path.rename(final)
+        self.files_written.append(final)
+        self._writer = None
+        self._path = None
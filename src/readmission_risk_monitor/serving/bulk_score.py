@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import json
+import os
+import resource
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from readmission_risk_monitor.config import SETTINGS
+
+# model_version is not stored in the part files: the model_version=<v> hive directory
+# carries it, and a file column of the same name would clash with the partition field
+OUTPUT_SCHEMA_FIELDS = [
+    ("readmission_risk", pa.float64()),
+    ("risk_tier", pa.dictionary(pa.int8(), pa.string())),
+]
+TIERS = np.array(["low", "medium", "high"])
+
+# Per-process state of a scoring worker, set once by _init_worker
+_WORKER: Dict[str, Any] = {}
+
+
+def _utcnow() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size of this process (ru_maxrss is KiB on Linux, bytes on macOS)."""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def risk_tiers(p: np.ndarray, *, high: float, medium: float) -> np.ndarray:
+    """Vectorized explain.derive_risk_tier: tier index 0=low, 1=medium, 2=high."""
+    return (p >= medium).astype(np.int8) + (p >= high).astype(np.int8)
+
+
+def row_group_tasks(source: Path) -> List[Tuple[str, int, int]]:
+    """(file, row group, rows) for every row group of a parquet file or directory of files."""
+    files = sorted(source.rglob("*.parquet")) if source.is_dir() else [source]
+    tasks = []
+    for f in files:
+        meta = pq.ParquetFile(f).metadata
+        tasks.extend((str(f), rg, meta.row_group(rg).num_rows) for rg in range(meta.num_row_groups))
+    return tasks
+
+
+def _init_worker(bundle_dir: str, blas_threads: int) -> None:
+    """Load the bundle once per worker process, with native pools capped so workers don't oversubscribe."""
+    from readmission_risk_monitor.runtime import limit_native_threads, set_model_threads
+    from readmission_risk_monitor.serving.explain import tier_thresholds_from_metadata
+    from readmission_risk_monitor.serving.model_loader import load_bundle
+
+    limit_native_threads(blas_threads)
+    bundle = load_bundle(Path(bundle_dir))
+    set_model_threads(bundle.model, blas_threads)
+    _WORKER.update(
+        scorer=bundle.scorer,
+        feature_columns=bundle.feature_columns,
+        thresholds=tier_thresholds_from_metadata(bundle.metadata),
+    )
+
+
+def _score_row_group(
+        path: str,
+        row_group: int,
+        out_path: str,
+        keep_columns: Sequence[str],
+        chunk_size: int,
+) -> Dict[str, Any]:
+    """
+    Worker: stream one row group `chunk_size` rows at a time, reading only `keep_columns`
+    and the bundle's feature columns (absent features score as missing), and append each
+    scored chunk to its own output file as one row group.
+    """
+    features: List[str] = _WORKER["feature_columns"]
+    pf = pq.ParquetFile(path)
+    names = set(pf.schema_arrow.names)
+    keep = [c for c in keep_columns if c in names]
+    present = [c for c in features if c in names and c not in keep]
+    absent = [c for c in features if c not in names]
+    tier_names = pa.array(TIERS.tolist())
+
+    t0 = time.perf_counter()
+    n_rows = 0
+    tmp = Path(out_path).with_name(Path(out_path).name + f".{os.getpid()}.tmp")
+    writer: Optional[pq.ParquetWriter] = None
+    try:
+        for batch in pf.iter_batches(batch_size=chunk_size, row_groups=[row_group], columns=keep + present):
+            X = batch.to_pandas().reindex(columns=features)
+            for c in absent:
+                X[c] = None
+            p = _WORKER["scorer"].predict_proba(X)[:, 1]
+            tiers = risk_tiers(p, **_WORKER["thresholds"])
+            out = pa.Table.from_arrays(
+                [batch.column(c) for c in keep] + [
+                    pa.array(p, type=pa.float64()),
+                    pa.DictionaryArray.from_arrays(pa.array(tiers), tier_names),
+                ],
+                names=keep + [name for name, _ in OUTPUT_SCHEMA_FIELDS],
+            )
+            if writer is None:
+                writer = pq.ParquetWriter(str(tmp), out.schema)
+            writer.write_table(out)
+            n_rows += len(p)
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is not None:
+        os.replace(tmp, out_path)
+    return {
+        "n_rows": n_rows,
+        "seconds": time.perf_counter() - t0,
+        "pid": os.getpid(),
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def _swap_in(staging: Path, partition: Path) -> None:
+    """Replace `partition` with the fully written `staging` directory (renames only)."""
+    if not partition.exists():
+        os.replace(staging, partition)
+        return
+    # os.replace cannot overwrite a non-empty directory: move the old one aside first
+    retired = partition.with_name(f"_retired-{partition.name}-{os.getpid()}")
+    os.replace(partition, retired)
+    os.replace(staging, partition)
+    shutil.rmtree(retired, ignore_errors=True)
+
+
+def score_dataset(
+        source: Path,
+        bundle_root: Path,
+        out_dir: Path,
+        *,
+        keep_columns: Sequence[str] = (SETTINGS.record_id_col, SETTINGS.patient_id_col),
+        chunk_size: int = 10_000,
+        n_workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Score a parquet dataset (file or directory) with the latest bundle under `bundle_root`.
+
+    Row groups are sharded across `n_workers` processes (default: available CPUs, see
+    runtime.ResourceConfig); each worker loads the bundle once, runs with one BLAS/OpenMP
+    thread, and reads only `keep_columns` + the bundle's feature columns in chunks of
+    `chunk_size` rows, so its memory is bounded by the chunk, not the dataset. Output is a
+    hive-partitioned dataset out_dir/model_version=<v>/ with one file per input row group
+    holding the kept columns, readmission_risk and risk_tier; reading out_dir as a dataset
+    adds model_version from the partition. A rerun with the same model version replaces
+    that partition, but only once every row group has scored: output is staged in a
+    "_"-prefixed sibling directory (ignored by dataset readers) and swapped in at the end,
+    so a failed or interrupted rerun leaves the previous scores in place.
+
+    `latest` is resolved once here and every worker loads that exact bundle directory, so
+    a promotion during the run cannot mix model versions within the partition.
+    """
+    from readmission_risk_monitor.runtime import ResourceConfig
+    from readmission_risk_monitor.serving.model_loader import resolve_latest_bundle_dir
+
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+    tasks = row_group_tasks(source)
+    if not tasks:
+        raise ValueError(f"No parquet row groups under {source}")
+    bundle_dir = resolve_latest_bundle_dir(bundle_root)
+    meta = json.loads((bundle_dir / "metadata.json").read_text())
+    model_version = str(meta.get("model_version", "unknown"))
+
+    partition = out_dir / f"model_version={model_version}"
+    staging = out_dir / f"_staging-model_version={model_version}-{os.getpid()}"
+    if staging.exists():
+        shutil.rmtree(staging)
+    staging.mkdir(parents=True)
+    outputs = [str(staging / f"part-{i:05d}.parquet") for i in range(len(tasks))]
+
+    t0 = time.perf_counter()
+    n_workers = max(1, min(n_workers or ResourceConfig.from_env().cpus, len(tasks)))
+    args = [(path, rg, out, list(keep_columns), chunk_size) for (path, rg, _), out in zip(tasks, outputs, strict=True)]
+    try:
+        if n_workers == 1:
+            _init_worker(str(bundle_dir), 1)
+            results = [_score_row_group(*a) for a in args]
+        else:
+            with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker,
+                                     initargs=(str(bundle_dir), 1)) as pool:
+                futures = [pool.submit(_score_row_group, *a) for a in args]
+                results = [f.result() for f in futures]
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    _swap_in(staging, partition)
+
+    seconds = time.perf_counter() - t0
+    n_rows = sum(r["n_rows"] for r in results)
+    peak_rss = {}
+    for r in results:
+        peak_rss[r["pid"]] = max(peak_rss.get(r["pid"], 0.0), r["peak_rss_mb"])
+    return {
+        "created_utc": _utcnow(),
+        "source": str(source),
+        "out_dir": str(partition),
+        "model_version": model_version,
+        "n_rows": n_rows,
+        "n_row_groups": len(tasks),
+        "n_workers": n_workers,
+        "chunk_size": chunk_size,
+        "seconds": seconds,
+        "rows_per_s": n_rows / seconds if seconds > 0 else None,
+        "worker_peak_rss_mb": max(peak_rss.values()),
+    }
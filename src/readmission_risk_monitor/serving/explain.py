@@ -1,8 +1,32 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
+import pandas as pd
+
+from readmission_risk_monitor.modeling.compiled_trees import CompiledTrees, compile_lightgbm
+
+DEFAULT_TIER_THRESHOLDS: Dict[str, float] = {"high": 0.7, "medium": 0.4}
+
+# Reason code for bundles without a per-patient explainer (non-tree models)
+BASELINE_REASON_CODE = "PHASE4_BASELINE_EXPLAIN"
+
+
+def tier_thresholds_from_metadata(meta: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Tier cut-points stored in the bundle (see modeling/thresholds.py).
+    Older bundles without "tier_thresholds" fall back to the fixed defaults.
+    """
+    tiers = meta.get("tier_thresholds") or {}
+    high = float(tiers.get("high", DEFAULT_TIER_THRESHOLDS["high"]))
+    medium = float(tiers.get("medium", DEFAULT_TIER_THRESHOLDS["medium"]))
+    if medium > high:
+        raise ValueError(f"Invalid tier thresholds in bundle: medium={medium} > high={high}")
+    return {"high": high, "medium": medium}
 
 
 def derive_risk_tier(p: float, *, high: float = 0.7, medium: float = 0.4) -> str:
@@ -27,4 +51,148 @@ def baseline_reason_codes(model: Any, feature_columns: list[str], x_row) -> List
     coefs = model.coef_[0]
     top_idx = np.argsort(coefs)[-5:][::-1]
     top_feats = [feature_columns[i] for i in top_idx if i < len(feature_columns)]
-    return [f"TOP_GLOBAL_{f}" for f in top_feats] if top_feats else ["NO_TOP_FEATURES"]
\ No newline at end of file
+    return [f"TOP_GLOBAL_{f}" for f in top_feats] if top_feats else ["NO_TOP_FEATURES"]
+
+def _group_reducer(group_idx: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Column order and segment starts that let np.add.reduceat sum columns per group."""
+    order = np.argsort(group_idx, kind="stable")
+    sorted_groups = group_idx[order]
+    starts = np.flatnonzero(np.r_[True, sorted_groups[1:] != sorted_groups[:-1]]) if len(order) else order
+    return order, starts, sorted_groups[starts]
+
+
+class TreeExplainer:
+    """
+    Per-patient reason codes for LightGBM bundles, batched.
+
+    - exact: TreeSHAP from the booster (predict(pred_contrib=True)), one call per batch
+    - contributions of the encoded one-hot / hash columns are summed back onto the raw
+      feature they came from (features.build.encoded_feature_groups)
+    - exact results are cached per feature row (LRU, keyed on the row's values)
+    - with budget_ms, rows whose exact SHAP would not fit the remaining budget (from a
+      running per-row cost estimate) get path attributions over the compiled trees
+      instead: approximate, at the cost of one scoring pass, and never cached
+
+    explain() returns, per row, the top_k raw features by |contribution| as
+    "<FEATURE>_UP" / "<FEATURE>_DOWN" (pushes risk up / down) and an approximate flag.
+    """
+
+    def __init__(
+            self,
+            pipeline: Any,
+            feature_columns: List[str],
+            *,
+            compiled: Optional[CompiledTrees] = None,
+            top_k: int = 5,
+            budget_ms: Optional[float] = None,
+            cache_size: int = 10_000,
+    ):
+        # features.build pulls in sklearn; by now the unpickled bundle has imported it anyway
+        from readmission_risk_monitor.features.build import encoded_feature_groups
+
+        self.preprocessor = pipeline.named_steps["preprocess"]
+        self.booster = pipeline.named_steps["model"].booster_
+        self.trees = compiled if compiled is not None and compiled.node_value is not None \
+            else compile_lightgbm(self.booster)
+        self.feature_columns = list(feature_columns)
+        self.top_k = top_k
+        self.budget_ms = budget_ms
+        self.cache_size = cache_size
+
+        position = {c: i for i, c in enumerate(self.feature_columns)}
+        group_idx = np.asarray([position[c] for c in encoded_feature_groups(self.preprocessor)], dtype=np.int64)
+        self._exact_reducer = _group_reducer(group_idx)
+        self._approx_reducer = _group_reducer(group_idx[self.trees.used_features])
+
+        self._cache: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.shap_ms_per_row: Optional[float] = None
+        self.calibrate()
+
+    @staticmethod
+    def supports(pipeline: Any) -> bool:
+        steps = getattr(pipeline, "named_steps", {})
+        return "preprocess" in steps and hasattr(steps.get("model"), "booster_")
+
+    def calibrate(self) -> None:
+        """Time one exact explanation (all-missing row) to seed the per-row cost estimate."""
+        X_encoded = self.preprocessor.transform(pd.DataFrame.from_records([{}], columns=self.feature_columns))
+        self._exact(X_encoded)
+
+    def _reduce(self, contrib: np.ndarray, reducer) -> np.ndarray:
+        order, starts, groups = reducer
+        out = np.zeros((contrib.shape[0], len(self.feature_columns)))
+        if len(starts):
+            out[:, groups] = np.add.reduceat(contrib[:, order], starts, axis=1)
+        return out
+
+    def _exact(self, X_encoded) -> np.ndarray:
+        t0 = time.perf_counter()
+        contrib = self.booster.predict(X_encoded, pred_contrib=True)
+        contrib = contrib.toarray() if hasattr(contrib, "toarray") else np.asarray(contrib)
+        per_row = (time.perf_counter() - t0) * 1000.0 / max(X_encoded.shape[0], 1)
+        with self._lock:
+            prev = self.shap_ms_per_row
+            self.shap_ms_per_row = per_row if prev is None else 0.8 * prev + 0.2 * per_row
+        return self._reduce(contrib[:, :-1], self._exact_reducer)
+
+    def _approximate(self, X_encoded) -> np.ndarray:
+        contrib, _ = self.trees.path_contributions(X_encoded)
+        return self._reduce(contrib, self._approx_reducer)
+
+    def _codes(self, contrib: np.ndarray) -> List[str]:
+        top = np.argsort(-np.abs(contrib), kind="stable")[:self.top_k]
+        return [
+            f"{self.feature_columns[i]}_{'UP' if contrib[i] > 0 else 'DOWN'}"
+            for i in top if contrib[i] != 0.0
+        ] or ["NO_DRIVERS"]
+
+    def explain(self, rows: List[Dict[str, Any]], X, X_encoded=None) -> Tuple[List[List[str]], List[bool]]:
+        """
+        rows: bundle-ordered feature dicts; X: the same rows as the scoring frame;
+        X_encoded: X already run through the preprocessor (skips encoding it again).
+        """
+        t0 = time.perf_counter()
+        codes: List[Optional[List[str]]] = [None] * len(rows)
+        approximate = [False] * len(rows)
+        keys: List[Optional[tuple]] = []
+        with self._lock:
+            for i, row in enumerate(rows):
+                try:
+                    key = tuple(row.values())
+                    hash(key)
+                except TypeError:
+                    key = None
+                keys.append(key)
+                if key is not None and key in self._cache:
+                    self._cache.move_to_end(key)
+                    codes[i] = self._cache[key]
+        missing = [i for i, c in enumerate(codes) if c is None]
+        if not missing:
+            return codes, approximate
+
+        if X_encoded is None:
+            X_encoded = self.preprocessor.transform(X.iloc[missing] if len(missing) < len(rows) else X)
+        elif len(missing) < len(rows):
+            X_encoded = X_encoded[missing]
+        n_exact = len(missing)
+        if self.budget_ms is not None and self.shap_ms_per_row:
+            remaining_ms = self.budget_ms - (time.perf_counter() - t0) * 1000.0
+            n_exact = int(min(len(missing), max(remaining_ms, 0.0) // self.shap_ms_per_row))
+
+        contrib = np.zeros((len(missing), len(self.feature_columns)))
+        if n_exact:
+            contrib[:n_exact] = self._exact(X_encoded[:n_exact])
+        if n_exact < len(missing):
+            contrib[n_exact:] = self._approximate(X_encoded[n_exact:])
+
+        with self._lock:
+            for j, i in enumerate(missing):
+                codes[i] = self._codes(contrib[j])
+                if j >= n_exact:
+                    approximate[i] = True
+                elif keys[i] is not None:
+                    self._cache[keys[i]] = codes[i]
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return codes, approximate
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import math
+import os
+import threading
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence
+
+from prometheus_client import CollectorRegistry, Counter, Histogram, generate_latest, multiprocess
+
+RISK_BUCKETS = (0.05, 0.1, 0.15, 0.2, 0.25, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0)
+RISK_TIERS = ("low", "medium", "high")
+
+# Exception names kept as label values; anything else is reported as "other" so a
+# misbehaving client cannot grow the series count
+KNOWN_ERROR_TYPES = frozenset({
+    "RequestValidationError",
+    "ValidationError",
+    "ValueError",
+    "KeyError",
+    "TypeError",
+    "RuntimeError",
+    "MemoryError",
+})
+
+RISK_SCORE = Histogram("rrm_readmission_risk", "Predicted 30-day readmission risk", buckets=RISK_BUCKETS)
+PREDICTIONS = Counter("rrm_predictions_total", "Scored patients by risk tier", ["risk_tier", "model_version"])
+ERRORS = Counter("rrm_errors_total", "Failed requests by endpoint and exception type", ["endpoint", "error_type"])
+FEATURE_MISSING = Counter("rrm_feature_missing_total", "Scored rows with the feature absent or null", ["feature"])
+
+
+def error_type(exc: BaseException) -> str:
+    name = type(exc).__name__
+    return name if name in KNOWN_ERROR_TYPES else "other"
+
+
+def record_error(endpoint: str, exc: BaseException) -> None:
+    ERRORS.labels(endpoint=endpoint, error_type=error_type(exc)).inc()
+
+
+def metrics_payload() -> bytes:
+    """
+    /metrics exposition. Under PROMETHEUS_MULTIPROC_DIR (pre-forked workers) every
+    worker writes its values to files there and any worker's scrape aggregates all of them.
+    """
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest()
+
+
+def _add_to_histogram(
+        hist: Histogram,
+        bounds: Sequence[float],
+        bucket_counts: List[int],
+        bucket_sums: List[float],
+) -> None:
+    # prometheus_client has no bulk observe(). Observing each bucket's mean once per
+    # value lands in the same bucket (the mean of values in (lo, hi] stays in it) and
+    # keeps _sum exact, using only the public API (works with the multiprocess collector).
+    lo = -math.inf
+    for hi, n, total in zip(bounds, bucket_counts, bucket_sums, strict=True):
+        if n:
+            # Clamp away float rounding that could push the mean across a bucket edge
+            mean = min(max(total / n, math.nextafter(lo, math.inf)), hi)
+            for _ in range(n):
+                hist.observe(mean)
+        lo = hi
+
+
+class ServingMetrics:
+    """
+    Per-request clinical/operational metrics with a small, fixed hot-path cost.
+
+    observe() only does list/dict increments under one uncontended lock:
+    - risk scores are bucketed locally (bisect over RISK_BUCKETS)
+    - tier counts are kept per tier; the labelled children are bound to
+      (tier, model_version) once, so there is no labels() lookup per request
+    - feature missingness is counted per column, scanning a row only if it holds a None
+    Everything is flushed into the Prometheus metrics every `flush_every` rows, on every
+    /metrics scrape, and every `flush_interval_s` seconds by a daemon thread (start()).
+    With several workers a scrape only reaches one of them, so the timer is what keeps
+    idle workers' tallies current. Label cardinality is bounded by the tiers and the
+    bundle's feature columns.
+    """
+
+    def __init__(
+            self,
+            feature_columns: Sequence[str],
+            model_version: str,
+            *,
+            flush_every: int = 1000,
+            flush_interval_s: float = 1.0,
+    ):
+        self.feature_columns = list(feature_columns)
+        self.flush_every = flush_every
+        self.flush_interval_s = flush_interval_s
+        self._bounds = list(RISK_BUCKETS) + [math.inf]
+        self._tier_children = {t: PREDICTIONS.labels(risk_tier=t, model_version=model_version) for t in RISK_TIERS}
+        self._missing_children = [FEATURE_MISSING.labels(feature=c) for c in self.feature_columns]
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._reset()
+
+    def _reset(self) -> None:
+        self._risk_buckets = [0] * len(self._bounds)
+        self._risk_sums = [0.0] * len(self._bounds)
+        self._tiers = dict.fromkeys(RISK_TIERS, 0)
+        self._missing = [0] * len(self.feature_columns)
+        self._pending_rows = 0
+
+    def observe(self, rows: List[Dict[str, Any]], probas: Sequence[float], tiers: Sequence[str]) -> None:
+        """Record scored rows (dicts aligned to feature_columns, absent features as None)."""
+        bounds = self._bounds
+        with self._lock:
+            buckets, sums = self._risk_buckets, self._risk_sums
+            tier_counts, missing = self._tiers, self._missing
+            for p, t in zip(probas, tiers, strict=True):
+                i = bisect_left(bounds, p)
+                buckets[i] += 1
+                sums[i] += p
+                tier_counts[t] += 1
+            for r in rows:
+                if None in r.values():
+                    # Rows are built in feature_columns order, so enumerate() gives the column index
+                    for i, v in enumerate(r.values()):
+                        if v is None:
+                            missing[i] += 1
+            self._pending_rows += len(rows)
+            due = self._pending_rows >= self.flush_every
+        if due:
+            self.flush()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="rrm-metrics", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval_s):
+            self.flush()
+
+    def flush(self) -> None:
+        """Move the pending tallies into the Prometheus metrics."""
+        with self._lock:
+            buckets, sums = self._risk_buckets, self._risk_sums
+            tiers, missing = self._tiers, self._missing
+            self._reset()
+
+        if any(buckets):
+            _add_to_histogram(RISK_SCORE, self._bounds, buckets, sums)
+        for t, n in tiers.items():
+            if n:
+                self._tier_children[t].inc(n)
+        for child, n in zip(self._missing_children, missing, strict=True):
+            if n:
+                child.inc(n)
@@ -3,9 +3,14 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-import joblib
+from readmission_risk_monitor.modeling.compiled_trees import (
+    COMPILED_FILENAME,
+    CompiledPipeline,
+    CompiledTrees,
+)
+from readmission_risk_monitor.modeling.importance import IMPORTANCE_FILENAME
 
 
 @dataclass(frozen=True)
@@ -14,16 +19,24 @@ class LoadedBundle:
     metadata: Dict[str, Any]
     feature_columns: list[str]
     bundle_dir: Path
+    reference_stats: Optional[Dict[str, Any]] = None
+    compiled: Optional[CompiledTrees] = None
+    global_importance: Optional[Dict[str, Any]] = None
 
+    @property
+    def scorer(self) -> Any:
+        """What serving calls predict_proba on: the compiled trees when the bundle has them."""
+        if self.compiled is None:
+            return self.model
+        return CompiledPipeline(
+            self.model.named_steps["preprocess"],
+            self.compiled,
+            booster=self.model.named_steps["model"],
+        )
 
-def load_latest_bundle(bundle_root: Path) -> LoadedBundle:
-    """
-    Reads bundle/latest/PATH.txt to locate the active model directory.
-    Loads:
-      - model.joblib (binary)
-      - metadata.json
-      - feature_columns.json
-    """
+
+def resolve_latest_bundle_dir(bundle_root: Path) -> Path:
+    """Reads bundle/latest/PATH.txt and returns the active model directory."""
     latest_ptr = bundle_root / "latest" / "PATH.txt"
     if not latest_ptr.exists():
         raise FileNotFoundError(f"Missing latest pointer: {latest_ptr}. Run scripts/train.py first.")
@@ -31,7 +44,26 @@ def load_latest_bundle(bundle_root: Path) -> LoadedBundle:
     bundle_dir = Path(latest_ptr.read_text().strip())
     if not bundle_dir.exists():
         raise FileNotFoundError(f"Bundle path in PATH.txt does not exist: {bundle_dir}")
+    return bundle_dir
+
+
+def load_latest_bundle(bundle_root: Path) -> LoadedBundle:
+    """Loads the bundle that bundle/latest/PATH.txt currently points to (see load_bundle)."""
+    return load_bundle(resolve_latest_bundle_dir(bundle_root))
 
+
+def load_bundle(bundle_dir: Path) -> LoadedBundle:
+    """
+    Loads one model directory. Use this instead of load_latest_bundle when several
+    processes must score with the same version even if a promotion lands meanwhile.
+    Loads:
+      - model.joblib (binary)
+      - metadata.json
+      - feature_columns.json
+      - reference_stats.json (optional; drift monitoring)
+      - model_compiled.npz (optional; compiled LightGBM trees)
+      - global_importance.json (optional; permutation importance from training)
+    """
     model_path = bundle_dir / "model.joblib"
     meta_path = bundle_dir / "metadata.json"
     feat_path = bundle_dir / "feature_columns.json"
@@ -43,9 +75,30 @@ def load_latest_bundle(bundle_root: Path) -> LoadedBundle:
     if not feat_path.exists():
         raise FileNotFoundError(f"Missing feature_columns: {feat_path}")
 
+    # joblib (and, through unpickling, the model's sklearn/lightgbm stack) is only
+    # imported here, so importing this module stays cheap
+    import joblib
+
     model = joblib.load(model_path)
     metadata = json.loads(meta_path.read_text())
     feature_payload = json.loads(feat_path.read_text())
     feature_columns = list(feature_payload["feature_columns"])
 
-    return LoadedBundle(model=model, metadata=metadata, feature_columns=feature_columns, bundle_dir=bundle_dir)
+    ref_path = bundle_dir / "reference_stats.json"
+    reference_stats = json.loads(ref_path.read_text()) if ref_path.exists() else None
+
+    compiled_path = bundle_dir / COMPILED_FILENAME
+    compiled = CompiledTrees.load(compiled_path) if compiled_path.exists() else None
+
+    importance_path = bundle_dir / IMPORTANCE_FILENAME
+    global_importance = json.loads(importance_path.read_text()) if importance_path.exists() else None
+
+    return LoadedBundle(
+        model=model,
+        metadata=metadata,
+        feature_columns=feature_columns,
+        bundle_dir=bundle_dir,
+        reference_stats=reference_stats,
+        compiled=compiled,
+        global_importance=global_importance,
+    )
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import gc
+import os
+import shutil
+import signal
+import socket
+import sys
+from pathlib import Path
+from typing import Callable, Dict
+
+MULTIPROC_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+
+def prepare_multiprocess_dir(path: Path) -> Path:
+    """
+    Fresh PROMETHEUS_MULTIPROC_DIR for this server run.
+    Must happen before prometheus_client is imported: it picks its (file-backed)
+    value class from the environment at import time.
+    """
+    if "prometheus_client" in sys.modules:
+        raise RuntimeError(f"{MULTIPROC_ENV} must be set before prometheus_client is imported")
+    if path.exists():
+        shutil.rmtree(path)
+    path.mkdir(parents=True)
+    os.environ[MULTIPROC_ENV] = str(path)
+    return path
+
+
+def _listen(host: str, port: int, backlog: int) -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _run_worker(app_path: str, sock: socket.socket, log_level: str) -> None:
+    import uvicorn
+
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    config = uvicorn.Config(app_path, log_level=log_level, access_log=False)
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def serve_prefork(
+        *,
+        app_path: str,
+        host: str,
+        port: int,
+        workers: int,
+        preload: Callable[[], None],
+        log_level: str = "info",
+        backlog: int = 2048,
+) -> None:
+    """
+    Pre-fork server: bind once, run `preload` once in the parent (bundle load), then fork
+    `workers` uvicorn servers that accept on the shared socket.
+
+    - workers inherit the loaded model copy-on-write; gc.freeze() keeps the collector
+      from touching (and so copying) the parent's objects in every child
+    - a worker that dies is replaced; SIGINT/SIGTERM stop all workers
+    - with PROMETHEUS_MULTIPROC_DIR set, a dead worker's live gauges are discarded
+    POSIX only (os.fork).
+    """
+    sock = _listen(host, port, backlog)
+    preload()
+    gc.collect()
+    gc.freeze()
+
+    children: Dict[int, int] = {}
+    stopping = False
+
+    def spawn(slot: int) -> None:
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                _run_worker(app_path, sock, log_level)
+            except BaseException:
+                code = 1
+            finally:
+                os._exit(code)
+        children[pid] = slot
+
+    def stop(signum, _frame) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    for slot in range(workers):
+        spawn(slot)
+    print(f"[OK] Serving {app_path} on http://{host}:{port} with {workers} worker(s)", flush=True)
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        slot = children.pop(pid, None)
+        if os.getenv(MULTIPROC_ENV):
+            from prometheus_client import multiprocess
+
+            multiprocess.mark_process_dead(pid)
+        if slot is not None and not stopping:
+            print(f"[WARN] Worker {pid} exited ({status}); restarting", flush=True)
+            spawn(slot)
+
+    sock.close()
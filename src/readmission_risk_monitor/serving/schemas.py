@@ -1,11 +1,21 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
-from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Literal, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel, ConfigDict, Field, StrictFloat, StrictStr, create_model, model_validator
+
+from readmission_risk_monitor.data.contract import DataContract
+
+# Request header naming the traffic class: "interactive" or "bulk" (serving/admission.py)
+PRIORITY_HEADER = "X-RRM-Priority"
+
 
 class PredictRequest(BaseModel):
     request_id: str = Field(..., description="Client-provided request id for traceability")
     features: Dict[str, Any] = Field(..., description="Raw feature key/value pairs (pre-encoding)")
+    encounter_id: Optional[str] = Field(
+        None, description="Encounter being scored; recorded in the audit log for delayed-label joins"
+    )
 
 
 class PredictResponse(BaseModel):
@@ -14,15 +24,176 @@ class PredictResponse(BaseModel):
     risk_tier: str
     rank_score: float
     reason_codes: list[str]
+    reason_codes_approximate: bool = Field(
+        False, description="Reason codes came from the fast path approximation (latency budget hit)"
+    )
 
     model_version: str
     schema_version: str
     latency_ms: float
 
 
+class ScoreResponse(PredictResponse):
+    source: Literal["table", "live"] = Field(
+        ..., description="table: nightly score table hit; live: scored from the request's features"
+    )
+    scored_utc: Optional[str] = Field(None, description="When the table was built (table hits only)")
+
+
+MAX_BATCH_ITEMS = 5000
+
+
+class PredictBatchRequest(BaseModel):
+    items: list[PredictRequest] = Field(
+        ..., max_length=MAX_BATCH_ITEMS, description="Patients to score in one vectorized call"
+    )
+
+
+class PredictBatchResponse(BaseModel):
+    predictions: list[PredictResponse]
+    latency_ms: float
+
+
+MAX_SWEEP_AXES = 3
+MAX_SWEEP_POINTS = MAX_BATCH_ITEMS
+
+
+class SweepAxis(BaseModel):
+    feature: str = Field(..., description="Feature to vary; the base patient's value is replaced")
+    values: Optional[List[Union[StrictFloat, StrictStr, None]]] = Field(
+        None, min_length=1, description="Explicit values to try (categorical codes or numbers; null = missing)"
+    )
+    start: Optional[float] = Field(None, description="Numeric range start (with stop / num)")
+    stop: Optional[float] = Field(None, description="Numeric range end, inclusive")
+    num: int = Field(20, ge=2, le=MAX_SWEEP_POINTS, description="Evenly spaced points from start to stop")
+
+    @model_validator(mode="after")
+    def _one_form(self) -> SweepAxis:
+        given = (self.values is not None, self.start is not None, self.stop is not None)
+        if given not in ((True, False, False), (False, True, True)):
+            raise ValueError("Give either `values` or both `start` and `stop`")
+        return self
+
+    def grid_values(self) -> List[Any]:
+        if self.values is not None:
+            return list(self.values)
+        step = (self.stop - self.start) / (self.num - 1)
+        return [self.start + i * step for i in range(self.num - 1)] + [self.stop]
+
+
+class SweepRequest(BaseModel):
+    request_id: str = Field(..., description="Client-provided request id for traceability")
+    features: Dict[str, Any] = Field(..., description="The base patient's raw feature values")
+    axes: List[SweepAxis] = Field(
+        ..., min_length=1, max_length=MAX_SWEEP_AXES,
+        description=f"Features to vary; the grid is their cartesian product (at most {MAX_SWEEP_POINTS} points)",
+    )
+
+
+class SweepAxisValues(BaseModel):
+    feature: str
+    values: List[Any]
+
+
+class SweepResponse(BaseModel):
+    request_id: str
+    base_risk: float
+    base_risk_tier: str
+    axes: List[SweepAxisValues]
+    risk: List[Any] = Field(
+        ..., description="Risk over the grid, nested in axis order: risk[i][j] is axes[0].values[i] x axes[1].values[j]"
+    )
+    n_points: int
+    model_version: str
+    schema_version: str
+    latency_ms: float
+
 
 class HealthResponse(BaseModel):
     status: str
     model_version: str
     schema_version: str
-    bundle_path: str
\ No newline at end of file
+    bundle_path: str
+
+
+class FeatureSchemaResponse(BaseModel):
+    model_version: str
+    feature_columns: list[str]
+    json_schema: Dict[str, Any] = Field(..., description="JSON schema of the bundle's `features` object")
+
+
+class FeatureImportance(BaseModel):
+    feature: str
+    importance_mean: float = Field(..., description="Mean drop in validation AUROC when the feature is shuffled")
+    importance_std: float
+    n_encoded_columns: int
+
+
+class GlobalImportanceResponse(BaseModel):
+    model_version: str
+    method: str
+    metric: str
+    baseline_score: float = Field(..., description="Unshuffled validation score")
+    n_rows: int
+    n_repeats: int
+    generated_utc: Optional[str] = None
+    features: List[FeatureImportance] = Field(..., description="Most important first")
+
+
+def _feature_type(ref_col: Optional[Dict[str, Any]], allowed: Optional[set]) -> Any:
+    if allowed:
+        return Literal[tuple(sorted(allowed))]
+    if ref_col is None:
+        return Union[StrictFloat, StrictStr]
+    return StrictFloat if ref_col.get("type") == "numeric" else StrictStr
+
+
+def build_features_model(
+        feature_columns: List[str],
+        *,
+        reference_stats: Optional[Dict[str, Any]] = None,
+        contract: Optional[DataContract] = None,
+) -> Type[BaseModel]:
+    """
+    Strict pydantic model of one patient's features, generated from the bundle at load time.
+    - numeric reference columns: numbers only (ints accepted, no strings / NaN / inf)
+    - categorical reference columns: strings only; contract allowed_values become enums
+    - columns without reference stats: number or string
+    Every field is nullable and defaults to None (missing value); unknown keys are
+    rejected. model_dump() returns the row in bundle column order.
+    """
+    ref_cols = (reference_stats or {}).get("columns", {})
+    allowed = {r.name: r.allowed_values for r in contract.columns} if contract is not None else {}
+    fields = {
+        c: (Optional[_feature_type(ref_cols.get(c), allowed.get(c))], None)
+        for c in feature_columns
+    }
+    return create_model(
+        "PatientFeatures",
+        __config__=ConfigDict(extra="forbid", allow_inf_nan=False),
+        **fields,
+    )
+
+
+def bundle_request_models(features_model: Type[BaseModel]) -> Tuple[Type[PredictRequest], Type[PredictBatchRequest]]:
+    """PredictRequest / PredictBatchRequest with `features` typed by build_features_model()."""
+    request = create_model(
+        "BundlePredictRequest",
+        __base__=PredictRequest,
+        features=(features_model, Field(..., description="Patient features (bundle schema)")),
+    )
+    batch = create_model(
+        "BundlePredictBatchRequest",
+        __base__=PredictBatchRequest,
+        items=(List[request], Field(..., max_length=MAX_BATCH_ITEMS)),
+    )
+    return request, batch
+
+
+def bundle_sweep_model(features_model: Type[BaseModel]) -> Type[SweepRequest]:
+    """SweepRequest with the base patient's `features` typed by build_features_model()."""
+    return create_model(
+        "BundleSweepRequest",
+        __base__=SweepRequest,
+        features=(features_model, Field(..., description="The base patient's features (bundle schema)")),
+    )
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pyarrow as pa
+from prometheus_client import Counter
+
+SCORE_TABLE_FILENAME = "score_table.arrow"
+
+LOOKUPS = Counter("rrm_score_table_lookups_total", "Score table lookups by outcome", ["result"])
+
+SCORE_TABLE_SCHEMA = pa.schema([
+    ("ENCOUNTER_ID", pa.int64()),
+    ("readmission_risk", pa.float64()),
+    ("risk_tier", pa.dictionary(pa.int8(), pa.string())),
+    ("reason_codes", pa.list_(pa.string())),
+    ("reason_codes_approximate", pa.bool_()),
+    ("model_version", pa.dictionary(pa.int8(), pa.string())),
+])
+
+
+def _utcnow() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def write_score_table(
+        path: Path,
+        *,
+        encounter_ids: Sequence[int],
+        probas: Sequence[float],
+        tiers: Sequence[str],
+        reason_codes: Sequence[List[str]],
+        approximate: Optional[Sequence[bool]] = None,
+        model_version: str,
+        schema_version: str,
+) -> Dict[str, Any]:
+    """
+    Write a score table: one uncompressed Arrow IPC record batch sorted by ENCOUNTER_ID,
+    so readers can memory-map it and binary-search the id column in place. Duplicate
+    encounter ids keep their last row. The file is written next to `path` and renamed
+    over it, so a serving process never sees a half-written table.
+    """
+    ids = np.asarray(encounter_ids, dtype=np.int64)
+    n = len(ids)
+    # stable sort on the reversed ids puts each id's last occurrence first
+    order = (n - 1 - np.argsort(ids[::-1], kind="stable"))
+    ids_sorted = ids[order]
+    keep = np.r_[True, ids_sorted[1:] != ids_sorted[:-1]] if n else np.zeros(0, dtype=bool)
+    order = order[keep]
+    idx = pa.array(order)
+
+    table = pa.Table.from_arrays(
+        [
+            pa.array(ids[order]),
+            pa.array(np.asarray(probas, dtype=np.float64)[order]),
+            pa.array(tiers, type=pa.string()).take(idx).dictionary_encode().cast(SCORE_TABLE_SCHEMA.field(2).type),
+            pa.array(reason_codes, type=pa.list_(pa.string())).take(idx),
+            pa.array(approximate if approximate is not None else [False] * n, type=pa.bool_()).take(idx),
+            pa.DictionaryArray.from_arrays(
+                pa.array(np.zeros(len(order), dtype=np.int8)), pa.array([model_version])
+            ),
+        ],
+        schema=SCORE_TABLE_SCHEMA.with_metadata({
+            "model_version": model_version,
+            "schema_version": schema_version,
+            "created_utc": _utcnow(),
+        }),
+    ).combine_chunks()
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + f".{os.getpid()}.tmp")
+    with pa.OSFile(str(tmp), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table, max_chunksize=max(len(order), 1))
+    os.replace(tmp, path)
+    return {"n_rows": len(order), "n_duplicates": int(n - len(order))}
+
+
+class ScoreTable:
+    """
+    Read side of write_score_table(): the file is memory-mapped (pages are shared by all
+    serving workers through the OS page cache) and lookup() is a numpy searchsorted over
+    the zero-copy id column, then a handful of scalar reads from the same row.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._mtime_ns = self.path.stat().st_mtime_ns
+        source = pa.memory_map(str(self.path), "r")
+        table = pa.ipc.open_file(source).read_all()
+        meta = {k.decode(): v.decode() for k, v in (table.schema.metadata or {}).items()}
+        self.model_version = meta.get("model_version", "unknown")
+        self.schema_version = meta.get("schema_version", "unknown")
+        self.created_utc = meta.get("created_utc")
+        self.n_rows = table.num_rows
+
+        def single(name: str) -> pa.Array:
+            col = table.column(name)
+            return col.chunk(0) if col.num_chunks == 1 else col.combine_chunks()
+
+        self._ids = single("ENCOUNTER_ID").to_numpy(zero_copy_only=True) if self.n_rows else np.zeros(0, np.int64)
+        self._risk = single("readmission_risk").to_numpy(zero_copy_only=True) if self.n_rows else np.zeros(0)
+        tiers = single("risk_tier")
+        self._tier_codes = tiers.indices.to_numpy(zero_copy_only=False)
+        self._tier_names = tiers.dictionary.to_pylist()
+        versions = single("model_version")
+        self._version_codes = versions.indices.to_numpy(zero_copy_only=False)
+        self._version_names = versions.dictionary.to_pylist()
+        self._codes = single("reason_codes")
+        self._approximate = single("reason_codes_approximate")
+
+    def changed_on_disk(self) -> bool:
+        try:
+            return self.path.stat().st_mtime_ns != self._mtime_ns
+        except FileNotFoundError:
+            return False
+
+    def lookup(self, encounter_id: int) -> Optional[Dict[str, Any]]:
+        i = int(np.searchsorted(self._ids, encounter_id))
+        if i >= self.n_rows or self._ids[i] != encounter_id:
+            return None
+        return {
+            "encounter_id": int(encounter_id),
+            "readmission_risk": float(self._risk[i]),
+            "risk_tier": self._tier_names[self._tier_codes[i]],
+            "reason_codes": self._codes[i].as_py(),
+            "reason_codes_approximate": bool(self._approximate[i].as_py()),
+            "model_version": self._version_names[self._version_codes[i]],
+            "scored_utc": self.created_utc,
+        }
+
+
+class ScoreTableReader:
+    """
+    The serving process's handle on the nightly table: opens it lazily, swaps in a new
+    file after the nightly job replaces it (mtime checked at most every `check_interval_s`)
+    and counts lookups by outcome (hit / miss / stale / absent).
+    """
+
+    def __init__(self, path: Path, *, check_interval_s: float = 5.0):
+        self.path = Path(path)
+        self.check_interval_s = check_interval_s
+        self._table: Optional[ScoreTable] = None
+        self._checked = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def table(self) -> Optional[ScoreTable]:
+        now = time.monotonic()
+        if now - self._checked >= self.check_interval_s:
+            with self._lock:
+                if now - self._checked >= self.check_interval_s:
+                    self._checked = now
+                    if self._table is None or self._table.changed_on_disk():
+                        self._table = ScoreTable(self.path) if self.path.exists() else self._table
+        return self._table
+
+    def lookup(self, encounter_id: int, model_version: str) -> Optional[Dict[str, Any]]:
+        """The stored score when present and produced by `model_version`, else None."""
+        table = self.table
+        if table is None:
+            LOOKUPS.labels(result="absent").inc()
+            return None
+        row = table.lookup(encounter_id)
+        if row is None:
+            LOOKUPS.labels(result="miss").inc()
+            return None
+        if row["model_version"] != model_version:
+            LOOKUPS.labels(result="stale").inc()
+            return None
+        LOOKUPS.labels(result="hit").inc()
+        return row
+
+
+def materialize_scores(
+        source: Path,
+        bundle: Any,
+        out_path: Path,
+        *,
+        batch_size: int = 50_000,
+        explain: bool = True,
+) -> Dict[str, Any]:
+    """
+    Score every encounter in a parquet extract (file or directory) with a LoadedBundle and
+    write the score table. The extract is streamed `batch_size` rows at a time, projected
+    to ENCOUNTER_ID + the bundle's feature columns (absent features score as missing).
+    Tree bundles get exact TreeSHAP reason codes; other bundles the baseline code.
+    """
+    import pyarrow.dataset as ds
+
+    from readmission_risk_monitor.serving.explain import (
+        BASELINE_REASON_CODE,
+        TreeExplainer,
+        derive_risk_tier,
+        tier_thresholds_from_metadata,
+    )
+
+    dataset = ds.dataset(str(source), format="parquet")
+    if "ENCOUNTER_ID" not in dataset.schema.names:
+        raise ValueError(f"Extract has no ENCOUNTER_ID column: {source}")
+    features = bundle.feature_columns
+    present = [c for c in features if c in dataset.schema.names]
+    thresholds = tier_thresholds_from_metadata(bundle.metadata)
+    explainer = None
+    if explain and TreeExplainer.supports(bundle.model):
+        explainer = TreeExplainer(bundle.model, features, compiled=bundle.compiled, cache_size=0)
+
+    t0 = time.perf_counter()
+    ids: List[np.ndarray] = []
+    probas: List[np.ndarray] = []
+    codes: List[List[str]] = []
+    approximate: List[bool] = []
+    for batch in dataset.to_batches(columns=["ENCOUNTER_ID"] + present, batch_size=batch_size):
+        df = batch.to_pandas()
+        df = df[df["ENCOUNTER_ID"].notna()]
+        if df.empty:
+            continue
+        X = df.reindex(columns=features)
+        for c in features:
+            if c not in present:
+                X[c] = None
+        p = bundle.model.predict_proba(X)[:, 1]
+        ids.append(df["ENCOUNTER_ID"].to_numpy(dtype=np.int64))
+        probas.append(p)
+        if explainer is not None:
+            c, a = explainer.explain(X.to_dict("records"), X)
+        else:
+            c, a = [[BASELINE_REASON_CODE]] * len(X), [False] * len(X)
+        codes.extend(c)
+        approximate.extend(a)
+
+    all_probas = np.concatenate(probas) if probas else np.zeros(0)
+    summary = write_score_table(
+        out_path,
+        encounter_ids=np.concatenate(ids) if ids else np.zeros(0, dtype=np.int64),
+        probas=all_probas,
+        tiers=[derive_risk_tier(float(p), **thresholds) for p in all_probas],
+        reason_codes=codes,
+        approximate=approximate,
+        model_version=str(bundle.metadata.get("model_version", "unknown")),
+        schema_version=str(bundle.metadata.get("schema_version", "unknown")),
+    )
+    return {
+        **summary,
+        "path": str(out_path),
+        "model_version": str(bundle.metadata.get("model_version", "unknown")),
+        "missing_features": [c for c in features if c not in present],
+        "seconds": time.perf_counter() - t0,
+    }
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import hashlib
+import io
 import json
 import os
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, List
 
-import requests
+import pandas as pd
 import streamlit as st
 
+from readmission_risk_monitor.client.sync import RiskClient
+from readmission_risk_monitor.serving.schemas import PredictRequest
+
 
 # -----------------------------
 # App Config
@@ -17,6 +22,12 @@ DEFAULT_HOSPITAL = "St. Catherine General Hospital"
 DEFAULT_UNIT = "Medical Ward"
 DEFAULT_API_URL = os.getenv("RRM_API_URL", "http://127.0.0.1:8000")
 
+SINGLE_MODE = "Single patient"
+WARD_MODE = "Ward triage (bulk)"
+WARD_BATCH_SIZE = 500
+# Shown next to the score in the ward table when the upload has them
+WARD_CONTEXT_COLUMNS = ["AGE", "GENDER", "TIME_IN_HOSPITAL", "NUMBER_INPATIENT", "NUMBER_EMERGENCY", "DIAG_1"]
+
 st.set_page_config(
     page_title=APP_TITLE,
     page_icon="🩺",
@@ -31,18 +42,174 @@ def _pill(label: str, value: str) -> str:
     return f"<span style='padding:6px 10px;border-radius:999px;background:#F0F7FF;border:1px solid #D6E8FF;font-size:0.9rem;'><b>{label}:</b> {value}</span>"
 
 
+@st.cache_resource
+def get_client(api_url: str, timeout_s: int = 30) -> RiskClient:
+    """One pooled keep-alive client per (URL, timeout), shared across reruns and sessions."""
+    return RiskClient(api_url, timeout=float(timeout_s))
+
+
 def post_predict(api_url: str, payload: Dict[str, Any], timeout_s: int = 30) -> Dict[str, Any]:
-    url = api_url.rstrip("/") + "/predict"
-    resp = requests.post(url, json=payload, timeout=timeout_s)
-    resp.raise_for_status()
-    return resp.json()
+    return get_client(api_url, timeout_s).predict(PredictRequest(**payload)).model_dump()
 
 
 def get_health(api_url: str, timeout_s: int = 10) -> Dict[str, Any]:
-    url = api_url.rstrip("/") + "/health"
-    resp = requests.get(url, timeout=timeout_s)
-    resp.raise_for_status()
-    return resp.json()
+    return get_client(api_url, timeout_s).health().model_dump()
+
+
+def get_feature_schema(api_url: str, timeout_s: int = 10) -> Dict[str, Any]:
+    return get_client(api_url, timeout_s).feature_schema().model_dump()
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def get_global_importance(api_url: str, timeout_s: int = 10) -> Dict[str, Any]:
+    return get_client(api_url, timeout_s).global_importance().model_dump()
+
+
+def post_sweep(api_url: str, features: Dict[str, Any], axes: List[Dict[str, Any]], timeout_s: int = 30) -> Dict[str, Any]:
+    return get_client(api_url, timeout_s).sweep(features, axes).model_dump()
+
+
+def sweep_curves(sweep: Dict[str, Any]) -> pd.DataFrame:
+    """Risk (%) indexed by the first axis' values; one column per value of the second axis, if any."""
+    first = sweep["axes"][0]
+    if len(sweep["axes"]) == 1:
+        curves = pd.DataFrame({"Risk (%)": sweep["risk"]})
+    else:
+        second = sweep["axes"][1]
+        labels = [f"{second['feature']}={'missing' if v is None else v}" for v in second["values"]]
+        curves = pd.DataFrame(sweep["risk"], columns=labels)
+    curves.index = pd.Index(first["values"], name=first["feature"])
+    return curves * 100.0
+
+
+def _string_columns(feature_schema: Dict[str, Any]) -> List[str]:
+    """Features the API types as strings (codes), from the bundle's JSON schema."""
+    out = []
+    for col, prop in feature_schema["json_schema"].get("properties", {}).items():
+        types = {opt.get("type") for opt in prop.get("anyOf", [prop])}
+        if "string" in types and not types & {"number", "integer"}:
+            out.append(col)
+    return out
+
+
+def _as_code(v: Any) -> Any:
+    """Codes read back as numbers from CSV (e.g. DIAG_1 414 -> 414.0) go back to their string form."""
+    if v is None or isinstance(v, str):
+        return v
+    if isinstance(v, float) and v.is_integer():
+        return str(int(v))
+    return str(v)
+
+
+def read_encounters(data: bytes, filename: str) -> pd.DataFrame:
+    """Uploaded CSV/parquet with column names standardized like scripts/ingest.py."""
+    if filename.lower().endswith((".parquet", ".pq")):
+        df = pd.read_parquet(io.BytesIO(data))
+    else:
+        df = pd.read_csv(io.BytesIO(data), na_values=["?"])
+    df.columns = (
+        df.columns.str.strip().str.upper().str.replace(" ", "_", regex=False).str.replace("-", "_", regex=False)
+    )
+    return df
+
+
+def _ward_requests(df: pd.DataFrame, feature_schema: Dict[str, Any]) -> List[PredictRequest]:
+    """
+    One request per encounter with only the model's features (the API rejects unknown
+    keys such as ids or labels); code columns are sent as strings.
+    """
+    features = [c for c in feature_schema["feature_columns"] if c in df.columns]
+    codes = [c for c in _string_columns(feature_schema) if c in df.columns]
+    has_enc = "ENCOUNTER_ID" in df.columns
+    records = json.loads(df[features + (["ENCOUNTER_ID"] if has_enc else [])].to_json(orient="records"))
+    out = []
+    for i, rec in enumerate(records):
+        enc = rec.pop("ENCOUNTER_ID", None)
+        for c in codes:
+            rec[c] = _as_code(rec[c])
+        out.append(PredictRequest(
+            request_id=f"ward-{enc if enc is not None else i}",
+            features=rec,
+            encounter_id=None if enc is None else str(enc),
+        ))
+    return out
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def score_ward(file_hash: str, model_version: str, api_url: str, timeout_s: int, _df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Scores every encounter via /predict/batch (WARD_BATCH_SIZE per round trip).
+    Cached by upload hash + model version: re-renders and re-uploads of the same file
+    are free until a new model is promoted. _df is excluded from the cache key.
+    """
+    client = get_client(api_url, timeout_s)
+    preds = client.predict_many(_ward_requests(_df, get_feature_schema(api_url, timeout_s)))
+
+    out = pd.DataFrame({
+        "readmission_risk": [p.readmission_risk for p in preds],
+        "risk_tier": [p.risk_tier for p in preds],
+    })
+    ids = [c for c in ("ENCOUNTER_ID", "PATIENT_NBR") if c in _df.columns]
+    context = [c for c in WARD_CONTEXT_COLUMNS if c in _df.columns]
+    out = pd.concat([_df[ids + context].reset_index(drop=True), out], axis=1)
+    out = out.sort_values("readmission_risk", ascending=False, kind="stable").reset_index(drop=True)
+    out.insert(0, "rank", range(1, len(out) + 1))
+    return out
+
+
+def render_ward_triage(api_url: str, timeout_s: int, hospital_name: str, unit_name: str, shift: str) -> None:
+    st.subheader("🏥 Ward triage")
+    st.markdown(
+        f"{_pill('Hospital', hospital_name)}&nbsp;&nbsp;{_pill('Unit', unit_name)}&nbsp;&nbsp;{_pill('Shift', shift)}",
+        unsafe_allow_html=True,
+    )
+    st.caption(
+        "Upload the unit's encounters (CSV or parquet, one row per encounter, same columns as the training "
+        "table). All patients are scored in a few batched calls and ranked by risk."
+    )
+
+    upload = st.file_uploader("Unit encounters", type=["csv", "parquet"])
+    if upload is None:
+        return
+
+    data = upload.getvalue()
+    file_hash = hashlib.sha256(data).hexdigest()
+    try:
+        df = read_encounters(data, upload.name)
+        model_version = get_health(api_url).get("model_version", "unknown")
+        with st.spinner(f"Scoring {len(df)} encounters..."):
+            ranked = score_ward(file_hash, model_version, api_url, timeout_s, df)
+    except Exception as e:
+        st.error(f"Ward scoring failed: {e}")
+        return
+
+    counts = ranked["risk_tier"].value_counts()
+    k0, k1, k2, k3 = st.columns(4)
+    k0.metric("Patients", len(ranked))
+    k1.metric(risk_badge("high"), int(counts.get("high", 0)))
+    k2.metric(risk_badge("medium"), int(counts.get("medium", 0)))
+    k3.metric(risk_badge("low"), int(counts.get("low", 0)))
+
+    tiers = st.multiselect("Show tiers", ["high", "medium", "low"], default=["high", "medium", "low"])
+    view = ranked[ranked["risk_tier"].isin(tiers)]
+    st.dataframe(
+        view,
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            "readmission_risk": st.column_config.ProgressColumn(
+                "Readmission risk", format="%.3f", min_value=0.0, max_value=1.0
+            ),
+            "risk_tier": st.column_config.TextColumn("Tier"),
+        },
+    )
+    st.download_button(
+        "Download ranked list (CSV)",
+        view.to_csv(index=False).encode(),
+        file_name=f"ward_triage_{datetime.utcnow():%Y%m%d_%H%M}.csv",
+        mime="text/csv",
+    )
+    st.caption(f"Model v{model_version} • file {file_hash[:12]}")
 
 
 def risk_badge(tier: str) -> str:
@@ -104,6 +271,8 @@ st.write("")
 # Sidebar: Operational Context
 # -----------------------------
 with st.sidebar:
+    workflow = st.radio("Workflow", [SINGLE_MODE, WARD_MODE], horizontal=True)
+
     st.header("🏥 Clinical context")
 
     hospital_name = st.text_input("Hospital / Facility", value=DEFAULT_HOSPITAL)
@@ -147,6 +316,11 @@ with st.sidebar:
     st.caption("If the model/bundle is large, increase timeout.")
 
 
+if workflow == WARD_MODE:
+    render_ward_triage(api_url, timeout_s, hospital_name, unit_name, shift)
+    st.stop()
+
+
 # -----------------------------
 # Main layout
 # -----------------------------
@@ -161,8 +335,8 @@ with left:
     )
 
     demo_features = {
-        # Put a few realistic-looking examples. These will be ignored if not part of FEATURE_COLUMNS in the API.
-        "AGE": 65,
+        # Realistic-looking example; keys must be bundle feature columns (see GET /schema), others are rejected.
+        "AGE": "[60-70)",
         "RACE": "Caucasian",
         "GENDER": "Female",
         "ADMISSION_TYPE_ID": 1,
@@ -210,6 +384,19 @@ with left:
 
     st.caption("These fields are **context** for the UI and audit trail; they don’t change the model unless you include them in the JSON features.")
 
+    with st.expander("🌐 What drives the model (all patients)"):
+        try:
+            importance = get_global_importance(api_url)
+            top = pd.DataFrame(importance["features"][:15]).set_index("feature")
+            st.bar_chart(top["importance_mean"])
+            st.caption(
+                f"Drop in validation AUROC when each feature is shuffled "
+                f"(baseline {importance['baseline_score']:.3f}, {importance['n_repeats']} repeats, "
+                f"{importance['n_rows']} patients) • model v{importance['model_version']}"
+            )
+        except Exception as e:
+            st.caption(f"Global importance unavailable: {e}")
+
 
 with right:
     st.subheader("📊 Risk output")
@@ -233,6 +420,7 @@ with right:
 
     if predict_clicked:
         st.session_state["last_error"] = None
+        st.session_state["last_sweep"] = None
         try:
             features = json.loads(st.session_state["features_json"])
             if not isinstance(features, dict):
@@ -241,6 +429,7 @@ with right:
             payload = {
                 "request_id": f"{encounter_id}-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}",
                 "features": features,
+                "encounter_id": encounter_id or None,
             }
 
             with st.spinner("Calling model service..."):
@@ -319,6 +508,53 @@ with right:
                 "Low risk: continue with standard discharge process; provide routine self-management guidance."
             )
 
+        st.write("")
+        st.subheader("📈 What-if sweep")
+        base_features = st.session_state["last_result"]["payload"]["features"]
+        numeric_keys = [k for k, v in base_features.items() if isinstance(v, (int, float)) and not isinstance(v, bool)]
+        if not numeric_keys:
+            st.caption("Add numeric features to the JSON to sweep them.")
+        else:
+            s1, s2, s3 = st.columns([0.4, 0.3, 0.3])
+            with s1:
+                sweep_feature = st.selectbox("Vary", numeric_keys, index=0)
+            with s2:
+                sweep_start = st.number_input("From", value=0.0)
+            with s3:
+                sweep_stop = st.number_input("To", value=float(max(2 * float(base_features[sweep_feature]), 10.0)))
+            compare_feature = st.selectbox(
+                "Compare across (optional)",
+                ["(none)"] + [k for k in base_features if k != sweep_feature],
+                index=0,
+            )
+            compare_values = st.text_input(
+                "Values to compare (comma-separated)",
+                value="",
+                disabled=compare_feature == "(none)",
+                help="Categorical codes as text, e.g. Caucasian, AfricanAmerican; numbers for numeric features.",
+            )
+            if st.button("Run sweep", use_container_width=True):
+                try:
+                    axes: List[Dict[str, Any]] = [
+                        {"feature": sweep_feature, "start": sweep_start, "stop": sweep_stop, "num": 50}
+                    ]
+                    if compare_feature != "(none)" and compare_values.strip():
+                        numeric = isinstance(base_features.get(compare_feature), (int, float))
+                        parts = [v.strip() for v in compare_values.split(",") if v.strip()]
+                        axes.append({"feature": compare_feature, "values": [float(v) if numeric else v for v in parts]})
+                    with st.spinner("Sweeping..."):
+                        st.session_state["last_sweep"] = post_sweep(api_url, base_features, axes, timeout_s=timeout_s)
+                except Exception as e:
+                    st.session_state["last_sweep"] = None
+                    st.error(f"Sweep failed: {e}")
+            sweep = st.session_state.get("last_sweep")
+            if sweep:
+                st.line_chart(sweep_curves(sweep))
+                st.caption(
+                    f"{sweep['n_points']} what-if points scored in {sweep['latency_ms']:.1f} ms • "
+                    f"risk (%) vs {sweep['axes'][0]['feature']} • current patient {sweep['base_risk']*100:.1f}%"
+                )
+
         st.write("")
         st.subheader("🧾 Raw response (for audit)")
         st.code(json.dumps(st.session_state["last_result"], indent=2), language="json")
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict
+
+import pandas as pd
+import pytest
+
+from readmission_risk_monitor.config import SETTINGS
+from readmission_risk_monitor.features.split import SplitConfig, group_split
+from readmission_risk_monitor.modeling.bundle import write_bundle
+from readmission_risk_monitor.modeling.importance import grouped_permutation_importance
+from readmission_risk_monitor.modeling.thresholds import choose_tier_thresholds
+from readmission_risk_monitor.modeling.train import train_baseline_logreg, try_train_lightgbm
+
+
+@pytest.fixture(autouse=True)
+def _audit_to_tmp(tmp_path, monkeypatch) -> None:
+    """Keep the serving app's audit log and score table out of the repo's artifacts dir."""
+    monkeypatch.setenv("RRM_AUDIT_DIR", str(tmp_path / "audit"))
+    monkeypatch.setenv("RRM_SCORE_TABLE", str(tmp_path / "scores" / "score_table.arrow"))
+
+
+@pytest.fixture(scope="session")
+def fixture_df() -> pd.DataFrame:
+    return pd.read_parquet(SETTINGS.data_fixtures_dir / SETTINGS.fixture_table)
+
+
+def json_features(row: pd.Series, feature_columns: list[str]) -> Dict[str, Any]:
+    """JSON-safe feature dict for /predict payloads (numpy scalars / NA -> python)."""
+    out: Dict[str, Any] = {}
+    for c in feature_columns:
+        v = row[c]
+        out[c] = None if pd.isna(v) else (v.item() if hasattr(v, "item") else v)
+    return out
+
+
+@pytest.fixture(scope="session")
+def fixture_splits(fixture_df: pd.DataFrame):
+    cfg = SplitConfig(train_size=0.7, valid_size=0.15, test_size=0.15, random_state=42)
+    return group_split(
+        fixture_df,
+        group_col=SETTINGS.patient_id_col,
+        target_col=SETTINGS.target_col,
+        cfg=cfg,
+    )
+
+
+@pytest.fixture(scope="session")
+def trained_bundle_root(tmp_path_factory, fixture_splits) -> Path:
+    """
+    Baseline bundle trained on the fixture, written to a temp bundle root.
+    Serving tests point RRM_BUNDLE_DIR at it.
+    """
+    train_df, valid_df, _ = fixture_splits
+    result = train_baseline_logreg(
+        train_df,
+        target_col=SETTINGS.target_col,
+        patient_id_col=SETTINGS.patient_id_col,
+        record_id_col=SETTINGS.record_id_col,
+    )
+    scores = result.pipeline.predict_proba(valid_df[result.feature_columns])[:, 1]
+    tiers = choose_tier_thresholds(valid_df[SETTINGS.target_col], scores)
+    importance = grouped_permutation_importance(
+        result.pipeline,
+        valid_df,
+        valid_df[SETTINGS.target_col],
+        feature_columns=result.feature_columns,
+        n_repeats=2,
+        n_workers=1,
+    )
+
+    root = tmp_path_factory.mktemp("bundle")
+    write_bundle(
+        bundle_root=root,
+        model_version="0.1.0",
+        schema_version="1.0.0",
+        pipeline=result.pipeline,
+        feature_columns=result.feature_columns,
+        feature_spec=result.feature_spec,
+        reference_df=train_df[result.feature_columns],
+        model_type="logistic_regression",
+        tier_thresholds=tiers,
+        global_importance=importance,
+    )
+    return root
+
+
+@pytest.fixture(scope="session")
+def trained_lgbm(fixture_splits):
+    """LightGBM pipeline on the fixture's train split (skips when lightgbm is missing)."""
+    pytest.importorskip("lightgbm")
+    train_df, _, _ = fixture_splits
+    return try_train_lightgbm(
+        train_df,
+        target_col=SETTINGS.target_col,
+        patient_id_col=SETTINGS.patient_id_col,
+        record_id_col=SETTINGS.record_id_col,
+    )
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+
+from readmission_risk_monitor.serving.admission import (
+    BULK,
+    INTERACTIVE,
+    AdmissionConfig,
+    AdmissionController,
+    AdmissionMiddleware,
+    Rejected,
+)
+
+
+def _shed(priority: str, reason: str) -> float:
+    return REGISTRY.get_sample_value("rrm_admission_shed_total", {"priority": priority, "reason": reason}) or 0.0
+
+
+def test_freed_slot_goes_to_interactive_before_earlier_bulk() -> None:
+    async def scenario() -> list:
+        ctl = AdmissionController(AdmissionConfig(slots=1, bulk_slots=1))
+        order = []
+        first = await ctl.acquire(BULK)
+
+        async def wait(priority: str) -> None:
+            admitted = await ctl.acquire(priority)
+            order.append(priority)
+            ctl.release(priority, admitted)
+
+        waiters = [asyncio.create_task(wait(BULK)), asyncio.create_task(wait(INTERACTIVE))]
+        await asyncio.sleep(0.01)
+        ctl.release(BULK, first)
+        await asyncio.gather(*waiters)
+        return order
+
+    assert asyncio.run(scenario()) == [INTERACTIVE, BULK]
+
+
+def test_bulk_cannot_take_the_reserved_interactive_slot() -> None:
+    async def scenario() -> None:
+        ctl = AdmissionController(AdmissionConfig(slots=2, bulk_slots=1, bulk_deadline_ms=20))
+        await ctl.acquire(BULK)
+        with pytest.raises(Rejected) as exc:
+            await ctl.acquire(BULK)
+        assert exc.value.reason == "deadline"
+        await asyncio.wait_for(ctl.acquire(INTERACTIVE), timeout=0.01)
+
+    before = _shed(BULK, "deadline")
+    asyncio.run(scenario())
+    assert _shed(BULK, "deadline") == before + 1
+
+
+def test_requests_that_would_miss_their_deadline_are_shed_up_front() -> None:
+    async def scenario() -> str:
+        ctl = AdmissionController(AdmissionConfig(slots=1, bulk_slots=1, interactive_deadline_ms=30))
+        admitted = await ctl.acquire(INTERACTIVE)
+        await asyncio.sleep(0.05)
+        ctl.release(INTERACTIVE, admitted)   # slot hold time is now ~50 ms
+        await ctl.acquire(INTERACTIVE)
+        t0 = asyncio.get_running_loop().time()
+        with pytest.raises(Rejected) as exc:
+            await ctl.acquire(INTERACTIVE)
+        assert asyncio.get_running_loop().time() - t0 < 0.01
+        return exc.value.reason
+
+    assert asyncio.run(scenario()) == "slo"
+
+
+def test_middleware_sheds_with_retry_after_and_bypasses_non_scoring_routes() -> None:
+    ctl = AdmissionController(AdmissionConfig(slots=1, bulk_slots=1, interactive_deadline_ms=20))
+
+    async def scenario() -> None:
+        release = asyncio.Event()
+
+        async def app(scope, receive, send) -> None:
+            if scope["path"] == "/predict/batch":
+                await release.wait()
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"{}"})
+
+        transport = httpx.ASGITransport(app=AdmissionMiddleware(app, controller=lambda: ctl))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            bulk = asyncio.create_task(client.post("/predict/batch", json={"items": []}))
+            await asyncio.sleep(0.01)
+
+            shed = await client.post("/predict", json={})
+            assert shed.status_code == 503
+            assert shed.json()["reason"] == "deadline"
+            assert int(shed.headers["Retry-After"]) >= 1
+            assert (await client.get("/health")).status_code == 200
+
+            release.set()
+            assert (await bulk).status_code == 200
+            ok = await client.post("/predict", json={}, headers={"X-RRM-Priority": "interactive"})
+            assert ok.status_code == 200
+
+    asyncio.run(scenario())
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import json
+
+import pandas as pd
+from conftest import json_features
+from fastapi.testclient import TestClient
+
+from readmission_risk_monitor.serving.audit import AuditLogger
+
+
+def _record(logger: AuditLogger, n: int, start: int = 0) -> None:
+    logger.record(
+        request_ids=[f"r-{i}" for i in range(start, start + n)],
+        encounter_ids=[str(i) for i in range(start, start + n)],
+        features=[{"AGE": "[50-60)", "NUM_MEDICATIONS": i} for i in range(start, start + n)],
+        probas=[0.1] * n,
+        tiers=["low"] * n,
+        model_version="0.1.0",
+        schema_version="1.0.0",
+        latency_ms=1.5,
+    )
+
+
+def test_audit_rotates_row_groups_and_files(tmp_path) -> None:
+    logger = AuditLogger(tmp_path, row_group_size=40, rotate_rows=100)
+    _record(logger, 250)
+    logger.close()
+
+    files = sorted(tmp_path.glob("date=*/*.parquet"))
+    assert len(files) == 3
+    assert not list(tmp_path.glob("date=*/*.inprogress"))
+
+    df = pd.read_parquet(files)
+    assert len(df) == 250
+    assert sorted(df["request_id"]) == sorted(f"r-{i}" for i in range(250))
+    assert json.loads(df.loc[df["request_id"] == "r-7", "features"].iloc[0])["NUM_MEDICATIONS"] == 7
+    assert str(df["scored_utc"].dtype) == "datetime64[us, UTC]"
+
+
+def test_audit_buffer_is_bounded(tmp_path) -> None:
+    logger = AuditLogger(tmp_path, capacity=10)
+    _record(logger, 25)
+    logger.close()
+
+    df = pd.read_parquet(sorted(tmp_path.glob("date=*/*.parquet")))
+    # Oldest rows are overwritten; the newest `capacity` survive
+    assert list(df["request_id"]) == [f"r-{i}" for i in range(15, 25)]
+
+
+def test_predictions_are_audited_on_shutdown(trained_bundle_root, fixture_df, monkeypatch, tmp_path) -> None:
+    from readmission_risk_monitor.serving import app as app_module
+
+    audit_dir = tmp_path / "served"
+    monkeypatch.setenv("RRM_BUNDLE_DIR", str(trained_bundle_root))
+    monkeypatch.setenv("RRM_AUDIT_DIR", str(audit_dir))
+    with TestClient(app_module.app) as client:
+        cols = app_module.FEATURE_COLUMNS
+        client.post("/predict", json={
+            "request_id": "one", "encounter_id": "1001", "features": json_features(fixture_df.iloc[0], cols),
+        }).raise_for_status()
+        items = [{"request_id": f"b-{i}", "features": json_features(fixture_df.iloc[i], cols)} for i in range(3)]
+        preds = client.post("/predict/batch", json={"items": items}).json()["predictions"]
+        assert "rrm_audit_rows_dropped_total" in client.get("/metrics").text
+
+    df = pd.read_parquet(sorted(audit_dir.glob("date=*/*.parquet")))
+    assert list(df["request_id"]) == ["one", "b-0", "b-1", "b-2"]
+    assert df["encounter_id"].iloc[0] == "1001"
+    assert df["readmission_risk"].iloc[1:].tolist() == [p["readmission_risk"] for p in preds]
+    assert (df["model_version"] == "0.1.0").all()
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import pytest
+
+from readmission_risk_monitor.modeling.bundle import compute_reference_stats
+from readmission_risk_monitor.monitoring.batch_drift import profile_against_reference, render_html
+
+FEATURES = ["TIME_IN_HOSPITAL", "NUM_MEDICATIONS", "NUMBER_EMERGENCY", "RACE", "DIAG_1"]
+
+
+@pytest.mark.parametrize("n_workers", [1, 2])
+def test_streamed_profile_matches_in_memory_stats(tmp_path, fixture_df, n_workers) -> None:
+    ref = compute_reference_stats(fixture_df, feature_columns=FEATURES)
+    path = tmp_path / "extract.parquet"
+    fixture_df.to_parquet(path, row_group_size=700)
+
+    report = profile_against_reference(path, ref, feature_columns=FEATURES, n_workers=n_workers, batch_size=500)
+
+    assert report["n_rows"] == len(fixture_df)
+    for c in ("TIME_IN_HOSPITAL", "NUM_MEDICATIONS"):
+        cur, want = report["features"][c]["current"], ref["columns"][c]
+        assert cur["mean"] == pytest.approx(want["mean"])
+        assert cur["std"] == pytest.approx(want["std"])
+        assert cur["histogram"]["counts"] == want["histogram"]["counts"]
+        assert report["features"][c]["psi"] == pytest.approx(0.0, abs=1e-9)
+    assert report["features"]["DIAG_1"]["current"]["top_values"] == ref["columns"]["DIAG_1"]["top_values"]
+
+
+def test_report_ranks_shifted_feature_first(tmp_path, fixture_df) -> None:
+    ref = compute_reference_stats(fixture_df, feature_columns=FEATURES)
+    path = tmp_path / "extract.parquet"
+    fixture_df.assign(NUM_MEDICATIONS=fixture_df["NUM_MEDICATIONS"] * 2).drop(columns=["RACE"]).to_parquet(path)
+
+    report = profile_against_reference(path, ref, feature_columns=FEATURES, n_workers=1)
+
+    assert report["ranking"][0]["feature"] == "NUM_MEDICATIONS"
+    assert report["ranking"][0]["severity"] == "major"
+    assert report["missing_columns"] == ["RACE"]
+    assert "NUM_MEDICATIONS" in render_html(report)
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pyarrow.dataset as ds
+import pytest
+
+from readmission_risk_monitor.serving.bulk_score import row_group_tasks, score_dataset
+from readmission_risk_monitor.serving.explain import derive_risk_tier, tier_thresholds_from_metadata
+from readmission_risk_monitor.serving.model_loader import load_latest_bundle
+
+
+def _read(partition) -> pd.DataFrame:
+    return ds.dataset(str(partition), format="parquet").to_table().to_pandas()
+
+
+def test_sharded_scores_match_the_bundle_row_for_row(trained_bundle_root, fixture_df, tmp_path) -> None:
+    bundle = load_latest_bundle(trained_bundle_root)
+    data = tmp_path / "in"
+    data.mkdir()
+    df = fixture_df.head(900).reset_index(drop=True)
+    df.iloc[:500].to_parquet(data / "a.parquet", row_group_size=200)
+    df.iloc[500:].drop(columns=[bundle.feature_columns[0]]).to_parquet(data / "b.parquet", row_group_size=200)
+    assert [t[1:] for t in row_group_tasks(data)] == [(0, 200), (1, 200), (2, 100), (0, 200), (1, 200)]
+
+    serial = score_dataset(data, trained_bundle_root, tmp_path / "serial", chunk_size=64, n_workers=1)
+    parallel = score_dataset(data, trained_bundle_root, tmp_path / "out", chunk_size=64, n_workers=2)
+    assert (serial["n_rows"], parallel["n_rows"], parallel["n_workers"]) == (900, 900, 2)
+    assert parallel["out_dir"].endswith("model_version=0.1.0")
+
+    out = _read(parallel["out_dir"])
+    assert list(out.columns) == ["ENCOUNTER_ID", "PATIENT_NBR", "readmission_risk", "risk_tier"]
+    assert out["ENCOUNTER_ID"].tolist() == df["ENCOUNTER_ID"].tolist()
+    pd.testing.assert_frame_equal(out, _read(serial["out_dir"]))
+
+    X = df[bundle.feature_columns].copy()
+    X.loc[500:, bundle.feature_columns[0]] = None   # absent from b.parquet: scored as missing
+    expected = bundle.scorer.predict_proba(X)[:, 1]
+    np.testing.assert_allclose(out["readmission_risk"].to_numpy(), expected, rtol=0, atol=1e-12)
+    thresholds = tier_thresholds_from_metadata(bundle.metadata)
+    assert out["risk_tier"].astype(str).tolist() == [derive_risk_tier(p, **thresholds) for p in expected]
+
+
+def test_output_root_reads_as_a_partitioned_dataset(trained_bundle_root, fixture_df, tmp_path) -> None:
+    import pyarrow.parquet as pq
+
+    src = tmp_path / "in.parquet"
+    fixture_df.head(300).to_parquet(src, row_group_size=100)
+    score_dataset(src, trained_bundle_root, tmp_path / "out", n_workers=2)
+
+    root = str(tmp_path / "out")
+    tables = [
+        pq.read_table(root).to_pandas(),
+        pd.read_parquet(root),
+        ds.dataset(root, format="parquet", partitioning="hive").to_table().to_pandas(),
+    ]
+    for out in tables:
+        assert len(out) == 300
+        assert set(out["model_version"].astype(str)) == {"0.1.0"}
+        assert {"readmission_risk", "risk_tier"} <= set(out.columns)
+
+
+def test_rerun_replaces_the_model_version_partition(trained_bundle_root, fixture_df, tmp_path) -> None:
+    src = tmp_path / "in.parquet"
+    fixture_df.head(300).to_parquet(src, row_group_size=100)
+    first = score_dataset(src, trained_bundle_root, tmp_path / "out", n_workers=1)
+    fixture_df.head(100).to_parquet(src)
+    second = score_dataset(src, trained_bundle_root, tmp_path / "out", n_workers=1)
+
+    assert first["out_dir"] == second["out_dir"]
+    assert len(_read(second["out_dir"])) == 100
+    with pytest.raises(ValueError, match="chunk_size"):
+        score_dataset(src, trained_bundle_root, tmp_path / "out", chunk_size=0)
+
+
+def test_failed_rerun_keeps_the_previous_partition(trained_bundle_root, fixture_df, tmp_path, monkeypatch) -> None:
+    from readmission_risk_monitor.serving import bulk_score
+
+    src = tmp_path / "in.parquet"
+    fixture_df.head(200).to_parquet(src, row_group_size=100)
+    first = score_dataset(src, trained_bundle_root, tmp_path / "out", n_workers=1)
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("worker died")
+
+    monkeypatch.setattr(bulk_score, "_score_row_group", fail)
+    with pytest.raises(RuntimeError, match="worker died"):
+        score_dataset(src, trained_bundle_root, tmp_path / "out", n_workers=1)
+
+    assert len(_read(first["out_dir"])) == 200
+    assert [p.name for p in (tmp_path / "out").iterdir()] == ["model_version=0.1.0"]
+
+
+def test_workers_score_the_bundle_resolved_at_start(trained_bundle_root, fixture_df, tmp_path, monkeypatch) -> None:
+    from readmission_risk_monitor.serving import model_loader
+
+    root = tmp_path / "bundles"
+    (root / "latest").mkdir(parents=True)
+    pointer = root / "latest" / "PATH.txt"
+    pointer.write_text((trained_bundle_root / "latest" / "PATH.txt").read_text())
+    resolve = model_loader.resolve_latest_bundle_dir
+
+    def resolve_then_promote(bundle_root):
+        # A promotion lands right after the run resolved `latest`
+        bundle_dir = resolve(bundle_root)
+        pointer.write_text(str(tmp_path / "promoted-elsewhere"))
+        return bundle_dir
+
+    monkeypatch.setattr(model_loader, "resolve_latest_bundle_dir", resolve_then_promote)
+    src = tmp_path / "in.parquet"
+    fixture_df.head(200).to_parquet(src, row_group_size=100)
+    result = score_dataset(src, root, tmp_path / "out", n_workers=2)
+
+    assert result["n_rows"] == 200
+    assert result["out_dir"].endswith("model_version=0.1.0")
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+from conftest import json_features
+from fastapi.testclient import TestClient
+
+from readmission_risk_monitor.client.aio import AsyncRiskClient
+from readmission_risk_monitor.client.base import RetryPolicy, RiskClientError
+from readmission_risk_monitor.client.sync import RiskClient
+from readmission_risk_monitor.serving.schemas import PredictResponse
+
+
+@pytest.fixture()
+def served(trained_bundle_root, fixture_df, monkeypatch):
+    from readmission_risk_monitor.serving import app as app_module
+
+    monkeypatch.setenv("RRM_BUNDLE_DIR", str(trained_bundle_root))
+    with TestClient(app_module.app) as tc:
+        rows = [json_features(fixture_df.iloc[i], app_module.FEATURE_COLUMNS) for i in range(12)]
+        yield app_module.app, tc, rows
+
+
+def test_sync_client_batches_and_keeps_order(served) -> None:
+    _, tc, rows = served
+    client = RiskClient("http://testserver", batch_size=5, max_concurrency=2, http_client=tc)
+
+    assert client.health().status == "ok"
+    assert client.feature_schema().feature_columns == list(rows[0])
+    assert {f.feature for f in client.global_importance().features} == set(rows[0])
+    many = client.predict_many(rows)
+    assert len(many) == 12 and all(isinstance(p, PredictResponse) for p in many)
+    for i in (0, 7, 11):
+        assert client.predict(rows[i]).readmission_risk == pytest.approx(many[i].readmission_risk)
+
+    sweep = client.sweep(rows[0], [{"feature": "NUMBER_INPATIENT", "values": [0, 2]}])
+    assert sweep.base_risk == pytest.approx(many[0].readmission_risk)
+    assert len(sweep.risk) == sweep.n_points == 2
+
+
+class _CountingTransport(httpx.ASGITransport):
+    def __init__(self, app) -> None:
+        super().__init__(app=app)
+        self.paths: list[str] = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.paths.append(request.url.path)
+        return await super().handle_async_request(request)
+
+
+def test_async_client_coalesces_concurrent_predicts(served) -> None:
+    app, tc, rows = served
+    transport = _CountingTransport(app)
+
+    async def main():
+        async with AsyncRiskClient("http://testserver", transport=transport, batch_window_ms=20) as client:
+            return await asyncio.gather(*(client.predict(f) for f in rows))
+
+    preds = asyncio.run(main())
+    expected = RiskClient("http://testserver", http_client=tc).predict_many(rows)
+    assert [p.readmission_risk for p in preds] == pytest.approx([p.readmission_risk for p in expected])
+    assert transport.paths == ["/predict/batch"]
+
+
+def test_short_batch_reply_fails_every_coalesced_caller() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        # One prediction for however many items were sent
+        return httpx.Response(200, json={"latency_ms": 1.0, "predictions": [{
+            "request_id": "r-0", "readmission_risk": 0.5, "risk_tier": "medium", "rank_score": 0.5, "reason_codes": [],
+            "model_version": "1", "schema_version": "1", "latency_ms": 1.0,
+        }]})
+
+    async def main():
+        async with AsyncRiskClient("http://x", transport=httpx.MockTransport(handler), batch_window_ms=20) as client:
+            return await asyncio.wait_for(
+                asyncio.gather(*(client.predict({"A": i}) for i in range(3)), return_exceptions=True), timeout=5
+            )
+
+    results = asyncio.run(main())
+    assert len(results) == 3
+    assert all(isinstance(r, RiskClientError) and "1 predictions for 3" in str(r) for r in results)
+
+
+def test_retries_transient_errors_then_raises() -> None:
+    statuses = iter([503, 503, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = next(statuses)
+        if status != 200:
+            return httpx.Response(status, headers={"Retry-After": "0"}, json={"detail": "busy"})
+        return httpx.Response(200, json={"status": "ok", "model_version": "1", "schema_version": "1",
+                                         "bundle_path": "x"})
+
+    http = httpx.Client(base_url="http://x", transport=httpx.MockTransport(handler))
+    client = RiskClient("http://x", http_client=http, retry=RetryPolicy(max_attempts=3, backoff_base_s=0.0))
+    assert client.health().status == "ok"
+
+    http = httpx.Client(base_url="http://x", transport=httpx.MockTransport(lambda r: httpx.Response(422, json={})))
+    with pytest.raises(RiskClientError) as err:
+        RiskClient("http://x", http_client=http).health()
+    assert err.value.status_code == 422
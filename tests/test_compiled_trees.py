@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from conftest import json_features
+from fastapi.testclient import TestClient
+
+from readmission_risk_monitor.modeling.bundle import write_bundle
+from readmission_risk_monitor.modeling.compiled_trees import (
+    CompiledPipeline,
+    CompiledTrees,
+    compile_lightgbm,
+)
+from readmission_risk_monitor.serving.model_loader import load_latest_bundle
+
+
+def test_compiled_matches_predict_proba_batch_and_single_row(trained_lgbm, fixture_splits) -> None:
+    _, valid_df, _ = fixture_splits
+    booster = trained_lgbm.pipeline.named_steps["model"]
+    X_encoded = trained_lgbm.pipeline.named_steps["preprocess"].transform(valid_df[trained_lgbm.feature_columns])
+    compiled = compile_lightgbm(booster)
+
+    assert compiled.n_trees == booster.booster_.num_trees()
+    np.testing.assert_allclose(compiled.predict_proba(X_encoded), booster.predict_proba(X_encoded), atol=1e-12)
+    for i in range(10):
+        row = X_encoded[i:i + 1]
+        np.testing.assert_allclose(compiled.predict_proba(row), booster.predict_proba(row), atol=1e-12)
+
+
+def test_compiled_follows_lightgbm_missing_value_routing(trained_lgbm, fixture_splits) -> None:
+    _, valid_df, _ = fixture_splits
+    booster = trained_lgbm.pipeline.named_steps["model"]
+    X = trained_lgbm.pipeline.named_steps["preprocess"].transform(valid_df[trained_lgbm.feature_columns]).toarray()
+    X[np.random.default_rng(0).random(X.shape) < 0.2] = np.nan
+
+    np.testing.assert_allclose(compile_lightgbm(booster).predict_proba(X), booster.predict_proba(X), atol=1e-12)
+
+
+def test_compiled_bundle_is_served(trained_lgbm, fixture_splits, tmp_path, monkeypatch) -> None:
+    train_df, valid_df, _ = fixture_splits
+    paths = write_bundle(
+        bundle_root=tmp_path,
+        model_version="0.2.0",
+        schema_version="1.0.0",
+        pipeline=trained_lgbm.pipeline,
+        feature_columns=trained_lgbm.feature_columns,
+        feature_spec=trained_lgbm.feature_spec,
+        reference_df=train_df[trained_lgbm.feature_columns],
+        model_type="lightgbm",
+        compile_trees=True,
+    )
+    bundle = load_latest_bundle(tmp_path)
+    assert bundle.metadata["compiled_model"]["n_trees"] == bundle.compiled.n_trees
+    assert isinstance(bundle.scorer, CompiledPipeline)
+    reloaded = CompiledTrees.load(paths.model_dir / "model_compiled.npz")
+    np.testing.assert_array_equal(reloaded.threshold, bundle.compiled.threshold)
+
+    # Small batches take the compiled path, large ones the booster: same answers either way
+    X = valid_df[trained_lgbm.feature_columns]
+    expected = trained_lgbm.pipeline.predict_proba(X)[:, 1]
+    np.testing.assert_allclose(bundle.scorer.predict_proba(X.head(3))[:, 1], expected[:3], atol=1e-12)
+    np.testing.assert_allclose(bundle.scorer.predict_proba(X)[:, 1], expected, atol=1e-12)
+
+    from readmission_risk_monitor.serving import app as app_module
+
+    monkeypatch.setenv("RRM_BUNDLE_DIR", str(tmp_path))
+    with TestClient(app_module.app) as client:
+        features = json_features(valid_df.iloc[0], trained_lgbm.feature_columns)
+        resp = client.post("/predict", json={"request_id": "c-1", "features": features})
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["readmission_risk"] == pytest.approx(expected[0], abs=1e-9)
+    # tree bundles explain per patient instead of the baseline placeholder
+    assert body["reason_codes"] and all(c.endswith(("_UP", "_DOWN")) for c in body["reason_codes"])
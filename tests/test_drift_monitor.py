@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from conftest import json_features
+from fastapi.testclient import TestClient
+
+from readmission_risk_monitor.modeling.bundle import compute_reference_stats
+from readmission_risk_monitor.monitoring.drift import DriftMonitor
+from readmission_risk_monitor.monitoring.stats import accumulator_for, score_against_reference
+
+FEATURES = ["TIME_IN_HOSPITAL", "NUM_MEDICATIONS", "NUMBER_EMERGENCY", "RACE", "DIAG_1"]
+
+
+def test_accumulators_reproduce_reference_stats(fixture_df) -> None:
+    ref = compute_reference_stats(fixture_df, feature_columns=FEATURES)
+
+    accs = {c: accumulator_for(ref["columns"][c]) for c in FEATURES}
+    for chunk in np.array_split(fixture_df, 7):
+        for c, acc in accs.items():
+            acc.update(chunk[c].to_numpy(dtype=object))
+
+    for c in ("TIME_IN_HOSPITAL", "NUM_MEDICATIONS"):
+        got, want = accs[c].to_stats(), ref["columns"][c]
+        assert got["mean"] == pytest.approx(want["mean"])
+        assert got["std"] == pytest.approx(want["std"])
+        assert got["histogram"]["counts"] == want["histogram"]["counts"]
+
+    assert accs["RACE"].to_stats()["top_values"] == ref["columns"]["RACE"]["top_values"]
+
+
+def test_psi_flags_shifted_traffic(fixture_df) -> None:
+    ref = compute_reference_stats(fixture_df, feature_columns=FEATURES)
+
+    same = {c: accumulator_for(ref["columns"][c]) for c in FEATURES}
+    shifted = {c: accumulator_for(ref["columns"][c]) for c in FEATURES}
+    sample = fixture_df.sample(1000, random_state=0)
+    for c in FEATURES:
+        same[c].update(sample[c].to_numpy(dtype=object))
+    moved = sample.assign(NUM_MEDICATIONS=sample["NUM_MEDICATIONS"] + 15, RACE="Other")
+    for c in FEATURES:
+        shifted[c].update(moved[c].to_numpy(dtype=object))
+
+    s_same = score_against_reference(same, ref)
+    s_shift = score_against_reference(shifted, ref)
+
+    assert s_same["NUM_MEDICATIONS"]["psi"] < 0.1
+    assert s_shift["NUM_MEDICATIONS"]["psi"] > 0.25
+    assert s_shift["NUM_MEDICATIONS"]["ks"] > s_same["NUM_MEDICATIONS"]["ks"]
+    assert s_shift["RACE"]["severity"] == "major"
+    assert s_shift["TIME_IN_HOSPITAL"]["psi"] == pytest.approx(s_same["TIME_IN_HOSPITAL"]["psi"])
+
+
+def test_monitor_queue_is_bounded(fixture_df) -> None:
+    ref = compute_reference_stats(fixture_df, feature_columns=FEATURES)
+    monitor = DriftMonitor(ref, FEATURES, queue_size=10, min_rows=1)
+
+    rows = fixture_df[FEATURES].head(25).to_dict(orient="records")
+    monitor.observe(rows)
+    assert monitor.drain() == 10
+
+    report = monitor.close_window()
+    assert report["window_rows"] == 10
+    assert set(report["features"]) == set(FEATURES)
+
+
+def test_drift_endpoint(trained_bundle_root, fixture_df, monkeypatch) -> None:
+    from readmission_risk_monitor.serving import app as app_module
+
+    monkeypatch.setenv("RRM_BUNDLE_DIR", str(trained_bundle_root))
+    with TestClient(app_module.app) as client:
+        items = [
+            {"request_id": f"d-{i}", "features": json_features(fixture_df.iloc[i], app_module.FEATURE_COLUMNS)}
+            for i in range(300)
+        ]
+        assert client.post("/predict/batch", json={"items": items}).status_code == 200
+
+        app_module.DRIFT.drain()
+        app_module.DRIFT.close_window()
+
+        body = client.get("/drift").json()
+        assert body["status"] == "ok"
+        assert body["window_rows"] == 300
+        assert "NUM_MEDICATIONS" in body["features"]
+        assert "rrm_feature_drift_psi" in client.get("/metrics").text
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import roc_auc_score
+from sklearn.pipeline import Pipeline
+
+from readmission_risk_monitor.config import SETTINGS
+from readmission_risk_monitor.modeling.importance import grouped_permutation_importance
+from readmission_risk_monitor.serving.model_loader import load_latest_bundle
+
+
+def test_block_permutation_matches_shuffling_the_raw_column(trained_bundle_root, fixture_splits) -> None:
+    _, valid_df, _ = fixture_splits
+    bundle = load_latest_bundle(trained_bundle_root)
+    columns, y = bundle.feature_columns, valid_df[SETTINGS.target_col].astype(int)
+
+    result = grouped_permutation_importance(
+        bundle.model, valid_df, y, feature_columns=columns, n_repeats=1, random_state=7, n_workers=1
+    )
+    got = {f["feature"]: f["importance_mean"] for f in result["features"]}
+    assert [f["feature"] for f in result["features"]] == sorted(got, key=lambda c: -got[c])
+
+    # Same permutations, applied to the raw frame and pushed through the whole pipeline
+    rng = np.random.default_rng(int(np.random.SeedSequence(7).generate_state(1)[0]))
+    encoded = {f["feature"]: f["n_encoded_columns"] for f in result["features"]}
+    X = valid_df[columns].reset_index(drop=True)
+    for c in columns:
+        if not encoded[c]:
+            assert got[c] == 0.0
+            continue
+        shuffled = X.copy()
+        shuffled[c] = X[c].to_numpy()[rng.permutation(len(X))]
+        score = roc_auc_score(y, bundle.model.predict_proba(shuffled)[:, 1])
+        assert got[c] == pytest.approx(result["baseline_score"] - score, abs=1e-12)
+
+
+def test_parallel_repeats_match_serial(trained_bundle_root, fixture_splits) -> None:
+    _, valid_df, _ = fixture_splits
+    bundle = load_latest_bundle(trained_bundle_root)
+    kwargs = dict(feature_columns=bundle.feature_columns, n_repeats=2, random_state=0)
+
+    serial = grouped_permutation_importance(bundle.model, valid_df, valid_df[SETTINGS.target_col], n_workers=1, **kwargs)
+    parallel = grouped_permutation_importance(bundle.model, valid_df, valid_df[SETTINGS.target_col], n_workers=2, **kwargs)
+    assert parallel["n_workers"] == 2
+    assert parallel["features"] == serial["features"]
+
+
+class _ThreadCheckedLogReg(LogisticRegression):
+    """Fails inside a pool worker unless its n_jobs was pinned to that worker's share."""
+
+    parent_pid = os.getpid()
+
+    def predict_proba(self, X):
+        if os.getpid() != self.parent_pid:
+            assert self.n_jobs == 2, f"worker predicted with n_jobs={self.n_jobs}"
+        return super().predict_proba(X)
+
+
+def test_parallel_workers_pin_model_threads(trained_bundle_root, fixture_splits, monkeypatch) -> None:
+    _, valid_df, _ = fixture_splits
+    bundle = load_latest_bundle(trained_bundle_root)
+    model = _ThreadCheckedLogReg()
+    model.__dict__.update(bundle.model.named_steps["model"].__dict__, n_jobs=4)
+    pipeline = Pipeline([("preprocess", bundle.model.named_steps["preprocess"]), ("model", model)])
+
+    monkeypatch.setenv("RRM_TRAIN_CPUS", "4")
+    result = grouped_permutation_importance(
+        pipeline, valid_df, valid_df[SETTINGS.target_col],
+        feature_columns=bundle.feature_columns, n_repeats=2, n_workers=2,
+    )
+    assert result["n_workers"] == 2
+    assert model.n_jobs == 4   # the caller's model keeps its training thread count
+
+
+def test_global_importance_is_served_from_the_bundle(trained_bundle_root, monkeypatch) -> None:
+    from readmission_risk_monitor.serving import app as app_module
+
+    monkeypatch.setenv("RRM_BUNDLE_DIR", str(trained_bundle_root))
+    with TestClient(app_module.app) as client:
+        body = client.get("/explain/global").json()
+
+    stored = load_latest_bundle(trained_bundle_root).global_importance
+    assert body["model_version"] == "0.1.0"
+    assert body["metric"] == "auroc" and body["n_repeats"] == 2
+    assert [f["feature"] for f in body["features"]] == [f["feature"] for f in stored["features"]]
+    assert len(body["features"]) == len(app_module.FEATURE_COLUMNS)
@@ -0,0 +1,30 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+HEAVY = ("sklearn", "lightgbm")
+
+
+def _loaded_after_import(module: str) -> dict:
+    code = (
+        f"import json, sys; import {module}; "
+        f"print(json.dumps({{m: m in sys.modules for m in {HEAVY!r}}}))"
+    )
+    # The child does not see pytest's `pythonpath = ["src"]`; hand it this process's path
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env)
+    return json.loads(out.stdout)
+
+
+@pytest.mark.parametrize("module", [
+    "readmission_risk_monitor.serving.app",
+    "readmission_risk_monitor.serving.model_loader",
+    "readmission_risk_monitor.monitoring.live_performance",
+    "readmission_risk_monitor.features.split",
+])
+def test_module_import_does_not_pull_training_stack(module):
+    # sklearn/lightgbm arrive with the unpickled model (or the training call), not on import
+    assert _loaded_after_import(module) == {m: False for m in HEAVY}
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from readmission_risk_monitor.config import SETTINGS
+from readmission_risk_monitor.modeling.evaluate import binary_metrics
+from readmission_risk_monitor.monitoring.live_performance import (
+    JoinConfig,
+    join_predictions_with_labels,
+    live_performance_series,
+)
+from readmission_risk_monitor.serving.audit import AUDIT_SCHEMA
+
+
+def _audit_log(root, fixture_df: pd.DataFrame, scores: np.ndarray, week_of: np.ndarray) -> None:
+    """Audit files (same schema the API writes) with scored_utc in week_of[i] of March 2026."""
+    monday = pd.Timestamp("2026-03-02", tz="UTC")
+    for week in (0, 1):
+        idx = np.flatnonzero(week_of == week)
+        day = monday + pd.Timedelta(days=7 * week)
+        table = pa.Table.from_pydict({
+            "scored_utc": [day] * len(idx),
+            "request_id": [f"r-{i}" for i in idx],
+            "encounter_id": [str(e) for e in fixture_df[SETTINGS.record_id_col].iloc[idx]],
+            "model_version": ["0.1.0"] * len(idx),
+            "schema_version": ["1.0.0"] * len(idx),
+            "readmission_risk": scores[idx],
+            "risk_tier": ["low"] * len(idx),
+            "latency_ms": [1.0] * len(idx),
+            "features": ["{}"] * len(idx),
+        }, schema=AUDIT_SCHEMA)
+        part = root / f"date={day:%Y-%m-%d}"
+        part.mkdir(parents=True)
+        pq.write_table(table, part / "audit-000000-1-0001.parquet", row_group_size=400)
+
+
+def test_join_matches_in_memory_metrics(tmp_path, fixture_df) -> None:
+    rng = np.random.default_rng(0)
+    df = fixture_df.head(2000)
+    scores = rng.random(len(df))
+    week_of = rng.integers(0, 2, len(df))
+    _audit_log(tmp_path / "audit", df, scores, week_of)
+
+    # Labels for only part of the scored encounters have arrived
+    labels_path = tmp_path / "labels.parquet"
+    df.head(1500)[[SETTINGS.record_id_col, SETTINGS.target_col]].to_parquet(labels_path)
+
+    cfg = JoinConfig(n_partitions=7, batch_size=300)
+    groups, counts = join_predictions_with_labels(
+        tmp_path / "audit",
+        labels_path,
+        record_id_col=SETTINGS.record_id_col,
+        target_col=SETTINGS.target_col,
+        cfg=cfg,
+    )
+    assert counts["audit_rows"] == 2000
+    assert counts["joined_rows"] == 1500
+
+    series = live_performance_series(groups, cfg=cfg)
+    assert [s["week_start"] for s in series] == ["2026-03-02", "2026-03-09"]
+
+    y = df[SETTINGS.target_col].to_numpy()[:1500]
+    w = week_of[:1500]
+    for s, week in zip(series, (0, 1), strict=True):
+        want = binary_metrics(y[w == week], scores[:1500][w == week])
+        assert s["weekly"]["n"] == want["n"]
+        assert s["weekly"]["auroc"] == pytest.approx(want["auroc"])
+        assert s["weekly"]["brier"] == pytest.approx(want["brier"])
+
+    assert series[1]["rolling"]["weeks"] == 2
+    assert series[1]["rolling"]["auroc"] == pytest.approx(binary_metrics(y, scores[:1500])["auroc"])
+    assert sum(b["n"] for b in series[0]["weekly"]["calibration"]["bins"]) == series[0]["weekly"]["n"]
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from readmission_risk_monitor.config import SETTINGS
+from readmission_risk_monitor.modeling.bundle import (
+    compute_reference_stats,
+    merge_reference_stats,
+    next_model_version,
+    write_bundle,
+)
+from readmission_risk_monitor.modeling.retrain import warm_start_retrain
+from readmission_risk_monitor.modeling.train import train_baseline_logreg, try_train_lightgbm
+from readmission_risk_monitor.serving.model_loader import load_latest_bundle
+
+
+def _train_kwargs() -> dict:
+    return {
+        "target_col": SETTINGS.target_col,
+        "patient_id_col": SETTINGS.patient_id_col,
+        "record_id_col": SETTINGS.record_id_col,
+    }
+
+
+def test_next_model_version_bumps_latest(tmp_path) -> None:
+    assert next_model_version(tmp_path) == "0.1.0"
+    for v in ("0.1.0", "0.1.9", "0.1.10", "latest"):
+        (tmp_path / v).mkdir()
+
+    assert next_model_version(tmp_path) == "0.1.11"
+    assert next_model_version(tmp_path, bump="minor") == "0.2.0"
+    assert next_model_version(tmp_path, bump="major") == "1.0.0"
+
+
+def test_warm_start_logreg_writes_new_version(tmp_path, fixture_splits) -> None:
+    train_df, valid_df, test_df = fixture_splits
+    base = train_baseline_logreg(train_df, **_train_kwargs())
+    write_bundle(
+        bundle_root=tmp_path,
+        model_version="0.1.0",
+        schema_version="1.0.0",
+        pipeline=base.pipeline,
+        feature_columns=base.feature_columns,
+        feature_spec=base.feature_spec,
+        reference_df=train_df[base.feature_columns],
+        model_type="logistic_regression",
+    )
+    previous = load_latest_bundle(tmp_path)
+
+    result = warm_start_retrain(
+        previous.model,
+        valid_df,
+        feature_columns=previous.feature_columns,
+        feature_spec=previous.metadata["feature_spec"],
+        max_iter=20,
+    )
+    old_clf = previous.model.named_steps["model"]
+    new_clf = result.pipeline.named_steps["model"]
+
+    assert new_clf.coef_.shape == old_clf.coef_.shape
+    assert not np.allclose(new_clf.coef_, old_clf.coef_)
+    assert new_clf.n_iter_[0] <= 20
+    # the preprocessor is shared, not refit
+    assert result.pipeline.named_steps["preprocess"] is previous.model.named_steps["preprocess"]
+
+    version = next_model_version(tmp_path)
+    write_bundle(
+        bundle_root=tmp_path,
+        model_version=version,
+        schema_version="1.0.0",
+        pipeline=result.pipeline,
+        feature_columns=result.feature_columns,
+        feature_spec=result.feature_spec,
+        reference_df=valid_df[result.feature_columns],
+        model_type="logistic_regression",
+        lineage={"parent_version": "0.1.0"},
+    )
+    reloaded = load_latest_bundle(tmp_path)
+    assert reloaded.metadata["model_version"] == "0.1.1"
+    assert reloaded.metadata["lineage"]["parent_version"] == "0.1.0"
+    assert reloaded.model.predict_proba(test_df[reloaded.feature_columns]).shape == (len(test_df), 2)
+
+
+def test_warm_start_lightgbm_continues_boosting(fixture_splits) -> None:
+    pytest.importorskip("lightgbm")
+    train_df, valid_df, _ = fixture_splits
+    base = try_train_lightgbm(train_df, **_train_kwargs())
+
+    result = warm_start_retrain(
+        base.pipeline,
+        valid_df,
+        feature_columns=base.feature_columns,
+        feature_spec=base.feature_spec,
+        extra_rounds=10,
+    )
+    old_trees = base.pipeline.named_steps["model"].booster_.num_trees()
+    new_trees = result.pipeline.named_steps["model"].booster_.num_trees()
+    assert new_trees == old_trees + 10
+
+
+def test_merged_reference_matches_profiling_both_sets_in_parent_bins(fixture_splits) -> None:
+    train_df, valid_df, _ = fixture_splits
+    cols = ["TIME_IN_HOSPITAL", "NUM_MEDICATIONS", "A1CRESULT", "RACE"]
+    parent = compute_reference_stats(train_df, feature_columns=cols)
+    merged = merge_reference_stats(parent, valid_df, feature_columns=cols)
+    both = pd.concat([train_df, valid_df])
+    full = compute_reference_stats(both, feature_columns=cols)
+
+    assert merged["n_rows"] == len(both)
+    for c in cols:
+        got, want = merged["columns"][c], full["columns"][c]
+        assert got["type"] == want["type"]
+        assert got["missing_rate"] == pytest.approx(want["missing_rate"], abs=1e-3)
+        if want["type"] == "numeric":
+            for k in ("mean", "std", "min", "max"):
+                assert got[k] == pytest.approx(want[k], rel=1e-9)
+            # Parent edges are kept; every row of both sets is counted into them
+            edges = parent["columns"][c]["histogram"]["edges"]
+            assert got["histogram"]["edges"] == edges
+            v = both[c].dropna().to_numpy(dtype=float)
+            expected = np.bincount(np.searchsorted(edges, v, side="right"), minlength=len(edges) + 1)
+            assert got["histogram"]["counts"] == expected.tolist()
+        else:
+            assert got["top_values"] == want["top_values"]
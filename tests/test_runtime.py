@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+from conftest import json_features
+from fastapi.testclient import TestClient
+
+from readmission_risk_monitor.runtime import THREAD_ENV_VARS, ResourceConfig, limit_native_threads
+
+
+def test_serving_workers_split_the_cpu_budget(monkeypatch) -> None:
+    monkeypatch.setenv("RRM_CPUS", "8")
+    monkeypatch.setenv("RRM_WORKERS", "4")
+    for var in ("RRM_BLAS_THREADS", "RRM_SCORING_THREADS", "RRM_TRAIN_CPUS"):
+        monkeypatch.delenv(var, raising=False)
+
+    config = ResourceConfig.from_env()
+    assert (config.cpus_per_worker, config.blas_threads, config.scoring_threads, config.train_cpus) == (2, 1, 2, 8)
+    assert ResourceConfig.from_env(workers=1).scoring_threads == 8
+
+    monkeypatch.setenv("RRM_SCORING_THREADS", "0")
+    with pytest.raises(ValueError, match="scoring_threads"):
+        ResourceConfig.from_env()
+
+
+def test_limit_native_threads_caps_loaded_pools(monkeypatch) -> None:
+    import numpy  # noqa: F401  (its BLAS is what gets capped)
+
+    for var in THREAD_ENV_VARS:
+        monkeypatch.setenv(var, "")
+    pools = limit_native_threads(1)
+    assert all(os.environ[var] == "1" for var in THREAD_ENV_VARS)
+    assert pools and all(p["num_threads"] == 1 for p in pools)
+
+
+def test_app_sizes_scoring_pool_admission_and_model_threads(trained_bundle_root, fixture_df, monkeypatch) -> None:
+    from readmission_risk_monitor.serving import app as app_module
+
+    monkeypatch.setenv("RRM_BUNDLE_DIR", str(trained_bundle_root))
+    monkeypatch.setenv("RRM_SCORING_THREADS", "3")
+    monkeypatch.setenv("RRM_BLAS_THREADS", "2")
+    monkeypatch.delenv("RRM_ADMISSION_SLOTS", raising=False)
+    for var in THREAD_ENV_VARS:
+        monkeypatch.setenv(var, "")
+    with TestClient(app_module.app) as client:
+        assert app_module.SCORING_POOL._max_workers == 3
+        assert app_module.ADMISSION.config.slots == 3
+        assert app_module.BUNDLE.model.named_steps["model"].get_params()["n_jobs"] == 2
+        features = json_features(fixture_df.iloc[0], app_module.FEATURE_COLUMNS)
+        assert client.post("/predict", json={"request_id": "rt-1", "features": features}).status_code == 200
+    assert app_module.SCORING_POOL is None
+    limit_native_threads(1)
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import pytest
+from conftest import json_features
+from fastapi.testclient import TestClient
+
+from readmission_risk_monitor.serving.model_loader import load_latest_bundle
+from readmission_risk_monitor.serving.score_table import (
+    ScoreTable,
+    materialize_scores,
+    write_score_table,
+)
+
+
+def test_table_is_sorted_deduplicated_and_searchable(tmp_path) -> None:
+    path = tmp_path / "scores.arrow"
+    summary = write_score_table(
+        path,
+        encounter_ids=[30, 10, 20, 10],
+        probas=[0.3, 0.1, 0.2, 0.15],
+        tiers=["medium", "low", "low", "low"],
+        reason_codes=[["A_UP"], ["B_DOWN"], [], ["C_UP"]],
+        model_version="1.2.3",
+        schema_version="1.0.0",
+    )
+    assert summary == {"n_rows": 3, "n_duplicates": 1}
+
+    table = ScoreTable(path)
+    assert table.model_version == "1.2.3"
+    assert table.lookup(10)["readmission_risk"] == 0.15  # last duplicate wins
+    assert table.lookup(10)["reason_codes"] == ["C_UP"]
+    assert table.lookup(30)["risk_tier"] == "medium"
+    assert table.lookup(20)["model_version"] == "1.2.3"
+    assert table.lookup(5) is None and table.lookup(25) is None and table.lookup(99) is None
+
+
+def test_score_endpoint_serves_table_and_falls_back_to_live(
+        trained_bundle_root, fixture_splits, tmp_path, monkeypatch
+) -> None:
+    from readmission_risk_monitor.serving import app as app_module
+
+    _, valid_df, _ = fixture_splits
+    extract = tmp_path / "open.parquet"
+    valid_df.head(50).to_parquet(extract)
+    table_path = tmp_path / "scores" / "score_table.arrow"
+    summary = materialize_scores(extract, load_latest_bundle(trained_bundle_root), table_path)
+    assert summary["n_rows"] == 50
+
+    monkeypatch.setenv("RRM_BUNDLE_DIR", str(trained_bundle_root))
+    monkeypatch.setenv("RRM_SCORE_TABLE", str(table_path))
+    row = valid_df.iloc[3]
+    enc = int(row["ENCOUNTER_ID"])
+    features = json_features(row, load_latest_bundle(trained_bundle_root).feature_columns)
+    with TestClient(app_module.app) as client:
+        live = client.post("/predict", json={"request_id": "p", "features": features}).json()
+        hit = client.get(f"/score/{enc}").json()
+        assert hit["source"] == "table" and hit["scored_utc"]
+        assert hit["readmission_risk"] == pytest.approx(live["readmission_risk"], abs=1e-12)
+        assert hit["risk_tier"] == live["risk_tier"]
+
+        missing_enc = int(valid_df["ENCOUNTER_ID"].max()) + 1
+        assert client.get(f"/score/{missing_enc}").status_code == 404
+        fallback = client.post(f"/score/{missing_enc}", json={"request_id": "f", "features": features}).json()
+        assert fallback["source"] == "live"
+        assert fallback["readmission_risk"] == pytest.approx(live["readmission_risk"])
+
+    # A table from another model version is stale: lookups miss, POST scores live
+    write_score_table(
+        table_path, encounter_ids=[enc], probas=[0.99], tiers=["high"], reason_codes=[[]],
+        model_version="9.9.9", schema_version="1.0.0",
+    )
+    with TestClient(app_module.app) as client:
+        assert client.get(f"/score/{enc}").status_code == 404
+        stale = client.post(f"/score/{enc}", json={"request_id": "s", "features": features}).json()
+        assert stale["source"] == "live"
+        assert stale["readmission_risk"] == pytest.approx(live["readmission_risk"])
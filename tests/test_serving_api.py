@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import pytest
+from conftest import json_features
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture()
+def client(trained_bundle_root, monkeypatch):
+    from readmission_risk_monitor.serving import app as app_module
+
+    monkeypatch.setenv("RRM_BUNDLE_DIR", str(trained_bundle_root))
+    with TestClient(app_module.app) as c:
+        yield c
+
+
+def test_predict_batch_matches_single(client, fixture_df) -> None:
+    from readmission_risk_monitor.serving import app as app_module
+
+    rows = [json_features(fixture_df.iloc[i], app_module.FEATURE_COLUMNS) for i in range(5)]
+
+    batch = client.post(
+        "/predict/batch",
+        json={"items": [{"request_id": f"r-{i}", "features": f} for i, f in enumerate(rows)]},
+    )
+    assert batch.status_code == 200
+    preds = batch.json()["predictions"]
+    assert [p["request_id"] for p in preds] == [f"r-{i}" for i in range(5)]
+
+    for i, f in enumerate(rows):
+        single = client.post("/predict", json={"request_id": f"r-{i}", "features": f}).json()
+        assert single["readmission_risk"] == pytest.approx(preds[i]["readmission_risk"])
+        assert single["risk_tier"] == preds[i]["risk_tier"]
+
+
+def test_predict_batch_empty(client) -> None:
+    resp = client.post("/predict/batch", json={"items": []})
+    assert resp.status_code == 200
+    assert resp.json()["predictions"] == []
+
+
+def test_invalid_features_are_rejected_by_field(client, fixture_df) -> None:
+    from readmission_risk_monitor.serving import app as app_module
+
+    good = json_features(fixture_df.iloc[0], app_module.FEATURE_COLUMNS)
+    bad = {**good, "RACE": "Martian", "TIME_IN_HOSPITAL": "four", "NOT_A_FEATURE": 1}
+    resp = client.post(
+        "/predict/batch",
+        json={"items": [{"request_id": "ok", "features": good}, {"request_id": "x", "features": bad}]},
+    )
+    assert resp.status_code == 422
+    errors = {tuple(e["loc"]): e["type"] for e in resp.json()["detail"]}
+    assert errors == {
+        ("body", "items", 1, "features", "RACE"): "literal_error",
+        ("body", "items", 1, "features", "TIME_IN_HOSPITAL"): "float_type",
+        ("body", "items", 1, "features", "NOT_A_FEATURE"): "extra_forbidden",
+    }
+
+    schema = client.get("/schema").json()
+    assert schema["feature_columns"] == app_module.FEATURE_COLUMNS
+    assert "Martian" not in schema["json_schema"]["properties"]["RACE"]["anyOf"][0]["enum"]
+
+
+def _sample_value(text: str, prefix: str) -> float:
+    return sum(float(line.rsplit(" ", 1)[1]) for line in text.splitlines() if line.startswith(prefix))
+
+
+def test_metrics_track_tiers_missingness_and_errors(client, fixture_df) -> None:
+    from readmission_risk_monitor.serving import app as app_module
+
+    before = client.get("/metrics").text
+    features = json_features(fixture_df.iloc[0], app_module.FEATURE_COLUMNS)
+    features.pop("NUM_MEDICATIONS")
+    for i in range(3):
+        assert client.post("/predict", json={"request_id": f"m-{i}", "features": features}).status_code == 200
+    assert client.post("/predict", json={"request_id": "bad"}).status_code == 422
+
+    after = client.get("/metrics").text
+    missing = 'rrm_feature_missing_total{feature="NUM_MEDICATIONS"}'
+    assert _sample_value(after, missing) - _sample_value(before, missing) == 3
+    tiers = 'rrm_predictions_total{model_version="0.1.0"'
+    assert _sample_value(after, tiers) - _sample_value(before, tiers) == 3
+    assert _sample_value(after, "rrm_readmission_risk_count") - _sample_value(before, "rrm_readmission_risk_count") == 3
+    errors = 'rrm_errors_total{endpoint="/predict",error_type="RequestValidationError"}'
+    assert _sample_value(after, errors) - _sample_value(before, errors) == 1
+
+
+def test_bulk_histogram_flush_matches_per_value_observe() -> None:
+    from bisect import bisect_left
+
+    from prometheus_client import CollectorRegistry, Histogram
+
+    from readmission_risk_monitor.serving.metrics import RISK_BUCKETS, _add_to_histogram
+
+    scores = [0.0, 0.05, 0.05, 0.1, 0.12, 0.3, 0.3, 0.3, 0.55, 0.99, 1.0]
+    bounds = list(RISK_BUCKETS) + [float("inf")]
+    counts, sums = [0] * len(bounds), [0.0] * len(bounds)
+    for p in scores:
+        i = bisect_left(bounds, p)
+        counts[i] += 1
+        sums[i] += p
+
+    registry = CollectorRegistry()
+    bulk = Histogram("bulk", "bulk", buckets=RISK_BUCKETS, registry=registry)
+    direct = Histogram("direct", "direct", buckets=RISK_BUCKETS, registry=registry)
+    _add_to_histogram(bulk, bounds, counts, sums)
+    for p in scores:
+        direct.observe(p)
+
+    def samples(name):
+        return {(s.name.removeprefix(name), tuple(s.labels.items())): s.value
+                for m in registry.collect() if m.name == name for s in m.samples
+                if not s.name.endswith("_created")}
+
+    got, want = samples("bulk"), samples("direct")
+    assert got.keys() == want.keys()
+    for k in want:
+        assert got[k] == pytest.approx(want[k], abs=1e-12)
+
+
+def test_metrics_timer_flushes_idle_worker() -> None:
+    import time
+
+    from prometheus_client import REGISTRY
+
+    from readmission_risk_monitor.serving.metrics import ServingMetrics
+
+    labels = {"risk_tier": "high", "model_version": "timer-test"}
+    metrics = ServingMetrics(["A"], "timer-test", flush_every=1000, flush_interval_s=0.05)
+    metrics.start()
+    try:
+        metrics.observe([{"A": 1}], [0.9], ["high"])
+        deadline = time.monotonic() + 5.0
+        while REGISTRY.get_sample_value("rrm_predictions_total", labels) != 1.0:
+            assert time.monotonic() < deadline, "pending tallies were never flushed"
+            time.sleep(0.01)
+    finally:
+        metrics.stop()
+
+
+def test_preloaded_bundle_is_not_reloaded_by_workers(trained_bundle_root, monkeypatch) -> None:
+    from readmission_risk_monitor.serving import app as app_module
+
+    monkeypatch.setattr(app_module, "_PRELOADED", False)
+    app_module.preload_bundle(trained_bundle_root)
+    model = app_module.MODEL
+
+    # A forked worker's startup must reuse the parent's model, whatever its env says
+    monkeypatch.setenv("RRM_BUNDLE_DIR", str(trained_bundle_root / "does-not-exist"))
+    with TestClient(app_module.app) as c:
+        assert app_module.MODEL is model
+        assert c.get("/health").json()["status"] == "ok"
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from readmission_risk_monitor.data.contract import diabetes_readmission_contract
+from readmission_risk_monitor.data.synthetic import (
+    SyntheticSpec,
+    generate_synthetic_frame,
+    write_synthetic_dataset,
+)
+from readmission_risk_monitor.data.validate import validate_dataframe
+from readmission_risk_monitor.modeling.bundle import compute_reference_stats
+from readmission_risk_monitor.monitoring.batch_drift import profile_against_reference
+
+
+@pytest.fixture(scope="module")
+def reference(fixture_df):
+    contract = diabetes_readmission_contract()
+    reserved = {contract.primary_key, contract.patient_key, contract.target, "READMITTED"}
+    return compute_reference_stats(fixture_df, feature_columns=[c for c in fixture_df.columns if c not in reserved])
+
+
+def test_synthetic_frame_is_contract_valid_with_requested_shape(reference, fixture_df) -> None:
+    spec = SyntheticSpec(n_rows=60_000, positive_rate=0.2, encounters_per_patient=2.0, row_group_size=20_000)
+    df = generate_synthetic_frame(reference, spec)
+
+    assert list(df.columns) == list(fixture_df.columns)
+    assert validate_dataframe(df, diabetes_readmission_contract())["passed"]
+    assert df["READMITTED_30D"].mean() == pytest.approx(0.2, abs=0.01)
+    assert df.groupby("PATIENT_NBR").size().mean() == pytest.approx(2.0, rel=0.05)
+    assert df["READMITTED"].eq("<30").equals(df["READMITTED_30D"].eq(1))
+    for c in ("TIME_IN_HOSPITAL", "NUM_LAB_PROCEDURES", "NUMBER_INPATIENT"):
+        assert df[c].mean() == pytest.approx(reference["columns"][c]["mean"], rel=0.05)
+
+
+def test_parallel_dataset_is_deterministic_and_matches_reference(tmp_path, reference) -> None:
+    spec = SyntheticSpec(n_rows=25_000, row_group_size=5_000, rows_per_file=10_000, seed=7)
+    summary = write_synthetic_dataset(tmp_path / "syn", reference, spec, n_workers=2)
+
+    assert summary["n_files"] == 3 and summary["n_rows"] == 25_000
+    written = pd.read_parquet(tmp_path / "syn")
+    pd.testing.assert_frame_equal(written, generate_synthetic_frame(reference, spec), check_dtype=False)
+
+    report = profile_against_reference(tmp_path / "syn", reference, n_workers=1)
+    assert {r["severity"] for r in report["ranking"]} == {"stable"}
+
+    with pytest.raises(FileExistsError):
+        write_synthetic_dataset(tmp_path / "syn", reference, spec)
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from conftest import json_features
+from fastapi.testclient import TestClient
+
+from readmission_risk_monitor.modeling.thresholds import (
+    capacity_threshold,
+    choose_tier_thresholds,
+    threshold_curve,
+)
+
+
+def test_threshold_curve_matches_brute_force() -> None:
+    rng = np.random.default_rng(0)
+    y = rng.integers(0, 2, size=500)
+    s = rng.integers(0, 50, size=500) / 50.0  # plenty of ties
+
+    curve = threshold_curve(y, s)
+
+    assert np.all(np.diff(curve.thresholds) < 0)
+    for t, flagged, tp in zip(curve.thresholds, curve.flagged, curve.true_positives, strict=True):
+        mask = s >= t
+        assert flagged == mask.sum()
+        assert tp == y[mask].sum()
+
+
+def test_capacity_threshold_respects_budget() -> None:
+    rng = np.random.default_rng(1)
+    y = rng.integers(0, 2, size=1000)
+    s = rng.random(1000)
+
+    curve = threshold_curve(y, s)
+    t = capacity_threshold(curve, 0.10)
+
+    assert (s >= t).sum() <= 100
+    assert (s >= t).sum() >= 99
+
+
+def test_choose_tier_thresholds_orders_tiers() -> None:
+    rng = np.random.default_rng(2)
+    y = rng.integers(0, 2, size=1000)
+    s = rng.random(1000)
+
+    tiers = choose_tier_thresholds(y, s, high_capacity=0.1, medium_capacity=0.3)
+
+    assert tiers["medium"] <= tiers["high"]
+    assert tiers["operating_points"]["medium"]["flagged_rate"] <= 0.30
+    with pytest.raises(ValueError):
+        choose_tier_thresholds(y, s, high_capacity=0.3, medium_capacity=0.1)
+
+
+def test_server_reads_tier_thresholds_from_bundle(trained_bundle_root, fixture_df, monkeypatch) -> None:
+    from readmission_risk_monitor.serving import app as app_module
+
+    monkeypatch.setenv("RRM_BUNDLE_DIR", str(trained_bundle_root))
+    with TestClient(app_module.app) as client:
+        assert app_module.TIER_THRESHOLDS["high"] == app_module.META["tier_thresholds"]["high"]
+
+        health = client.get("/health").json()
+        assert health["status"] == "ok"
+
+        features = json_features(fixture_df.iloc[0], app_module.FEATURE_COLUMNS)
+        resp = client.post("/predict", json={"request_id": "t-1", "features": features})
+        assert resp.status_code == 200
+        body = resp.json()
+
+        t = app_module.TIER_THRESHOLDS
+        expected = "high" if body["readmission_risk"] >= t["high"] else (
+            "medium" if body["readmission_risk"] >= t["medium"] else "low"
+        )
+        assert body["risk_tier"] == expected
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import numpy as np
+from conftest import json_features
+
+from readmission_risk_monitor.modeling.compiled_trees import compile_lightgbm
+from readmission_risk_monitor.serving.explain import TreeExplainer
+
+
+def _rows(df, feature_columns):
+    return [json_features(r, feature_columns) for _, r in df.iterrows()]
+
+
+def test_path_contributions_sum_to_raw_score(trained_lgbm, fixture_splits) -> None:
+    _, valid_df, _ = fixture_splits
+    booster = trained_lgbm.pipeline.named_steps["model"]
+    X_encoded = trained_lgbm.pipeline.named_steps["preprocess"].transform(valid_df[trained_lgbm.feature_columns][:20])
+    compiled = compile_lightgbm(booster)
+
+    contrib, bias = compiled.path_contributions(X_encoded)
+    assert contrib.shape == (20, len(compiled.used_features))
+    np.testing.assert_allclose(contrib.sum(axis=1) + bias, compiled.raw_score(X_encoded), atol=1e-9)
+
+
+def test_grouped_shap_sums_to_margin_and_is_cached(trained_lgbm, fixture_splits) -> None:
+    _, valid_df, _ = fixture_splits
+    cols = trained_lgbm.feature_columns
+    X = valid_df[cols].head(10)
+    explainer = TreeExplainer(trained_lgbm.pipeline, cols, top_k=3)
+
+    X_encoded = explainer.preprocessor.transform(X)
+    grouped = explainer._exact(X_encoded)
+    assert grouped.shape == (10, len(cols))
+    margin = explainer.booster.predict(X_encoded, raw_score=True)
+    expected_value = explainer.booster.predict(X_encoded[:1], pred_contrib=True)[0, -1]
+    np.testing.assert_allclose(grouped.sum(axis=1) + expected_value, margin, atol=1e-9)
+
+    codes, approximate = explainer.explain(_rows(X, cols), X)
+    assert not any(approximate)
+    assert all(0 < len(c) <= 3 and all(x.endswith(("_UP", "_DOWN")) for x in c) for c in codes)
+    assert codes[0][0].rsplit("_", 1)[0] == cols[int(np.argmax(np.abs(grouped[0])))]
+    assert len(explainer._cache) == 10
+    assert explainer.explain(_rows(X, cols), X)[0] == codes
+
+
+def test_exhausted_budget_falls_back_to_path_attributions(trained_lgbm, fixture_splits) -> None:
+    _, valid_df, _ = fixture_splits
+    cols = trained_lgbm.feature_columns
+    X = valid_df[cols].head(5)
+    explainer = TreeExplainer(trained_lgbm.pipeline, cols, budget_ms=0.0)
+
+    codes, approximate = explainer.explain(_rows(X, cols), X)
+    assert all(approximate)
+    assert all(c for c in codes)
+    assert not explainer._cache
+
+
+def test_pre_encoded_rows_match_and_skip_the_preprocessor(trained_lgbm, fixture_splits, monkeypatch) -> None:
+    _, valid_df, _ = fixture_splits
+    cols = trained_lgbm.feature_columns
+    X = valid_df[cols].head(8)
+    rows = _rows(X, cols)
+    expected = TreeExplainer(trained_lgbm.pipeline, cols).explain(rows, X)
+
+    explainer = TreeExplainer(trained_lgbm.pipeline, cols)
+    X_encoded = explainer.preprocessor.transform(X)
+    explainer.explain(rows[:3], X.head(3))   # cached rows: only the rest are sliced out of X_encoded
+
+    def no_transform(*args, **kwargs):
+        raise AssertionError("rows were encoded twice")
+
+    monkeypatch.setattr(explainer.preprocessor, "transform", no_transform)
+    assert explainer.explain(rows, X, X_encoded) == expected
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+from conftest import json_features
+from fastapi.testclient import TestClient
+
+from readmission_risk_monitor.serving.sweep import SweepScorer, sweep_frame
+
+
+@pytest.fixture()
+def client(trained_bundle_root, monkeypatch):
+    from readmission_risk_monitor.serving import app as app_module
+
+    monkeypatch.setenv("RRM_BUNDLE_DIR", str(trained_bundle_root))
+    with TestClient(app_module.app) as c:
+        yield c
+
+
+def test_sweep_matches_scoring_each_grid_point(client, fixture_df) -> None:
+    from readmission_risk_monitor.serving import app as app_module
+
+    base = json_features(fixture_df.iloc[0], app_module.FEATURE_COLUMNS)
+    resp = client.post("/predict/sweep", json={
+        "request_id": "what-if",
+        "features": base,
+        "axes": [
+            {"feature": "NUM_MEDICATIONS", "start": 1, "stop": 40, "num": 4},
+            {"feature": "RACE", "values": ["Caucasian", "AfricanAmerican", None]},
+        ],
+    })
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["n_points"] == 12
+    assert body["axes"][0]["values"] == [1.0, 14.0, 27.0, 40.0]
+    assert np.asarray(body["risk"]).shape == (4, 3)
+
+    single = client.post("/predict", json={"request_id": "base", "features": base}).json()
+    assert body["base_risk"] == pytest.approx(single["readmission_risk"])
+
+    items = [
+        {"request_id": f"{i}-{j}", "features": {**base, "NUM_MEDICATIONS": meds, "RACE": race}}
+        for i, meds in enumerate(body["axes"][0]["values"])
+        for j, race in enumerate(body["axes"][1]["values"])
+    ]
+    batch = client.post("/predict/batch", json={"items": items}).json()["predictions"]
+    expected = np.asarray([p["readmission_risk"] for p in batch]).reshape(4, 3)
+    np.testing.assert_allclose(body["risk"], expected, rtol=1e-9)
+
+
+def test_sweep_axes_are_validated_against_the_bundle_schema(client, fixture_df) -> None:
+    from readmission_risk_monitor.serving import app as app_module
+
+    base = json_features(fixture_df.iloc[0], app_module.FEATURE_COLUMNS)
+    resp = client.post("/predict/sweep", json={
+        "request_id": "bad",
+        "features": base,
+        "axes": [
+            {"feature": "RACE", "values": ["Caucasian", "Martian"]},
+            {"feature": "NOT_A_FEATURE", "values": [1]},
+            {"feature": "GENDER", "start": 0, "stop": 1},
+        ],
+    })
+    assert resp.status_code == 422
+    errors = {tuple(e["loc"]): e["type"] for e in resp.json()["detail"]}
+    assert errors == {
+        ("body", "axes", 0, "values", 1): "literal_error",
+        ("body", "axes", 1, "feature"): "value_error",
+        ("body", "axes", 2, "start"): "literal_error",
+    }
+
+    too_big = [{"feature": f, "start": 0, "stop": 10, "num": 100} for f in ("NUM_MEDICATIONS", "TIME_IN_HOSPITAL")]
+    resp = client.post("/predict/sweep", json={"request_id": "big", "features": base, "axes": too_big})
+    assert resp.status_code == 422
+    assert resp.json()["detail"][0]["loc"] == ["body", "axes"]
+
+
+def test_sweep_scorer_matches_full_grid_for_tree_bundles(trained_lgbm, fixture_df) -> None:
+    pipeline, columns = trained_lgbm.pipeline, trained_lgbm.feature_columns
+    base = json_features(fixture_df.iloc[3], columns)
+    axes = [
+        ("NUMBER_INPATIENT", [0.0, 1.0, 3.0, None]),
+        ("DIAG_1", ["428", "250.83", "V57", "not-a-code"]),
+        ("TIME_IN_HOSPITAL", list(np.linspace(1, 14, 5))),
+    ]
+
+    base_risk, risk = SweepScorer(pipeline, columns).score(base, axes)
+
+    grid = pipeline.predict_proba(sweep_frame(base, axes, columns))[:, 1].reshape(4, 4, 5)
+    np.testing.assert_allclose(risk, grid, rtol=1e-9)
+    assert base_risk == pytest.approx(pipeline.predict_proba(pd.DataFrame([base], columns=columns))[0, 1])